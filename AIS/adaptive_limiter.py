@@ -0,0 +1,784 @@
+"""
+==============================================================================
+Name: adaptive_limiter
+Author: AI Assistant
+Date: 10/17/2026
+Description: Adaptive concurrency limiter for AI Search calls. An AIMD or
+latency-gradient policy moves the concurrency limit: it backs off on
+throttling (429/503, timeouts) and ramps up while latency is healthy.
+Throughput and error-rate curves are recorded per time window to find the
+sustainable QPS of an index.
+==============================================================================
+"""
+
+import argparse
+import asyncio
+import csv
+import math
+import random
+from abc import ABC, abstractmethod
+from collections import deque
+from enum import Enum
+from pathlib import Path
+from time import monotonic
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, TypeVar, Union
+
+import httpx
+from pydantic import BaseModel, ConfigDict
+
+T = TypeVar("T")
+
+# Status codes AI Search, Cosmos DB and the embedding endpoint return when overloaded
+THROTTLING_STATUS_CODES = frozenset({429, 503})
+_THROTTLING_MARKERS = ("429", "too many requests", "throttl", "rate limit", "request rate is large", "server busy")
+
+
+class Outcome(str, Enum):
+    """
+    How a limited call ended.
+    """
+
+    SUCCESS = "success"
+    # The service is overloaded: throttled, unavailable or timed out. The limit backs off.
+    THROTTLED = "throttled"
+    # Any other failure. It says nothing about load, so the limit is left alone.
+    ERROR = "error"
+
+
+def is_throttling_error(error: BaseException) -> bool:
+    """
+    Returns whether an error means the service is overloaded.
+
+    Status codes are read from the error or its `response` (httpx and the Azure SDKs both expose one); errors without
+    a status code are matched on their message.
+
+    Args:
+        error (BaseException): The error a call raised.
+
+    Returns:
+        bool: True for throttling, unavailability and timeouts.
+    """
+    if isinstance(error, (asyncio.TimeoutError, httpx.TimeoutException)):
+        return True
+
+    status_code = getattr(error, "status_code", None)
+    if status_code is None:
+        status_code = getattr(getattr(error, "response", None), "status_code", None)
+    if status_code is not None:
+        return status_code in THROTTLING_STATUS_CODES
+
+    message = str(error).lower()
+    return any(marker in message for marker in _THROTTLING_MARKERS)
+
+
+def retry_after_seconds(error: BaseException) -> Optional[float]:
+    """
+    Read the delay a throttled response asks for.
+
+    Args:
+        error (BaseException): The error a call raised.
+
+    Returns:
+        Optional[float]: The `Retry-After` (or `retry-after-ms`) delay in seconds, or None if the response has none.
+    """
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        if headers.get("retry-after-ms") is not None:
+            return float(headers["retry-after-ms"]) / 1000
+        if headers.get("retry-after") is not None:
+            return float(headers["retry-after"])
+    except (TypeError, ValueError):
+        return None
+    return None
+
+
+class LimitSample(BaseModel):
+    """
+    One finished call, as seen by a limit policy.
+
+    Attributes:
+        latency_seconds (float): Time the call held its slot.
+        outcome (Outcome): How it ended.
+        in_flight (int): Calls in flight when it started, itself included.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    latency_seconds: float
+    outcome: Outcome
+    in_flight: int
+
+
+class ILimitPolicy(ABC):
+    """
+    Interface for deciding the concurrency limit from finished calls.
+    """
+
+    @abstractmethod
+    def update(self, limit: float, sample: LimitSample) -> float:
+        """
+        Compute the limit after a call finished.
+
+        Args:
+            limit (float): The current limit.
+            sample (LimitSample): The finished call.
+
+        Returns:
+            float: The new limit. The limiter clamps it to its bounds.
+        """
+
+    @abstractmethod
+    def back_off(self, limit: float) -> float:
+        """
+        Compute the limit after the service signalled overload.
+
+        Args:
+            limit (float): The current limit.
+
+        Returns:
+            float: The reduced limit.
+        """
+
+
+class AIMDPolicy(ILimitPolicy):
+    """
+    Additive increase, multiplicative decrease.
+
+    Each success adds `increase / limit`, so the limit grows by about `increase` per round of calls, as long as the calls
+    actually use the limit and (with `latency_threshold_seconds`) come back fast enough. Throttling multiplies the limit
+    by `backoff_ratio`.
+    """
+
+    def __init__(self, increase: float = 1.0, backoff_ratio: float = 0.7, latency_threshold_seconds: Optional[float] = None):
+        """
+        Initialize the policy.
+
+        Args:
+            increase (float): Limit added per round of successful calls.
+            backoff_ratio (float): Factor applied to the limit on throttling, between 0 and 1.
+            latency_threshold_seconds (Optional[float]): Successes slower than this hold the limit instead of raising
+                it. Latency is not considered if None.
+
+        Raises:
+            ValueError: If `increase` is not positive or `backoff_ratio` is not between 0 and 1.
+        """
+        if increase <= 0:
+            raise ValueError("increase must be > 0")
+        if not 0 < backoff_ratio < 1:
+            raise ValueError("backoff_ratio must be between 0 and 1")
+
+        self._increase = increase
+        self._backoff_ratio = backoff_ratio
+        self._latency_threshold_seconds = latency_threshold_seconds
+
+    def update(self, limit: float, sample: LimitSample) -> float:
+        """
+        Compute the limit after a call finished.
+
+        Args:
+            limit (float): The current limit.
+            sample (LimitSample): The finished call.
+
+        Returns:
+            float: The new limit.
+        """
+        if sample.outcome is Outcome.THROTTLED:
+            return self.back_off(limit=limit)
+        if sample.outcome is Outcome.ERROR:
+            return limit
+        if self._latency_threshold_seconds is not None and sample.latency_seconds > self._latency_threshold_seconds:
+            return limit
+        # A caller using less than half the limit has not shown the service can take more
+        if sample.in_flight * 2 < limit:
+            return limit
+        return limit + self._increase / limit
+
+    def back_off(self, limit: float) -> float:
+        """
+        Compute the limit after the service signalled overload.
+
+        Args:
+            limit (float): The current limit.
+
+        Returns:
+            float: The reduced limit.
+        """
+        return limit * self._backoff_ratio
+
+
+class GradientPolicy(ILimitPolicy):
+    """
+    Latency gradient: the limit follows the ratio of the long-term latency to the recent latency.
+
+    While recent latency matches the long-term baseline the gradient is 1 and the limit grows by a queue allowance of
+    `sqrt(limit)`; when queueing in the service pushes recent latency up, the gradient drops below 1 and the limit
+    shrinks before the service starts throttling. Throttling multiplies the limit by `backoff_ratio`.
+    """
+
+    def __init__(self, tolerance: float = 1.5, smoothing: float = 0.2, long_window: int = 100, backoff_ratio: float = 0.7):
+        """
+        Initialize the policy.
+
+        Args:
+            tolerance (float): Recent latency may exceed the baseline by this factor before the limit shrinks.
+            smoothing (float): Weight of the new limit estimate per round of calls, between 0 and 1.
+            long_window (int): Calls averaged into the latency baseline.
+            backoff_ratio (float): Factor applied to the limit on throttling, between 0 and 1.
+
+        Raises:
+            ValueError: If an argument is out of range.
+        """
+        if tolerance < 1:
+            raise ValueError("tolerance must be >= 1")
+        if not 0 < smoothing <= 1:
+            raise ValueError("smoothing must be between 0 and 1")
+        if long_window < 1:
+            raise ValueError("long_window must be >= 1")
+        if not 0 < backoff_ratio < 1:
+            raise ValueError("backoff_ratio must be between 0 and 1")
+
+        self._tolerance = tolerance
+        self._smoothing = smoothing
+        self._long_alpha = 2 / (long_window + 1)
+        self._backoff_ratio = backoff_ratio
+        self._short_latency: Optional[float] = None
+        self._long_latency: Optional[float] = None
+
+    def update(self, limit: float, sample: LimitSample) -> float:
+        """
+        Compute the limit after a call finished.
+
+        Args:
+            limit (float): The current limit.
+            sample (LimitSample): The finished call.
+
+        Returns:
+            float: The new limit.
+        """
+        if sample.outcome is Outcome.THROTTLED:
+            return self.back_off(limit=limit)
+        if sample.outcome is Outcome.ERROR:
+            return limit
+
+        latency = sample.latency_seconds
+        if self._short_latency is None:
+            self._short_latency = self._long_latency = latency
+        else:
+            self._short_latency = 0.5 * self._short_latency + 0.5 * latency
+            self._long_latency = (1 - self._long_alpha) * self._long_latency + self._long_alpha * latency
+        # After a load drop the baseline would keep the limit inflated; let it decay toward recent latency
+        if self._long_latency > 2 * self._short_latency:
+            self._long_latency *= 0.95
+
+        if sample.in_flight * 2 < limit:
+            return limit
+
+        gradient = max(0.5, min(1.0, self._tolerance * self._long_latency / max(self._short_latency, 1e-9)))
+        estimate = limit * gradient + math.sqrt(limit)
+        # Every call of a round reports; spread the smoothed step over the round so the limit moves once per round
+        return limit + self._smoothing * (estimate - limit) / limit
+
+    def back_off(self, limit: float) -> float:
+        """
+        Compute the limit after the service signalled overload.
+
+        Args:
+            limit (float): The current limit.
+
+        Returns:
+            float: The reduced limit.
+        """
+        return limit * self._backoff_ratio
+
+
+class LimiterWindow(BaseModel):
+    """
+    Limiter activity over one time window: one point of the throughput and error-rate curves.
+
+    Attributes:
+        elapsed_seconds (float): End of the window, from the first recorded call.
+        limit (int): Concurrency limit at the end of the window.
+        max_in_flight (int): Most calls in flight at once.
+        max_waiting (int): Most calls queued for a slot at once.
+        completed (int): Calls finished in the window.
+        succeeded (int): Calls that succeeded.
+        throttled (int): Calls throttled or timed out.
+        errors (int): Calls that failed otherwise.
+        qps (float): Successful calls per second.
+        error_rate (float): Fraction of finished calls that failed, throttled included.
+        p50_latency_seconds (float): Median latency of the successful calls.
+        p95_latency_seconds (float): 95th percentile latency of the successful calls.
+    """
+
+    elapsed_seconds: float
+    limit: int
+    max_in_flight: int
+    max_waiting: int
+    completed: int
+    succeeded: int
+    throttled: int
+    errors: int
+    qps: float
+    error_rate: float
+    p50_latency_seconds: float
+    p95_latency_seconds: float
+
+
+class LimiterRecorder:
+    """
+    Records the limiter's throughput, error rate, latency and limit per time window.
+    """
+
+    def __init__(self, window_seconds: float = 1.0):
+        """
+        Initialize the recorder.
+
+        Args:
+            window_seconds (float): Length of a window.
+
+        Raises:
+            ValueError: If `window_seconds` is not positive.
+        """
+        if window_seconds <= 0:
+            raise ValueError("window_seconds must be > 0")
+
+        self._window_seconds = window_seconds
+        self._started_at: Optional[float] = None
+        self._windows: List[LimiterWindow] = []
+        self._reset_window(window_index=0)
+
+    def record(self, now: float, sample: LimitSample, limit: int, in_flight: int, waiting: int) -> None:
+        """
+        Record a finished call.
+
+        Args:
+            now (float): `monotonic()` time the call finished.
+            sample (LimitSample): The finished call.
+            limit (int): The limit after the call.
+            in_flight (int): Calls in flight after the call.
+            waiting (int): Calls queued for a slot.
+        """
+        if self._started_at is None:
+            self._started_at = now - sample.latency_seconds
+        window_index = int((now - self._started_at) // self._window_seconds)
+        if window_index > self._window_index:
+            self._flush()
+            self._reset_window(window_index=window_index)
+
+        self._limit = limit
+        self._max_in_flight = max(self._max_in_flight, in_flight + 1, sample.in_flight)
+        self._max_waiting = max(self._max_waiting, waiting)
+        if sample.outcome is Outcome.SUCCESS:
+            self._latencies.append(sample.latency_seconds)
+        elif sample.outcome is Outcome.THROTTLED:
+            self._throttled += 1
+        else:
+            self._errors += 1
+
+    @property
+    def windows(self) -> List[LimiterWindow]:
+        """
+        Returns the recorded windows, the current partial one included.
+
+        Returns:
+            List[LimiterWindow]: The windows, oldest first.
+        """
+        current = self._current_window()
+        return [*self._windows, current] if current is not None else list(self._windows)
+
+    def sustainable_qps(self, max_error_rate: float = 0.01) -> float:
+        """
+        Highest throughput of a full window whose error rate stayed within the bound.
+
+        Args:
+            max_error_rate (float): Highest acceptable error rate.
+
+        Returns:
+            float: Successful calls per second, or 0.0 if no full window qualifies.
+        """
+        return max((window.qps for window in self._windows if window.error_rate <= max_error_rate), default=0.0)
+
+    def summary(self, max_error_rate: float = 0.01) -> Dict[str, Any]:
+        """
+        Summarize the recorded curves.
+
+        Args:
+            max_error_rate (float): Highest error rate counted as sustainable.
+
+        Returns:
+            Dict[str, Any]: Totals, peak and sustainable QPS, and the final limit.
+        """
+        windows = self.windows
+        completed = sum(window.completed for window in windows)
+        failed = sum(window.throttled + window.errors for window in windows)
+        return {
+            "windows": len(windows),
+            "completed": completed,
+            "throttled": sum(window.throttled for window in windows),
+            "errors": sum(window.errors for window in windows),
+            "error_rate": failed / completed if completed else 0.0,
+            "peak_qps": max((window.qps for window in windows), default=0.0),
+            "sustainable_qps": self.sustainable_qps(max_error_rate=max_error_rate),
+            "final_limit": windows[-1].limit if windows else None,
+        }
+
+    def to_csv(self, path: Union[str, Path]) -> None:
+        """
+        Write the curves, one window per row.
+
+        Args:
+            path (Union[str, Path]): The CSV file, overwritten.
+        """
+        with open(path, "w", newline="", encoding="utf-8") as csv_file:
+            writer = csv.DictWriter(csv_file, fieldnames=list(LimiterWindow.model_fields))
+            writer.writeheader()
+            for window in self.windows:
+                writer.writerow(window.model_dump())
+
+    def _current_window(self) -> Optional[LimiterWindow]:
+        """
+        Build the window being recorded.
+
+        Returns:
+            Optional[LimiterWindow]: The window, or None if no call finished in it.
+        """
+        completed = len(self._latencies) + self._throttled + self._errors
+        if not completed:
+            return None
+
+        latencies = sorted(self._latencies)
+        elapsed = min((self._window_index + 1) * self._window_seconds, monotonic() - self._started_at)
+        window_length = elapsed - self._window_index * self._window_seconds
+        return LimiterWindow(
+            elapsed_seconds=elapsed,
+            limit=self._limit,
+            max_in_flight=self._max_in_flight,
+            max_waiting=self._max_waiting,
+            completed=completed,
+            succeeded=len(latencies),
+            throttled=self._throttled,
+            errors=self._errors,
+            qps=len(latencies) / window_length if window_length > 0 else 0.0,
+            error_rate=(self._throttled + self._errors) / completed,
+            p50_latency_seconds=latencies[len(latencies) // 2] if latencies else 0.0,
+            p95_latency_seconds=latencies[max(0, math.ceil(0.95 * len(latencies)) - 1)] if latencies else 0.0,
+        )
+
+    def _flush(self) -> None:
+        """
+        Close the current window.
+        """
+        window = self._current_window()
+        if window is not None:
+            self._windows.append(window)
+
+    def _reset_window(self, window_index: int) -> None:
+        """
+        Start an empty window.
+
+        Args:
+            window_index (int): Index of the window from the first recorded call.
+        """
+        self._window_index = window_index
+        self._limit = 0
+        self._max_in_flight = 0
+        self._max_waiting = 0
+        self._latencies: List[float] = []
+        self._throttled = 0
+        self._errors = 0
+
+
+class LimiterOverloadedError(Exception):
+    """
+    Raised instead of queueing a call when the limiter's queue is full.
+    """
+
+
+class _Permit:
+    """
+    A slot held by one call.
+    """
+
+    __slots__ = ("started_at", "in_flight")
+
+    def __init__(self, started_at: float, in_flight: int):
+        self.started_at = started_at
+        self.in_flight = in_flight
+
+
+class AdaptiveLimiter:
+    """
+    Bounds the calls in flight to a service, with a limit that a policy adapts to how the service responds.
+
+    Calls over the limit wait in FIFO order; with `max_waiting` set, calls beyond a full queue fail fast with
+    `LimiterOverloadedError`, which pushes back on the producer instead of growing the queue. A burst of throttled
+    responses backs the limit off once: throttling of calls that started before the last back-off is ignored, since
+    they were sent under the old limit.
+    """
+
+    def __init__(
+        self,
+        policy: Optional[ILimitPolicy] = None,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        max_waiting: Optional[int] = None,
+        recorder: Optional[LimiterRecorder] = None,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            policy (Optional[ILimitPolicy]): Adapts the limit. An AIMDPolicy if None.
+            initial_limit (int): Limit before any call finished.
+            min_limit (int): Lowest limit.
+            max_limit (int): Highest limit.
+            max_waiting (Optional[int]): Calls that may queue for a slot. Unbounded if None.
+            recorder (Optional[LimiterRecorder]): Records the throughput and error-rate curves.
+
+        Raises:
+            ValueError: If the limits are inconsistent.
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Limits must satisfy 1 <= min_limit <= initial_limit <= max_limit")
+
+        self.policy = policy or AIMDPolicy()
+        self.recorder = recorder
+        self._limit = float(initial_limit)
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._max_waiting = max_waiting
+        self._in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._last_back_off_at = float("-inf")
+
+    @property
+    def limit(self) -> int:
+        """
+        Returns the current concurrency limit.
+
+        Returns:
+            int: Calls allowed in flight at once.
+        """
+        return max(self._min_limit, int(self._limit))
+
+    @property
+    def in_flight(self) -> int:
+        """
+        Returns the calls holding a slot.
+
+        Returns:
+            int: Calls in flight.
+        """
+        return self._in_flight
+
+    @property
+    def waiting(self) -> int:
+        """
+        Returns the calls queued for a slot.
+
+        Returns:
+            int: Queued calls.
+        """
+        return len(self._waiters)
+
+    async def acquire(self) -> _Permit:
+        """
+        Wait for a slot.
+
+        Returns:
+            _Permit: The slot. Give it back with `release`.
+
+        Raises:
+            LimiterOverloadedError: If the queue is full.
+        """
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return _Permit(started_at=monotonic(), in_flight=self._in_flight)
+
+        if self._max_waiting is not None and len(self._waiters) >= self._max_waiting:
+            raise LimiterOverloadedError(f"{len(self._waiters)} calls are already waiting for one of {self.limit} slots")
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over as the wait was cancelled; pass it on
+                self._in_flight -= 1
+                self._wake()
+            else:
+                self._waiters.remove(waiter)
+            raise
+        return _Permit(started_at=monotonic(), in_flight=self._in_flight)
+
+    def release(self, permit: _Permit, outcome: Optional[Outcome]) -> None:
+        """
+        Give a slot back and adapt the limit to how its call ended.
+
+        Args:
+            permit (_Permit): The slot.
+            outcome (Optional[Outcome]): How the call ended. The limit is not adapted if None, e.g. when the call was
+                cancelled.
+        """
+        self._in_flight -= 1
+        if outcome is not None:
+            now = monotonic()
+            sample = LimitSample(latency_seconds=now - permit.started_at, outcome=outcome, in_flight=permit.in_flight)
+            if outcome is Outcome.THROTTLED:
+                if permit.started_at > self._last_back_off_at:
+                    self._limit = self.policy.back_off(limit=self._limit)
+                    self._last_back_off_at = now
+            else:
+                self._limit = self.policy.update(limit=self._limit, sample=sample)
+            self._limit = min(float(self._max_limit), max(float(self._min_limit), self._limit))
+
+            if self.recorder is not None:
+                self.recorder.record(now=now, sample=sample, limit=self.limit, in_flight=self._in_flight, waiting=len(self._waiters))
+        self._wake()
+
+    async def run(self, call: Callable[[], Awaitable[T]], max_retries: int = 3, retry_base_seconds: float = 0.5) -> T:
+        """
+        Run a call within the limit, retrying it after throttling.
+
+        Retries wait out the response's `Retry-After`, or an exponential backoff with jitter, without holding a slot.
+
+        Args:
+            call (Callable[[], Awaitable[T]]): Starts the call; invoked again for each retry.
+            max_retries (int): Retries after throttling before the error is raised.
+            retry_base_seconds (float): Delay before the first retry without `Retry-After`; doubled per retry.
+
+        Returns:
+            T: The call's result.
+
+        Raises:
+            LimiterOverloadedError: If the queue is full.
+            Exception: The call's error, once retries are used up or if it is not throttling.
+        """
+        attempt = 0
+        while True:
+            permit = await self.acquire()
+            try:
+                result = await call()
+            except asyncio.CancelledError:
+                self.release(permit=permit, outcome=None)
+                raise
+            except Exception as error:
+                throttled = is_throttling_error(error)
+                self.release(permit=permit, outcome=Outcome.THROTTLED if throttled else Outcome.ERROR)
+                if not throttled or attempt >= max_retries:
+                    raise
+                delay = retry_after_seconds(error)
+                if delay is None:
+                    delay = retry_base_seconds * 2**attempt * random.uniform(0.5, 1.0)
+                attempt += 1
+                await asyncio.sleep(delay)
+                continue
+
+            self.release(permit=permit, outcome=Outcome.SUCCESS)
+            return result
+
+    def _wake(self) -> None:
+        """
+        Hand free slots to the longest-waiting calls.
+        """
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
+
+
+class _SimulatedIndex:
+    """
+    Stand-in search service: latency grows with load past half its capacity, and calls over capacity get a 429.
+    """
+
+    def __init__(self, capacity: int, base_latency_seconds: float):
+        self._capacity = capacity
+        self._base_latency_seconds = base_latency_seconds
+        self._in_flight = 0
+
+    async def search(self) -> None:
+        self._in_flight += 1
+        try:
+            if self._in_flight > self._capacity:
+                await asyncio.sleep(self._base_latency_seconds / 10)
+                raise httpx.HTTPStatusError(
+                    "429 Too Many Requests", request=httpx.Request("POST", "https://search"), response=httpx.Response(429)
+                )
+            load = max(0.0, self._in_flight - self._capacity / 2) / self._capacity
+            await asyncio.sleep(self._base_latency_seconds * (1 + 2 * load) * random.uniform(0.8, 1.2))
+        finally:
+            self._in_flight -= 1
+
+
+async def _simulate(policy_name: str, requests: int, capacity: int, base_latency_seconds: float, csv_path: Optional[str]) -> None:
+    """
+    Drive the simulated index with every request issued at once, through the limiter or (policy "none") unbounded.
+
+    Args:
+        policy_name (str): "aimd", "gradient" or "none".
+        requests (int): Searches issued.
+        capacity (int): Concurrent searches the index accepts before throttling.
+        base_latency_seconds (float): Search latency at light load.
+        csv_path (Optional[str]): Where the curves are written.
+    """
+    index = _SimulatedIndex(capacity=capacity, base_latency_seconds=base_latency_seconds)
+    recorder = LimiterRecorder(window_seconds=max(0.25, base_latency_seconds * 5))
+    policies: Dict[str, ILimitPolicy] = {"aimd": AIMDPolicy(), "gradient": GradientPolicy()}
+    # With no policy the limit is pinned at the request count, i.e. every call is in flight at once
+    limiter = AdaptiveLimiter(
+        policy=policies.get(policy_name),
+        initial_limit=requests if policy_name == "none" else 4,
+        min_limit=requests if policy_name == "none" else 1,
+        max_limit=requests,
+        recorder=recorder,
+    )
+    retries = 0 if policy_name == "none" else 3
+
+    async def one() -> bool:
+        try:
+            await limiter.run(index.search, max_retries=retries, retry_base_seconds=base_latency_seconds)
+        except httpx.HTTPStatusError:
+            return False
+        return True
+
+    start = monotonic()
+    succeeded = sum(await asyncio.gather(*[one() for _ in range(requests)]))
+    wall_seconds = monotonic() - start
+
+    summary = recorder.summary()
+    print(f"policy={policy_name} capacity={capacity} requests={requests}")
+    print(f"  succeeded {succeeded}/{requests} in {wall_seconds:.2f}s ({succeeded / wall_seconds:.1f} searches/s end to end)")
+    print(
+        f"  calls {summary['completed']}, throttled {summary['throttled']}, error rate {summary['error_rate']:.1%}, "
+        f"peak {summary['peak_qps']:.1f} qps, sustainable {summary['sustainable_qps']:.1f} qps, final limit {summary['final_limit']}"
+    )
+    if csv_path:
+        recorder.to_csv(csv_path)
+        print(f"  curves written to {csv_path}")
+
+
+def main() -> None:
+    """
+    Parse arguments and run the limiter against a simulated index, to tune a policy offline.
+    """
+    parser = argparse.ArgumentParser(description="Run the adaptive limiter against a simulated, throttling search index.")
+    parser.add_argument("--policy", choices=["aimd", "gradient", "none"], default="aimd", help="Limit policy; none issues every call at once.")
+    parser.add_argument("--requests", type=int, default=1000, help="Searches issued.")
+    parser.add_argument("--capacity", type=int, default=16, help="Concurrent searches the index accepts before returning 429.")
+    parser.add_argument("--latency", type=float, default=0.05, help="Search latency at light load, in seconds.")
+    parser.add_argument("--csv", default=None, help="Write the throughput and error-rate curves to this CSV file.")
+    args = parser.parse_args()
+
+    asyncio.run(
+        _simulate(policy_name=args.policy, requests=args.requests, capacity=args.capacity, base_latency_seconds=args.latency, csv_path=args.csv)
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,46 @@
 import asyncio
-import random
-from collections import defaultdict
 from time import perf_counter
-from typing import Any, Dict
+from typing import Any, Dict, List
 
-import httpx
-
-# Configuration - Number of searches to run (randomly selected from available searches)
+# Configuration - Number of searches to run (selected from available searches with a fixed seed)
 NUM_SEARCHES_TO_RUN = 30  # Change this to test different loads (max 30)
+SEARCH_SEED = 42  # Same seed, same searches; see retrieval_benchmark.py for concurrency sweeps and percentiles
+NUM_SEARCH_ROUNDS = 1  # Repeat the selected searches to measure sustained throughput
+
+# Adaptive concurrency limiting of the AI Search calls
+LIMITER_POLICY = "aimd"  # "aimd", "gradient", or None to fire every search at once
+LIMITER_INITIAL_CONCURRENCY = 4
+LIMITER_MAX_CONCURRENCY = 30
+LIMITER_MAX_RETRIES = 3  # Retries of a throttled search, waiting out Retry-After or an exponential backoff
+LIMITER_WINDOW_SECONDS = 1.0
+LIMITER_CURVES_CSV = "ai_search_limiter_curves.csv"  # Throughput/error-rate curves per window; None to skip
+
+# Run the searches as one multi-query retrieval. Embeddings are batched across the searches in flight together, so
+# with LIMITER_POLICY = None all query texts are embedded in a single request.
+USE_BATCHED_RETRIEVAL = True
+
+# Query embeddings cached by model and normalized text; the directory keeps them across runs (None for memory only)
+EMBEDDING_CACHE_MAX_ENTRIES = 10_000
+EMBEDDING_CACHE_DIR = ".embedding_cache"
+
+# Cosmos DB hydration of the retrieved members
+HYDRATION_CHUNK_SIZE = 100  # Member names per IN query
+HYDRATION_MAX_CONCURRENCY = 8  # IN queries in flight at once, across partitions
+USE_MEMBER_STORE = True  # Hydrate through the local member store: members fetched once are served from memory
+
+# Dimensions, and the members of the member store, are read from a memory-mapped snapshot while it is valid and younger
+# than the maximum age; otherwise they are queried from Cosmos DB and the snapshot is rewritten. None to always query.
+DIMENSION_SNAPSHOT_PATH = "dimension_snapshot.bin"
+DIMENSION_SNAPSHOT_MAX_AGE_SECONDS = 24 * 60 * 60
+
+# Searches are filtered on the dimension types their target labels resolve to; when none matches, the fallback applies
+DIM_TYPE_FALLBACK_POLICY = "first_n"  # "first_n", "all", "none" (search unfiltered) or "raise"
+DIM_TYPE_FALLBACK_COUNT = 2
+
+# Search results are merged as each search completes: deduplicated by dimension type and name, ranked by reciprocal-rank
+# fusion, and only the best members per dimension type are hydrated
+MERGE_TOP_K_PER_DIM_TYPE = 200
+MERGE_RRF_K = 60
 
 from wernicke.config.env_config.constants import EnvVar
 from wernicke.engines.llm.llm_orchestrators.store.rubix.get_cell_orchestrator import (
@@ -23,13 +56,25 @@ from wernicke.engines.retrieval.retriever.initiative_retrievers.rubix_retriever
 from wernicke.managers.cosmos_database.azure_cosmos_manager import CosmosDatabaseManager
 from wernicke.tests.shared_utils.test_session import create_test_user_session
 
+from adaptive_limiter import AdaptiveLimiter, AIMDPolicy, GradientPolicy, LimiterRecorder
+from batched_retrieval import DimensionSearch, create_batching_http_client, retrieve_dimensions_members_batch_async
+from dim_type_router import DimTypeRouter, FallbackPolicy
+from dimension_snapshot import DimensionSnapshot, dim_type_decoder, stale_reason, write_snapshot
+from embedding_cache import EmbeddingCache
+from member_hydration import hydrate_dimension_members_async
+from member_store import DimensionMemberStore
+from result_merge import StreamingResultMerger
+from retrieval_benchmark import DIMENSION_SEARCHES, LatencyHistogram, select_searches
+
 
 async def exec():
     print("🚀 Starting AI Search Performance Test...")
     overall_start_time = perf_counter()
 
     user_session_info = create_test_user_session()
-    http_async_client = httpx.AsyncClient()
+    # Cached search texts skip the embedding call; the remaining concurrent embedding requests are coalesced into one
+    embedding_cache = EmbeddingCache(max_entries=EMBEDDING_CACHE_MAX_ENTRIES, directory=EMBEDDING_CACHE_DIR)
+    http_async_client, embedding_transport = create_batching_http_client(embedding_cache=embedding_cache)
 
     # Use async context manager for Cosmos DB to avoid asyncio.run() conflict
     cosmos_db_manager = CosmosDatabaseManager(user_session_info=user_session_info)
@@ -43,6 +88,7 @@ async def exec():
             user_session_info=user_session_info,
             database_connection=user_session_info.database_connection,
         )
+        member_store = DimensionMemberStore(rubix_manager=rubix_manager) if USE_MEMBER_STORE else None
 
         # Get environment variables with proper type checking
         search_index_name = user_session_info.environment_config_adapter.getenv(EnvVar.RUBIX_SEARCH_INDEX_NAME)
@@ -64,22 +110,45 @@ async def exec():
             index_config_file_name=index_config_file,
         )
 
-        # Get all available dimensions first
+        # Get all available dimensions first, from the snapshot if it can be used
         print("⏱️  Getting dimensions...")
         start_time = perf_counter()
-        dimensions = await rubix_manager.get_dimensions_async()
+        snapshot_stale_reason = stale_reason(DIMENSION_SNAPSHOT_PATH, DIMENSION_SNAPSHOT_MAX_AGE_SECONDS) if DIMENSION_SNAPSHOT_PATH else "disabled"
+        catalog_version = None
+        if snapshot_stale_reason is None:
+            decode_dim_type = dim_type_decoder()
+            with DimensionSnapshot(DIMENSION_SNAPSHOT_PATH) as snapshot:
+                dimensions = snapshot.dimensions()
+                if member_store is not None:
+                    for dim_type in snapshot.partitions():
+                        member_store.put(dim_type=decode_dim_type(dim_type), members=snapshot.members(dim_type))
+                print(f"📦 Dimension snapshot {snapshot.checksum[:16]}: {snapshot.dimension_count} dimensions, {snapshot.member_count} members")
+                catalog_version = snapshot.checksum
+            os_dim_types = list(set([decode_dim_type(dimension.related_dim_type) for dimension in dimensions]))
+        else:
+            print(f"📦 Dimension snapshot not used: {snapshot_stale_reason}")
+            dimensions = await rubix_manager.get_dimensions_async()
+            os_dim_types = list(set([dimension.related_dim_type for dimension in dimensions]))
         dimensions_time = perf_counter() - start_time
         performance_metrics["dimensions_query"] = dimensions_time
         print(f"Found {len(dimensions)} available dimensions (took {dimensions_time:.3f}s)")
 
         # Get the unique OS dimension types
-        os_dim_types = list(set([dimension.related_dim_type for dimension in dimensions]))
         print(f"Unique dimension types: {os_dim_types}")
 
         # Get the dimension names for each dimension
         dimension_names = [dim.name for dim in dimensions]
         print(f"Dimension names: {dimension_names[:10]}...")  # Show first 10
 
+        # Label to dimension type lookup, built once for this catalog
+        dim_type_router = DimTypeRouter(
+            dim_types=os_dim_types,
+            dimensions=dimensions,
+            version=catalog_version,
+            fallback_policy=FallbackPolicy(DIM_TYPE_FALLBACK_POLICY),
+            fallback_count=DIM_TYPE_FALLBACK_COUNT,
+        )
+
         # Create index manager and use it as an async context manager
         index_manager = IndexManagerFactory.get_index_manager(
             index_service=IndexService.AZURE_COGNITIVE_SEARCH,
@@ -110,304 +179,198 @@ async def exec():
             print(f"🔍 User Query: '{user_query}'")
             print(f"🎯 Unknown Object: '{unknown_object}'")
 
-            # Define all available dimension searches (30 total)
-            all_dimension_searches = [
-                # Revenue & Income Accounts
-                {
-                    "focus": "revenue accounts",
-                    "search_text": "revenue sales income",
-                    "target_dim_types": ["Account"],
-                    "description": "Finding revenue and sales accounts",
-                },
-                {
-                    "focus": "gross profit",
-                    "search_text": "gross profit margin",
-                    "target_dim_types": ["Account"],
-                    "description": "Finding gross profit accounts",
-                },
-                {
-                    "focus": "operating income",
-                    "search_text": "operating income EBITDA",
-                    "target_dim_types": ["Account"],
-                    "description": "Finding operating income accounts",
-                },
-                {
-                    "focus": "net income",
-                    "search_text": "net income earnings",
-                    "target_dim_types": ["Account"],
-                    "description": "Finding net income accounts",
-                },
-                # Expense & Cost Accounts
-                {
-                    "focus": "operating expenses",
-                    "search_text": "operating expenses OPEX",
-                    "target_dim_types": ["Account"],
-                    "description": "Finding operating expense accounts",
-                },
-                {
-                    "focus": "cost of goods sold",
-                    "search_text": "COGS cost of goods sold",
-                    "target_dim_types": ["Account"],
-                    "description": "Finding COGS accounts",
-                },
-                {
-                    "focus": "SG&A expenses",
-                    "search_text": "SGA selling general administrative",
-                    "target_dim_types": ["Account"],
-                    "description": "Finding SG&A expense accounts",
-                },
-                {
-                    "focus": "R&D expenses",
-                    "search_text": "research development RND",
-                    "target_dim_types": ["Account"],
-                    "description": "Finding R&D expense accounts",
-                },
-                # Balance Sheet Accounts
-                {
-                    "focus": "current assets",
-                    "search_text": "current assets cash inventory",
-                    "target_dim_types": ["Account"],
-                    "description": "Finding current asset accounts",
-                },
-                {
-                    "focus": "fixed assets",
-                    "search_text": "fixed assets PPE property plant equipment",
-                    "target_dim_types": ["Account"],
-                    "description": "Finding fixed asset accounts",
-                },
-                {
-                    "focus": "accounts receivable",
-                    "search_text": "accounts receivable AR",
-                    "target_dim_types": ["Account"],
-                    "description": "Finding receivables accounts",
-                },
-                {
-                    "focus": "accounts payable",
-                    "search_text": "accounts payable AP",
-                    "target_dim_types": ["Account"],
-                    "description": "Finding payables accounts",
-                },
-                {
-                    "focus": "long-term debt",
-                    "search_text": "long term debt liabilities",
-                    "target_dim_types": ["Account"],
-                    "description": "Finding long-term debt accounts",
-                },
-                {
-                    "focus": "shareholders equity",
-                    "search_text": "shareholders equity retained earnings",
-                    "target_dim_types": ["Account"],
-                    "description": "Finding equity accounts",
-                },
-                # Business Units & Entities
-                {
-                    "focus": "cost centers",
-                    "search_text": "cost centers departments",
-                    "target_dim_types": ["Entity"],
-                    "description": "Finding cost center entities",
-                },
-                {
-                    "focus": "profit centers",
-                    "search_text": "profit centers business units",
-                    "target_dim_types": ["Entity"],
-                    "description": "Finding profit center entities",
-                },
-                {
-                    "focus": "business divisions",
-                    "search_text": "business divisions segments",
-                    "target_dim_types": ["Entity"],
-                    "description": "Finding business division entities",
-                },
-                {
-                    "focus": "subsidiaries",
-                    "search_text": "subsidiaries affiliates",
-                    "target_dim_types": ["Entity"],
-                    "description": "Finding subsidiary entities",
-                },
-                {
-                    "focus": "geographic regions",
-                    "search_text": "geographic regions territories",
-                    "target_dim_types": ["Entity"],
-                    "description": "Finding geographic entities",
-                },
-                {
-                    "focus": "product lines",
-                    "search_text": "product lines business lines",
-                    "target_dim_types": ["Entity"],
-                    "description": "Finding product line entities",
-                },
-                {
-                    "focus": "sales channels",
-                    "search_text": "sales channels distribution",
-                    "target_dim_types": ["Entity"],
-                    "description": "Finding sales channel entities",
-                },
-                {
-                    "focus": "manufacturing plants",
-                    "search_text": "manufacturing plants facilities",
-                    "target_dim_types": ["Entity"],
-                    "description": "Finding manufacturing entities",
-                },
-                # Scenarios & Planning
-                {
-                    "focus": "actual results",
-                    "search_text": "actual results",
-                    "target_dim_types": ["Scenario"],
-                    "description": "Finding actual scenario types",
-                },
-                {
-                    "focus": "budget plan",
-                    "search_text": "budget plan annual",
-                    "target_dim_types": ["Scenario"],
-                    "description": "Finding budget scenarios",
-                },
-                {
-                    "focus": "forecast projection",
-                    "search_text": "forecast projection rolling",
-                    "target_dim_types": ["Scenario"],
-                    "description": "Finding forecast scenarios",
-                },
-                {
-                    "focus": "prior year",
-                    "search_text": "prior year PY",
-                    "target_dim_types": ["Scenario"],
-                    "description": "Finding prior year scenarios",
-                },
-                # Cash Flow & Working Capital
-                {
-                    "focus": "cash flow operations",
-                    "search_text": "cash flow operations CFO",
-                    "target_dim_types": ["Account"],
-                    "description": "Finding operating cash flow accounts",
-                },
-                {
-                    "focus": "working capital",
-                    "search_text": "working capital WC",
-                    "target_dim_types": ["Account"],
-                    "description": "Finding working capital accounts",
-                },
-                {
-                    "focus": "capital expenditures",
-                    "search_text": "capital expenditures CAPEX",
-                    "target_dim_types": ["Account"],
-                    "description": "Finding CAPEX accounts",
-                },
-                {
-                    "focus": "depreciation amortization",
-                    "search_text": "depreciation amortization DA",
-                    "target_dim_types": ["Account"],
-                    "description": "Finding depreciation accounts",
-                },
-            ]
-
-            # Randomly select the specified number of searches
+            # Select the specified number of searches, reproducibly for a given seed
+            all_dimension_searches = DIMENSION_SEARCHES
             if NUM_SEARCHES_TO_RUN > len(all_dimension_searches):
                 print(f"⚠️  Warning: NUM_SEARCHES_TO_RUN ({NUM_SEARCHES_TO_RUN}) exceeds available searches ({len(all_dimension_searches)})")
                 print(f"   Using all {len(all_dimension_searches)} available searches")
                 dimension_searches = all_dimension_searches
             else:
-                dimension_searches = random.sample(all_dimension_searches, NUM_SEARCHES_TO_RUN)
-                print(f"🎲 Randomly selected {NUM_SEARCHES_TO_RUN} searches from {len(all_dimension_searches)} available options")
+                dimension_searches = select_searches(all_dimension_searches, count=NUM_SEARCHES_TO_RUN, seed=SEARCH_SEED)
+                print(f"🎲 Selected {NUM_SEARCHES_TO_RUN} searches from {len(all_dimension_searches)} available options (seed {SEARCH_SEED})")
 
                 # Show which searches were selected
                 selected_focuses = [search["focus"] for search in dimension_searches]
                 print(f"🎯 Selected searches: {', '.join(selected_focuses[:5])}{'...' if len(selected_focuses) > 5 else ''}")
 
+            dimension_searches = dimension_searches * NUM_SEARCH_ROUNDS
+
             print(f"\n🚀 Breaking query into {len(dimension_searches)} parallel dimension searches...")
 
+            limiter_recorder = LimiterRecorder(window_seconds=LIMITER_WINDOW_SECONDS)
+            limiter = None
+            if LIMITER_POLICY:
+                limiter = AdaptiveLimiter(
+                    policy=GradientPolicy() if LIMITER_POLICY == "gradient" else AIMDPolicy(),
+                    initial_limit=min(LIMITER_INITIAL_CONCURRENCY, LIMITER_MAX_CONCURRENCY),
+                    max_limit=LIMITER_MAX_CONCURRENCY,
+                    recorder=limiter_recorder,
+                )
+                print(f"🚦 Adaptive limiter: {LIMITER_POLICY}, starting at {limiter.limit} concurrent searches (max {LIMITER_MAX_CONCURRENCY})")
+
+            result_merger = StreamingResultMerger(top_k_per_dim_type=MERGE_TOP_K_PER_DIM_TYPE, rrf_k=MERGE_RRF_K)
+
+            def get_target_types(search_info: Dict[str, Any]):
+                # Filter dimension types to focus on relevant ones for this search aspect
+                return dim_type_router.resolve(search_info["target_dim_types"])
+
+            # Search scores across every search, accumulated as results arrive so no search's members are kept
+            score_summary = {"count": 0, "total": 0.0, "min": float("inf"), "max": float("-inf"), "low": 0, "medium": 0, "high": 0}
+
+            def merge_search_results(search_info: Dict[str, Any], results: Any, execution_time: float, target_types: Any):
+                # Merge a search's members as it completes and keep only its counts and top matches
+                result_merger.add(results)
+                for member in results:
+                    score = getattr(member, "search_score", 0)
+                    if score > 0:
+                        score_summary["count"] += 1
+                        score_summary["total"] += score
+                        score_summary["min"] = min(score_summary["min"], score)
+                        score_summary["max"] = max(score_summary["max"], score)
+                        score_summary["low" if score < 0.5 else "medium" if score < 0.8 else "high"] += 1
+                return {
+                    "focus": search_info["focus"],
+                    "search_text": search_info["search_text"],
+                    "result_count": len(results),
+                    "top_matches": [(getattr(member, "dim_member_name", "N/A"), getattr(member, "search_score", 0)) for member in results[:3]],
+                    "execution_time": execution_time,
+                    "target_types": target_types,
+                    "success": True,
+                }
+
+            def failed_search(search_info: Dict[str, Any], error: BaseException, execution_time: float):
+                return {
+                    "focus": search_info["focus"],
+                    "search_text": search_info["search_text"],
+                    "result_count": 0,
+                    "top_matches": [],
+                    "execution_time": execution_time,
+                    "target_types": [],
+                    "success": False,
+                    "error": str(error),
+                    "error_type": type(error).__name__,
+                }
+
             # Create parallel search tasks for different aspects of the query
             async def search_dimension_focus(search_info: Dict[str, Any]):
                 focus_start_time = perf_counter()
                 print(f"  🔍 [{search_info['focus']}] Searching: '{search_info['search_text']}'")
 
                 try:
-                    # Filter dimension types to focus on relevant ones for this search aspect
-                    target_types = []
-                    for dim_type in os_dim_types:
-                        if any(target in str(dim_type).lower() for target in [t.lower() for t in search_info["target_dim_types"]]):
-                            target_types.append(dim_type)
-
-                    # If no specific matches, use all types (fallback)
-                    if not target_types:
-                        target_types = os_dim_types[:2]  # Use first 2 to limit results
-
-                    results = await rubix_retriever.retrieve_dimensions_members_async(
-                        search_text=search_info["search_text"],
-                        top_k=200,  # Smaller per-search to simulate real pattern
-                        dim_types=target_types,
-                        dim_names=dimension_names,
-                        use_access_groups=True,
-                    )
+                    target_types = get_target_types(search_info)
+
+                    def retrieve():
+                        return rubix_retriever.retrieve_dimensions_members_async(
+                            search_text=search_info["search_text"],
+                            top_k=200,  # Smaller per-search to simulate real pattern
+                            dim_types=target_types,
+                            dim_names=dimension_names,
+                            use_access_groups=True,
+                        )
+
+                    if limiter is not None:
+                        results = await limiter.run(retrieve, max_retries=LIMITER_MAX_RETRIES)
+                    else:
+                        results = await retrieve()
 
                     focus_time = perf_counter() - focus_start_time
                     print(f"  ✅ [{search_info['focus']}] Found {len(results)} results (took {focus_time:.3f}s)")
-
-                    return {
-                        "focus": search_info["focus"],
-                        "search_text": search_info["search_text"],
-                        "results": results,
-                        "execution_time": focus_time,
-                        "target_types": target_types,
-                        "success": True,
-                    }
+                    return merge_search_results(search_info, results, execution_time=focus_time, target_types=target_types)
 
                 except Exception as e:
                     focus_time = perf_counter() - focus_start_time
-                    error_type = type(e).__name__
-                    print(f"  ❌ [{search_info['focus']}] {error_type}: {str(e)} (took {focus_time:.3f}s)")
-
-                    return {
-                        "focus": search_info["focus"],
-                        "search_text": search_info["search_text"],
-                        "results": [],
-                        "execution_time": focus_time,
-                        "target_types": [],
-                        "success": False,
-                        "error": str(e),
-                        "error_type": error_type,
-                    }
+                    print(f"  ❌ [{search_info['focus']}] {type(e).__name__}: {str(e)} (took {focus_time:.3f}s)")
+                    return failed_search(search_info, e, execution_time=focus_time)
+
+            # Run every search in one multi-query retrieval, merging each search as it completes; each search's time runs
+            # from the start of the batch, which it starts with, to its own completion
+            async def search_dimensions_batched():
+                batch_start_time = perf_counter()
+                searches = [
+                    DimensionSearch(search_text=search_info["search_text"], dim_types=get_target_types(search_info), top_k=200)
+                    for search_info in dimension_searches
+                ]
+                results: List[Dict[str, Any]] = [{} for _ in searches]
+
+                def on_search_result(index: int, search_results: Any):
+                    search_info = dimension_searches[index]
+                    search_time = perf_counter() - batch_start_time
+                    if isinstance(search_results, Exception):
+                        print(f"  ❌ [{search_info['focus']}] {type(search_results).__name__}: {str(search_results)}")
+                        results[index] = failed_search(search_info, search_results, execution_time=search_time)
+                    else:
+                        print(f"  ✅ [{search_info['focus']}] Found {len(search_results)} results (took {search_time:.3f}s)")
+                        results[index] = merge_search_results(search_info, search_results, execution_time=search_time, target_types=searches[index].dim_types)
+
+                await retrieve_dimensions_members_batch_async(
+                    rubix_retriever=rubix_retriever,
+                    searches=searches,
+                    dim_names=dimension_names,
+                    use_access_groups=True,
+                    limiter=limiter,
+                    max_retries=LIMITER_MAX_RETRIES,
+                    return_exceptions=True,
+                    keep_results=False,
+                    on_result=on_search_result,
+                )
+                return results
 
             # Execute all dimension-focused searches in parallel
             print("⏱️  Executing parallel dimension searches...")
             parallel_start_time = perf_counter()
 
-            dimension_results = await asyncio.gather(*[search_dimension_focus(search_info) for search_info in dimension_searches])
+            if USE_BATCHED_RETRIEVAL:
+                dimension_results = await search_dimensions_batched()
+            else:
+                dimension_results = await asyncio.gather(*[search_dimension_focus(search_info) for search_info in dimension_searches])
 
             parallel_time = perf_counter() - parallel_start_time
             performance_metrics["ai_search_query"] = parallel_time
 
             print(f"\n🏁 All parallel dimension searches completed in {parallel_time:.3f}s")
 
-            # Combine and analyze results
-            all_retrieved_members = []
-            dimension_type_results = {}
+            embedding_stats = embedding_transport.stats
+            print(
+                f"🧮 Embedding requests: {embedding_stats.requests} made, {embedding_stats.batches} sent "
+                f"({embedding_stats.inputs} texts, {embedding_stats.round_trips_saved} round trips saved)"
+            )
+            cache_stats = embedding_cache.stats
+            print(
+                f"🗄️  Embedding cache: {cache_stats.hit_rate*100:.1f}% hit rate "
+                f"({cache_stats.memory_hits} memory, {cache_stats.disk_hits} disk, {cache_stats.misses} misses)"
+            )
+
+            if limiter is not None:
+                limiter_summary = limiter_recorder.summary()
+                print(f"\n🚦 ADAPTIVE LIMITER ({LIMITER_POLICY}):")
+                print(f"   Calls (retries included): {limiter_summary['completed']}")
+                print(f"   Throttled: {limiter_summary['throttled']}, other errors: {limiter_summary['errors']}")
+                print(f"   Error rate: {limiter_summary['error_rate']*100:.1f}%")
+                print(f"   Final concurrency limit: {limiter_summary['final_limit']}")
+                print(f"   Peak QPS: {limiter_summary['peak_qps']:.1f}")
+                print(f"   Sustainable QPS (windows with <=1% errors): {limiter_summary['sustainable_qps']:.1f}")
+                if LIMITER_CURVES_CSV:
+                    limiter_recorder.to_csv(LIMITER_CURVES_CSV)
+                    print(f"   Curves written to {LIMITER_CURVES_CSV}")
+
+            # Analyze results; the merger already combined them
+            merged_results = result_merger.result()
 
             print("\n📊 DIMENSION SEARCH RESULTS:")
             print("=" * 60)
 
             for result in dimension_results:
                 if result["success"]:
-                    all_retrieved_members.extend(result["results"])
-
                     print(f"🎯 {result['focus'].upper()}:")
                     print(f"   Search: '{result['search_text']}'")
                     print(f"   Target Types: {[str(t) for t in result['target_types']]}")
-                    print(f"   Results: {len(result['results'])}")
+                    print(f"   Results: {result['result_count']}")
                     print(f"   Time: {result['execution_time']:.3f}s")
 
-                    # Group by dimension type
-                    for member in result["results"]:
-                        dim_type = str(member.dim_type)
-                        if dim_type not in dimension_type_results:
-                            dimension_type_results[dim_type] = []
-                        dimension_type_results[dim_type].append(member)
-
                     # Show top results for this dimension focus
-                    if result["results"]:
+                    if result["top_matches"]:
                         print(f"   Top matches:")
-                        for i, member in enumerate(result["results"][:3]):
-                            score = getattr(member, "search_score", 0)
-                            name = getattr(member, "dim_member_name", "N/A")
+                        for i, (name, score) in enumerate(result["top_matches"]):
                             print(f"     {i+1}. {name} (score: {score:.3f})")
                     print()
                 else:
@@ -420,8 +383,12 @@ async def exec():
 
             print("=" * 60)
             print(f"📈 COMBINED RESULTS BY DIMENSION TYPE:")
-            for dim_type, members in dimension_type_results.items():
-                print(f"   {dim_type}: {len(members)} members")
+            print(
+                f"   {merged_results.received} received, {merged_results.unique} unique, {merged_results.duplicates} duplicates, "
+                f"{merged_results.evicted} pushed out of the top {MERGE_TOP_K_PER_DIM_TYPE}"
+            )
+            for dim_type, merged_members in merged_results.by_dim_type.items():
+                print(f"   {dim_type}: {len(merged_members)} members (best: {merged_members[0].name}, rrf {merged_members[0].rrf_score:.4f})")
 
             # STRESS TEST FAILURE ANALYSIS
             print(f"\n🚨 STRESS TEST FAILURE ANALYSIS:")
@@ -485,6 +452,13 @@ async def exec():
                 print(f"   Avg time: {sum(all_times)/len(all_times):.3f}s")
                 print(f"   Median time: {sorted(all_times)[len(all_times)//2]:.3f}s")
                 print(f"   Time range: {max(all_times) - min(all_times):.3f}s")
+                latency_histogram = LatencyHistogram()
+                for execution_time in all_times:
+                    latency_histogram.record_seconds(execution_time)
+                print(
+                    f"   p50 / p90 / p99: {latency_histogram.percentile(50) / 1e6:.3f}s / "
+                    f"{latency_histogram.percentile(90) / 1e6:.3f}s / {latency_histogram.percentile(99) / 1e6:.3f}s"
+                )
 
                 # Time distribution analysis
                 fast_queries = [t for t in all_times if t < 1.0]
@@ -496,7 +470,7 @@ async def exec():
                 print(f"   Slow queries (>3s): {len(slow_queries)} ({len(slow_queries)/len(all_times)*100:.1f}%)")
 
             # Results count metrics
-            all_result_counts = [len(r.get("results", [])) for r in successful_results]
+            all_result_counts = [r.get("result_count", 0) for r in successful_results]
 
             if all_result_counts:
                 print(f"\n📊 RESULTS COUNT METRICS:")
@@ -519,31 +493,19 @@ async def exec():
                 print(f"   Medium results (11-50): {len(medium_results)} queries ({len(medium_results)/len(all_result_counts)*100:.1f}%)")
                 print(f"   Many results (>50): {len(many_results)} queries ({len(many_results)/len(all_result_counts)*100:.1f}%)")
 
-            # Search score analysis (from successful results)
-            all_scores = []
-            for result in successful_results:
-                for member in result.get("results", []):
-                    score = getattr(member, "search_score", 0)
-                    if score > 0:
-                        all_scores.append(score)
-
-            if all_scores:
+            # Search score analysis (accumulated from successful results as they arrived)
+            scored = score_summary["count"]
+            if scored:
                 print(f"\n🎯 SEARCH SCORE METRICS:")
-                print(f"   Total scored results: {len(all_scores)}")
-                print(f"   Min score: {min(all_scores):.3f}")
-                print(f"   Max score: {max(all_scores):.3f}")
-                print(f"   Avg score: {sum(all_scores)/len(all_scores):.3f}")
-                print(f"   Median score: {sorted(all_scores)[len(all_scores)//2]:.3f}")
-                print(f"   Score range: {max(all_scores) - min(all_scores):.3f}")
-
-                # Score distribution analysis
-                low_scores = [s for s in all_scores if s < 0.5]
-                medium_scores = [s for s in all_scores if 0.5 <= s < 0.8]
-                high_scores = [s for s in all_scores if s >= 0.8]
-
-                print(f"   Low relevance (<0.5): {len(low_scores)} results ({len(low_scores)/len(all_scores)*100:.1f}%)")
-                print(f"   Medium relevance (0.5-0.8): {len(medium_scores)} results ({len(medium_scores)/len(all_scores)*100:.1f}%)")
-                print(f"   High relevance (>=0.8): {len(high_scores)} results ({len(high_scores)/len(all_scores)*100:.1f}%)")
+                print(f"   Total scored results: {scored}")
+                print(f"   Min score: {score_summary['min']:.3f}")
+                print(f"   Max score: {score_summary['max']:.3f}")
+                print(f"   Avg score: {score_summary['total']/scored:.3f}")
+                print(f"   Score range: {score_summary['max'] - score_summary['min']:.3f}")
+
+                print(f"   Low relevance (<0.5): {score_summary['low']} results ({score_summary['low']/scored*100:.1f}%)")
+                print(f"   Medium relevance (0.5-0.8): {score_summary['medium']} results ({score_summary['medium']/scored*100:.1f}%)")
+                print(f"   High relevance (>=0.8): {score_summary['high']} results ({score_summary['high']/scored*100:.1f}%)")
 
             # Efficiency metrics
             if successful_results:
@@ -551,7 +513,7 @@ async def exec():
                 efficiency_scores = []
                 for result in successful_results:
                     time = result.get("execution_time", 1)  # Avoid division by zero
-                    count = len(result.get("results", []))
+                    count = result.get("result_count", 0)
                     if time > 0:
                         efficiency = count / time  # results per second
                         efficiency_scores.append(efficiency)
@@ -585,8 +547,8 @@ async def exec():
                 if result["success"]:
                     successful_searches += 1
                     total_individual_time += result["execution_time"]
-                    efficiency = len(result["results"]) / result["execution_time"] if result["execution_time"] > 0 else 0
-                    print(f"🔍 {result['focus']}: {result['execution_time']:.3f}s → {len(result['results'])} results ({efficiency:.1f} results/sec)")
+                    efficiency = result["result_count"] / result["execution_time"] if result["execution_time"] > 0 else 0
+                    print(f"🔍 {result['focus']}: {result['execution_time']:.3f}s → {result['result_count']} results ({efficiency:.1f} results/sec)")
 
             if successful_searches > 0:
                 avg_search_time = total_individual_time / successful_searches
@@ -599,34 +561,39 @@ async def exec():
                 print(f"   Time saved: {time_saved:.3f}s ({efficiency_gain:.1f}% faster)")
                 print(f"   Average per search: {avg_search_time:.3f}s")
 
-            retrieved_dimension_members = all_retrieved_members
-            print(f"\n🎯 Total combined results: {len(retrieved_dimension_members)} members")
+            retrieved_dimension_members = merged_results.members
+            print(f"\n🎯 Total combined results: {len(retrieved_dimension_members)} members (from {merged_results.received} retrieved)")
             print(f"⚡ Parallel execution advantage: Searched {len(dimension_searches)} aspects simultaneously")
 
-            # Re-split by os_dim_type so that we can query cosmos across each dimension type (since db is partitioned by dimension type)
-            os_dim_type_to_members = defaultdict(list)
-            for retrieved_dim_member in retrieved_dimension_members:
-                os_dim_type_to_members[retrieved_dim_member.dim_type].append(retrieved_dim_member)
-
-            print(f"Grouped by dimension types: {list(os_dim_type_to_members.keys())}")
-
-            # Get the dimension members from the Rubix manager
+            # Hydrate from Cosmos DB, which is partitioned by dimension type: names are deduplicated per partition, split
+            # into bounded IN queries, and every partition is queried concurrently
             print("⏱️  Getting detailed dimension info from Cosmos DB...")
-            cosmos_start_time = perf_counter()
-            all_retrieved_dim_members = []
-
-            for dim_type, dim_members in os_dim_type_to_members.items():
-                print(f"  📊 Getting detailed info for {len(dim_members)} members of type {dim_type}")
-                dim_type_start_time = perf_counter()
-                dim_members_detailed = await rubix_manager.get_dim_members_async(
-                    dim_type=dim_type, dim_member_names=[dim_member.dim_member_name for dim_member in dim_members]
-                )
-                dim_type_time = perf_counter() - dim_type_start_time
-                print(f"    ✅ Got {len(dim_members_detailed)} detailed members (took {dim_type_time:.3f}s)")
-                all_retrieved_dim_members.extend(dim_members_detailed)
+            hydration = await hydrate_dimension_members_async(
+                rubix_manager=member_store or rubix_manager,
+                retrieved_members=retrieved_dimension_members,
+                chunk_size=HYDRATION_CHUNK_SIZE,
+                max_concurrency=HYDRATION_MAX_CONCURRENCY,
+            )
+            all_retrieved_dim_members = hydration.members
+            print(f"Grouped by dimension types: {list(hydration.by_dim_type.keys())}")
+            print(
+                f"  📊 {hydration.retrieved} retrieved members, {hydration.duplicates_removed} duplicates removed, "
+                f"{hydration.chunks} queries over {hydration.partitions} partitions"
+            )
+            for dim_type, dim_members_detailed in hydration.by_dim_type.items():
+                print(f"    ✅ Got {len(dim_members_detailed)} detailed members of type {dim_type}")
+            if hydration.missing:
+                print(f"    ⚠️  {len(hydration.missing)} retrieved members had no detailed record")
 
-            cosmos_time = perf_counter() - cosmos_start_time
+            cosmos_time = hydration.wall_seconds
             performance_metrics["cosmos_queries"] = cosmos_time
+            print(f"  🐢 Slowest partition: {hydration.slowest_partition_seconds:.3f}s")
+            if member_store is not None:
+                store_stats = member_store.stats
+                print(f"  🗄️  Member store: {store_stats.fetches} fetches, hit rate {store_stats.hit_rate:.1%}")
+            if DIMENSION_SNAPSHOT_PATH and snapshot_stale_reason is not None:
+                checksum = write_snapshot(DIMENSION_SNAPSHOT_PATH, dimensions=dimensions, members=member_store.members() if member_store else all_retrieved_dim_members)
+                print(f"  📦 Wrote dimension snapshot {checksum[:16]} to {DIMENSION_SNAPSHOT_PATH}")
             print(f"\n📋 Final results: {len(all_retrieved_dim_members)} detailed dimension members (Cosmos queries took {cosmos_time:.3f}s total)")
 
             # Print some results
@@ -657,15 +624,15 @@ async def exec():
             print(f"🐌 Slowest operation: {slowest_operation[0].replace('_', ' ').title()} ({slowest_operation[1]:.3f}s)")
 
             if parallel_time > 0:
-                throughput = len(retrieved_dimension_members) / parallel_time
+                throughput = merged_results.received / parallel_time
                 print(f"🚀 AI Search Throughput: {throughput:.1f} results/second")
-                print(f"📊 Retrieved {len(retrieved_dimension_members)} results, got {len(all_retrieved_dim_members)} detailed records")
+                print(f"📊 Retrieved {merged_results.received} results, kept {len(retrieved_dimension_members)}, got {len(all_retrieved_dim_members)} detailed records")
 
                 # Show individual search timings
                 print(f"🔍 Individual Search Timings:")
                 for result in dimension_results:
                     if isinstance(result, dict) and result["success"]:
-                        focus_throughput = len(result["results"]) / result["execution_time"] if result["execution_time"] > 0 else 0
+                        focus_throughput = result["result_count"] / result["execution_time"] if result["execution_time"] > 0 else 0
                         print(f"   {result['focus']}: {result['execution_time']:.3f}s ({focus_throughput:.1f} results/sec)")
 
     except Exception as e:
@@ -676,6 +643,7 @@ async def exec():
 
     finally:
         await http_async_client.aclose()
+        embedding_cache.close()
         # Clean up Cosmos DB connection manually since we're not using context manager
         try:
             if hasattr(cosmos_db_manager, "_cosmos_client_async"):
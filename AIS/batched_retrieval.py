@@ -0,0 +1,528 @@
+"""
+==============================================================================
+Name: batched_retrieval
+Author: AI Assistant
+Date: 10/17/2026
+Description: Multi-query dimension member retrieval. Concurrent embedding
+requests made through the retriever's HTTP client are coalesced into one
+request by an httpx transport, and many searches are run in one call with
+results returned per query.
+==============================================================================
+"""
+
+import argparse
+import asyncio
+import json
+from time import perf_counter
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Set, Tuple, Union
+
+import httpx
+from pydantic import BaseModel, ConfigDict, Field
+
+from adaptive_limiter import AdaptiveLimiter
+from embedding_cache import EmbeddingCache, EmbeddingCacheTransport
+
+# Request headers that identify the caller; requests are only combined when they match
+_IDENTITY_HEADERS = ("api-key", "authorization")
+# Headers describing the original body, which no longer apply to a rebuilt one
+_BODY_HEADERS = ("content-length", "content-encoding", "transfer-encoding")
+
+
+class EmbeddingBatchStats(BaseModel):
+    """
+    Counters of the embedding batching transport.
+
+    Attributes:
+        requests (int): Embedding requests received from the client.
+        inputs (int): Texts embedded.
+        batches (int): Embedding requests sent to the endpoint.
+        passthrough (int): Other requests forwarded unchanged.
+    """
+
+    requests: int = 0
+    inputs: int = 0
+    batches: int = 0
+    passthrough: int = 0
+
+    @property
+    def round_trips_saved(self) -> int:
+        """
+        Returns the embedding round trips avoided by batching.
+
+        Returns:
+            int: Requests received minus requests sent.
+        """
+        return self.requests - self.batches
+
+
+class _PendingBatch:
+    """
+    Embedding requests with the same endpoint, credentials and options, waiting to be sent together.
+    """
+
+    __slots__ = ("request", "body", "members", "size", "timer")
+
+    def __init__(self, request: httpx.Request, body: Dict[str, Any]):
+        self.request = request
+        self.body = body
+        self.members: List[Tuple[List[Any], asyncio.Future]] = []
+        self.size = 0
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+
+class EmbeddingBatchingTransport(httpx.AsyncBaseTransport):
+    """
+    httpx transport that coalesces concurrent OpenAI-style embedding requests into one.
+
+    A POST to a path ending in `/embeddings` is held for up to `max_wait_seconds`; every embedding request with the
+    same URL, credentials and options that arrives meanwhile joins it, and the combined `input` list is sent as one
+    request. The response's `data` is split back in order, with indexes renumbered, so each caller sees the response
+    to its own request. A failed batch returns its status and body to every caller. Everything else passes through.
+
+    Pass it to the `httpx.AsyncClient` used as the retriever's `embedding_http_async_client`; the retriever does not
+    need to change.
+    """
+
+    def __init__(
+        self,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        max_wait_seconds: float = 0.01,
+        max_batch_inputs: int = 256,
+        path_suffix: str = "/embeddings",
+    ):
+        """
+        Initialize the transport.
+
+        Args:
+            transport (Optional[httpx.AsyncBaseTransport]): Sends the requests. A pooled `httpx.AsyncHTTPTransport` if None.
+            max_wait_seconds (float): How long the first request of a batch waits for others to join.
+            max_batch_inputs (int): Texts per request sent; a full batch is sent without waiting. Azure OpenAI accepts
+                up to 2048.
+            path_suffix (str): URL path suffix of embedding requests.
+
+        Raises:
+            ValueError: If `max_wait_seconds` is negative or `max_batch_inputs` is less than 1.
+        """
+        if max_wait_seconds < 0:
+            raise ValueError("max_wait_seconds must be >= 0")
+        if max_batch_inputs < 1:
+            raise ValueError("max_batch_inputs must be >= 1")
+
+        self._transport = transport or httpx.AsyncHTTPTransport(limits=httpx.Limits(max_connections=100, max_keepalive_connections=20))
+        self._max_wait_seconds = max_wait_seconds
+        self._max_batch_inputs = max_batch_inputs
+        self._path_suffix = path_suffix
+        self._pending: Dict[Tuple[str, ...], _PendingBatch] = {}
+        # Batches being sent; holding their tasks keeps them from being garbage collected mid-request
+        self._tasks: Set[asyncio.Task] = set()
+        self._stats = EmbeddingBatchStats()
+
+    @property
+    def stats(self) -> EmbeddingBatchStats:
+        """
+        Returns the transport's counters.
+
+        Returns:
+            EmbeddingBatchStats: A snapshot of the counters.
+        """
+        return self._stats.model_copy()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """
+        Send a request, batching it with concurrent embedding requests.
+
+        Args:
+            request (httpx.Request): The request.
+
+        Returns:
+            httpx.Response: The response to this request.
+        """
+        body = await self._embedding_body(request=request)
+        if body is None:
+            self._stats.passthrough += 1
+            return await self._transport.handle_async_request(request)
+
+        inputs = body["input"] if isinstance(body["input"], list) else [body["input"]]
+        # Token-array inputs are lists of ints; a single one must not be split into separate inputs
+        if inputs and isinstance(inputs[0], int):
+            inputs = [inputs]
+        self._stats.requests += 1
+        self._stats.inputs += len(inputs)
+
+        options = {name: value for name, value in body.items() if name != "input"}
+        key = (str(request.url), *(request.headers.get(name, "") for name in _IDENTITY_HEADERS), json.dumps(options, sort_keys=True))
+        batch = self._pending.get(key)
+        if batch is not None and batch.size + len(inputs) > self._max_batch_inputs:
+            self._send(key=key)
+            batch = None
+        if batch is None:
+            batch = self._pending[key] = _PendingBatch(request=request, body=options)
+            batch.timer = asyncio.get_running_loop().call_later(self._max_wait_seconds, self._send, key)
+
+        future = asyncio.get_running_loop().create_future()
+        batch.members.append((inputs, future))
+        batch.size += len(inputs)
+        if batch.size >= self._max_batch_inputs:
+            self._send(key=key)
+
+        status_code, headers, content = await future
+        return httpx.Response(status_code=status_code, headers=headers, content=content, request=request)
+
+    async def aclose(self) -> None:
+        """
+        Cancel the batches waiting to be sent and those in flight, then close the underlying transport.
+        """
+        for batch in self._pending.values():
+            if batch.timer is not None:
+                batch.timer.cancel()
+            for _, future in batch.members:
+                future.cancel()
+        self._pending.clear()
+
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        await self._transport.aclose()
+
+    async def _embedding_body(self, request: httpx.Request) -> Optional[Dict[str, Any]]:
+        """
+        Parse the body of an embedding request.
+
+        Args:
+            request (httpx.Request): The request.
+
+        Returns:
+            Optional[Dict[str, Any]]: The JSON body, or None if the request is not a batchable embedding request.
+        """
+        if request.method != "POST" or not request.url.path.rstrip("/").endswith(self._path_suffix):
+            return None
+        try:
+            body = json.loads(await request.aread())
+        except (ValueError, UnicodeDecodeError):
+            return None
+        if not isinstance(body, dict) or "input" not in body:
+            return None
+        return body
+
+    def _send(self, key: Tuple[str, ...]) -> None:
+        """
+        Send a pending batch in the background.
+
+        Args:
+            key (Tuple[str, ...]): The batch key.
+        """
+        batch = self._pending.pop(key, None)
+        if batch is None:
+            return
+        if batch.timer is not None:
+            batch.timer.cancel()
+        task = asyncio.ensure_future(self._send_batch(batch=batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send_batch(self, batch: _PendingBatch) -> None:
+        """
+        Send a batch as one request and hand each member its part of the response.
+
+        A failed request fails every member with its error. If the send is cancelled, every member is cancelled and the
+        cancellation is re-raised, so no caller is left waiting.
+
+        Args:
+            batch (_PendingBatch): The batch.
+        """
+        self._stats.batches += 1
+        members = [(inputs, future) for inputs, future in batch.members if not future.done()]
+        if not members:
+            return
+
+        template = batch.request
+        content = json.dumps({**batch.body, "input": [text for inputs, _ in members for text in inputs]}).encode("utf-8")
+        headers = [(name, value) for name, value in template.headers.multi_items() if name.lower() not in _BODY_HEADERS]
+        request = httpx.Request(template.method, template.url, headers=headers, content=content, extensions=template.extensions)
+
+        try:
+            response = await self._transport.handle_async_request(request)
+            try:
+                response_content = await response.aread()
+            finally:
+                await response.aclose()
+        except BaseException as error:
+            for _, future in members:
+                if future.done():
+                    continue
+                if isinstance(error, Exception):
+                    future.set_exception(error)
+                else:
+                    future.cancel()
+            if not isinstance(error, Exception):
+                raise
+            return
+
+        response_headers = [(name, value) for name, value in response.headers.multi_items() if name.lower() not in _BODY_HEADERS]
+        parts = self._split(status_code=response.status_code, content=response_content, sizes=[len(inputs) for inputs, _ in members])
+        for (_, future), part in zip(members, parts):
+            if not future.done():
+                future.set_result((response.status_code, response_headers, part))
+
+    @staticmethod
+    def _split(status_code: int, content: bytes, sizes: List[int]) -> List[bytes]:
+        """
+        Split a batch response into the responses of its members.
+
+        Args:
+            status_code (int): Status of the batch response.
+            content (bytes): Body of the batch response.
+            sizes (List[int]): Inputs of each member, in batch order.
+
+        Returns:
+            List[bytes]: Each member's body. Every member gets the whole body if the batch failed.
+        """
+        if status_code != 200:
+            return [content] * len(sizes)
+        try:
+            body = json.loads(content)
+            data = sorted(body["data"], key=lambda item: item["index"])
+        except (ValueError, KeyError, TypeError):
+            return [content] * len(sizes)
+        if len(data) != sum(sizes):
+            return [content] * len(sizes)
+
+        usage = body.get("usage") or {}
+        total = sum(sizes)
+        parts = []
+        offset = 0
+        for size in sizes:
+            member_data = [{**item, "index": index} for index, item in enumerate(data[offset : offset + size])]
+            offset += size
+            # Token usage is reported per batch; attribute it by share of the inputs
+            member_usage = {name: value * size // total if isinstance(value, int) else value for name, value in usage.items()}
+            parts.append(json.dumps({**body, "data": member_data, "usage": member_usage}).encode("utf-8"))
+        return parts
+
+
+def create_batching_http_client(
+    max_wait_seconds: float = 0.01,
+    max_batch_inputs: int = 256,
+    max_connections: int = 100,
+    timeout_seconds: float = 30.0,
+    embedding_cache: Optional[EmbeddingCache] = None,
+) -> Tuple[httpx.AsyncClient, EmbeddingBatchingTransport]:
+    """
+    Build an HTTP client that batches embedding requests over a pooled connection.
+
+    With an embedding cache, cached texts are answered before batching, so only the misses are batched and sent.
+
+    Args:
+        max_wait_seconds (float): How long the first request of a batch waits for others to join.
+        max_batch_inputs (int): Texts per embedding request sent.
+        max_connections (int): Connections in the pool.
+        timeout_seconds (float): Read and write timeout of a request.
+        embedding_cache (Optional[EmbeddingCache]): Serves repeated texts without an embedding call. Not cached if None.
+
+    Returns:
+        Tuple[httpx.AsyncClient, EmbeddingBatchingTransport]: The client, and its transport for reading the batching
+            stats. Close the client when done.
+    """
+    transport = EmbeddingBatchingTransport(
+        transport=httpx.AsyncHTTPTransport(limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=min(20, max_connections))),
+        max_wait_seconds=max_wait_seconds,
+        max_batch_inputs=max_batch_inputs,
+    )
+    client_transport = EmbeddingCacheTransport(cache=embedding_cache, transport=transport) if embedding_cache is not None else transport
+    client = httpx.AsyncClient(transport=client_transport, timeout=httpx.Timeout(timeout_seconds, connect=10.0))
+    return client, transport
+
+
+class DimensionSearch(BaseModel):
+    """
+    One query of a multi-query retrieval.
+
+    Attributes:
+        search_text (str): The text to search for.
+        dim_types (List[Any]): Dimension types to search.
+        dim_names (Optional[List[str]]): Dimension names to search. The batch's shared names if None.
+        top_k (int): Members to return.
+    """
+
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    search_text: str
+    dim_types: List[Any] = Field(default_factory=list)
+    dim_names: Optional[List[str]] = None
+    top_k: int = 200
+
+    def key(self) -> Tuple[Any, ...]:
+        """
+        Identify the query, so identical queries in a deduplicated batch run once.
+
+        Returns:
+            Tuple[Any, ...]: The search text, sorted filters and top_k.
+        """
+        dim_names = tuple(sorted(self.dim_names)) if self.dim_names is not None else None
+        return self.search_text, tuple(sorted(str(dim_type) for dim_type in self.dim_types)), dim_names, self.top_k
+
+
+async def retrieve_dimensions_members_batch_async(
+    rubix_retriever: Any,
+    searches: Sequence[Union[str, DimensionSearch]],
+    dim_types: Optional[List[Any]] = None,
+    dim_names: Optional[List[str]] = None,
+    top_k: int = 200,
+    use_access_groups: bool = True,
+    limiter: Optional[AdaptiveLimiter] = None,
+    max_retries: int = 3,
+    return_exceptions: bool = False,
+    deduplicate: bool = False,
+    on_result: Optional[Callable[[int, Union[List[Any], BaseException]], None]] = None,
+    keep_results: bool = True,
+) -> List[Optional[Union[List[Any], BaseException]]]:
+    """
+    Run many dimension member searches in one call, with results returned per query.
+
+    All searches start together, so with the retriever's embedding client built by `create_batching_http_client` their
+    query embeddings go out as one request instead of one per search. Every search runs, so repeating searches measures
+    repeated load; with `deduplicate`, identical searches run once and share the result.
+
+    If a search fails without `return_exceptions`, or the call is cancelled, the searches still running are cancelled
+    and awaited before this returns, so they release their limiter slots and `on_result` is not called again.
+
+    Args:
+        rubix_retriever (RubixRetriever): The retriever.
+        searches (Sequence[Union[str, DimensionSearch]]): The searches; a plain string uses the shared filters.
+        dim_types (Optional[List[Any]]): Dimension types of searches given as strings.
+        dim_names (Optional[List[str]]): Dimension names of searches that set none.
+        top_k (int): Members per search given as a string.
+        use_access_groups (bool): Filter members by the user's access groups.
+        limiter (Optional[AdaptiveLimiter]): Bounds the searches in flight. Embeddings are only batched across searches
+            in flight together, so a low limit means smaller batches.
+        max_retries (int): Retries of a throttled search, with a limiter.
+        return_exceptions (bool): Return a failed search's exception in its place instead of raising it.
+        deduplicate (bool): Run identical searches once.
+        on_result (Optional[Callable[[int, Union[List[Any], BaseException]], None]]): Called with the index of each search
+            and its members as soon as it completes, or its exception with `return_exceptions`.
+        keep_results (bool): Hold every search's members until the batch returns. With False, members are only passed
+            to `on_result`, so a consumer merging them as they arrive does not hold them all at once.
+
+    Returns:
+        List[Optional[Union[List[Any], BaseException]]]: The members found by each search, in the order of `searches`,
+            or None in place of a successful search's members without `keep_results`.
+    """
+    queries = [
+        search if isinstance(search, DimensionSearch) else DimensionSearch(search_text=search, dim_types=dim_types or [], top_k=top_k)
+        for search in searches
+    ]
+    groups: Dict[Hashable, List[int]] = {}
+    for index, query in enumerate(queries):
+        groups.setdefault(query.key() if deduplicate else index, []).append(index)
+    results: List[Optional[Union[List[Any], BaseException]]] = [None for _ in queries]
+
+    async def retrieve(indices: List[int]) -> None:
+        query = queries[indices[0]]
+
+        def call():
+            return rubix_retriever.retrieve_dimensions_members_async(
+                search_text=query.search_text,
+                top_k=query.top_k,
+                dim_types=query.dim_types,
+                dim_names=query.dim_names if query.dim_names is not None else dim_names,
+                use_access_groups=use_access_groups,
+            )
+
+        try:
+            result = await (limiter.run(call, max_retries=max_retries) if limiter is not None else call())
+        except Exception as error:
+            if not return_exceptions:
+                raise
+            result = error
+        for index in indices:
+            if keep_results or isinstance(result, BaseException):
+                results[index] = result
+            if on_result is not None:
+                on_result(index, result)
+
+    tasks = [asyncio.ensure_future(retrieve(indices)) for indices in groups.values()]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        pending = [task for task in tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+    return results
+
+
+class _SimulatedRetriever:
+    """
+    Stand-in retriever: embeds the search text through its HTTP client, then waits for a simulated index query.
+    """
+
+    def __init__(self, http_client: httpx.AsyncClient, search_latency_seconds: float):
+        self._http_client = http_client
+        self._search_latency_seconds = search_latency_seconds
+
+    async def retrieve_dimensions_members_async(self, search_text: str, top_k: int, dim_types, dim_names, use_access_groups: bool) -> List[str]:
+        response = await self._http_client.post("https://embeddings.local/openai/deployments/embed/embeddings", json={"input": [search_text]})
+        response.raise_for_status()
+        await asyncio.sleep(self._search_latency_seconds)
+        return [f"{search_text} member {index}" for index in range(min(top_k, 3))]
+
+
+async def _simulate(searches: int, embedding_latency_seconds: float, search_latency_seconds: float, batched: bool) -> None:
+    """
+    Compare embedding round trips and wall time of a multi-query retrieval with and without batching.
+
+    Args:
+        searches (int): Searches in the batch.
+        embedding_latency_seconds (float): Latency of one embedding request.
+        search_latency_seconds (float): Latency of one index query.
+        batched (bool): Batch the embedding requests.
+    """
+    endpoint_requests = 0
+
+    async def embeddings_endpoint(request: httpx.Request) -> httpx.Response:
+        nonlocal endpoint_requests
+        endpoint_requests += 1
+        await asyncio.sleep(embedding_latency_seconds)
+        inputs = json.loads(request.content)["input"]
+        data = [{"object": "embedding", "index": index, "embedding": [float(len(text))]} for index, text in enumerate(inputs)]
+        return httpx.Response(200, json={"object": "list", "data": data, "usage": {"prompt_tokens": len(inputs), "total_tokens": len(inputs)}})
+
+    endpoint = httpx.MockTransport(embeddings_endpoint)
+    transport = EmbeddingBatchingTransport(transport=endpoint) if batched else endpoint
+    async with httpx.AsyncClient(transport=transport) as http_client:
+        retriever = _SimulatedRetriever(http_client=http_client, search_latency_seconds=search_latency_seconds)
+        start = perf_counter()
+        results = await retrieve_dimensions_members_batch_async(
+            rubix_retriever=retriever, searches=[f"search {index}" for index in range(searches)], dim_types=["Account"]
+        )
+        wall_seconds = perf_counter() - start
+
+    print(f"batched={batched}: {len(results)} searches, {endpoint_requests} embedding requests, {wall_seconds * 1000:.1f}ms")
+
+
+def main() -> None:
+    """
+    Parse arguments and run the simulation.
+    """
+    parser = argparse.ArgumentParser(description="Compare embedding round trips of a multi-query retrieval with and without batching.")
+    parser.add_argument("--searches", type=int, default=30, help="Searches in the batch.")
+    parser.add_argument("--embedding-latency", type=float, default=0.05, help="Latency of one embedding request, in seconds.")
+    parser.add_argument("--search-latency", type=float, default=0.1, help="Latency of one index query, in seconds.")
+    args = parser.parse_args()
+
+    for batched in (False, True):
+        asyncio.run(
+            _simulate(
+                searches=args.searches,
+                embedding_latency_seconds=args.embedding_latency,
+                search_latency_seconds=args.search_latency,
+                batched=batched,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,306 @@
+"""
+==============================================================================
+Name: dim_type_router
+Author: AI Assistant
+Date: 10/17/2026
+Description: Resolution of user-facing dimension labels to the dimension
+types searches are filtered on: a normalized label lookup precomputed once
+per catalog version, memoized resolution of label sets, and an explicit,
+configurable fallback when no label matches.
+==============================================================================
+"""
+
+import argparse
+import random
+from enum import Enum
+from time import perf_counter
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+from pydantic import BaseModel
+
+
+class FallbackPolicy(str, Enum):
+    """
+    What a resolution returns when none of its labels matches a dimension type.
+    """
+
+    FIRST_N = "first_n"  # The first `fallback_count` dimension types of the catalog
+    ALL = "all"  # Every dimension type of the catalog
+    NONE = "none"  # No dimension type: the caller skips the search
+    RAISE = "raise"  # Raise UnresolvedDimTypeError
+
+
+class UnresolvedDimTypeError(LookupError):
+    """
+    Raised by the RAISE fallback policy when no label matches a dimension type.
+    """
+
+
+class RouterStats(BaseModel):
+    """
+    Counters of a router.
+
+    Attributes:
+        resolutions (int): Calls to `resolve`.
+        memo_hits (int): Resolutions answered from the memo.
+        fallbacks (int): Resolutions that no label matched, memoized ones included.
+        rebuilds (int): Lookups built, one per catalog version.
+    """
+
+    resolutions: int = 0
+    memo_hits: int = 0
+    fallbacks: int = 0
+    rebuilds: int = 0
+
+
+def normalize_label(label: Any) -> str:
+    """
+    Normalize a dimension label or dimension type for matching: enums by value, case-folded, whitespace collapsed.
+
+    Args:
+        label (Any): The label or dimension type.
+
+    Returns:
+        str: The normalized label.
+    """
+    text = label.value if isinstance(label, Enum) else label
+    return " ".join(str(text).casefold().split())
+
+
+class DimTypeRouter:
+    """
+    Resolves the labels of a search ("Account", "UD1", a dimension name) to the dimension types to filter it on.
+
+    A label matches a dimension type when it is contained in one of the dimension type's keys: its string, its enum
+    name and value, and the names of its dimensions. The keys of every dimension type are indexed once per catalog
+    version, every exact key is resolved in O(1), other labels are resolved by one scan and memoized, and so is every
+    set of labels. Dimension types are returned in catalog order: sorted by their string, so the fallback is stable.
+    """
+
+    def __init__(
+        self,
+        dim_types: Iterable[Hashable],
+        dimensions: Iterable[Any] = (),
+        version: Optional[Hashable] = None,
+        fallback_policy: FallbackPolicy = FallbackPolicy.FIRST_N,
+        fallback_count: int = 2,
+    ):
+        """
+        Initialize the router and build its lookup.
+
+        Args:
+            dim_types (Iterable[Hashable]): The dimension types of the catalog.
+            dimensions (Iterable[Any]): Dimensions with `name` and `related_dim_type`, whose names become labels.
+            version (Optional[Hashable]): Version of the catalog, e.g. a snapshot checksum.
+            fallback_policy (FallbackPolicy): What to return when no label matches.
+            fallback_count (int): Dimension types returned by the FIRST_N fallback.
+
+        Raises:
+            ValueError: If `fallback_count` is less than 1.
+        """
+        if fallback_count < 1:
+            raise ValueError("fallback_count must be >= 1")
+        self.fallback_policy = fallback_policy
+        self.fallback_count = fallback_count
+        self._stats = RouterStats()
+        self.version: Optional[Hashable] = None
+        self.rebuild(dim_types=dim_types, dimensions=dimensions, version=version)
+
+    @property
+    def stats(self) -> RouterStats:
+        """
+        Returns the router's counters.
+
+        Returns:
+            RouterStats: A snapshot of the counters.
+        """
+        return self._stats.model_copy()
+
+    @property
+    def dim_types(self) -> Tuple[Hashable, ...]:
+        """
+        Returns the dimension types of the catalog.
+
+        Returns:
+            Tuple[Hashable, ...]: The dimension types, in catalog order.
+        """
+        return self._dim_types
+
+    def rebuild(self, dim_types: Iterable[Hashable], dimensions: Iterable[Any] = (), version: Optional[Hashable] = None) -> bool:
+        """
+        Rebuild the lookup for a catalog version, unless it is the current one.
+
+        Args:
+            dim_types (Iterable[Hashable]): The dimension types of the catalog.
+            dimensions (Iterable[Any]): Dimensions with `name` and `related_dim_type`.
+            version (Optional[Hashable]): Version of the catalog. Always rebuilt if None.
+
+        Returns:
+            bool: Whether the lookup was rebuilt.
+        """
+        if version is not None and version == self.version:
+            return False
+
+        self._dim_types: Tuple[Hashable, ...] = tuple(sorted(dict.fromkeys(dim_types), key=str))
+        by_normalized = {normalize_label(dim_type): dim_type for dim_type in self._dim_types}
+        keys: Dict[Hashable, set] = {dim_type: {normalize_label(str(dim_type)), normalize_label(dim_type)} for dim_type in self._dim_types}
+        for dim_type in self._dim_types:
+            if isinstance(dim_type, Enum):
+                keys[dim_type].add(normalize_label(dim_type.name))
+        for dimension in dimensions:
+            dim_type = by_normalized.get(normalize_label(dimension.related_dim_type))
+            if dim_type is not None:
+                keys[dim_type].add(normalize_label(dimension.name))
+
+        # Every key resolves to the dimension types it is contained in, in catalog order
+        self._keys = keys
+        self._labels: Dict[str, Tuple[Hashable, ...]] = {}
+        for key in {key for dim_type_keys in keys.values() for key in dim_type_keys}:
+            self._labels[key] = self._scan(key)
+        self._memo: Dict[Tuple[Any, ...], Tuple[Tuple[Hashable, ...], bool]] = {}
+        self.version = version
+        self._stats.rebuilds += 1
+        return True
+
+    def resolve_label(self, label: Any) -> Tuple[Hashable, ...]:
+        """
+        Resolve one label, without fallback.
+
+        Args:
+            label (Any): The label.
+
+        Returns:
+            Tuple[Hashable, ...]: The dimension types it matches, in catalog order.
+        """
+        normalized = normalize_label(label)
+        dim_types = self._labels.get(normalized)
+        if dim_types is None:
+            dim_types = self._labels[normalized] = self._scan(normalized)
+        return dim_types
+
+    def resolve(self, labels: Sequence[Any]) -> List[Hashable]:
+        """
+        Resolve the labels of a search to the dimension types to filter it on.
+
+        Args:
+            labels (Sequence[Any]): The labels.
+
+        Returns:
+            List[Hashable]: The dimension types any label matches, in catalog order, or the fallback if none does.
+
+        Raises:
+            UnresolvedDimTypeError: If no label matches and the fallback policy is RAISE.
+        """
+        self._stats.resolutions += 1
+        key = tuple(labels)
+        memoized = self._memo.get(key)
+        if memoized is None:
+            matched = {dim_type for label in key for dim_type in self.resolve_label(label)}
+            memoized = self._memo[key] = (tuple(dim_type for dim_type in self._dim_types if dim_type in matched), not matched)
+        else:
+            self._stats.memo_hits += 1
+
+        dim_types, unmatched = memoized
+        if not unmatched:
+            return list(dim_types)
+        self._stats.fallbacks += 1
+        return self._fallback(labels=labels)
+
+    def _fallback(self, labels: Sequence[Any]) -> List[Hashable]:
+        """
+        Apply the fallback policy.
+
+        Args:
+            labels (Sequence[Any]): The labels no dimension type matched.
+
+        Returns:
+            List[Hashable]: The fallback dimension types.
+
+        Raises:
+            UnresolvedDimTypeError: If the fallback policy is RAISE.
+        """
+        if self.fallback_policy == FallbackPolicy.FIRST_N:
+            return list(self._dim_types[: self.fallback_count])
+        if self.fallback_policy == FallbackPolicy.ALL:
+            return list(self._dim_types)
+        if self.fallback_policy == FallbackPolicy.NONE:
+            return []
+        raise UnresolvedDimTypeError(f"No dimension type matches {list(labels)}; known types: {[normalize_label(dim_type) for dim_type in self._dim_types]}")
+
+    def _scan(self, label: str) -> Tuple[Hashable, ...]:
+        """
+        Find the dimension types with a key containing a normalized label.
+
+        Args:
+            label (str): The normalized label.
+
+        Returns:
+            Tuple[Hashable, ...]: The matching dimension types, in catalog order.
+        """
+        if not label:
+            return ()
+        return tuple(dim_type for dim_type in self._dim_types if any(label in key for key in self._keys[dim_type]))
+
+
+class _SimulatedDimType(str, Enum):
+    ACCOUNT = "Account"
+    ENTITY = "Entity"
+    FLOW = "Flow"
+    SCENARIO = "Scenario"
+    TIME = "Time"
+    UD1 = "UD1"
+    UD2 = "UD2"
+    UD3 = "UD3"
+
+
+class _SimulatedDimension(BaseModel):
+    name: str
+    related_dim_type: str
+
+
+def main() -> None:
+    """
+    Parse arguments and compare resolving search labels by scanning with resolving them through the router.
+    """
+    parser = argparse.ArgumentParser(description="Compare the per-search dimension type scan with the router.")
+    parser.add_argument("--searches", type=int, default=100_000, help="Searches to resolve.")
+    parser.add_argument("--policy", choices=[policy.value for policy in FallbackPolicy], default=FallbackPolicy.FIRST_N.value, help="Fallback policy.")
+    args = parser.parse_args()
+
+    dim_types = list(_SimulatedDimType)
+    dimensions = [_SimulatedDimension(name=f"{dim_type.value}Dim{index}", related_dim_type=dim_type.value) for dim_type in dim_types for index in range(3)]
+    rng = random.Random(0)
+    label_sets = [["Account"], ["Entity"], ["Account", "Flow"], ["UD"], ["Product"], ["time"], ["EntityDim1"]]
+    searches = [rng.choice(label_sets) for _ in range(args.searches)]
+
+    start = perf_counter()
+    scanned = []
+    for labels in searches:
+        target_types = [dim_type for dim_type in dim_types if any(target in str(dim_type).lower() for target in [label.lower() for label in labels])]
+        scanned.append(target_types or dim_types[:2])
+    scan_seconds = perf_counter() - start
+
+    router = DimTypeRouter(dim_types=dim_types, dimensions=dimensions, version="v1", fallback_policy=FallbackPolicy(args.policy))
+    start = perf_counter()
+    routed = []
+    for labels in searches:
+        try:
+            routed.append(router.resolve(labels))
+        except UnresolvedDimTypeError:
+            routed.append(None)
+    route_seconds = perf_counter() - start
+
+    print(f"{args.searches} searches over {len(dim_types)} dimension types")
+    print(f"  scan:   {scan_seconds / args.searches * 1e6:6.2f}us per search")
+    print(f"  router: {route_seconds / args.searches * 1e6:6.2f}us per search ({router.stats.memo_hits} memo hits, {router.stats.fallbacks} fallbacks)")
+    for labels in label_sets:
+        try:
+            resolved = [dim_type.value for dim_type in router.resolve(labels)]
+        except UnresolvedDimTypeError as error:
+            resolved = f"error: {error}"
+        print(f"    {labels} -> {resolved}")
+    print(f"  rebuilt for the same version: {router.rebuild(dim_types=dim_types, dimensions=dimensions, version='v1')}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,676 @@
+"""
+==============================================================================
+Name: dimension_snapshot
+Author: AI Assistant
+Date: 10/17/2026
+Description: Binary snapshot of dimensions and dimension members: a columnar
+layout over an interned string table, opened with mmap so workers load it
+in near-zero time and share its pages, guarded by a content checksum, and
+rebuilt from Cosmos DB by the refresh command.
+==============================================================================
+"""
+
+import argparse
+import asyncio
+import json
+import mmap
+import os
+import sys
+from array import array
+from enum import Enum
+from hashlib import blake2b
+from pathlib import Path
+from struct import Struct
+from time import perf_counter, time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from pydantic import BaseModel, Field
+
+MAGIC = b"DIMSNAP\x00"
+FORMAT_VERSION = 1
+
+# magic, format version, section count, strings, dimensions, members, partitions, created at, body size, checksum
+_HEADER = Struct("<8sHHIIIIdQ32s")
+# offset, length in bytes
+_SECTION = Struct("<QQ")
+_ALIGNMENT = 8
+# String index of a missing value
+_NONE = 0xFFFFFFFF
+# Member ID of a member without one
+_NO_MEMBER_ID = -(2**63)
+
+# Every column is an array of uint32 string indexes or offsets, unless listed in _FORMATS. A partition is a
+# (dimension type, first member, end member) triple: members are sorted by dimension type, then name.
+_SECTIONS = (
+    "string_offsets",
+    "string_data",
+    "dimension_names",
+    "dimension_types",
+    "partitions",
+    "member_names",
+    "member_descriptions",
+    "member_ids",
+    "member_parents",
+    "member_dimension_offsets",
+    "member_dimension_values",
+    "member_children_offsets",
+    "member_children_values",
+)
+_FORMATS = {"string_data": "B", "member_ids": "q"}
+
+
+class SnapshotError(ValueError):
+    """
+    Raised when a file is not a readable snapshot, or its checksum does not match its content.
+    """
+
+
+class SnapshotDimension(BaseModel):
+    """
+    Dimension of a snapshot.
+
+    Attributes:
+        name (str): Dimension name.
+        related_dim_type (str): Value of the dimension type.
+    """
+
+    name: str
+    related_dim_type: str
+
+
+class SnapshotMember(BaseModel):
+    """
+    Dimension member of a snapshot, with the fields of the Cosmos DB member records.
+
+    Attributes:
+        name (str): Member name.
+        description (Optional[str]): Member description.
+        member_id (Optional[int]): OneStream member ID.
+        dim_type (str): Value of the dimension type.
+        dimensions (List[str]): Names of the dimensions the member belongs to.
+        parent_hierarchy (str): Name of the parent, empty for a root.
+        children (List[str]): Names of the children, in hierarchy order.
+    """
+
+    name: str
+    description: Optional[str] = None
+    member_id: Optional[int] = None
+    dim_type: str
+    dimensions: List[str] = Field(default_factory=list)
+    parent_hierarchy: str = ""
+    children: List[str] = Field(default_factory=list)
+
+
+def _text(value: Any) -> str:
+    """
+    Convert a field to the string stored in the snapshot: enums by value.
+
+    Args:
+        value (Any): The field value.
+
+    Returns:
+        str: The stored string.
+    """
+    return str(value.value) if isinstance(value, Enum) else str(value)
+
+
+class _StringTable:
+    """
+    Interned strings of a snapshot being encoded.
+    """
+
+    def __init__(self):
+        self.indexes: Dict[str, int] = {}
+        self.strings: List[str] = []
+
+    def intern(self, value: Any) -> int:
+        if value is None:
+            return _NONE
+        text = _text(value)
+        index = self.indexes.get(text)
+        if index is None:
+            index = self.indexes[text] = len(self.strings)
+            self.strings.append(text)
+        return index
+
+
+def encode_snapshot(dimensions: Iterable[Any], members: Iterable[Any], created_at: Optional[float] = None) -> bytes:
+    """
+    Encode dimensions and members as a snapshot.
+
+    The encoding only depends on the content: dimensions are sorted by name, members by dimension type and name, and
+    the last of several members with the same key is kept, so equal catalogs encode to equal checksums.
+
+    Args:
+        dimensions (Iterable[Any]): Objects with `name` and `related_dim_type`.
+        members (Iterable[Any]): Objects with `name` and `dim_type`, and optionally `description`, `member_id`,
+            `dimensions`, `parent_hierarchy` and `children`.
+        created_at (Optional[float]): Creation time in the header, as a Unix timestamp. Now if None.
+
+    Returns:
+        bytes: The snapshot file content.
+    """
+    if sys.byteorder != "little":
+        raise SnapshotError("Snapshots are little-endian; this platform is not")
+
+    strings = _StringTable()
+    columns: Dict[str, array] = {name: array(_FORMATS.get(name, "I")) for name in _SECTIONS}
+
+    for name, dim_type in sorted({(_text(dimension.name), _text(dimension.related_dim_type)) for dimension in dimensions}):
+        columns["dimension_names"].append(strings.intern(name))
+        columns["dimension_types"].append(strings.intern(dim_type))
+
+    rows = {(_text(member.dim_type), _text(member.name)): member for member in members}
+    columns["member_dimension_offsets"].append(0)
+    columns["member_children_offsets"].append(0)
+    partition: Optional[str] = None
+    for index, ((dim_type, name), member) in enumerate(sorted(rows.items(), key=lambda row: row[0])):
+        if dim_type != partition:
+            if partition is not None:
+                columns["partitions"].append(index)
+            columns["partitions"].extend((strings.intern(dim_type), index))
+            partition = dim_type
+        columns["member_names"].append(strings.intern(name))
+        columns["member_descriptions"].append(strings.intern(getattr(member, "description", None)))
+        member_id = getattr(member, "member_id", None)
+        columns["member_ids"].append(_NO_MEMBER_ID if member_id is None else int(member_id))
+        columns["member_parents"].append(strings.intern(getattr(member, "parent_hierarchy", None) or None))
+        columns["member_dimension_values"].extend(strings.intern(value) for value in getattr(member, "dimensions", None) or [])
+        columns["member_dimension_offsets"].append(len(columns["member_dimension_values"]))
+        columns["member_children_values"].extend(strings.intern(value) for value in getattr(member, "children", None) or [])
+        columns["member_children_offsets"].append(len(columns["member_children_values"]))
+    if partition is not None:
+        columns["partitions"].append(len(rows))
+
+    encoded = [text.encode("utf-8") for text in strings.strings]
+    columns["string_offsets"].append(0)
+    for value in encoded:
+        columns["string_offsets"].append(columns["string_offsets"][-1] + len(value))
+    columns["string_data"] = array("B", b"".join(encoded))
+
+    # Sections start on aligned offsets after the header and the section table
+    table_end = _HEADER.size + _SECTION.size * len(_SECTIONS)
+    offset = table_end
+    table = bytearray()
+    payloads = []
+    for name in _SECTIONS:
+        offset += -offset % _ALIGNMENT
+        payload = columns[name].tobytes()
+        table += _SECTION.pack(offset, len(payload))
+        payloads.append((offset, payload))
+        offset += len(payload)
+
+    body = bytearray(table)
+    for start, payload in payloads:
+        body += bytes(start - _HEADER.size - len(body))
+        body += payload
+
+    header = _HEADER.pack(
+        MAGIC,
+        FORMAT_VERSION,
+        len(_SECTIONS),
+        len(strings.strings),
+        len(columns["dimension_names"]),
+        len(rows),
+        len(columns["partitions"]) // 3,
+        time() if created_at is None else created_at,
+        len(body),
+        blake2b(body, digest_size=32).digest(),
+    )
+    return header + bytes(body)
+
+
+def write_snapshot(path: Union[str, Path], dimensions: Iterable[Any], members: Iterable[Any] = ()) -> str:
+    """
+    Write a snapshot, replacing the file atomically: workers that mapped the previous file keep reading it.
+
+    Args:
+        path (Union[str, Path]): The snapshot file.
+        dimensions (Iterable[Any]): Objects with `name` and `related_dim_type`.
+        members (Iterable[Any]): Dimension members. See `encode_snapshot`.
+
+    Returns:
+        str: The checksum of the snapshot, in hex.
+    """
+    path = Path(path)
+    content = encode_snapshot(dimensions=dimensions, members=members)
+    temporary = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(temporary, "wb") as file:
+        file.write(content)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temporary, path)
+    return _HEADER.unpack_from(content)[-1].hex()
+
+
+class DimensionSnapshot:
+    """
+    Read-only view of a snapshot file through mmap.
+
+    Opening maps the file and reads the header and section table; columns are views on the mapping, and strings are
+    decoded on first use. The mapping is shared by every process that opens the same file.
+    """
+
+    def __init__(self, path: Union[str, Path], verify: bool = False):
+        """
+        Map a snapshot file.
+
+        Args:
+            path (Union[str, Path]): The snapshot file.
+            verify (bool): Check the content against the checksum, which reads the whole file.
+
+        Raises:
+            SnapshotError: If the file is not a snapshot of this format, is truncated, or fails verification.
+        """
+        self.path = Path(path)
+        with open(self.path, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            if size < _HEADER.size:
+                raise SnapshotError(f"{self.path} is too small to be a snapshot")
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            magic, version, section_count, string_count, dimension_count, member_count, partition_count, created_at, body_size, checksum = (
+                _HEADER.unpack_from(self._mmap)
+            )
+            if magic != MAGIC or version != FORMAT_VERSION or section_count != len(_SECTIONS):
+                raise SnapshotError(f"{self.path} is not a version {FORMAT_VERSION} snapshot")
+            if _HEADER.size + body_size != size:
+                raise SnapshotError(f"{self.path} is truncated or has trailing data")
+
+            self.created_at: float = created_at
+            self.checksum: str = checksum.hex()
+            self.string_count: int = string_count
+            self.dimension_count: int = dimension_count
+            self.member_count: int = member_count
+            self.partition_count: int = partition_count
+
+            self._view = memoryview(self._mmap)
+            self._columns: Dict[str, memoryview] = {}
+            for index, name in enumerate(_SECTIONS):
+                offset, length = _SECTION.unpack_from(self._mmap, _HEADER.size + index * _SECTION.size)
+                if offset + length > size:
+                    raise SnapshotError(f"{self.path}: section {name} is out of bounds")
+                self._columns[name] = self._view[offset : offset + length].cast(_FORMATS.get(name, "I"))
+            if verify and not self.verify():
+                raise SnapshotError(f"{self.path}: checksum mismatch")
+        except BaseException:
+            self.close()
+            raise
+
+        self._strings: List[Optional[str]] = [None] * string_count
+        self._partitions: Optional[Dict[str, Tuple[int, int]]] = None
+
+    def __enter__(self) -> "DimensionSnapshot":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Release the column views and unmap the file.
+        """
+        for column in getattr(self, "_columns", {}).values():
+            column.release()
+        self._columns = {}
+        if getattr(self, "_view", None) is not None:
+            self._view.release()
+            self._view = None
+        if not self._mmap.closed:
+            self._mmap.close()
+
+    def verify(self) -> bool:
+        """
+        Check the content against the checksum in the header.
+
+        Returns:
+            bool: Whether the content matches.
+        """
+        return blake2b(self._view[_HEADER.size :], digest_size=32).hexdigest() == self.checksum
+
+    def string(self, index: int) -> Optional[str]:
+        """
+        Read an interned string.
+
+        Args:
+            index (int): String index.
+
+        Returns:
+            Optional[str]: The string, or None for a missing value.
+        """
+        if index == _NONE:
+            return None
+        text = self._strings[index]
+        if text is None:
+            offsets = self._columns["string_offsets"]
+            text = self._strings[index] = str(self._columns["string_data"][offsets[index] : offsets[index + 1]], "utf-8")
+        return text
+
+    def dimensions(self) -> List[SnapshotDimension]:
+        """
+        Read the dimensions, sorted by name.
+
+        Returns:
+            List[SnapshotDimension]: The dimensions.
+        """
+        names, dim_types = self._columns["dimension_names"], self._columns["dimension_types"]
+        return [SnapshotDimension.model_construct(name=self.string(names[index]), related_dim_type=self.string(dim_types[index])) for index in range(self.dimension_count)]
+
+    def dim_types(self) -> List[str]:
+        """
+        Read the dimension types of the dimensions.
+
+        Returns:
+            List[str]: The unique dimension types, in the order of first use.
+        """
+        return list(dict.fromkeys(self.string(index) for index in self._columns["dimension_types"]))
+
+    def dimension_names(self) -> List[str]:
+        """
+        Read the dimension names.
+
+        Returns:
+            List[str]: The names, sorted.
+        """
+        return [self.string(index) for index in self._columns["dimension_names"]]
+
+    def partitions(self) -> Dict[str, Tuple[int, int]]:
+        """
+        Read the member partitions.
+
+        Returns:
+            Dict[str, Tuple[int, int]]: The first and end member index per dimension type.
+        """
+        if self._partitions is None:
+            column = self._columns["partitions"]
+            self._partitions = {self.string(column[index]): (column[index + 1], column[index + 2]) for index in range(0, len(column), 3)}
+        return self._partitions
+
+    def member(self, index: int, dim_type: Optional[str] = None) -> SnapshotMember:
+        """
+        Decode a member.
+
+        Args:
+            index (int): Member index.
+            dim_type (Optional[str]): Its dimension type, looked up if None.
+
+        Returns:
+            SnapshotMember: The member.
+        """
+        if dim_type is None:
+            dim_type = next(key for key, (start, end) in self.partitions().items() if start <= index < end)
+        columns, string = self._columns, self.string
+        member_id = columns["member_ids"][index]
+        dimension_offsets, children_offsets = columns["member_dimension_offsets"], columns["member_children_offsets"]
+        return SnapshotMember.model_construct(
+            name=string(columns["member_names"][index]),
+            description=string(columns["member_descriptions"][index]),
+            member_id=None if member_id == _NO_MEMBER_ID else member_id,
+            dim_type=dim_type,
+            dimensions=[string(value) for value in columns["member_dimension_values"][dimension_offsets[index] : dimension_offsets[index + 1]]],
+            parent_hierarchy=string(columns["member_parents"][index]) or "",
+            children=[string(value) for value in columns["member_children_values"][children_offsets[index] : children_offsets[index + 1]]],
+        )
+
+    def members(self, dim_type: Any) -> List[SnapshotMember]:
+        """
+        Decode the members of a dimension type.
+
+        Args:
+            dim_type (Any): The dimension type, or its value.
+
+        Returns:
+            List[SnapshotMember]: The members, sorted by name.
+        """
+        dim_type = _text(dim_type)
+        start, end = self.partitions().get(dim_type, (0, 0))
+        return [self.member(index, dim_type=dim_type) for index in range(start, end)]
+
+    def member_names(self, dim_type: Any) -> List[str]:
+        """
+        Read the member names of a dimension type, without decoding the members.
+
+        Args:
+            dim_type (Any): The dimension type, or its value.
+
+        Returns:
+            List[str]: The names, sorted.
+        """
+        start, end = self.partitions().get(_text(dim_type), (0, 0))
+        return [self.string(index) for index in self._columns["member_names"][start:end]]
+
+    def find_member(self, dim_type: Any, name: str) -> Optional[SnapshotMember]:
+        """
+        Look up a member by binary search over its partition, decoding only the member found.
+
+        Args:
+            dim_type (Any): The dimension type, or its value.
+            name (str): The member name.
+
+        Returns:
+            Optional[SnapshotMember]: The member, or None if the snapshot has none by that name.
+        """
+        dim_type = _text(dim_type)
+        low, high = self.partitions().get(dim_type, (0, 0))
+        # UTF-8 bytes sort like the code points the members were sorted by
+        target = name.encode("utf-8")
+        names, offsets, data = self._columns["member_names"], self._columns["string_offsets"], self._columns["string_data"]
+        while low < high:
+            middle = (low + high) // 2
+            index = names[middle]
+            value = data[offsets[index] : offsets[index + 1]].tobytes()
+            if value == target:
+                return self.member(middle, dim_type=dim_type)
+            if value < target:
+                low = middle + 1
+            else:
+                high = middle
+        return None
+
+
+def stale_reason(path: Union[str, Path], max_age_seconds: Optional[float] = None) -> Optional[str]:
+    """
+    Check whether a snapshot can be used.
+
+    Args:
+        path (Union[str, Path]): The snapshot file.
+        max_age_seconds (Optional[float]): Maximum age of the snapshot. Any age if None.
+
+    Returns:
+        Optional[str]: Why the snapshot cannot be used, or None if it can.
+    """
+    if not Path(path).exists():
+        return "no snapshot"
+    try:
+        with DimensionSnapshot(path, verify=True) as snapshot:
+            age = time() - snapshot.created_at
+    except SnapshotError as error:
+        return str(error)
+    if max_age_seconds is not None and age > max_age_seconds:
+        return f"snapshot is {age / 3600:.1f}h old"
+    return None
+
+
+def dim_type_decoder() -> Callable[[str], Any]:
+    """
+    Map stored dimension type values back to the OneStream dimension type enums.
+
+    Returns:
+        Callable[[str], Any]: Returns the enum member of a value, or the value if no enum has it.
+    """
+    from wernicke.engines.llm.auxillary.tools.wernicke_tools.models import CoreOneStreamDimType, ExtendedOneStreamDimType
+
+    dim_types = {_text(dim_type): dim_type for dim_type in [*CoreOneStreamDimType, *ExtendedOneStreamDimType]}
+    return lambda value: dim_types.get(value, value)
+
+
+async def _refresh(path: Path, member_names_file: Optional[Path], check: bool) -> int:
+    """
+    Rebuild a snapshot from Cosmos DB: every dimension, and the members of the current snapshot and of a names file.
+
+    Args:
+        path (Path): The snapshot file.
+        member_names_file (Optional[Path]): JSON object of member names per dimension type value, to add.
+        check (bool): Only compare Cosmos DB with the snapshot, without writing.
+
+    Returns:
+        int: The exit code: 1 if checking found the snapshot stale, else 0.
+    """
+    from wernicke.engines.processing.onestream_metadata.manager import RubixDimensionManager
+    from wernicke.managers.cosmos_database.azure_cosmos_manager import CosmosDatabaseManager
+    from wernicke.tests.shared_utils.test_session import create_test_user_session
+
+    from member_hydration import hydrate_dimension_members_async
+
+    names: Dict[str, Dict[str, None]] = {}
+    if path.exists():
+        with DimensionSnapshot(path) as snapshot:
+            for dim_type in snapshot.partitions():
+                names.setdefault(dim_type, {}).update(dict.fromkeys(snapshot.member_names(dim_type)))
+    if member_names_file is not None:
+        for dim_type, dim_member_names in json.loads(member_names_file.read_text()).items():
+            names.setdefault(dim_type, {}).update(dict.fromkeys(dim_member_names))
+
+    user_session_info = create_test_user_session()
+    cosmos_db_manager = CosmosDatabaseManager(user_session_info=user_session_info)
+    user_session_info.database_connection = cosmos_db_manager
+    try:
+        rubix_manager = RubixDimensionManager(user_session_info=user_session_info, database_connection=user_session_info.database_connection)
+        start = perf_counter()
+        dimensions = await rubix_manager.get_dimensions_async()
+        decode = dim_type_decoder()
+        hydration = await hydrate_dimension_members_async(
+            rubix_manager=rubix_manager,
+            retrieved_members=[(decode(dim_type), name) for dim_type, dim_member_names in names.items() for name in dim_member_names],
+            dim_type_of=lambda pair: pair[0],
+            name_of=lambda pair: pair[1],
+        )
+        print(f"Read {len(dimensions)} dimensions and {len(hydration.members)} members from Cosmos DB in {perf_counter() - start:.3f}s")
+        if hydration.missing:
+            print(f"  {len(hydration.missing)} members no longer exist")
+    finally:
+        cosmos_client = getattr(cosmos_db_manager, "_cosmos_client_async", None)
+        if cosmos_client:
+            await cosmos_client.close()
+
+    content = encode_snapshot(dimensions=dimensions, members=hydration.members)
+    checksum = _HEADER.unpack_from(content)[-1].hex()
+    if check:
+        current = None
+        if path.exists():
+            with DimensionSnapshot(path) as snapshot:
+                current = snapshot.checksum
+        print(f"{path}: {'up to date' if current == checksum else 'stale'} (Cosmos DB {checksum[:16]}, snapshot {(current or 'none')[:16]})")
+        return 0 if current == checksum else 1
+
+    write_snapshot(path=path, dimensions=dimensions, members=hydration.members)
+    print(f"Wrote {path} ({path.stat().st_size / 1024:.1f} KiB, checksum {checksum[:16]})")
+    return 0
+
+
+def _inspect(path: Path) -> None:
+    """
+    Print the header and partitions of a snapshot, and verify it.
+
+    Args:
+        path (Path): The snapshot file.
+    """
+    start = perf_counter()
+    with DimensionSnapshot(path) as snapshot:
+        open_seconds = perf_counter() - start
+        print(f"{path}: {path.stat().st_size / 1024:.1f} KiB, opened in {open_seconds * 1e6:.0f}us")
+        print(f"  created {time() - snapshot.created_at:.0f}s ago, checksum {snapshot.checksum[:16]} ({'valid' if snapshot.verify() else 'MISMATCH'})")
+        print(f"  {snapshot.dimension_count} dimensions, {snapshot.member_count} members, {snapshot.string_count} unique strings")
+        for dim_type, (first, end) in snapshot.partitions().items():
+            print(f"    {dim_type}: {end - first} members")
+
+
+def _simulate(members_per_dim_type: int, dim_types: int, path: Path) -> None:
+    """
+    Compare loading a generated catalog from JSON and from a snapshot.
+
+    Args:
+        members_per_dim_type (int): Members per dimension type.
+        dim_types (int): Dimension types.
+        path (Path): Where to write the snapshot.
+    """
+    dimensions = [SnapshotDimension(name=f"Dimension{index}", related_dim_type=f"DimType{index % dim_types}") for index in range(dim_types * 3)]
+    members = [
+        SnapshotMember(
+            name=f"{dim_type}_{index}",
+            description=f"Member {index} of {dim_type}",
+            member_id=type_index * members_per_dim_type + index,
+            dim_type=dim_type,
+            dimensions=[f"Dimension{type_index}"],
+            parent_hierarchy=f"{dim_type}_{(index - 1) // 10}" if index else "",
+            children=[f"{dim_type}_{child}" for child in range(index * 10 + 1, min(index * 10 + 11, members_per_dim_type))],
+        )
+        for type_index, dim_type in enumerate(f"DimType{index}" for index in range(dim_types))
+        for index in range(members_per_dim_type)
+    ]
+
+    json_path = path.with_suffix(".json")
+    json_path.write_text(json.dumps({"dimensions": [d.model_dump() for d in dimensions], "members": [m.model_dump() for m in members]}))
+    start = perf_counter()
+    write_snapshot(path=path, dimensions=dimensions, members=members)
+    write_seconds = perf_counter() - start
+
+    start = perf_counter()
+    loaded = json.loads(json_path.read_text())
+    json_seconds = perf_counter() - start
+
+    start = perf_counter()
+    with DimensionSnapshot(path) as snapshot:
+        open_seconds = perf_counter() - start
+        start = perf_counter()
+        dim_type_values, dimension_names = snapshot.dim_types(), snapshot.dimension_names()
+        dimensions_seconds = perf_counter() - start
+        start = perf_counter()
+        found = snapshot.find_member("DimType1", f"DimType1_{members_per_dim_type // 2}")
+        find_seconds = perf_counter() - start
+        start = perf_counter()
+        decoded = snapshot.members("DimType0")
+        decode_seconds = perf_counter() - start
+        start = perf_counter()
+        valid = snapshot.verify()
+        verify_seconds = perf_counter() - start
+
+    print(f"{len(members)} members over {dim_types} dimension types")
+    print(f"  JSON:     {json_path.stat().st_size / 1024:9.1f} KiB, parsed in {json_seconds * 1000:8.2f}ms ({len(loaded['members'])} members)")
+    print(f"  snapshot: {path.stat().st_size / 1024:9.1f} KiB, written in {write_seconds * 1000:.0f}ms, opened in {open_seconds * 1000:8.3f}ms")
+    print(f"    dimension types and names: {dimensions_seconds * 1e6:8.1f}us ({len(dim_type_values)} types, {len(dimension_names)} names)")
+    print(f"    find one member:           {find_seconds * 1e6:8.1f}us ({found.name if found else None}, {len(found.children) if found else 0} children)")
+    print(f"    decode one partition:      {decode_seconds * 1000:8.2f}ms ({len(decoded)} members)")
+    print(f"    verify checksum:           {verify_seconds * 1000:8.2f}ms ({'valid' if valid else 'MISMATCH'})")
+    json_path.unlink()
+
+
+def main() -> None:
+    """
+    Parse arguments and run a command.
+    """
+    parser = argparse.ArgumentParser(description="Build, check and inspect dimension snapshots.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    refresh = commands.add_parser("refresh", help="Rebuild a snapshot from Cosmos DB.")
+    refresh.add_argument("--path", type=Path, default=Path("dimension_snapshot.bin"), help="Snapshot file.")
+    refresh.add_argument("--member-names", type=Path, help="JSON object of member names per dimension type to add.")
+    refresh.add_argument("--check", action="store_true", help="Only report whether the snapshot matches Cosmos DB.")
+    inspect = commands.add_parser("inspect", help="Print and verify a snapshot.")
+    inspect.add_argument("--path", type=Path, default=Path("dimension_snapshot.bin"), help="Snapshot file.")
+    simulate = commands.add_parser("simulate", help="Compare a generated snapshot with JSON.")
+    simulate.add_argument("--members", type=int, default=50_000, help="Members per dimension type.")
+    simulate.add_argument("--dim-types", type=int, default=4, help="Dimension types.")
+    simulate.add_argument("--path", type=Path, default=Path("simulated_snapshot.bin"), help="Snapshot file to write.")
+    args = parser.parse_args()
+
+    if args.command == "refresh":
+        sys.exit(asyncio.run(_refresh(path=args.path, member_names_file=args.member_names, check=args.check)))
+    elif args.command == "inspect":
+        _inspect(path=args.path)
+    else:
+        _simulate(members_per_dim_type=args.members, dim_types=args.dim_types, path=args.path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,574 @@
+"""
+==============================================================================
+Name: embedding_cache
+Author: AI Assistant
+Date: 10/17/2026
+Description: Content-addressed cache of query embeddings keyed by model name
+and normalized text: an in-memory LRU in front of an optional memory-mapped
+float32 store on disk, served to the retriever by an httpx transport so
+repeated search texts skip the embedding call.
+==============================================================================
+"""
+
+import argparse
+import asyncio
+import base64
+import hashlib
+import json
+import mmap
+import os
+import random
+import re
+import unicodedata
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import httpx
+from pydantic import BaseModel
+
+# Deployment name in an Azure OpenAI embeddings URL, used as the model name when the body names none
+_DEPLOYMENT = re.compile(r"/deployments/([^/]+)/")
+_WHITESPACE = re.compile(r"\s+")
+# Headers describing the original body, which no longer apply to a rebuilt one
+_BODY_HEADERS = ("content-length", "content-encoding", "transfer-encoding")
+_DIGEST_SIZE = 16
+
+
+def normalize_text(text: str, casefold: bool = False) -> str:
+    """
+    Normalize a text for cache keying: Unicode NFKC, whitespace collapsed and trimmed.
+
+    Args:
+        text (str): The text.
+        casefold (bool): Also ignore case. Embeddings are case-sensitive, so this trades a little fidelity for hits.
+
+    Returns:
+        str: The normalized text.
+    """
+    normalized = _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", text)).strip()
+    return normalized.casefold() if casefold else normalized
+
+
+class EmbeddingCacheStats(BaseModel):
+    """
+    Counters of an embedding cache.
+
+    Attributes:
+        memory_hits (int): Lookups served from the in-memory LRU.
+        disk_hits (int): Lookups served from the on-disk store.
+        misses (int): Lookups that needed the embedding call.
+        writes (int): Embeddings stored.
+        evictions (int): Embeddings dropped from the in-memory LRU.
+    """
+
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    evictions: int = 0
+
+    @property
+    def hits(self) -> int:
+        """
+        Returns the lookups served without an embedding call.
+
+        Returns:
+            int: Memory and disk hits.
+        """
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Returns the fraction of lookups served without an embedding call.
+
+        Returns:
+            float: The hit rate, or 0.0 before any lookup.
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class MmapEmbeddingStore:
+    """
+    Append-only on-disk embedding store, memory-mapped for reads.
+
+    Embeddings of each dimension live in a pair of files: `<dimensions>.f32` holds the vectors as rows of float32 and
+    `<dimensions>.keys` holds the 16-byte key digest of each row. A vector is appended before its key, so a crash can
+    leave an orphaned vector but never a key without one. The whole index of digests is loaded at open; vectors are
+    read from the map. One process should write to a directory at a time.
+    """
+
+    def __init__(self, directory: Union[str, Path]):
+        """
+        Open the store, creating the directory if needed.
+
+        Args:
+            directory (Union[str, Path]): Directory holding the store files.
+        """
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        # dimensions -> (digest -> row, mapped vector file or None, rows mapped)
+        self._tables: Dict[int, Tuple[Dict[bytes, int], Optional[mmap.mmap], int]] = {}
+        self._lock = Lock()
+        for keys_path in self._directory.glob("*.keys"):
+            if keys_path.stem.isdigit():
+                self._open_table(dimensions=int(keys_path.stem))
+
+    def __len__(self) -> int:
+        """
+        Returns the embeddings stored.
+
+        Returns:
+            int: Stored embeddings, across dimensions.
+        """
+        return sum(len(rows) for rows, _, _ in self._tables.values())
+
+    def get(self, digest: bytes) -> Optional[bytes]:
+        """
+        Read an embedding.
+
+        Args:
+            digest (bytes): The key digest.
+
+        Returns:
+            Optional[bytes]: The embedding as packed float32, or None if it is not stored.
+        """
+        with self._lock:
+            for dimensions, (rows, mapped, mapped_rows) in self._tables.items():
+                row = rows.get(digest)
+                if row is None:
+                    continue
+                if mapped is None or row >= mapped_rows:
+                    mapped, mapped_rows = self._remap(dimensions=dimensions)
+                row_bytes = 4 * dimensions
+                return mapped[row * row_bytes : (row + 1) * row_bytes]
+        return None
+
+    def put(self, digest: bytes, vector: bytes) -> None:
+        """
+        Store an embedding. Storing a key again is a no-op.
+
+        Args:
+            digest (bytes): The key digest.
+            vector (bytes): The embedding as packed float32.
+        """
+        dimensions = len(vector) // 4
+        with self._lock:
+            if dimensions not in self._tables:
+                self._open_table(dimensions=dimensions)
+            rows, mapped, mapped_rows = self._tables[dimensions]
+            if digest in rows:
+                return
+
+            with open(self._directory / f"{dimensions}.f32", "ab") as vector_file:
+                vector_file.write(vector)
+            with open(self._directory / f"{dimensions}.keys", "ab") as keys_file:
+                keys_file.write(digest)
+            rows[digest] = len(rows)
+
+    def close(self) -> None:
+        """
+        Unmap the vector files.
+        """
+        with self._lock:
+            for dimensions, (rows, mapped, _) in list(self._tables.items()):
+                if mapped is not None:
+                    mapped.close()
+                self._tables[dimensions] = (rows, None, 0)
+
+    def _open_table(self, dimensions: int) -> None:
+        """
+        Load the key index of one dimension, dropping a torn trailing write.
+
+        Args:
+            dimensions (int): The embedding dimensions.
+        """
+        vector_path = self._directory / f"{dimensions}.f32"
+        keys_path = self._directory / f"{dimensions}.keys"
+        vector_path.touch()
+        keys_path.touch()
+
+        complete_rows = min(os.path.getsize(vector_path) // (4 * dimensions), os.path.getsize(keys_path) // _DIGEST_SIZE)
+        for path, row_bytes in ((vector_path, 4 * dimensions), (keys_path, _DIGEST_SIZE)):
+            if os.path.getsize(path) != complete_rows * row_bytes:
+                os.truncate(path, complete_rows * row_bytes)
+
+        keys = keys_path.read_bytes()
+        rows = {keys[row * _DIGEST_SIZE : (row + 1) * _DIGEST_SIZE]: row for row in range(complete_rows)}
+        self._tables[dimensions] = (rows, None, 0)
+
+    def _remap(self, dimensions: int) -> Tuple[mmap.mmap, int]:
+        """
+        Map the vector file of one dimension again after it grew.
+
+        Args:
+            dimensions (int): The embedding dimensions.
+
+        Returns:
+            Tuple[mmap.mmap, int]: The map and the rows it covers.
+        """
+        rows, mapped, _ = self._tables[dimensions]
+        if mapped is not None:
+            mapped.close()
+        with open(self._directory / f"{dimensions}.f32", "rb") as vector_file:
+            mapped = mmap.mmap(vector_file.fileno(), 0, access=mmap.ACCESS_READ)
+        mapped_rows = len(mapped) // (4 * dimensions)
+        self._tables[dimensions] = (rows, mapped, mapped_rows)
+        return mapped, mapped_rows
+
+
+class EmbeddingCache:
+    """
+    Content-addressed embedding cache: an in-memory LRU in front of an optional `MmapEmbeddingStore`.
+
+    Keys are digests of the model name, the request options that change the vector (e.g. `dimensions`) and the
+    normalized text, so the same text embedded by any caller resolves to the same entry. Vectors are held as packed
+    float32, the precision embedding models produce. Disk hits are promoted into the LRU.
+    """
+
+    def __init__(self, max_entries: int = 10_000, directory: Optional[Union[str, Path]] = None, casefold: bool = False):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries (int): Embeddings held in memory.
+            directory (Optional[Union[str, Path]]): Directory of the on-disk store. Memory only if None.
+            casefold (bool): Treat texts differing only in case as the same.
+
+        Raises:
+            ValueError: If `max_entries` is less than 1.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+
+        self._max_entries = max_entries
+        self._casefold = casefold
+        self._memory: "OrderedDict[bytes, bytes]" = OrderedDict()
+        self._store = MmapEmbeddingStore(directory=directory) if directory is not None else None
+        self._stats = EmbeddingCacheStats()
+        self._lock = Lock()
+
+    def key(self, model: str, text: str, options: Optional[Dict[str, Any]] = None) -> bytes:
+        """
+        Compute the cache key of a text.
+
+        Args:
+            model (str): The embedding model or deployment name.
+            text (str): The text.
+            options (Optional[Dict[str, Any]]): Request options that change the vector.
+
+        Returns:
+            bytes: The key digest.
+        """
+        material = "\0".join((model, json.dumps(options or {}, sort_keys=True), normalize_text(text, casefold=self._casefold)))
+        return hashlib.blake2b(material.encode("utf-8"), digest_size=_DIGEST_SIZE).digest()
+
+    def get(self, key: bytes) -> Optional[bytes]:
+        """
+        Look up an embedding.
+
+        Args:
+            key (bytes): The key digest.
+
+        Returns:
+            Optional[bytes]: The embedding as packed float32, or None on a miss.
+        """
+        with self._lock:
+            vector = self._memory.get(key)
+            if vector is not None:
+                self._memory.move_to_end(key)
+                self._stats.memory_hits += 1
+                return vector
+
+        vector = self._store.get(key) if self._store is not None else None
+        with self._lock:
+            if vector is None:
+                self._stats.misses += 1
+                return None
+            self._stats.disk_hits += 1
+            self._remember(key=key, vector=vector)
+        return vector
+
+    def put(self, key: bytes, vector: bytes) -> None:
+        """
+        Store an embedding.
+
+        Args:
+            key (bytes): The key digest.
+            vector (bytes): The embedding as packed float32.
+        """
+        with self._lock:
+            self._remember(key=key, vector=vector)
+            self._stats.writes += 1
+        if self._store is not None:
+            self._store.put(digest=key, vector=vector)
+
+    @property
+    def stats(self) -> EmbeddingCacheStats:
+        """
+        Returns the cache's counters.
+
+        Returns:
+            EmbeddingCacheStats: A snapshot of the counters.
+        """
+        with self._lock:
+            return self._stats.model_copy()
+
+    def close(self) -> None:
+        """
+        Close the on-disk store.
+        """
+        if self._store is not None:
+            self._store.close()
+
+    def _remember(self, key: bytes, vector: bytes) -> None:
+        """
+        Insert into the LRU, evicting the least recently used entry when full. Call with the lock held.
+
+        Args:
+            key (bytes): The key digest.
+            vector (bytes): The embedding as packed float32.
+        """
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        if len(self._memory) > self._max_entries:
+            self._memory.popitem(last=False)
+            self._stats.evictions += 1
+
+
+def pack_embedding(embedding: Union[List[float], str]) -> bytes:
+    """
+    Pack an embedding from a response as float32.
+
+    Args:
+        embedding (Union[List[float], str]): The embedding as a list of floats, or base64 float32 with
+            `encoding_format="base64"`.
+
+    Returns:
+        bytes: The packed embedding.
+    """
+    if isinstance(embedding, str):
+        return base64.b64decode(embedding)
+    return array("f", embedding).tobytes()
+
+
+def unpack_embedding(vector: bytes, encoding_format: str) -> Union[List[float], str]:
+    """
+    Render a packed embedding the way the request asked for it.
+
+    Args:
+        vector (bytes): The packed float32 embedding.
+        encoding_format (str): "float" or "base64".
+
+    Returns:
+        Union[List[float], str]: The embedding.
+    """
+    if encoding_format == "base64":
+        return base64.b64encode(vector).decode("ascii")
+    embedding = array("f")
+    embedding.frombytes(vector)
+    return embedding.tolist()
+
+
+class EmbeddingCacheTransport(httpx.AsyncBaseTransport):
+    """
+    httpx transport that serves OpenAI-style embedding requests from an `EmbeddingCache`.
+
+    Cached inputs are answered locally; only the missing ones are sent, in one request, and their vectors are cached.
+    A request whose inputs are all cached never leaves the process. Everything else passes through. Wrap the
+    transport of the retriever's `embedding_http_async_client` with it; put it outside an
+    `EmbeddingBatchingTransport` so only misses are batched.
+    """
+
+    def __init__(self, cache: EmbeddingCache, transport: Optional[httpx.AsyncBaseTransport] = None, path_suffix: str = "/embeddings"):
+        """
+        Initialize the transport.
+
+        Args:
+            cache (EmbeddingCache): The cache.
+            transport (Optional[httpx.AsyncBaseTransport]): Sends the misses. A pooled `httpx.AsyncHTTPTransport` if None.
+            path_suffix (str): URL path suffix of embedding requests.
+        """
+        self.cache = cache
+        self._transport = transport or httpx.AsyncHTTPTransport()
+        self._path_suffix = path_suffix
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """
+        Answer an embedding request from the cache, sending only the misses.
+
+        Args:
+            request (httpx.Request): The request.
+
+        Returns:
+            httpx.Response: The response to this request.
+        """
+        body = await self._embedding_body(request=request)
+        if body is None:
+            return await self._transport.handle_async_request(request)
+
+        texts: List[str] = body["input"] if isinstance(body["input"], list) else [body["input"]]
+        model = body.get("model") or next(iter(_DEPLOYMENT.findall(request.url.path)), "")
+        encoding_format = body.get("encoding_format") or "float"
+        options = {name: value for name, value in body.items() if name not in ("input", "model", "encoding_format", "user")}
+
+        keys = [self.cache.key(model=model, text=text, options=options) for text in texts]
+        vectors = [self.cache.get(key=key) for key in keys]
+        missing = [index for index, vector in enumerate(vectors) if vector is None]
+
+        response_body: Dict[str, Any] = {"object": "list", "model": model, "usage": {"prompt_tokens": 0, "total_tokens": 0}}
+        if missing:
+            miss_response, miss_body = await self._send_misses(request=request, body=body, texts=[texts[index] for index in missing])
+            if miss_body is None:
+                return miss_response
+            miss_data = sorted(miss_body["data"], key=lambda item: item["index"])
+            for index, item in zip(missing, miss_data):
+                vectors[index] = pack_embedding(item["embedding"])
+                self.cache.put(key=keys[index], vector=vectors[index])
+            response_body.update({name: value for name, value in miss_body.items() if name != "data"})
+
+        response_body["data"] = [
+            {"object": "embedding", "index": index, "embedding": unpack_embedding(vector=vector, encoding_format=encoding_format)}
+            for index, vector in enumerate(vectors)
+        ]
+        return httpx.Response(200, json=response_body, request=request)
+
+    async def aclose(self) -> None:
+        """
+        Close the underlying transport.
+        """
+        await self._transport.aclose()
+
+    async def _embedding_body(self, request: httpx.Request) -> Optional[Dict[str, Any]]:
+        """
+        Parse the body of an embedding request with text inputs.
+
+        Args:
+            request (httpx.Request): The request.
+
+        Returns:
+            Optional[Dict[str, Any]]: The JSON body, or None if the request is not a cacheable embedding request.
+        """
+        if request.method != "POST" or not request.url.path.rstrip("/").endswith(self._path_suffix):
+            return None
+        try:
+            body = json.loads(await request.aread())
+        except (ValueError, UnicodeDecodeError):
+            return None
+        if not isinstance(body, dict) or "input" not in body:
+            return None
+        # Token-array inputs are left alone
+        texts = body["input"] if isinstance(body["input"], list) else [body["input"]]
+        if not texts or not all(isinstance(text, str) for text in texts):
+            return None
+        return body
+
+    async def _send_misses(
+        self, request: httpx.Request, body: Dict[str, Any], texts: List[str]
+    ) -> Tuple[httpx.Response, Optional[Dict[str, Any]]]:
+        """
+        Send the uncached inputs as one request.
+
+        Args:
+            request (httpx.Request): The original request.
+            body (Dict[str, Any]): Its JSON body.
+            texts (List[str]): The uncached inputs.
+
+        Returns:
+            Tuple[httpx.Response, Optional[Dict[str, Any]]]: The response, and its JSON body if it holds one embedding per
+                input, else None.
+        """
+        headers = [(name, value) for name, value in request.headers.multi_items() if name.lower() not in _BODY_HEADERS]
+        miss_request = httpx.Request(
+            request.method, request.url, headers=headers, content=json.dumps({**body, "input": texts}).encode("utf-8"), extensions=request.extensions
+        )
+        response = await self._transport.handle_async_request(miss_request)
+        try:
+            content = await response.aread()
+        finally:
+            await response.aclose()
+
+        passthrough_headers = [(name, value) for name, value in response.headers.multi_items() if name.lower() not in _BODY_HEADERS]
+        passthrough = httpx.Response(response.status_code, headers=passthrough_headers, content=content, request=request)
+        if response.status_code != 200:
+            return passthrough, None
+        try:
+            miss_body = json.loads(content)
+        except ValueError:
+            return passthrough, None
+        if not isinstance(miss_body, dict) or len(miss_body.get("data") or []) != len(texts):
+            return passthrough, None
+        return passthrough, miss_body
+
+
+async def _simulate(lookups: int, distinct: int, max_entries: int, embedding_latency_seconds: float, directory: Optional[str]) -> None:
+    """
+    Issue repeated embedding requests through the cache and report hit rate and time.
+
+    Search texts recur with a Zipf-like skew: a few, like "revenue sales income", are requested far more than the rest.
+
+    Args:
+        lookups (int): Embedding requests issued.
+        distinct (int): Distinct texts they are drawn from.
+        max_entries (int): Embeddings held in memory.
+        embedding_latency_seconds (float): Latency of one embedding request.
+        directory (Optional[str]): Directory of the on-disk store.
+    """
+    endpoint_requests = 0
+
+    async def embeddings_endpoint(request: httpx.Request) -> httpx.Response:
+        nonlocal endpoint_requests
+        endpoint_requests += 1
+        await asyncio.sleep(embedding_latency_seconds)
+        texts = json.loads(request.content)["input"]
+        data = [{"object": "embedding", "index": index, "embedding": [float(len(text))] * 1536} for index, text in enumerate(texts)]
+        return httpx.Response(200, json={"object": "list", "data": data, "usage": {"prompt_tokens": len(texts), "total_tokens": len(texts)}})
+
+    cache = EmbeddingCache(max_entries=max_entries, directory=directory)
+    texts = random.Random(0).choices(range(distinct), weights=[1 / (rank + 1) for rank in range(distinct)], k=lookups)
+    url = "https://embeddings.local/openai/deployments/text-embedding-3-small/embeddings"
+    async with httpx.AsyncClient(transport=EmbeddingCacheTransport(cache=cache, transport=httpx.MockTransport(embeddings_endpoint))) as http_client:
+        start = perf_counter()
+        for text in texts:
+            response = await http_client.post(url, json={"input": [f"  search   text {text} "]})
+            response.raise_for_status()
+        wall_seconds = perf_counter() - start
+    cache.close()
+
+    stats = cache.stats
+    print(
+        f"{lookups} lookups over {distinct} texts, {max_entries} in memory: {endpoint_requests} embedding calls, hit rate {stats.hit_rate:.1%} "
+        f"(memory {stats.memory_hits}, disk {stats.disk_hits}), {stats.evictions} evictions, {wall_seconds:.2f}s"
+    )
+
+
+def main() -> None:
+    """
+    Parse arguments and run the simulation.
+    """
+    parser = argparse.ArgumentParser(description="Measure the embedding cache against a simulated embedding endpoint.")
+    parser.add_argument("--lookups", type=int, default=500, help="Embedding requests issued.")
+    parser.add_argument("--distinct", type=int, default=200, help="Distinct texts the requests are drawn from.")
+    parser.add_argument("--max-entries", type=int, default=50, help="Embeddings held in memory.")
+    parser.add_argument("--latency", type=float, default=0.02, help="Latency of one embedding request, in seconds.")
+    parser.add_argument("--directory", default=None, help="On-disk store directory; run twice to see disk hits.")
+    args = parser.parse_args()
+
+    asyncio.run(
+        _simulate(
+            lookups=args.lookups,
+            distinct=args.distinct,
+            max_entries=args.max_entries,
+            embedding_latency_seconds=args.latency,
+            directory=args.directory,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+"""
+==============================================================================
+Name: member_hydration
+Author: AI Assistant
+Date: 10/17/2026
+Description: Hydration of retrieved dimension members from Cosmos DB: names
+deduplicated per dimension type partition, split into bounded IN-query
+chunks, every chunk of every partition queried concurrently under a limit,
+and the detailed members reassembled in retrieval order.
+==============================================================================
+"""
+
+import argparse
+import asyncio
+import random
+from time import perf_counter
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from adaptive_limiter import AdaptiveLimiter
+
+
+class HydrationResult(BaseModel):
+    """
+    Detailed members of a hydration, with what it cost.
+
+    Attributes:
+        members (List[Any]): Detailed members, in the order their names were first retrieved.
+        by_dim_type (Dict[Any, List[Any]]): The same members per dimension type.
+        missing (List[Tuple[Any, str]]): Dimension type and name of retrieved members Cosmos DB returned nothing for.
+        errors (List[Tuple[Any, BaseException]]): Dimension type and error of each failed chunk.
+        retrieved (int): Members retrieved, duplicates included.
+        duplicates_removed (int): Names dropped because they were already requested for their partition.
+        partitions (int): Dimension types queried.
+        chunks (int): IN queries issued.
+        wall_seconds (float): Time of the whole hydration.
+        slowest_partition_seconds (float): Time until the last chunk of the slowest partition finished.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    members: List[Any] = Field(default_factory=list)
+    by_dim_type: Dict[Any, List[Any]] = Field(default_factory=dict)
+    missing: List[Tuple[Any, str]] = Field(default_factory=list)
+    errors: List[Tuple[Any, BaseException]] = Field(default_factory=list)
+    retrieved: int = 0
+    duplicates_removed: int = 0
+    partitions: int = 0
+    chunks: int = 0
+    wall_seconds: float = 0.0
+    slowest_partition_seconds: float = 0.0
+
+
+def plan_hydration(
+    retrieved_members: Iterable[Any],
+    dim_type_of: Callable[[Any], Hashable],
+    name_of: Callable[[Any], str],
+) -> Tuple[Dict[Hashable, List[str]], List[Tuple[Hashable, str]], int]:
+    """
+    Deduplicate retrieved member names per dimension type, keeping the order they were first retrieved in.
+
+    Args:
+        retrieved_members (Iterable[Any]): Members returned by the searches, duplicates included.
+        dim_type_of (Callable[[Any], Hashable]): Reads a retrieved member's dimension type (its partition).
+        name_of (Callable[[Any], str]): Reads a retrieved member's name.
+
+    Returns:
+        Tuple[Dict[Hashable, List[str]], List[Tuple[Hashable, str]], int]: The unique names per dimension type in first
+            retrieval order, the (dimension type, name) pairs in first retrieval order, and the members retrieved.
+    """
+    names_by_dim_type: Dict[Hashable, Dict[str, None]] = {}
+    order: Dict[Tuple[Hashable, str], None] = {}
+    retrieved = 0
+    for member in retrieved_members:
+        retrieved += 1
+        dim_type, name = dim_type_of(member), name_of(member)
+        names_by_dim_type.setdefault(dim_type, {})[name] = None
+        order[(dim_type, name)] = None
+    return {dim_type: list(names) for dim_type, names in names_by_dim_type.items()}, list(order), retrieved
+
+
+async def hydrate_dimension_members_async(
+    rubix_manager: Any,
+    retrieved_members: Iterable[Any],
+    chunk_size: int = 100,
+    max_concurrency: int = 8,
+    limiter: Optional[AdaptiveLimiter] = None,
+    dim_type_of: Callable[[Any], Hashable] = lambda member: member.dim_type,
+    name_of: Callable[[Any], str] = lambda member: member.dim_member_name,
+    detailed_name_of: Callable[[Any], str] = lambda member: member.name,
+    raise_on_error: bool = True,
+) -> HydrationResult:
+    """
+    Fetch the detailed records of retrieved dimension members.
+
+    Member names are deduplicated per dimension type (the Cosmos DB partition) and split into chunks of at most
+    `chunk_size`, so no IN query grows with the number of searches. Every chunk of every partition is queried at once
+    within the concurrency limit, so the stage takes about as long as the slowest partition instead of the sum of all
+    of them. Throttled chunks ("Request rate is large") are retried by the limiter.
+
+    Args:
+        rubix_manager (RubixDimensionManager): Provides `get_dim_members_async(dim_type, dim_member_names)`.
+        retrieved_members (Iterable[Any]): Members returned by the searches, duplicates included.
+        chunk_size (int): Names per IN query.
+        max_concurrency (int): Chunks queried at once, when no limiter is given.
+        limiter (Optional[AdaptiveLimiter]): Bounds the chunks in flight. A fixed limit of `max_concurrency` if None.
+        dim_type_of (Callable[[Any], Hashable]): Reads a retrieved member's dimension type.
+        name_of (Callable[[Any], str]): Reads a retrieved member's name.
+        detailed_name_of (Callable[[Any], str]): Reads a detailed member's name, to put it back in retrieval order.
+        raise_on_error (bool): Raise the first chunk error once every chunk finished. Failed chunks are only listed in
+            `errors`, and their members in `missing`, if False.
+
+    Returns:
+        HydrationResult: The detailed members in retrieval order, with counts and timings.
+
+    Raises:
+        ValueError: If `chunk_size` or `max_concurrency` is less than 1.
+        Exception: The first chunk error, if `raise_on_error`.
+    """
+    if chunk_size < 1 or max_concurrency < 1:
+        raise ValueError("chunk_size and max_concurrency must be >= 1")
+
+    names_by_dim_type, order, retrieved = plan_hydration(retrieved_members=retrieved_members, dim_type_of=dim_type_of, name_of=name_of)
+    chunks = [
+        (dim_type, names[start : start + chunk_size]) for dim_type, names in names_by_dim_type.items() for start in range(0, len(names), chunk_size)
+    ]
+    limiter = limiter or AdaptiveLimiter(initial_limit=max_concurrency, min_limit=max_concurrency, max_limit=max_concurrency)
+
+    start = perf_counter()
+    partition_finished: Dict[Hashable, float] = {}
+
+    async def fetch(dim_type: Hashable, names: List[str]) -> List[Any]:
+        try:
+            return await limiter.run(lambda: rubix_manager.get_dim_members_async(dim_type=dim_type, dim_member_names=names))
+        finally:
+            partition_finished[dim_type] = max(partition_finished.get(dim_type, 0.0), perf_counter() - start)
+
+    outcomes = await asyncio.gather(*[fetch(dim_type, names) for dim_type, names in chunks], return_exceptions=True)
+    wall_seconds = perf_counter() - start
+
+    detailed: Dict[Tuple[Hashable, str], Any] = {}
+    errors: List[Tuple[Any, BaseException]] = []
+    for (dim_type, _), outcome in zip(chunks, outcomes):
+        if isinstance(outcome, BaseException):
+            errors.append((dim_type, outcome))
+            continue
+        for member in outcome:
+            detailed.setdefault((dim_type, detailed_name_of(member)), member)
+
+    if errors and raise_on_error:
+        raise errors[0][1]
+
+    result = HydrationResult(
+        errors=errors,
+        retrieved=retrieved,
+        duplicates_removed=retrieved - len(order),
+        partitions=len(names_by_dim_type),
+        chunks=len(chunks),
+        wall_seconds=wall_seconds,
+        slowest_partition_seconds=max(partition_finished.values(), default=0.0),
+    )
+    for key in order:
+        member = detailed.get(key)
+        if member is None:
+            result.missing.append(key)
+            continue
+        result.members.append(member)
+        result.by_dim_type.setdefault(key[0], []).append(member)
+    return result
+
+
+class _SimulatedMember(BaseModel):
+    """
+    Stand-in retrieved and detailed dimension member.
+    """
+
+    dim_type: str
+    dim_member_name: str
+    name: str
+
+
+class _SimulatedManager:
+    """
+    Stand-in for RubixDimensionManager: an IN query costs a round trip plus time per name, and returns rows unordered.
+    """
+
+    def __init__(self, round_trip_seconds: float, per_name_seconds: float):
+        self._round_trip_seconds = round_trip_seconds
+        self._per_name_seconds = per_name_seconds
+
+    async def get_dim_members_async(self, dim_type: str, dim_member_names: List[str]) -> List[_SimulatedMember]:
+        await asyncio.sleep(self._round_trip_seconds + self._per_name_seconds * len(dim_member_names))
+        rows = [_SimulatedMember(dim_type=dim_type, dim_member_name=name, name=name) for name in dim_member_names]
+        random.shuffle(rows)
+        return rows
+
+
+async def _simulate(searches: int, results_per_search: int, dim_types: int, chunk_size: int, max_concurrency: int) -> None:
+    """
+    Compare the serial per-partition loop with the hydration stage on simulated search results.
+
+    Args:
+        searches (int): Searches whose results are hydrated.
+        results_per_search (int): Members each search returns.
+        dim_types (int): Dimension types the members spread over.
+        chunk_size (int): Names per IN query.
+        max_concurrency (int): Chunks queried at once.
+    """
+    rng = random.Random(0)
+    # Searches overlap: members are drawn from a pool smaller than the results, so names repeat across searches
+    pool = [(f"DimType{index % dim_types}", f"member {index}") for index in range(searches * results_per_search // 3)]
+    retrieved = [_SimulatedMember(dim_type=dim_type, dim_member_name=name, name=name) for dim_type, name in rng.choices(pool, k=searches * results_per_search)]
+    manager = _SimulatedManager(round_trip_seconds=0.03, per_name_seconds=0.0002)
+
+    start = perf_counter()
+    by_dim_type: Dict[str, List[str]] = {}
+    for member in retrieved:
+        by_dim_type.setdefault(member.dim_type, []).append(member.dim_member_name)
+    serial_members = 0
+    for dim_type, names in by_dim_type.items():
+        serial_members += len(await manager.get_dim_members_async(dim_type=dim_type, dim_member_names=names))
+    serial_seconds = perf_counter() - start
+
+    result = await hydrate_dimension_members_async(rubix_manager=manager, retrieved_members=retrieved, chunk_size=chunk_size, max_concurrency=max_concurrency)
+    in_order = [member.name for member in result.members] == [name for _, name in dict.fromkeys((m.dim_type, m.dim_member_name) for m in retrieved)]
+
+    print(f"{len(retrieved)} retrieved members over {len(by_dim_type)} dimension types")
+    print(f"  serial:    {serial_seconds * 1000:7.1f}ms, {len(by_dim_type)} queries, {serial_members} rows")
+    print(
+        f"  hydration: {result.wall_seconds * 1000:7.1f}ms, {result.chunks} queries, {len(result.members)} rows "
+        f"({result.duplicates_removed} duplicates removed, slowest partition {result.slowest_partition_seconds * 1000:.1f}ms, "
+        f"retrieval order kept: {in_order})"
+    )
+
+
+def main() -> None:
+    """
+    Parse arguments and run the simulation.
+    """
+    parser = argparse.ArgumentParser(description="Compare serial per-partition member hydration with the concurrent, chunked stage.")
+    parser.add_argument("--searches", type=int, default=30, help="Searches whose results are hydrated.")
+    parser.add_argument("--results", type=int, default=200, help="Members each search returns.")
+    parser.add_argument("--dim-types", type=int, default=4, help="Dimension types the members spread over.")
+    parser.add_argument("--chunk-size", type=int, default=100, help="Names per IN query.")
+    parser.add_argument("--concurrency", type=int, default=8, help="Chunks queried at once.")
+    args = parser.parse_args()
+
+    asyncio.run(
+        _simulate(
+            searches=args.searches,
+            results_per_search=args.results,
+            dim_types=args.dim_types,
+            chunk_size=args.chunk_size,
+            max_concurrency=args.concurrency,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
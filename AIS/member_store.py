@@ -0,0 +1,560 @@
+"""
+==============================================================================
+Name: member_store
+Author: AI Assistant
+Date: 10/17/2026
+Description: Read-through local store of dimension members in front of
+RubixDimensionManager: partitioned by dimension type, with hash indexes on
+name and member ID and a parent to children adjacency index, warmed on
+startup or first access and invalidated by version stamps.
+==============================================================================
+"""
+
+import argparse
+import asyncio
+import random
+from threading import Lock
+from time import monotonic, perf_counter
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, List, Optional, Sequence, Set
+
+from pydantic import BaseModel
+
+
+class MemberStoreStats(BaseModel):
+    """
+    Counters of a member store.
+
+    Attributes:
+        hits (int): Names served from memory, known-missing names included.
+        misses (int): Names fetched from the manager.
+        fetches (int): Manager round trips, partition loads included.
+        warms (int): Partitions loaded whole.
+        invalidations (int): Partitions dropped after a version change or on request.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    fetches: int = 0
+    warms: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Returns the fraction of names served from memory.
+
+        Returns:
+            float: The hit rate, or 0.0 before any lookup.
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class MemberPartition:
+    """
+    The members of one dimension type, with their indexes.
+    """
+
+    def __init__(self, version: Optional[Hashable] = None):
+        """
+        Initialize an empty partition.
+
+        Args:
+            version (Optional[Hashable]): Version stamp of the catalog the partition is filled from.
+        """
+        self.by_name: Dict[str, Any] = {}
+        self.by_member_id: Dict[Any, Any] = {}
+        self.children: Dict[str, List[str]] = {}
+        # Names the manager returned nothing for
+        self.absent: Set[str] = set()
+        # Loaded whole: a name not in `by_name` does not exist
+        self.complete = False
+        self.version = version
+        self.checked_at = monotonic()
+
+    def add(
+        self,
+        member: Any,
+        name_of: Callable[[Any], str],
+        member_id_of: Callable[[Any], Any],
+        children_of: Callable[[Any], Sequence[str]],
+        parent_of: Callable[[Any], Optional[str]],
+    ) -> None:
+        """
+        Index a member.
+
+        Args:
+            member (Any): The member.
+            name_of (Callable[[Any], str]): Reads its name.
+            member_id_of (Callable[[Any], Any]): Reads its member ID.
+            children_of (Callable[[Any], Sequence[str]]): Reads the names of its children.
+            parent_of (Callable[[Any], Optional[str]]): Reads the name of its parent.
+        """
+        name = name_of(member)
+        self.by_name[name] = member
+        self.absent.discard(name)
+        member_id = member_id_of(member)
+        if member_id is not None:
+            self.by_member_id[member_id] = member
+
+        children = self.children.setdefault(name, [])
+        for child in children_of(member):
+            if child not in children:
+                children.append(child)
+        parent = parent_of(member)
+        if parent:
+            siblings = self.children.setdefault(parent, [])
+            if name not in siblings:
+                siblings.append(name)
+
+
+class DimensionMemberStore:
+    """
+    Read-through store of dimension members, with the lookup methods of `RubixDimensionManager`.
+
+    Members are kept per dimension type (the Cosmos DB partition) and indexed by name, by member ID and by parent. A
+    lookup is served from memory; names not seen before are fetched from the manager in one call, shared by concurrent
+    lookups of the same names, and kept. Names the manager has no member for are remembered too.
+
+    With a `partition_loader`, a partition is loaded whole on startup (`warm_async`) or on first access, after which
+    every lookup in it is served from memory. A lookup served from memory costs a few dictionary probes per name, so it
+    scales with the names looked up: a few milliseconds for 6000 names in the sync path, against one Cosmos DB round
+    trip per chunk of names from the manager. With a `version_loader`, the version stamp of a partition is checked at
+    most every `version_check_seconds` by the async lookups, and the partition is dropped and reloaded when it changed.
+    The sync lookups never check versions.
+    """
+
+    def __init__(
+        self,
+        rubix_manager: Any,
+        partition_loader: Optional[Callable[[Hashable], Awaitable[Iterable[Any]]]] = None,
+        version_loader: Optional[Callable[[Hashable], Awaitable[Hashable]]] = None,
+        version_check_seconds: float = 30.0,
+        warm_on_first_access: bool = True,
+        name_of: Callable[[Any], str] = lambda member: member.name,
+        member_id_of: Callable[[Any], Any] = lambda member: getattr(member, "member_id", None),
+        children_of: Callable[[Any], Sequence[str]] = lambda member: getattr(member, "children", None) or [],
+        parent_of: Callable[[Any], Optional[str]] = lambda member: getattr(member, "parent_hierarchy", None) or None,
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            rubix_manager (RubixDimensionManager): Provides `get_dim_members(_async)(dim_type, dim_member_names)`.
+            partition_loader (Optional[Callable[[Hashable], Awaitable[Iterable[Any]]]]): Loads every member of a
+                dimension type. Members are only fetched by name if None.
+            version_loader (Optional[Callable[[Hashable], Awaitable[Hashable]]]): Reads the version stamp of a dimension
+                type's catalog, e.g. a metadata document's `_etag`. Partitions never expire if None.
+            version_check_seconds (float): Minimum time between version checks of a partition.
+            warm_on_first_access (bool): Load a partition whole on its first async lookup, with a `partition_loader`.
+            name_of (Callable[[Any], str]): Reads a member's name.
+            member_id_of (Callable[[Any], Any]): Reads a member's ID.
+            children_of (Callable[[Any], Sequence[str]]): Reads the names of a member's children.
+            parent_of (Callable[[Any], Optional[str]]): Reads the name of a member's parent.
+        """
+        self._rubix_manager = rubix_manager
+        self._partition_loader = partition_loader
+        self._version_loader = version_loader
+        self._version_check_seconds = version_check_seconds
+        self._warm_on_first_access = warm_on_first_access
+        self._name_of = name_of
+        self._member_id_of = member_id_of
+        self._children_of = children_of
+        self._parent_of = parent_of
+
+        self._partitions: Dict[Hashable, MemberPartition] = {}
+        self._pending: Dict[Hashable, Dict[str, asyncio.Future]] = {}
+        self._warming: Dict[Hashable, asyncio.Future] = {}
+        self._stats = MemberStoreStats()
+        self._lock = Lock()
+
+    @property
+    def stats(self) -> MemberStoreStats:
+        """
+        Returns the store's counters.
+
+        Returns:
+            MemberStoreStats: A snapshot of the counters.
+        """
+        return self._stats.model_copy()
+
+    def partition(self, dim_type: Hashable) -> MemberPartition:
+        """
+        Returns the partition of a dimension type, creating an empty one.
+
+        Args:
+            dim_type (Hashable): The dimension type.
+
+        Returns:
+            MemberPartition: The partition.
+        """
+        partition = self._partitions.get(dim_type)
+        if partition is None:
+            partition = self._partitions[dim_type] = MemberPartition()
+        return partition
+
+    def get_dim_members(self, dim_type: Hashable, dim_member_names: Sequence[str]) -> List[Any]:
+        """
+        Look up members by name, fetching unknown names with the manager's sync API.
+
+        Args:
+            dim_type (Hashable): The dimension type.
+            dim_member_names (Sequence[str]): The member names.
+
+        Returns:
+            List[Any]: The members found, in the order of the names, duplicates dropped.
+        """
+        partition = self.partition(dim_type)
+        unknown = self._unknown(partition=partition, names=dim_member_names)
+        if unknown:
+            self._stats.fetches += 1
+            self._store(partition=partition, names=unknown, members=self._rubix_manager.get_dim_members(dim_type=dim_type, dim_member_names=unknown))
+        return self._collect(partition=partition, names=dim_member_names)
+
+    async def get_dim_members_async(self, dim_type: Hashable, dim_member_names: Sequence[str]) -> List[Any]:
+        """
+        Look up members by name, fetching unknown names with the manager's async API.
+
+        Args:
+            dim_type (Hashable): The dimension type.
+            dim_member_names (Sequence[str]): The member names.
+
+        Returns:
+            List[Any]: The members found, in the order of the names, duplicates dropped.
+        """
+        partition = await self._fresh_partition(dim_type=dim_type)
+        unknown = self._unknown(partition=partition, names=dim_member_names)
+        if unknown:
+            pending = self._pending.setdefault(dim_type, {})
+            waiting = [pending[name] for name in unknown if name in pending]
+            to_fetch = [name for name in unknown if name not in pending]
+            if to_fetch:
+                await self._fetch(dim_type=dim_type, partition=partition, names=to_fetch)
+            if waiting:
+                await asyncio.gather(*waiting)
+        return self._collect(partition=partition, names=dim_member_names)
+
+    def get_by_member_id(self, dim_type: Hashable, member_id: Any) -> Optional[Any]:
+        """
+        Look up a stored member by ID. Only members already stored are found.
+
+        Args:
+            dim_type (Hashable): The dimension type.
+            member_id (Any): The member ID.
+
+        Returns:
+            Optional[Any]: The member, or None if it is not stored.
+        """
+        return self.partition(dim_type).by_member_id.get(member_id)
+
+    def get_children(self, dim_type: Hashable, dim_member_name: str) -> List[Any]:
+        """
+        Look up the stored children of a member. Only children already stored are returned.
+
+        Args:
+            dim_type (Hashable): The dimension type.
+            dim_member_name (str): The parent's name.
+
+        Returns:
+            List[Any]: The children, in hierarchy order.
+        """
+        partition = self.partition(dim_type)
+        return [partition.by_name[name] for name in partition.children.get(dim_member_name, []) if name in partition.by_name]
+
+    def get_child_names(self, dim_type: Hashable, dim_member_name: str) -> List[str]:
+        """
+        Look up the names of a member's children, stored or not.
+
+        Args:
+            dim_type (Hashable): The dimension type.
+            dim_member_name (str): The parent's name.
+
+        Returns:
+            List[str]: The child names, in hierarchy order.
+        """
+        return list(self.partition(dim_type).children.get(dim_member_name, []))
+
+    def members(self) -> List[Any]:
+        """
+        Returns every stored member, e.g. to export a snapshot.
+
+        Returns:
+            List[Any]: The members, partition by partition.
+        """
+        return [member for partition in self._partitions.values() for member in partition.by_name.values()]
+
+    def put(self, dim_type: Hashable, members: Iterable[Any]) -> None:
+        """
+        Store members, e.g. from a snapshot.
+
+        Args:
+            dim_type (Hashable): The dimension type.
+            members (Iterable[Any]): The members.
+        """
+        partition = self.partition(dim_type)
+        for member in members:
+            partition.add(member=member, name_of=self._name_of, member_id_of=self._member_id_of, children_of=self._children_of, parent_of=self._parent_of)
+
+    async def warm_async(self, dim_types: Iterable[Hashable]) -> None:
+        """
+        Load whole partitions with the partition loader, concurrently.
+
+        Args:
+            dim_types (Iterable[Hashable]): The dimension types.
+
+        Raises:
+            ValueError: If the store has no partition loader.
+        """
+        if self._partition_loader is None:
+            raise ValueError("Warming needs a partition_loader")
+        await asyncio.gather(*[self._warm(dim_type=dim_type) for dim_type in dim_types])
+
+    def invalidate(self, dim_type: Optional[Hashable] = None) -> None:
+        """
+        Drop a partition, or all of them.
+
+        Args:
+            dim_type (Optional[Hashable]): The dimension type. Every partition if None.
+        """
+        dim_types = [dim_type] if dim_type is not None else list(self._partitions)
+        for key in dim_types:
+            if self._partitions.pop(key, None) is not None:
+                self._stats.invalidations += 1
+
+    async def _fresh_partition(self, dim_type: Hashable) -> MemberPartition:
+        """
+        Get a partition for an async lookup: warmed on first access and checked against its version stamp.
+
+        Args:
+            dim_type (Hashable): The dimension type.
+
+        Returns:
+            MemberPartition: The partition.
+        """
+        partition = self._partitions.get(dim_type)
+        if partition is not None and self._version_loader is not None and monotonic() - partition.checked_at >= self._version_check_seconds:
+            partition.checked_at = monotonic()
+            version = await self._version_loader(dim_type)
+            if partition.version is not None and version != partition.version:
+                self.invalidate(dim_type=dim_type)
+                partition = None
+            else:
+                partition.version = version
+
+        if partition is None and self._partition_loader is not None and self._warm_on_first_access:
+            await self._warm(dim_type=dim_type)
+        return self.partition(dim_type)
+
+    async def _warm(self, dim_type: Hashable) -> None:
+        """
+        Load a partition whole, once for concurrent callers.
+
+        Args:
+            dim_type (Hashable): The dimension type.
+        """
+        warming = self._warming.get(dim_type)
+        if warming is not None:
+            await asyncio.shield(warming)
+            return
+
+        warming = self._warming[dim_type] = asyncio.get_running_loop().create_future()
+        try:
+            version = await self._version_loader(dim_type) if self._version_loader is not None else None
+            self._stats.fetches += 1
+            members = await self._partition_loader(dim_type)
+            partition = MemberPartition(version=version)
+            for member in members:
+                partition.add(member=member, name_of=self._name_of, member_id_of=self._member_id_of, children_of=self._children_of, parent_of=self._parent_of)
+            partition.complete = True
+            self._partitions[dim_type] = partition
+            self._stats.warms += 1
+            warming.set_result(None)
+        except BaseException as error:
+            warming.set_exception(error)
+            # Retrieved by the waiters, if any
+            warming.exception()
+            raise
+        finally:
+            self._warming.pop(dim_type, None)
+
+    async def _fetch(self, dim_type: Hashable, partition: MemberPartition, names: List[str]) -> None:
+        """
+        Fetch names from the manager once for concurrent callers.
+
+        Args:
+            dim_type (Hashable): The dimension type.
+            partition (MemberPartition): Its partition.
+            names (List[str]): Names not stored or pending.
+        """
+        pending = self._pending.setdefault(dim_type, {})
+        done = asyncio.get_running_loop().create_future()
+        for name in names:
+            pending[name] = done
+        try:
+            self._stats.fetches += 1
+            members = await self._rubix_manager.get_dim_members_async(dim_type=dim_type, dim_member_names=names)
+            self._store(partition=partition, names=names, members=members)
+            done.set_result(None)
+        except BaseException as error:
+            done.set_exception(error)
+            done.exception()
+            raise
+        finally:
+            for name in names:
+                if pending.get(name) is done:
+                    del pending[name]
+
+    def _unknown(self, partition: MemberPartition, names: Sequence[str]) -> List[str]:
+        """
+        Find the names the partition cannot answer, counting hits and misses.
+
+        Args:
+            partition (MemberPartition): The partition.
+            names (Sequence[str]): The names looked up.
+
+        Returns:
+            List[str]: Unique names neither stored nor known to be absent.
+        """
+        unique = list(dict.fromkeys(names))
+        if partition.complete:
+            unknown = []
+        else:
+            by_name, absent = partition.by_name, partition.absent
+            unknown = [name for name in unique if name not in by_name and name not in absent]
+        with self._lock:
+            self._stats.hits += len(unique) - len(unknown)
+            self._stats.misses += len(unknown)
+        return unknown
+
+    def _store(self, partition: MemberPartition, names: List[str], members: Iterable[Any]) -> None:
+        """
+        Store fetched members, and remember the names that had none.
+
+        Args:
+            partition (MemberPartition): The partition.
+            names (List[str]): The names fetched.
+            members (Iterable[Any]): The members the manager returned.
+        """
+        for member in members:
+            partition.add(member=member, name_of=self._name_of, member_id_of=self._member_id_of, children_of=self._children_of, parent_of=self._parent_of)
+        partition.absent.update(name for name in names if name not in partition.by_name)
+
+    @staticmethod
+    def _collect(partition: MemberPartition, names: Sequence[str]) -> List[Any]:
+        """
+        Read stored members in name order.
+
+        Args:
+            partition (MemberPartition): The partition.
+            names (Sequence[str]): The names.
+
+        Returns:
+            List[Any]: The stored members, duplicates dropped.
+        """
+        by_name = partition.by_name
+        return [by_name[name] for name in dict.fromkeys(names) if name in by_name]
+
+
+class _SimulatedMember(BaseModel):
+    """
+    Stand-in dimension member.
+    """
+
+    name: str
+    member_id: int
+    dim_type: str
+    parent_hierarchy: str = ""
+    children: List[str] = []
+
+
+class _SimulatedManager:
+    """
+    Stand-in for RubixDimensionManager over a generated catalog, with a fixed round trip per query.
+    """
+
+    def __init__(self, catalog: Dict[str, List[_SimulatedMember]], round_trip_seconds: float):
+        self._catalog = {dim_type: {member.name: member for member in members} for dim_type, members in catalog.items()}
+        self._round_trip_seconds = round_trip_seconds
+
+    async def get_dim_members_async(self, dim_type: str, dim_member_names: List[str]) -> List[_SimulatedMember]:
+        await asyncio.sleep(self._round_trip_seconds)
+        members = self._catalog.get(dim_type, {})
+        return [members[name] for name in dim_member_names if name in members]
+
+    async def get_all_dim_members_async(self, dim_type: str) -> List[_SimulatedMember]:
+        await asyncio.sleep(self._round_trip_seconds * 5)
+        return list(self._catalog.get(dim_type, {}).values())
+
+
+async def _simulate(members_per_dim_type: int, dim_types: int, retrieved: int) -> None:
+    """
+    Time hydrating retrieved members from the manager and from a warmed store.
+
+    Args:
+        members_per_dim_type (int): Catalog size per dimension type.
+        dim_types (int): Dimension types.
+        retrieved (int): Retrieved members to hydrate.
+    """
+    from member_hydration import hydrate_dimension_members_async
+
+    catalog: Dict[str, List[_SimulatedMember]] = {}
+    for type_index in range(dim_types):
+        dim_type = f"DimType{type_index}"
+        catalog[dim_type] = [
+            _SimulatedMember(
+                name=f"{dim_type}_{index}",
+                member_id=type_index * members_per_dim_type + index,
+                dim_type=dim_type,
+                parent_hierarchy=f"{dim_type}_{(index - 1) // 10}" if index else "",
+            )
+            for index in range(members_per_dim_type)
+        ]
+    manager = _SimulatedManager(catalog=catalog, round_trip_seconds=0.03)
+
+    rng = random.Random(0)
+    hits = rng.choices([member for members in catalog.values() for member in members], k=retrieved)
+    retrieved_members = [_SimulatedMember(name=member.name, member_id=member.member_id, dim_type=member.dim_type) for member in hits]
+
+    def hydrate(source: Any):
+        return hydrate_dimension_members_async(rubix_manager=source, retrieved_members=retrieved_members, name_of=lambda member: member.name)
+
+    direct = await hydrate(manager)
+
+    store = DimensionMemberStore(rubix_manager=manager, partition_loader=manager.get_all_dim_members_async)
+    start = perf_counter()
+    await store.warm_async(dim_types=list(catalog))
+    warm_seconds = perf_counter() - start
+
+    names_by_dim_type: Dict[str, List[str]] = {}
+    for member in retrieved_members:
+        names_by_dim_type.setdefault(member.dim_type, []).append(member.name)
+    start = perf_counter()
+    members = []
+    for dim_type, names in names_by_dim_type.items():
+        members.extend(store.get_dim_members(dim_type=dim_type, dim_member_names=names))
+    lookup_seconds = perf_counter() - start
+    from_store = await hydrate(store)
+
+    print(f"{retrieved} retrieved members over {dim_types} dimension types of {members_per_dim_type} members")
+    print(f"  manager hydration:        {direct.wall_seconds * 1000:8.1f}ms ({direct.chunks} queries)")
+    print(f"  store warm (once):        {warm_seconds * 1000:8.1f}ms ({store.stats.fetches} queries)")
+    print(f"  store hydration:          {from_store.wall_seconds * 1000:8.1f}ms ({len(from_store.members)} members)")
+    print(f"  store lookups, sync:      {lookup_seconds * 1000:8.1f}ms ({len(members)} members, {lookup_seconds / max(retrieved, 1) * 1e6:.2f}us per name)")
+    print(f"  children of {catalog['DimType0'][0].name}: {store.get_child_names('DimType0', catalog['DimType0'][0].name)[:5]}...")
+
+
+def main() -> None:
+    """
+    Parse arguments and run the simulation.
+    """
+    parser = argparse.ArgumentParser(description="Compare hydrating retrieved members from the manager and from a warmed store.")
+    parser.add_argument("--members", type=int, default=20_000, help="Catalog size per dimension type.")
+    parser.add_argument("--dim-types", type=int, default=4, help="Dimension types.")
+    parser.add_argument("--retrieved", type=int, default=6000, help="Retrieved members to hydrate.")
+    args = parser.parse_args()
+
+    asyncio.run(_simulate(members_per_dim_type=args.members, dim_types=args.dim_types, retrieved=args.retrieved))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,410 @@
+"""
+==============================================================================
+Name: result_merge
+Author: AI Assistant
+Date: 10/17/2026
+Description: Streaming merge of the results of multi-focus dimension
+searches: members deduplicated across queries by dimension type and name,
+ranked by reciprocal-rank fusion, and kept in a bounded top-k heap per
+dimension type as each query's results arrive.
+==============================================================================
+"""
+
+import argparse
+import asyncio
+import heapq
+import random
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, List, Sequence, Tuple
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class MergedMember(BaseModel):
+    """
+    A member of the merged results.
+
+    Attributes:
+        member (Any): The member as returned with its best search score, or as last returned if it left the top k and
+            rejoined it.
+        dim_type (Any): Its dimension type.
+        name (str): Its name.
+        rrf_score (float): Reciprocal-rank fusion score: the sum of 1 / (rrf_k + rank) over the queries returning it.
+        best_score (float): Its best search score.
+        best_rank (int): Its best rank in a query, from 1.
+        queries (int): Queries that returned it.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    member: Any
+    dim_type: Any
+    name: str
+    rrf_score: float
+    best_score: float
+    best_rank: int
+    queries: int
+
+
+class MergeResult(BaseModel):
+    """
+    Merged results, with what the merge dropped.
+
+    Attributes:
+        members (List[Any]): The kept members, best fused score first.
+        by_dim_type (Dict[Any, List[MergedMember]]): The kept members per dimension type, best fused score first.
+        queries (int): Result lists merged.
+        received (int): Members received, duplicates included.
+        unique (int): Distinct (dimension type, name) keys received.
+        evicted (int): Members pushed out of a full top-k heap.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    members: List[Any] = Field(default_factory=list)
+    by_dim_type: Dict[Any, List[MergedMember]] = Field(default_factory=dict)
+    queries: int = 0
+    received: int = 0
+    unique: int = 0
+    evicted: int = 0
+
+    @property
+    def duplicates(self) -> int:
+        """
+        Returns the members received more than once.
+
+        Returns:
+            int: Received members minus distinct keys.
+        """
+        return self.received - self.unique
+
+
+class _Score:
+    """
+    Fused score of a (dimension type, name) key.
+    """
+
+    __slots__ = ("rrf_score", "best_score", "best_rank", "queries", "member")
+
+    def __init__(self):
+        self.rrf_score = 0.0
+        self.best_score = float("-inf")
+        self.best_rank = 0
+        self.queries = 0
+        # Only set while the key is in its dimension type's top k
+        self.member: Any = None
+
+
+class _TopK:
+    """
+    Keys of one dimension type with the k best fused scores, in a min-heap with lazy deletion: a key whose score rose
+    is pushed again, and entries whose score is no longer the key's are skipped when they reach the top.
+    """
+
+    __slots__ = ("heap", "keys")
+
+    def __init__(self):
+        self.heap: List[Tuple[float, int, Tuple[Hashable, str]]] = []
+        self.keys: set = set()
+
+
+class StreamingResultMerger:
+    """
+    Merges result lists as they arrive, keeping the `top_k` members per dimension type by reciprocal-rank fusion.
+
+    Each key (dimension type, member name) holds its fused score, best search score and rank, and the number of
+    queries that returned it. Member objects are only held for keys in their dimension type's top k, so memory is
+    O(k) members per dimension type, plus a score per distinct key; a key pushed out of the top k rejoins it if later
+    queries raise its score above the lowest kept one.
+    """
+
+    def __init__(
+        self,
+        top_k_per_dim_type: int = 200,
+        rrf_k: int = 60,
+        dim_type_of: Callable[[Any], Hashable] = lambda member: member.dim_type,
+        name_of: Callable[[Any], str] = lambda member: member.dim_member_name,
+        score_of: Callable[[Any], float] = lambda member: getattr(member, "search_score", None) or 0.0,
+    ):
+        """
+        Initialize the merger.
+
+        Args:
+            top_k_per_dim_type (int): Members kept per dimension type.
+            rrf_k (int): Rank offset of reciprocal-rank fusion; larger values flatten the weight of the top ranks.
+            dim_type_of (Callable[[Any], Hashable]): Reads a member's dimension type.
+            name_of (Callable[[Any], str]): Reads a member's name.
+            score_of (Callable[[Any], float]): Reads a member's search score.
+
+        Raises:
+            ValueError: If `top_k_per_dim_type` is less than 1 or `rrf_k` is negative.
+        """
+        if top_k_per_dim_type < 1 or rrf_k < 0:
+            raise ValueError("top_k_per_dim_type must be >= 1 and rrf_k >= 0")
+        self._top_k = top_k_per_dim_type
+        self._rrf_k = rrf_k
+        self._dim_type_of = dim_type_of
+        self._name_of = name_of
+        self._score_of = score_of
+
+        self._scores: Dict[Tuple[Hashable, str], _Score] = {}
+        self._partitions: Dict[Hashable, _TopK] = {}
+        self._sequence = 0
+        self._queries = 0
+        self._received = 0
+        self._evicted = 0
+
+    def add(self, results: Sequence[Any]) -> None:
+        """
+        Merge the results of one query.
+
+        Args:
+            results (Sequence[Any]): The query's members, best first.
+        """
+        self._queries += 1
+        # A query returning a member twice counts once, at its best rank
+        seen = set()
+        for rank, member in enumerate(results, start=1):
+            self._received += 1
+            dim_type = self._dim_type_of(member)
+            key = (dim_type, self._name_of(member))
+            if key in seen:
+                continue
+            seen.add(key)
+
+            score = self._scores.get(key)
+            if score is None:
+                score = self._scores[key] = _Score()
+            score.rrf_score += 1.0 / (self._rrf_k + rank)
+            score.queries += 1
+            search_score = self._score_of(member)
+            if search_score > score.best_score:
+                score.best_score = search_score
+                if score.member is not None:
+                    score.member = member
+            if not score.best_rank or rank < score.best_rank:
+                score.best_rank = rank
+            self._offer(dim_type=dim_type, key=key, score=score, member=member)
+
+    async def consume(self, queries: Iterable[Awaitable[Sequence[Any]]], return_exceptions: bool = False) -> List[BaseException]:
+        """
+        Run queries concurrently and merge each one's results as soon as it completes.
+
+        If a query fails without `return_exceptions`, or the consumer is cancelled, the queries still running are
+        cancelled and awaited before this returns.
+
+        Args:
+            queries (Iterable[Awaitable[Sequence[Any]]]): The queries.
+            return_exceptions (bool): Collect failed queries' errors instead of raising the first one.
+
+        Returns:
+            List[BaseException]: The errors of failed queries, if `return_exceptions`.
+        """
+        tasks = [asyncio.ensure_future(query) for query in queries]
+        errors: List[BaseException] = []
+        try:
+            for completed in asyncio.as_completed(tasks):
+                try:
+                    self.add(await completed)
+                except Exception as error:
+                    if not return_exceptions:
+                        raise
+                    errors.append(error)
+        finally:
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        return errors
+
+    def result(self) -> MergeResult:
+        """
+        Read the merged results.
+
+        Returns:
+            MergeResult: The kept members, best fused score first, with counts.
+        """
+        result = MergeResult(queries=self._queries, received=self._received, unique=len(self._scores), evicted=self._evicted)
+        merged: List[MergedMember] = []
+        for dim_type, partition in self._partitions.items():
+            members = []
+            for key in partition.keys:
+                score = self._scores[key]
+                members.append(
+                    MergedMember(
+                        member=score.member,
+                        dim_type=dim_type,
+                        name=key[1],
+                        rrf_score=score.rrf_score,
+                        best_score=score.best_score,
+                        best_rank=score.best_rank,
+                        queries=score.queries,
+                    )
+                )
+            members.sort(key=lambda merged_member: (-merged_member.rrf_score, -merged_member.best_score, merged_member.name))
+            result.by_dim_type[dim_type] = members
+            merged.extend(members)
+        merged.sort(key=lambda merged_member: (-merged_member.rrf_score, -merged_member.best_score, merged_member.name))
+        result.members = [merged_member.member for merged_member in merged]
+        return result
+
+    def _offer(self, dim_type: Hashable, key: Tuple[Hashable, str], score: _Score, member: Any) -> None:
+        """
+        Put a key whose score rose into its dimension type's top k, evicting the lowest key if it is full.
+
+        Args:
+            dim_type (Hashable): The dimension type.
+            key (Tuple[Hashable, str]): The key.
+            score (_Score): Its fused score.
+            member (Any): The member just received for it.
+        """
+        partition = self._partitions.get(dim_type)
+        if partition is None:
+            partition = self._partitions[dim_type] = _TopK()
+
+        if key not in partition.keys:
+            if len(partition.keys) >= self._top_k:
+                lowest_score, lowest_key = self._lowest(partition)
+                if score.rrf_score <= lowest_score:
+                    return
+                heapq.heappop(partition.heap)
+                partition.keys.discard(lowest_key)
+                self._scores[lowest_key].member = None
+                self._evicted += 1
+            partition.keys.add(key)
+            score.member = member
+        elif score.member is None:
+            score.member = member
+
+        self._sequence += 1
+        heapq.heappush(partition.heap, (score.rrf_score, self._sequence, key))
+        # Stale entries are bounded: rebuild once they outnumber the live ones
+        if len(partition.heap) > 2 * self._top_k + 16:
+            partition.heap = [(self._scores[live].rrf_score, sequence, live) for sequence, live in enumerate(partition.keys)]
+            heapq.heapify(partition.heap)
+
+    def _lowest(self, partition: _TopK) -> Tuple[float, Tuple[Hashable, str]]:
+        """
+        Drop stale entries from the top of a heap and read its lowest live key.
+
+        Args:
+            partition (_TopK): A full top k.
+
+        Returns:
+            Tuple[float, Tuple[Hashable, str]]: The lowest fused score and its key.
+        """
+        heap = partition.heap
+        while True:
+            rrf_score, _, key = heap[0]
+            if key in partition.keys and self._scores[key].rrf_score == rrf_score:
+                return rrf_score, key
+            heapq.heappop(heap)
+
+
+def merge_results(results: Iterable[Sequence[Any]], **merger_options: Any) -> MergeResult:
+    """
+    Merge complete result lists.
+
+    Args:
+        results (Iterable[Sequence[Any]]): Each query's members, best first.
+        **merger_options: Options of `StreamingResultMerger`.
+
+    Returns:
+        MergeResult: The merged results.
+    """
+    merger = StreamingResultMerger(**merger_options)
+    for query_results in results:
+        merger.add(query_results)
+    return merger.result()
+
+
+class _SimulatedMember(BaseModel):
+    """
+    Stand-in retrieved dimension member.
+    """
+
+    dim_type: str
+    dim_member_name: str
+    search_score: float
+
+
+async def _simulate(queries: int, results_per_query: int, dim_types: int, top_k: int) -> None:
+    """
+    Compare concatenating and regrouping results with the streaming merge, and check the merge against a full sort.
+
+    Args:
+        queries (int): Queries whose results are merged.
+        results_per_query (int): Members each query returns.
+        dim_types (int): Dimension types the members spread over.
+        top_k (int): Members kept per dimension type.
+    """
+    rng = random.Random(0)
+    # Queries overlap: members are drawn from a pool smaller than the results, the popular ones more often
+    pool = [(f"DimType{index % dim_types}", f"member {index}") for index in range(queries * results_per_query // 3)]
+    weights = [1.0 / (index + 1) ** 0.5 for index in range(len(pool))]
+    query_results = []
+    for _ in range(queries):
+        picked = list(dict.fromkeys(rng.choices(pool, weights=weights, k=results_per_query)))
+        scores = sorted((rng.random() for _ in picked), reverse=True)
+        query_results.append([_SimulatedMember(dim_type=dim_type, dim_member_name=name, search_score=score) for (dim_type, name), score in zip(picked, scores)])
+
+    async def query(results: List[_SimulatedMember]) -> List[_SimulatedMember]:
+        await asyncio.sleep(rng.random() * 0.01)
+        return results
+
+    start = perf_counter()
+    concatenated: List[_SimulatedMember] = []
+    grouped: Dict[str, List[_SimulatedMember]] = {}
+    for results in query_results:
+        concatenated.extend(results)
+        for member in results:
+            grouped.setdefault(member.dim_type, []).append(member)
+    concatenate_seconds = perf_counter() - start
+
+    start = perf_counter()
+    merge_results(query_results, top_k_per_dim_type=top_k)
+    merge_seconds = perf_counter() - start
+
+    # Streamed: each query is merged as it completes, in completion order
+    merger = StreamingResultMerger(top_k_per_dim_type=top_k)
+    await merger.consume(query(results) for results in query_results)
+    merged = merger.result()
+
+    # Exact top k per dimension type by fused score, from every result at once
+    fused: Dict[Tuple[str, str], float] = {}
+    for results in query_results:
+        for rank, member in enumerate(results, start=1):
+            key = (member.dim_type, member.dim_member_name)
+            fused[key] = fused.get(key, 0.0) + 1.0 / (60 + rank)
+    exact = {
+        dim_type: {key for key, _ in sorted(((key, score) for key, score in fused.items() if key[0] == dim_type), key=lambda item: -item[1])[:top_k]}
+        for dim_type in grouped
+    }
+    matches = all({(dim_type, member.name) for member in members} == exact[dim_type] for dim_type, members in merged.by_dim_type.items())
+
+    print(f"{queries} queries x {results_per_query} results over {dim_types} dimension types")
+    print(f"  concatenate + regroup: {concatenate_seconds * 1000:6.2f}ms, {len(concatenated)} members handed to hydration")
+    print(f"  streaming merge:       {merge_seconds * 1000:6.2f}ms, {len(merged.members)} members handed to hydration")
+    print(f"    {merged.received} received, {merged.unique} unique, {merged.duplicates} duplicates, {merged.evicted} evictions")
+    print(f"    top {top_k} per dimension type matches a full sort: {matches}")
+    best = merged.by_dim_type["DimType0"][0]
+    print(f"    best DimType0 member: {best.name} (rrf {best.rrf_score:.4f}, {best.queries} queries, best rank {best.best_rank})")
+
+
+def main() -> None:
+    """
+    Parse arguments and run the simulation.
+    """
+    parser = argparse.ArgumentParser(description="Compare concatenating search results with the streaming top-k merge.")
+    parser.add_argument("--queries", type=int, default=30, help="Queries whose results are merged.")
+    parser.add_argument("--results", type=int, default=200, help="Members each query returns.")
+    parser.add_argument("--dim-types", type=int, default=4, help="Dimension types the members spread over.")
+    parser.add_argument("--top-k", type=int, default=200, help="Members kept per dimension type.")
+    args = parser.parse_args()
+
+    asyncio.run(_simulate(queries=args.queries, results_per_query=args.results, dim_types=args.dim_types, top_k=args.top_k))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,871 @@
+"""
+==============================================================================
+Name: retrieval_benchmark
+Author: AI Assistant
+Date: 10/17/2026
+Description: Benchmark runner for AI Search dimension retrieval: seeded
+workload selection, concurrency sweeps with warm-up rounds, HDR latency
+histograms with percentiles, JSON/CSV reports, comparison of two runs, and a
+local stub index backend for offline runs.
+==============================================================================
+"""
+
+import argparse
+import asyncio
+import csv
+import math
+import random
+import sys
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from time import perf_counter, perf_counter_ns
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Sequence, Union
+
+from pydantic import BaseModel, Field
+
+DEFAULT_CONCURRENCY_LEVELS = (1, 5, 10, 30, 100)
+
+# Dimension searches of the "Northeast region revenue Q1 2024" pattern, shared with ai_search_test.py
+DIMENSION_SEARCHES: List[Dict[str, Any]] = [
+    # Revenue & Income Accounts
+    {
+        "focus": "revenue accounts",
+        "search_text": "revenue sales income",
+        "target_dim_types": ["Account"],
+        "description": "Finding revenue and sales accounts",
+    },
+    {
+        "focus": "gross profit",
+        "search_text": "gross profit margin",
+        "target_dim_types": ["Account"],
+        "description": "Finding gross profit accounts",
+    },
+    {
+        "focus": "operating income",
+        "search_text": "operating income EBITDA",
+        "target_dim_types": ["Account"],
+        "description": "Finding operating income accounts",
+    },
+    {
+        "focus": "net income",
+        "search_text": "net income earnings",
+        "target_dim_types": ["Account"],
+        "description": "Finding net income accounts",
+    },
+    # Expense & Cost Accounts
+    {
+        "focus": "operating expenses",
+        "search_text": "operating expenses OPEX",
+        "target_dim_types": ["Account"],
+        "description": "Finding operating expense accounts",
+    },
+    {
+        "focus": "cost of goods sold",
+        "search_text": "COGS cost of goods sold",
+        "target_dim_types": ["Account"],
+        "description": "Finding COGS accounts",
+    },
+    {
+        "focus": "SG&A expenses",
+        "search_text": "SGA selling general administrative",
+        "target_dim_types": ["Account"],
+        "description": "Finding SG&A expense accounts",
+    },
+    {
+        "focus": "R&D expenses",
+        "search_text": "research development RND",
+        "target_dim_types": ["Account"],
+        "description": "Finding R&D expense accounts",
+    },
+    # Balance Sheet Accounts
+    {
+        "focus": "current assets",
+        "search_text": "current assets cash inventory",
+        "target_dim_types": ["Account"],
+        "description": "Finding current asset accounts",
+    },
+    {
+        "focus": "fixed assets",
+        "search_text": "fixed assets PPE property plant equipment",
+        "target_dim_types": ["Account"],
+        "description": "Finding fixed asset accounts",
+    },
+    {
+        "focus": "accounts receivable",
+        "search_text": "accounts receivable AR",
+        "target_dim_types": ["Account"],
+        "description": "Finding receivables accounts",
+    },
+    {
+        "focus": "accounts payable",
+        "search_text": "accounts payable AP",
+        "target_dim_types": ["Account"],
+        "description": "Finding payables accounts",
+    },
+    {
+        "focus": "long-term debt",
+        "search_text": "long term debt liabilities",
+        "target_dim_types": ["Account"],
+        "description": "Finding long-term debt accounts",
+    },
+    {
+        "focus": "shareholders equity",
+        "search_text": "shareholders equity retained earnings",
+        "target_dim_types": ["Account"],
+        "description": "Finding equity accounts",
+    },
+    # Business Units & Entities
+    {
+        "focus": "cost centers",
+        "search_text": "cost centers departments",
+        "target_dim_types": ["Entity"],
+        "description": "Finding cost center entities",
+    },
+    {
+        "focus": "profit centers",
+        "search_text": "profit centers business units",
+        "target_dim_types": ["Entity"],
+        "description": "Finding profit center entities",
+    },
+    {
+        "focus": "business divisions",
+        "search_text": "business divisions segments",
+        "target_dim_types": ["Entity"],
+        "description": "Finding business division entities",
+    },
+    {
+        "focus": "subsidiaries",
+        "search_text": "subsidiaries affiliates",
+        "target_dim_types": ["Entity"],
+        "description": "Finding subsidiary entities",
+    },
+    {
+        "focus": "geographic regions",
+        "search_text": "geographic regions territories",
+        "target_dim_types": ["Entity"],
+        "description": "Finding geographic entities",
+    },
+    {
+        "focus": "product lines",
+        "search_text": "product lines business lines",
+        "target_dim_types": ["Entity"],
+        "description": "Finding product line entities",
+    },
+    {
+        "focus": "sales channels",
+        "search_text": "sales channels distribution",
+        "target_dim_types": ["Entity"],
+        "description": "Finding sales channel entities",
+    },
+    {
+        "focus": "manufacturing plants",
+        "search_text": "manufacturing plants facilities",
+        "target_dim_types": ["Entity"],
+        "description": "Finding manufacturing entities",
+    },
+    # Scenarios & Planning
+    {
+        "focus": "actual results",
+        "search_text": "actual results",
+        "target_dim_types": ["Scenario"],
+        "description": "Finding actual scenario types",
+    },
+    {
+        "focus": "budget plan",
+        "search_text": "budget plan annual",
+        "target_dim_types": ["Scenario"],
+        "description": "Finding budget scenarios",
+    },
+    {
+        "focus": "forecast projection",
+        "search_text": "forecast projection rolling",
+        "target_dim_types": ["Scenario"],
+        "description": "Finding forecast scenarios",
+    },
+    {
+        "focus": "prior year",
+        "search_text": "prior year PY",
+        "target_dim_types": ["Scenario"],
+        "description": "Finding prior year scenarios",
+    },
+    # Cash Flow & Working Capital
+    {
+        "focus": "cash flow operations",
+        "search_text": "cash flow operations CFO",
+        "target_dim_types": ["Account"],
+        "description": "Finding operating cash flow accounts",
+    },
+    {
+        "focus": "working capital",
+        "search_text": "working capital WC",
+        "target_dim_types": ["Account"],
+        "description": "Finding working capital accounts",
+    },
+    {
+        "focus": "capital expenditures",
+        "search_text": "capital expenditures CAPEX",
+        "target_dim_types": ["Account"],
+        "description": "Finding CAPEX accounts",
+    },
+    {
+        "focus": "depreciation amortization",
+        "search_text": "depreciation amortization DA",
+        "target_dim_types": ["Account"],
+        "description": "Finding depreciation accounts",
+    },
+]
+
+
+def select_searches(searches: Sequence[Dict[str, Any]], count: int, seed: int) -> List[Dict[str, Any]]:
+    """
+    Select searches reproducibly: the same seed and count always give the same searches in the same order.
+
+    Args:
+        searches (Sequence[Dict[str, Any]]): The searches to select from.
+        count (int): Searches to select. Every search, shuffled, if it is not less than their number.
+        seed (int): Seed of the selection.
+
+    Returns:
+        List[Dict[str, Any]]: The selected searches.
+    """
+    return random.Random(seed).sample(list(searches), min(count, len(searches)))
+
+
+class LatencyHistogram:
+    """
+    HDR-style histogram of latencies in microseconds: log-linear buckets with a fixed number of significant figures,
+    so every recorded value is kept within a relative error of 10^-significant_figures at any magnitude.
+    """
+
+    def __init__(self, significant_figures: int = 3):
+        """
+        Initialize an empty histogram.
+
+        Args:
+            significant_figures (int): Decimal digits of precision, 1 to 5.
+
+        Raises:
+            ValueError: If `significant_figures` is out of range.
+        """
+        if not 1 <= significant_figures <= 5:
+            raise ValueError("significant_figures must be between 1 and 5")
+        self.significant_figures = significant_figures
+        # Sub-buckets per power of two: enough to tell apart values 10^-digits apart
+        self._sub_bucket_bits = math.ceil(math.log2(2 * 10**significant_figures))
+        self._half_bits = self._sub_bucket_bits - 1
+        self.counts: Dict[int, int] = {}
+        self.total = 0
+        self.min_us: Optional[int] = None
+        self.max_us = 0
+        self._sum_us = 0
+
+    def record(self, value_us: int, count: int = 1) -> None:
+        """
+        Record a latency.
+
+        Args:
+            value_us (int): The latency in microseconds. Negative values are recorded as 0.
+            count (int): Times it occurred.
+        """
+        value_us = max(0, int(value_us))
+        index = self._index(value_us)
+        self.counts[index] = self.counts.get(index, 0) + count
+        self.total += count
+        self._sum_us += value_us * count
+        self.min_us = value_us if self.min_us is None else min(self.min_us, value_us)
+        self.max_us = max(self.max_us, value_us)
+
+    def record_seconds(self, seconds: float) -> None:
+        """
+        Record a latency given in seconds.
+
+        Args:
+            seconds (float): The latency.
+        """
+        self.record(round(seconds * 1e6))
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """
+        Add the counts of a histogram with the same precision.
+
+        Args:
+            other (LatencyHistogram): The histogram.
+
+        Raises:
+            ValueError: If its precision differs.
+        """
+        if other.significant_figures != self.significant_figures:
+            raise ValueError("Histograms with different significant figures cannot be merged")
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.total += other.total
+        self._sum_us += other._sum_us
+        if other.min_us is not None:
+            self.min_us = other.min_us if self.min_us is None else min(self.min_us, other.min_us)
+        self.max_us = max(self.max_us, other.max_us)
+
+    @property
+    def mean_us(self) -> float:
+        """
+        Returns the mean latency.
+
+        Returns:
+            float: The mean in microseconds, or 0.0 when empty.
+        """
+        return self._sum_us / self.total if self.total else 0.0
+
+    def percentile(self, percentile: float) -> int:
+        """
+        Read the latency at or below which a percentage of the recorded latencies fall.
+
+        Args:
+            percentile (float): The percentage, 0 to 100.
+
+        Returns:
+            int: The highest latency of its bucket in microseconds, at most the maximum recorded, or 0 when empty.
+        """
+        if not self.total:
+            return 0
+        target = max(1, math.ceil(percentile / 100 * self.total))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                return min(self._highest_equivalent(index), self.max_us)
+        return self.max_us
+
+    def summary(self, percentiles: Iterable[float] = (50, 90, 99, 99.9)) -> Dict[str, float]:
+        """
+        Summarize the histogram in milliseconds.
+
+        Args:
+            percentiles (Iterable[float]): Percentiles to report, as `p<percentile>_ms`.
+
+        Returns:
+            Dict[str, float]: Count, min, mean, percentiles and max.
+        """
+        summary: Dict[str, float] = {"count": self.total, "min_ms": (self.min_us or 0) / 1000, "mean_ms": self.mean_us / 1000}
+        for percentile in percentiles:
+            summary[f"p{percentile:g}_ms".replace(".", "_")] = self.percentile(percentile) / 1000
+        summary["max_ms"] = self.max_us / 1000
+        return summary
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serialize the histogram, with sparse bucket counts.
+
+        Returns:
+            Dict[str, Any]: The histogram.
+        """
+        return {
+            "unit": "us",
+            "significant_figures": self.significant_figures,
+            "total": self.total,
+            "min_us": self.min_us,
+            "max_us": self.max_us,
+            "sum_us": self._sum_us,
+            "counts": {str(index): count for index, count in sorted(self.counts.items())},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencyHistogram":
+        """
+        Deserialize a histogram written by `to_dict`.
+
+        Args:
+            data (Dict[str, Any]): The histogram.
+
+        Returns:
+            LatencyHistogram: The histogram.
+        """
+        histogram = cls(significant_figures=data["significant_figures"])
+        histogram.counts = {int(index): count for index, count in data["counts"].items()}
+        histogram.total = data["total"]
+        histogram.min_us = data["min_us"]
+        histogram.max_us = data["max_us"]
+        histogram._sum_us = data["sum_us"]
+        return histogram
+
+    def _index(self, value_us: int) -> int:
+        """
+        Compute the bucket of a value: values below 2^sub_bucket_bits have their own bucket, and every further power
+        of two is split into 2^(sub_bucket_bits - 1) buckets.
+        """
+        shift = max(0, value_us.bit_length() - self._sub_bucket_bits)
+        return (shift << self._half_bits) + (value_us >> shift)
+
+    def _highest_equivalent(self, index: int) -> int:
+        """
+        Compute the highest value of a bucket.
+        """
+        shift = max(0, (index >> self._half_bits) - 1)
+        return ((index - (shift << self._half_bits)) << shift) + (1 << shift) - 1
+
+
+class IRetrievalBackend(ABC):
+    """
+    Interface for the index a benchmark searches.
+    """
+
+    name: str = "backend"
+
+    @abstractmethod
+    async def search(self, search: Dict[str, Any]) -> Sequence[Any]:
+        """
+        Run one dimension search.
+
+        Args:
+            search (Dict[str, Any]): A search of the workload, with `search_text` and `target_dim_types`.
+
+        Returns:
+            Sequence[Any]: The retrieved members.
+        """
+
+
+class StubIndexBackend(IRetrievalBackend):
+    """
+    Local stand-in for the search index, for offline runs: a fixed number of searches are served at once, each for a
+    log-normally distributed time, and further searches queue. Service times only depend on the seed and the
+    search's position in the run, so runs with the same seed are comparable.
+    """
+
+    name = "stub"
+
+    def __init__(self, seed: int = 0, base_latency_seconds: float = 0.05, sigma: float = 0.35, capacity: int = 16, results: int = 200):
+        """
+        Initialize the stub.
+
+        Args:
+            seed (int): Seed of the service times.
+            base_latency_seconds (float): Median service time.
+            sigma (float): Spread of the log-normal service time.
+            capacity (int): Searches served at once.
+            results (int): Members each search returns.
+        """
+        self._seed = seed
+        self._base_latency_seconds = base_latency_seconds
+        self._sigma = sigma
+        self._slots = asyncio.Semaphore(capacity)
+        self._results = results
+        self._searches = 0
+
+    async def search(self, search: Dict[str, Any]) -> Sequence[Any]:
+        self._searches += 1
+        rng = random.Random(f"{self._seed}:{self._searches}:{search['search_text']}")
+        service_seconds = self._base_latency_seconds * rng.lognormvariate(0.0, self._sigma)
+        async with self._slots:
+            await asyncio.sleep(service_seconds)
+        return [search["search_text"]] * self._results
+
+
+class RubixRetrieverBackend(IRetrievalBackend):
+    """
+    The AI Search index through RubixRetriever, as searched by ai_search_test.py.
+    """
+
+    name = "rubix"
+
+    def __init__(self, rubix_retriever: Any, dim_type_router: Any, dimension_names: List[str], top_k: int = 200):
+        """
+        Initialize the backend.
+
+        Args:
+            rubix_retriever (RubixRetriever): The retriever.
+            dim_type_router (DimTypeRouter): Resolves a search's target labels to dimension types.
+            dimension_names (List[str]): Dimension names to search.
+            top_k (int): Members per search.
+        """
+        self._rubix_retriever = rubix_retriever
+        self._dim_type_router = dim_type_router
+        self._dimension_names = dimension_names
+        self._top_k = top_k
+
+    async def search(self, search: Dict[str, Any]) -> Sequence[Any]:
+        return await self._rubix_retriever.retrieve_dimensions_members_async(
+            search_text=search["search_text"],
+            top_k=self._top_k,
+            dim_types=self._dim_type_router.resolve(search["target_dim_types"]),
+            dim_names=self._dimension_names,
+            use_access_groups=True,
+        )
+
+
+@asynccontextmanager
+async def open_rubix_backend(top_k: int = 200) -> AsyncIterator[RubixRetrieverBackend]:
+    """
+    Set up the retriever the way ai_search_test.py does, for the duration of a benchmark.
+
+    Args:
+        top_k (int): Members per search.
+
+    Yields:
+        RubixRetrieverBackend: The backend.
+    """
+    from wernicke.config.env_config.constants import EnvVar
+    from wernicke.engines.llm.llm_orchestrators.store.rubix.get_cell_orchestrator import GetCellOrchestrator
+    from wernicke.engines.processing.onestream_metadata.manager import RubixDimensionManager
+    from wernicke.engines.retrieval.helpers import get_or_create_index_config
+    from wernicke.engines.retrieval.index_management.factory import IndexManagerFactory
+    from wernicke.engines.retrieval.index_management.models import IndexService
+    from wernicke.engines.retrieval.retriever.initiative_retrievers.rubix_retriever import RubixRetriever
+    from wernicke.managers.cosmos_database.azure_cosmos_manager import CosmosDatabaseManager
+    from wernicke.tests.shared_utils.test_session import create_test_user_session
+
+    from batched_retrieval import create_batching_http_client
+    from dim_type_router import DimTypeRouter
+
+    user_session_info = create_test_user_session()
+    http_async_client, _ = create_batching_http_client()
+    cosmos_db_manager = CosmosDatabaseManager(user_session_info=user_session_info)
+    user_session_info.database_connection = cosmos_db_manager
+    try:
+        rubix_manager = RubixDimensionManager(user_session_info=user_session_info, database_connection=user_session_info.database_connection)
+        search_index_name = user_session_info.environment_config_adapter.getenv(EnvVar.RUBIX_SEARCH_INDEX_NAME)
+        index_config = get_or_create_index_config(
+            user_session_info=user_session_info,
+            index_name=search_index_name,
+            initiative_name=GetCellOrchestrator.__name__,
+            index_config_file_name=user_session_info.environment_config_adapter.getenv(EnvVar.RUBIX_INDEX_CONFIG),
+        )
+        dimensions = await rubix_manager.get_dimensions_async()
+        dim_type_router = DimTypeRouter(dim_types=[dimension.related_dim_type for dimension in dimensions], dimensions=dimensions)
+
+        index_manager = IndexManagerFactory.get_index_manager(
+            index_service=IndexService.AZURE_COGNITIVE_SEARCH,
+            user_session_info=user_session_info,
+            index_name=search_index_name,
+            read_timeout=30,
+            connection_timeout=10,
+        )
+        async with index_manager:
+            rubix_retriever = RubixRetriever(
+                user_session_info=user_session_info,
+                index_service_retriever=await index_manager.as_retriever_async(index_config=index_config, embedding_http_async_client=http_async_client),
+            )
+            yield RubixRetrieverBackend(
+                rubix_retriever=rubix_retriever,
+                dim_type_router=dim_type_router,
+                dimension_names=[dimension.name for dimension in dimensions],
+                top_k=top_k,
+            )
+    finally:
+        await http_async_client.aclose()
+        cosmos_client = getattr(cosmos_db_manager, "_cosmos_client_async", None)
+        if cosmos_client:
+            await cosmos_client.close()
+
+
+class LevelResult(BaseModel):
+    """
+    Measurements at one concurrency level.
+
+    Attributes:
+        concurrency (int): Searches in flight at once.
+        requests (int): Measured searches, warm-up excluded.
+        errors (int): Measured searches that failed.
+        wall_seconds (float): Time of the measured searches.
+        throughput_rps (float): Successful searches per second.
+        results_per_search (float): Mean members per successful search.
+        latency (Dict[str, float]): Latency summary of successful searches, in milliseconds.
+        histogram (Dict[str, Any]): The latency histogram, as written by `LatencyHistogram.to_dict`.
+        error_types (Dict[str, int]): Failed searches per exception type.
+    """
+
+    concurrency: int
+    requests: int
+    errors: int
+    wall_seconds: float
+    throughput_rps: float
+    results_per_search: float
+    latency: Dict[str, float]
+    histogram: Dict[str, Any]
+    error_types: Dict[str, int] = Field(default_factory=dict)
+
+    @property
+    def error_rate(self) -> float:
+        """
+        Returns the fraction of measured searches that failed.
+
+        Returns:
+            float: The error rate.
+        """
+        return self.errors / self.requests if self.requests else 0.0
+
+
+class BenchmarkRun(BaseModel):
+    """
+    A benchmark run: its parameters and the measurements of every concurrency level.
+
+    Attributes:
+        backend (str): Backend name.
+        started_at (str): Start time, ISO 8601 UTC.
+        seed (int): Seed of the workload selection.
+        workload (List[str]): Focus of each selected search, in order.
+        requests_per_level (int): Measured searches per level.
+        warmup_rounds (int): Passes over the workload before measuring each level.
+        levels (List[LevelResult]): Measurements, by concurrency.
+    """
+
+    backend: str
+    started_at: str
+    seed: int
+    workload: List[str]
+    requests_per_level: int
+    warmup_rounds: int
+    levels: List[LevelResult] = Field(default_factory=list)
+
+    def to_json(self, path: Union[str, Path]) -> None:
+        """
+        Write the run as JSON, histograms included.
+
+        Args:
+            path (Union[str, Path]): The JSON file, overwritten.
+        """
+        Path(path).write_text(self.model_dump_json(indent=2), encoding="utf-8")
+
+    @classmethod
+    def from_json(cls, path: Union[str, Path]) -> "BenchmarkRun":
+        """
+        Read a run written by `to_json`.
+
+        Args:
+            path (Union[str, Path]): The JSON file.
+
+        Returns:
+            BenchmarkRun: The run.
+        """
+        return cls.model_validate_json(Path(path).read_text(encoding="utf-8"))
+
+    def to_csv(self, path: Union[str, Path]) -> None:
+        """
+        Write the run, one concurrency level per row.
+
+        Args:
+            path (Union[str, Path]): The CSV file, overwritten.
+        """
+        rows = [
+            {
+                "backend": self.backend,
+                "seed": self.seed,
+                "concurrency": level.concurrency,
+                "requests": level.requests,
+                "errors": level.errors,
+                "error_rate": round(level.error_rate, 6),
+                "throughput_rps": round(level.throughput_rps, 3),
+                "results_per_search": round(level.results_per_search, 1),
+                **{name: round(value, 3) for name, value in level.latency.items()},
+            }
+            for level in self.levels
+        ]
+        with open(path, "w", newline="", encoding="utf-8") as csv_file:
+            writer = csv.DictWriter(csv_file, fieldnames=list(rows[0]) if rows else ["backend"])
+            writer.writeheader()
+            writer.writerows(rows)
+
+
+async def run_level(backend: IRetrievalBackend, workload: Sequence[Dict[str, Any]], concurrency: int, requests: int, warmup_rounds: int) -> LevelResult:
+    """
+    Measure one concurrency level: `concurrency` workers each run the workload's next search as soon as their previous
+    one finished, so exactly `concurrency` searches are in flight until the last ones.
+
+    Args:
+        backend (IRetrievalBackend): The index.
+        workload (Sequence[Dict[str, Any]]): Searches, repeated in order.
+        concurrency (int): Workers.
+        requests (int): Measured searches.
+        warmup_rounds (int): Passes over the workload at this concurrency before measuring, not recorded.
+
+    Returns:
+        LevelResult: The measurements.
+    """
+
+    async def drive(count: int, histogram: Optional[LatencyHistogram], error_types: Dict[str, int], result_counts: List[int]) -> None:
+        positions = iter(range(count))
+
+        async def worker() -> None:
+            for position in positions:
+                search = workload[position % len(workload)]
+                start = perf_counter_ns()
+                try:
+                    results = await backend.search(search)
+                except Exception as error:
+                    error_types[type(error).__name__] = error_types.get(type(error).__name__, 0) + 1
+                    continue
+                if histogram is not None:
+                    histogram.record((perf_counter_ns() - start) // 1000)
+                    result_counts.append(len(results))
+
+        await asyncio.gather(*[worker() for _ in range(min(concurrency, count))])
+
+    if warmup_rounds:
+        await drive(count=warmup_rounds * len(workload), histogram=None, error_types={}, result_counts=[])
+
+    histogram = LatencyHistogram()
+    error_types: Dict[str, int] = {}
+    result_counts: List[int] = []
+    start = perf_counter()
+    await drive(count=requests, histogram=histogram, error_types=error_types, result_counts=result_counts)
+    wall_seconds = perf_counter() - start
+
+    return LevelResult(
+        concurrency=concurrency,
+        requests=requests,
+        errors=sum(error_types.values()),
+        wall_seconds=wall_seconds,
+        throughput_rps=histogram.total / wall_seconds if wall_seconds else 0.0,
+        results_per_search=sum(result_counts) / len(result_counts) if result_counts else 0.0,
+        latency=histogram.summary(),
+        histogram=histogram.to_dict(),
+        error_types=error_types,
+    )
+
+
+async def run_benchmark(
+    backend: IRetrievalBackend,
+    workload: Sequence[Dict[str, Any]],
+    seed: int,
+    concurrency_levels: Sequence[int] = DEFAULT_CONCURRENCY_LEVELS,
+    requests_per_level: int = 200,
+    warmup_rounds: int = 1,
+) -> BenchmarkRun:
+    """
+    Sweep the concurrency levels in order.
+
+    Args:
+        backend (IRetrievalBackend): The index.
+        workload (Sequence[Dict[str, Any]]): The selected searches.
+        seed (int): Seed the workload was selected with, recorded in the run.
+        concurrency_levels (Sequence[int]): Levels to measure.
+        requests_per_level (int): Measured searches per level.
+        warmup_rounds (int): Passes over the workload before measuring each level.
+
+    Returns:
+        BenchmarkRun: The run.
+
+    Raises:
+        ValueError: If the workload is empty, or a level or the request count is less than 1.
+    """
+    if not workload or requests_per_level < 1 or any(level < 1 for level in concurrency_levels):
+        raise ValueError("The workload must not be empty, and concurrency levels and requests_per_level must be >= 1")
+
+    run = BenchmarkRun(
+        backend=backend.name,
+        started_at=datetime.now(timezone.utc).isoformat(),
+        seed=seed,
+        workload=[search["focus"] for search in workload],
+        requests_per_level=requests_per_level,
+        warmup_rounds=warmup_rounds,
+    )
+    for concurrency in concurrency_levels:
+        level = await run_level(backend=backend, workload=workload, concurrency=concurrency, requests=requests_per_level, warmup_rounds=warmup_rounds)
+        run.levels.append(level)
+        print(
+            f"  concurrency {concurrency:>4}: {level.throughput_rps:8.1f} searches/s, p50 {level.latency['p50_ms']:8.1f}ms, "
+            f"p90 {level.latency['p90_ms']:8.1f}ms, p99 {level.latency['p99_ms']:8.1f}ms, errors {level.errors}/{level.requests}"
+        )
+    return run
+
+
+def compare_runs(baseline: BenchmarkRun, candidate: BenchmarkRun, max_regression: float = 0.1) -> List[str]:
+    """
+    Print the change of every metric between two runs, per concurrency level both measured.
+
+    Args:
+        baseline (BenchmarkRun): The reference run.
+        candidate (BenchmarkRun): The run compared with it.
+        max_regression (float): Relative worsening of p50/p90/p99 latency or throughput tolerated, e.g. 0.1 for 10%.
+
+    Returns:
+        List[str]: The regressions beyond `max_regression`, empty if none.
+    """
+    if baseline.seed != candidate.seed or baseline.workload != candidate.workload:
+        print("⚠️  The runs have different workloads; latencies are not directly comparable")
+
+    regressions: List[str] = []
+    baseline_levels = {level.concurrency: level for level in baseline.levels}
+    print(f"{'concurrency':>11} {'metric':>14} {'baseline':>10} {'candidate':>10} {'change':>8}")
+    for level in candidate.levels:
+        reference = baseline_levels.get(level.concurrency)
+        if reference is None:
+            continue
+        metrics = [(name, reference.latency[name], level.latency[name], True) for name in ("p50_ms", "p90_ms", "p99_ms")]
+        metrics.append(("throughput_rps", reference.throughput_rps, level.throughput_rps, False))
+        metrics.append(("error_rate", reference.error_rate, level.error_rate, True))
+        for name, before, after, lower_is_better in metrics:
+            change = (after - before) / before if before else (0.0 if after == before else math.inf)
+            worse = change if lower_is_better else -change
+            flag = ""
+            if name != "error_rate" and worse > max_regression:
+                flag = " ⚠️"
+                regressions.append(f"concurrency {level.concurrency}: {name} {before:.3f} -> {after:.3f} ({change:+.1%})")
+            elif name == "error_rate" and after > before:
+                flag = " ⚠️"
+                regressions.append(f"concurrency {level.concurrency}: error rate {before:.2%} -> {after:.2%}")
+            print(f"{level.concurrency:>11} {name:>14} {before:>10.3f} {after:>10.3f} {change:>+8.1%}{flag}")
+    return regressions
+
+
+async def _run(args: argparse.Namespace) -> BenchmarkRun:
+    """
+    Run a benchmark from command-line arguments.
+
+    Args:
+        args (argparse.Namespace): The `run` arguments.
+
+    Returns:
+        BenchmarkRun: The run.
+    """
+    workload = select_searches(DIMENSION_SEARCHES, count=args.searches, seed=args.seed)
+    levels = [int(level) for level in args.concurrency.split(",")]
+    print(f"Benchmarking {args.backend} with {len(workload)} searches (seed {args.seed}), {args.requests} searches per level")
+
+    if args.backend == "stub":
+        backend = StubIndexBackend(seed=args.seed, base_latency_seconds=args.stub_latency, capacity=args.stub_capacity)
+        return await run_benchmark(backend, workload, seed=args.seed, concurrency_levels=levels, requests_per_level=args.requests, warmup_rounds=args.warmup)
+    async with open_rubix_backend(top_k=args.top_k) as backend:
+        return await run_benchmark(backend, workload, seed=args.seed, concurrency_levels=levels, requests_per_level=args.requests, warmup_rounds=args.warmup)
+
+
+def main() -> None:
+    """
+    Parse arguments and run or compare benchmarks.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark AI Search dimension retrieval across concurrency levels.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    run = commands.add_parser("run", help="Run a concurrency sweep.")
+    run.add_argument("--backend", choices=["stub", "rubix"], default="stub", help="Index to search; stub runs offline.")
+    run.add_argument("--seed", type=int, default=42, help="Seed of the workload selection.")
+    run.add_argument("--searches", type=int, default=30, help="Searches selected from the workload.")
+    run.add_argument("--concurrency", default=",".join(str(level) for level in DEFAULT_CONCURRENCY_LEVELS), help="Comma-separated levels.")
+    run.add_argument("--requests", type=int, default=200, help="Measured searches per level.")
+    run.add_argument("--warmup", type=int, default=1, help="Passes over the workload before measuring each level.")
+    run.add_argument("--top-k", type=int, default=200, help="Members per search (rubix backend).")
+    run.add_argument("--stub-latency", type=float, default=0.05, help="Median search time of the stub, in seconds.")
+    run.add_argument("--stub-capacity", type=int, default=16, help="Searches the stub serves at once.")
+    run.add_argument("--json", type=Path, help="Write the run, histograms included, to this JSON file.")
+    run.add_argument("--csv", type=Path, help="Write one row per concurrency level to this CSV file.")
+    compare = commands.add_parser("compare", help="Diff two runs written with --json.")
+    compare.add_argument("baseline", type=Path, help="Reference run.")
+    compare.add_argument("candidate", type=Path, help="Run compared with it.")
+    compare.add_argument("--max-regression", type=float, default=0.1, help="Relative worsening tolerated before exiting with 1.")
+    args = parser.parse_args()
+
+    if args.command == "compare":
+        regressions = compare_runs(BenchmarkRun.from_json(args.baseline), BenchmarkRun.from_json(args.candidate), max_regression=args.max_regression)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        sys.exit(1 if regressions else 0)
+
+    benchmark_run = asyncio.run(_run(args))
+    if args.json:
+        benchmark_run.to_json(args.json)
+        print(f"Run written to {args.json}")
+    if args.csv:
+        benchmark_run.to_csv(args.csv)
+        print(f"Levels written to {args.csv}")
+
+
+if __name__ == "__main__":
+    main()
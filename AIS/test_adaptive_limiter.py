@@ -0,0 +1,120 @@
+"""
+==============================================================================
+Name: test_adaptive_limiter
+Author: AI Assistant
+Date: 10/17/2026
+Description: Tests of throttling detection, the AIMD policy and the adaptive
+concurrency limiter's bounds, back-off, queue and retries.
+==============================================================================
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from adaptive_limiter import (
+    AdaptiveLimiter,
+    AIMDPolicy,
+    LimiterOverloadedError,
+    LimitSample,
+    Outcome,
+    is_throttling_error,
+    retry_after_seconds,
+)
+
+
+class _StatusError(Exception):
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"status {status_code}")
+        self.response = SimpleNamespace(status_code=status_code, headers=headers or {})
+
+
+def test_throttling_is_detected_from_status_timeouts_and_messages():
+    assert is_throttling_error(_StatusError(429))
+    assert is_throttling_error(_StatusError(503))
+    assert not is_throttling_error(_StatusError(400))
+    assert is_throttling_error(asyncio.TimeoutError())
+    assert is_throttling_error(RuntimeError("Request rate is large"))
+    assert not is_throttling_error(RuntimeError("bad query"))
+
+
+def test_retry_after_prefers_milliseconds():
+    assert retry_after_seconds(_StatusError(429, {"retry-after-ms": "250", "retry-after": "3"})) == 0.25
+    assert retry_after_seconds(_StatusError(429, {"retry-after": "3"})) == 3.0
+    assert retry_after_seconds(_StatusError(429, {"retry-after": "soon"})) is None
+    assert retry_after_seconds(RuntimeError("no response")) is None
+
+
+def test_aimd_grows_only_when_the_limit_is_used_and_backs_off_on_throttling():
+    policy = AIMDPolicy(increase=1.0, backoff_ratio=0.5)
+
+    assert policy.update(limit=4.0, sample=LimitSample(latency_seconds=0.1, outcome=Outcome.SUCCESS, in_flight=4)) == 4.25
+    assert policy.update(limit=4.0, sample=LimitSample(latency_seconds=0.1, outcome=Outcome.SUCCESS, in_flight=1)) == 4.0
+    assert policy.update(limit=4.0, sample=LimitSample(latency_seconds=0.1, outcome=Outcome.ERROR, in_flight=4)) == 4.0
+    assert policy.update(limit=4.0, sample=LimitSample(latency_seconds=0.1, outcome=Outcome.THROTTLED, in_flight=4)) == 2.0
+
+
+def test_limiter_bounds_calls_in_flight():
+    limiter = AdaptiveLimiter(initial_limit=2, max_limit=2)
+    peak = 0
+
+    async def call():
+        nonlocal peak
+        peak = max(peak, limiter.in_flight)
+        await asyncio.sleep(0.01)
+
+    async def main():
+        await asyncio.gather(*(limiter.run(call) for _ in range(6)))
+
+    asyncio.run(main())
+
+    assert peak == 2 and limiter.in_flight == 0 and limiter.waiting == 0
+
+
+def test_a_burst_of_throttling_backs_off_once():
+    limiter = AdaptiveLimiter(policy=AIMDPolicy(backoff_ratio=0.5), initial_limit=8, max_limit=8)
+
+    async def main():
+        permits = [await limiter.acquire() for _ in range(4)]
+        for permit in permits:
+            limiter.release(permit=permit, outcome=Outcome.THROTTLED)
+
+    asyncio.run(main())
+
+    assert limiter.limit == 4
+
+
+def test_full_queue_fails_fast():
+    limiter = AdaptiveLimiter(initial_limit=1, max_limit=1, max_waiting=0)
+
+    async def main():
+        permit = await limiter.acquire()
+        with pytest.raises(LimiterOverloadedError):
+            await limiter.acquire()
+        limiter.release(permit=permit, outcome=None)
+
+    asyncio.run(main())
+
+
+def test_run_retries_throttled_calls_and_raises_other_errors():
+    limiter = AdaptiveLimiter()
+    attempts = []
+
+    async def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise _StatusError(429, {"retry-after-ms": "1"})
+        return "ok"
+
+    async def broken():
+        raise ValueError("bad request")
+
+    async def main():
+        assert await limiter.run(flaky) == "ok"
+        with pytest.raises(ValueError):
+            await limiter.run(broken)
+
+    asyncio.run(main())
+
+    assert len(attempts) == 3 and limiter.in_flight == 0
@@ -0,0 +1,45 @@
+"""
+==============================================================================
+Name: test_ai_search_test
+Author: AI Assistant
+Date: 10/17/2026
+Description: Checks of the AI Search performance test script that do not need
+its services: every module-level name is bound before it is used.
+==============================================================================
+"""
+
+import ast
+import builtins
+from pathlib import Path
+
+SCRIPT = Path(__file__).with_name("ai_search_test.py")
+
+
+def _bound_names(statement: ast.stmt) -> set:
+    if isinstance(statement, (ast.Import, ast.ImportFrom)):
+        return {(alias.asname or alias.name).split(".")[0] for alias in statement.names}
+    if isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+        return {statement.name}
+    return {node.id for node in ast.walk(statement) if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store)}
+
+
+def _loaded_names(statement: ast.stmt) -> set:
+    # Function and class bodies run later; only their decorators, defaults and bases run at import
+    if isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef)):
+        nodes = [*statement.decorator_list, *statement.args.defaults, *statement.args.kw_defaults]
+    elif isinstance(statement, ast.ClassDef):
+        nodes = [*statement.decorator_list, *statement.bases]
+    else:
+        nodes = [statement]
+    return {node.id for root in nodes if root is not None for node in ast.walk(root) if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load)}
+
+
+def test_module_level_names_are_bound_before_use():
+    module = ast.parse(SCRIPT.read_text(), filename=str(SCRIPT))
+    bound = set(dir(builtins)) | {"__name__", "__file__"}
+    unbound = []
+    for statement in module.body:
+        unbound.extend(f"{name} (line {statement.lineno})" for name in sorted(_loaded_names(statement) - bound))
+        bound |= _bound_names(statement)
+
+    assert not unbound, f"used before it is bound: {unbound}"
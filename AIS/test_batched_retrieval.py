@@ -0,0 +1,184 @@
+"""
+==============================================================================
+Name: test_batched_retrieval
+Author: AI Assistant
+Date: 10/17/2026
+Description: Tests of the multi-query dimension retrieval: repeated searches,
+opt-in deduplication, per-search completion and failures, and of the embedding
+batching transport's task handling.
+==============================================================================
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from adaptive_limiter import AdaptiveLimiter
+from batched_retrieval import DimensionSearch, EmbeddingBatchingTransport, retrieve_dimensions_members_batch_async
+
+
+class _Retriever:
+    def __init__(self, latencies=None, failing=()):
+        self.calls = []
+        self.cancelled = []
+        self._latencies = latencies or {}
+        self._failing = set(failing)
+
+    async def retrieve_dimensions_members_async(self, search_text, top_k, dim_types, dim_names, use_access_groups):
+        self.calls.append(search_text)
+        try:
+            await asyncio.sleep(self._latencies.get(search_text, 0))
+        except asyncio.CancelledError:
+            self.cancelled.append(search_text)
+            raise
+        if search_text in self._failing:
+            raise RuntimeError(f"{search_text} failed")
+        return [f"{search_text} member"]
+
+
+def _retrieve(retriever, searches, **kwargs):
+    return asyncio.run(retrieve_dimensions_members_batch_async(rubix_retriever=retriever, searches=searches, dim_types=["Account"], **kwargs))
+
+
+def test_repeated_rounds_run_every_search():
+    retriever = _Retriever()
+
+    results = _retrieve(retriever, ["a", "b"] * 3)
+
+    assert len(retriever.calls) == 6
+    assert results == [["a member"], ["b member"]] * 3
+
+
+def test_deduplicate_runs_identical_searches_once():
+    retriever = _Retriever()
+    searches = ["a", DimensionSearch(search_text="a", dim_types=["Account"]), "b", "a"]
+
+    results = _retrieve(retriever, searches, deduplicate=True)
+
+    assert sorted(retriever.calls) == ["a", "b"]
+    assert results == [["a member"], ["a member"], ["b member"], ["a member"]]
+
+
+def test_on_result_reports_each_search_as_it_completes():
+    retriever = _Retriever(latencies={"slow": 0.05, "fast": 0.0})
+    completed = []
+
+    _retrieve(retriever, ["slow", "fast"], on_result=lambda index, result: completed.append(index))
+
+    assert completed == [1, 0]
+
+
+def test_failures_are_returned_in_place_or_raised():
+    retriever = _Retriever(failing={"bad"})
+    completed = {}
+
+    results = _retrieve(retriever, ["good", "bad"], return_exceptions=True, on_result=completed.__setitem__)
+
+    assert results[0] == ["good member"]
+    assert isinstance(results[1], RuntimeError) and completed[1] is results[1]
+    with pytest.raises(RuntimeError):
+        _retrieve(_Retriever(failing={"bad"}), ["good", "bad"])
+
+
+def test_results_can_be_left_to_on_result():
+    received = {}
+
+    results = _retrieve(_Retriever(failing={"bad"}), ["good", "bad"], return_exceptions=True, keep_results=False, on_result=received.__setitem__)
+
+    assert results[0] is None and isinstance(results[1], RuntimeError)
+    assert received[0] == ["good member"]
+
+
+def test_first_failure_cancels_the_searches_still_running():
+    retriever = _Retriever(latencies={"slow": 0.05, "slower": 10.0}, failing={"bad"})
+    limiter = AdaptiveLimiter(initial_limit=4)
+    completed = []
+
+    async def main():
+        with pytest.raises(RuntimeError):
+            await retrieve_dimensions_members_batch_async(
+                rubix_retriever=retriever,
+                searches=["bad", "slow", "slower", "fast"],
+                limiter=limiter,
+                on_result=lambda index, result: completed.append(index),
+            )
+        in_flight = limiter.in_flight
+        await asyncio.sleep(0.1)
+        return in_flight
+
+    assert asyncio.run(main()) == 0
+    assert sorted(retriever.cancelled) == ["slow", "slower"]
+    assert completed == [3]
+
+
+def _embeddings_endpoint(release, sent):
+    async def handler(request):
+        inputs = json.loads(request.content)["input"]
+        sent.append(inputs)
+        await release.wait()
+        return httpx.Response(200, json={"data": [{"index": index, "embedding": [0.0]} for index in range(len(inputs))], "usage": {}})
+
+    return httpx.MockTransport(handler)
+
+
+def _embed(client, *texts):
+    return client.post("https://embeddings.local/openai/deployments/embed/embeddings", json={"input": list(texts)})
+
+
+def test_transport_holds_batch_tasks_until_they_finish():
+    async def main():
+        release, sent = asyncio.Event(), []
+        transport = EmbeddingBatchingTransport(transport=_embeddings_endpoint(release, sent), max_wait_seconds=0)
+        async with httpx.AsyncClient(transport=transport) as client:
+            requests = [asyncio.ensure_future(_embed(client, text)) for text in ("a", "b")]
+            while not sent:
+                await asyncio.sleep(0)
+            assert len(transport._tasks) == 1
+            release.set()
+            responses = await asyncio.gather(*requests)
+        return transport, sent, responses
+
+    transport, sent, responses = asyncio.run(main())
+
+    assert sent == [["a", "b"]]
+    assert [response.json()["data"][0]["index"] for response in responses] == [0, 0]
+    assert transport._tasks == set()
+
+
+def test_aclose_cancels_batches_in_flight_and_waiting():
+    async def main():
+        release, sent = asyncio.Event(), []
+        transport = EmbeddingBatchingTransport(transport=_embeddings_endpoint(release, sent), max_wait_seconds=60, max_batch_inputs=2)
+        client = httpx.AsyncClient(transport=transport)
+        # A full batch is sent at once; a partial one waits for others to join
+        in_flight = asyncio.ensure_future(_embed(client, "a1", "a2"))
+        while not sent:
+            await asyncio.sleep(0)
+        waiting = asyncio.ensure_future(_embed(client, "b"))
+        await asyncio.sleep(0.01)
+
+        await client.aclose()
+        results = await asyncio.gather(in_flight, waiting, return_exceptions=True)
+        return transport, sent, results
+
+    transport, sent, results = asyncio.run(main())
+
+    assert sent == [["a1", "a2"]]
+    assert all(isinstance(result, asyncio.CancelledError) for result in results)
+    assert transport._tasks == set() and transport._pending == {}
+
+
+def test_failed_batch_fails_every_member():
+    async def handler(request):
+        raise httpx.ConnectError("endpoint down", request=request)
+
+    async def main():
+        transport = EmbeddingBatchingTransport(transport=httpx.MockTransport(handler), max_wait_seconds=0.01)
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await asyncio.gather(_embed(client, "a"), _embed(client, "b"), return_exceptions=True)
+
+    results = asyncio.run(main())
+
+    assert all(isinstance(result, httpx.ConnectError) for result in results)
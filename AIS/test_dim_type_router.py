@@ -0,0 +1,84 @@
+"""
+==============================================================================
+Name: test_dim_type_router
+Author: AI Assistant
+Date: 10/17/2026
+Description: Tests of dimension label resolution: label matching, catalog
+order, memoization, fallback policies and versioned rebuilds.
+==============================================================================
+"""
+
+from enum import Enum
+from types import SimpleNamespace
+
+import pytest
+
+from dim_type_router import DimTypeRouter, FallbackPolicy, UnresolvedDimTypeError, normalize_label
+
+
+class _DimType(str, Enum):
+    ENTITY = "Entity"
+    ACCOUNT = "Account"
+    UD1 = "UD1"
+
+
+DIMENSIONS = [SimpleNamespace(name="Cost Centers", related_dim_type=_DimType.UD1)]
+
+
+def _router(**kwargs):
+    return DimTypeRouter(dim_types=list(_DimType), dimensions=DIMENSIONS, **kwargs)
+
+
+def test_normalize_label():
+    assert normalize_label("  Cost   CENTERS ") == "cost centers"
+    assert normalize_label(_DimType.UD1) == "ud1"
+
+
+def test_labels_resolve_by_value_enum_name_and_dimension_name():
+    router = _router()
+
+    assert router.resolve(["account"]) == [_DimType.ACCOUNT]
+    assert router.resolve(["UD1"]) == [_DimType.UD1]
+    assert router.resolve(["cost centers", "Entity"]) == [dim_type for dim_type in router.dim_types if dim_type in (_DimType.ENTITY, _DimType.UD1)]
+    # A label contained in a key matches too
+    assert router.resolve(["cost"]) == [_DimType.UD1]
+
+
+def test_resolutions_are_memoized():
+    router = _router()
+
+    router.resolve(["Account"])
+    router.resolve(["Account"])
+
+    assert router.stats.resolutions == 2 and router.stats.memo_hits == 1
+
+
+@pytest.mark.parametrize(
+    "policy, expected",
+    [(FallbackPolicy.ALL, 3), (FallbackPolicy.FIRST_N, 2), (FallbackPolicy.NONE, 0)],
+)
+def test_fallback_policies(policy, expected):
+    router = _router(fallback_policy=policy)
+
+    assert len(router.resolve(["Scenario"])) == expected
+    assert router.stats.fallbacks == 1
+
+
+def test_raise_policy():
+    with pytest.raises(UnresolvedDimTypeError):
+        _router(fallback_policy=FallbackPolicy.RAISE).resolve(["Scenario"])
+
+
+def test_rebuild_only_on_a_new_version():
+    router = _router(version="v1")
+
+    assert not router.rebuild(dim_types=list(_DimType), version="v1")
+    assert router.rebuild(dim_types=[_DimType.ENTITY], version="v2")
+    assert router.dim_types == (_DimType.ENTITY,)
+    assert router.resolve_label("cost centers") == ()
+    assert router.stats.rebuilds == 2
+
+
+def test_fallback_count_must_be_positive():
+    with pytest.raises(ValueError):
+        _router(fallback_count=0)
@@ -0,0 +1,87 @@
+"""
+==============================================================================
+Name: test_dimension_snapshot
+Author: AI Assistant
+Date: 10/17/2026
+Description: Tests of the memory-mapped dimension snapshot: round trip,
+deterministic encoding, lookups and corruption detection.
+==============================================================================
+"""
+
+from enum import Enum
+from types import SimpleNamespace
+
+import pytest
+
+from dimension_snapshot import DimensionSnapshot, SnapshotError, encode_snapshot, stale_reason, write_snapshot
+
+
+class _DimType(Enum):
+    ENTITY = "Entity"
+    ACCOUNT = "Account"
+
+
+DIMENSIONS = [SimpleNamespace(name="Corp", related_dim_type=_DimType.ENTITY), SimpleNamespace(name="Chart", related_dim_type=_DimType.ACCOUNT)]
+MEMBERS = [
+    SimpleNamespace(name="Sales", dim_type=_DimType.ACCOUNT, member_id=7, description="Net sales", dimensions=["Chart"], children=[]),
+    SimpleNamespace(name="Total", dim_type=_DimType.ENTITY, member_id=1, children=["Europe", "Asia"]),
+    SimpleNamespace(name="Europe", dim_type=_DimType.ENTITY, member_id=2, parent_hierarchy="Total"),
+    SimpleNamespace(name="Asia", dim_type=_DimType.ENTITY, member_id=None, parent_hierarchy="Total"),
+]
+
+
+@pytest.fixture
+def snapshot_path(tmp_path):
+    path = tmp_path / "dimensions.snapshot"
+    write_snapshot(path, dimensions=DIMENSIONS, members=MEMBERS)
+    return path
+
+
+def test_round_trip(snapshot_path):
+    with DimensionSnapshot(snapshot_path, verify=True) as snapshot:
+        assert snapshot.dim_types() == ["Account", "Entity"]
+        assert snapshot.member_names("Entity") == ["Asia", "Europe", "Total"]
+        assert snapshot.members(_DimType.ACCOUNT)[0].model_dump() == {
+            "name": "Sales",
+            "description": "Net sales",
+            "member_id": 7,
+            "dim_type": "Account",
+            "dimensions": ["Chart"],
+            "parent_hierarchy": "",
+            "children": [],
+        }
+        total = snapshot.find_member("Entity", "Total")
+        assert total.children == ["Europe", "Asia"] and total.member_id == 1
+        assert snapshot.find_member("Entity", "Asia").member_id is None
+        assert snapshot.find_member("Entity", "Africa") is None
+        assert snapshot.find_member("Scenario", "Actual") is None
+
+
+def test_encoding_depends_only_on_content():
+    first = encode_snapshot(dimensions=DIMENSIONS, members=MEMBERS, created_at=0.0)
+    second = encode_snapshot(dimensions=list(reversed(DIMENSIONS)), members=list(reversed(MEMBERS)), created_at=0.0)
+
+    assert first == second
+
+
+def test_corruption_is_detected(snapshot_path):
+    content = bytearray(snapshot_path.read_bytes())
+    content[-1] ^= 0xFF
+    snapshot_path.write_bytes(bytes(content))
+
+    with pytest.raises(SnapshotError, match="checksum"):
+        DimensionSnapshot(snapshot_path, verify=True)
+    assert "checksum" in stale_reason(snapshot_path)
+
+
+def test_truncated_file_is_rejected(snapshot_path):
+    snapshot_path.write_bytes(snapshot_path.read_bytes()[:-8])
+
+    with pytest.raises(SnapshotError):
+        DimensionSnapshot(snapshot_path)
+
+
+def test_stale_reason(snapshot_path, tmp_path):
+    assert stale_reason(snapshot_path) is None
+    assert stale_reason(tmp_path / "missing.snapshot") == "no snapshot"
+    assert stale_reason(snapshot_path, max_age_seconds=-1).endswith("old")
@@ -0,0 +1,90 @@
+"""
+==============================================================================
+Name: test_embedding_cache
+Author: AI Assistant
+Date: 10/17/2026
+Description: Tests of the embedding cache: key normalization, LRU eviction,
+the on-disk store and the caching httpx transport.
+==============================================================================
+"""
+
+import asyncio
+import json
+
+import httpx
+
+from embedding_cache import EmbeddingCache, EmbeddingCacheTransport, MmapEmbeddingStore, pack_embedding, unpack_embedding
+
+URL = "https://embeddings.local/openai/deployments/text-embedding-3-small/embeddings"
+
+
+def test_keys_normalize_text_and_separate_models_and_options():
+    cache = EmbeddingCache()
+
+    assert cache.key(model="m", text="  revenue \n sales ") == cache.key(model="m", text="revenue sales")
+    assert cache.key(model="m", text="Revenue") != cache.key(model="m", text="revenue")
+    assert EmbeddingCache(casefold=True).key(model="m", text="Revenue") == EmbeddingCache(casefold=True).key(model="m", text="revenue")
+    assert cache.key(model="m", text="a") != cache.key(model="n", text="a")
+    assert cache.key(model="m", text="a", options={"dimensions": 256}) != cache.key(model="m", text="a")
+
+
+def test_memory_is_bounded_least_recently_used_first():
+    cache = EmbeddingCache(max_entries=2)
+    keys = [cache.key(model="m", text=text) for text in "abc"]
+    cache.put(keys[0], b"a" * 4)
+    cache.put(keys[1], b"b" * 4)
+    cache.get(keys[0])
+    cache.put(keys[2], b"c" * 4)
+
+    assert cache.get(keys[1]) is None and cache.get(keys[0]) == b"a" * 4
+    assert cache.stats.evictions == 1
+
+
+def test_disk_store_survives_reopening_and_drops_torn_writes(tmp_path):
+    vector = pack_embedding([0.5, -1.0, 2.0])
+    cache = EmbeddingCache(directory=tmp_path)
+    key = cache.key(model="m", text="a")
+    cache.put(key, vector)
+    cache.close()
+
+    with open(tmp_path / "3.f32", "ab") as vector_file:
+        vector_file.write(b"\0" * 5)
+    reopened = EmbeddingCache(directory=tmp_path)
+
+    assert reopened.get(key) == vector and reopened.stats.disk_hits == 1
+    assert len(MmapEmbeddingStore(tmp_path)) == 1
+    reopened.close()
+
+
+def test_pack_and_unpack_round_trip():
+    vector = pack_embedding([0.25, 1.5])
+
+    assert unpack_embedding(vector, "float") == [0.25, 1.5]
+    assert pack_embedding(unpack_embedding(vector, "base64")) == vector
+
+
+def test_transport_sends_only_the_misses():
+    sent = []
+
+    async def endpoint(request):
+        if request.method != "POST":
+            return httpx.Response(405)
+        texts = json.loads(request.content)["input"]
+        sent.append(texts)
+        data = [{"object": "embedding", "index": index, "embedding": [float(len(text))]} for index, text in enumerate(texts)]
+        return httpx.Response(200, json={"object": "list", "data": data, "usage": {"prompt_tokens": 1, "total_tokens": 1}})
+
+    async def main():
+        transport = EmbeddingCacheTransport(cache=EmbeddingCache(), transport=httpx.MockTransport(endpoint))
+        async with httpx.AsyncClient(transport=transport) as client:
+            first = (await client.post(URL, json={"input": ["ab", "abc"]})).json()
+            second = (await client.post(URL, json={"input": ["abc", "abcd"]})).json()
+            passthrough = await client.get(URL)
+        return first, second, passthrough
+
+    first, second, passthrough = asyncio.run(main())
+
+    assert sent == [["ab", "abc"], ["abcd"]]
+    assert [item["embedding"] for item in first["data"]] == [[2.0], [3.0]]
+    assert [item["embedding"] for item in second["data"]] == [[3.0], [4.0]]
+    assert passthrough.status_code == 405
@@ -0,0 +1,127 @@
+"""
+==============================================================================
+Name: test_member_hydration
+Author: AI Assistant
+Date: 10/17/2026
+Description: Tests of the member hydration stage: per-partition deduplication,
+chunking, retrieval-order reassembly, missing members, errors and the
+concurrency bound.
+==============================================================================
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from member_hydration import hydrate_dimension_members_async
+
+
+def _member(dim_type, name):
+    return SimpleNamespace(dim_type=dim_type, dim_member_name=name, name=name)
+
+
+class _Manager:
+    """Fake RubixDimensionManager returning rows in reverse order, recording every IN query."""
+
+    def __init__(self, unknown=(), failing=(), latency_seconds=0.0):
+        self.queries = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._unknown = set(unknown)
+        self._failing = set(failing)
+        self._latency_seconds = latency_seconds
+
+    async def get_dim_members_async(self, dim_type, dim_member_names):
+        self.queries.append((dim_type, list(dim_member_names)))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self._latency_seconds)
+        finally:
+            self.in_flight -= 1
+        if dim_type in self._failing:
+            raise RuntimeError(f"{dim_type} failed")
+        return [_member(dim_type, name) for name in reversed(dim_member_names) if name not in self._unknown]
+
+
+def _hydrate(manager, retrieved, **kwargs):
+    return asyncio.run(hydrate_dimension_members_async(rubix_manager=manager, retrieved_members=retrieved, **kwargs))
+
+
+def test_names_are_deduplicated_per_dimension_type():
+    manager = _Manager()
+    retrieved = [_member("Account", "cash"), _member("Entity", "cash"), _member("Account", "cash"), _member("Account", "debt")]
+
+    result = _hydrate(manager, retrieved)
+
+    assert sorted(manager.queries) == [("Account", ["cash", "debt"]), ("Entity", ["cash"])]
+    assert (result.retrieved, result.duplicates_removed, result.partitions) == (4, 1, 2)
+
+
+def test_names_are_split_into_chunks():
+    manager = _Manager()
+    retrieved = [_member("Account", f"m{index}") for index in range(5)] + [_member("Entity", "e0")]
+
+    result = _hydrate(manager, retrieved, chunk_size=2)
+
+    assert sorted(manager.queries) == [("Account", ["m0", "m1"]), ("Account", ["m2", "m3"]), ("Account", ["m4"]), ("Entity", ["e0"])]
+    assert result.chunks == 4
+
+
+def test_members_are_reassembled_in_retrieval_order():
+    retrieved = [_member("Entity", "e1"), _member("Account", "a2"), _member("Account", "a1"), _member("Entity", "e0"), _member("Account", "a2")]
+
+    result = _hydrate(_Manager(), retrieved, chunk_size=1)
+
+    assert [(member.dim_type, member.name) for member in result.members] == [("Entity", "e1"), ("Account", "a2"), ("Account", "a1"), ("Entity", "e0")]
+    assert {dim_type: [member.name for member in members] for dim_type, members in result.by_dim_type.items()} == {
+        "Entity": ["e1", "e0"],
+        "Account": ["a2", "a1"],
+    }
+
+
+def test_members_without_a_record_are_missing():
+    retrieved = [_member("Account", "a1"), _member("Account", "gone"), _member("Entity", "gone")]
+
+    result = _hydrate(_Manager(unknown={"gone"}), retrieved)
+
+    assert [member.name for member in result.members] == ["a1"]
+    assert result.missing == [("Account", "gone"), ("Entity", "gone")]
+
+
+def test_chunk_errors_are_collected_without_raise_on_error():
+    retrieved = [_member("Account", "a1"), _member("Entity", "e1"), _member("Entity", "e2")]
+
+    result = _hydrate(_Manager(failing={"Entity"}), retrieved, chunk_size=1, raise_on_error=False)
+
+    assert [member.name for member in result.members] == ["a1"]
+    assert [dim_type for dim_type, _ in result.errors] == ["Entity", "Entity"]
+    assert all(isinstance(error, RuntimeError) for _, error in result.errors)
+    assert result.missing == [("Entity", "e1"), ("Entity", "e2")]
+
+
+def test_chunk_error_is_raised_after_every_chunk_finished():
+    manager = _Manager(failing={"Entity"})
+
+    with pytest.raises(RuntimeError, match="Entity failed"):
+        _hydrate(manager, [_member("Entity", "e1"), _member("Account", "a1")])
+
+    assert len(manager.queries) == 2
+
+
+def test_chunks_in_flight_stay_within_max_concurrency():
+    manager = _Manager(latency_seconds=0.01)
+    retrieved = [_member(f"DimType{index % 3}", f"m{index}") for index in range(36)]
+
+    result = _hydrate(manager, retrieved, chunk_size=2, max_concurrency=3)
+
+    assert result.chunks == 18 and len(manager.queries) == 18
+    assert manager.max_in_flight == 3
+    assert len(result.members) == 36
+
+
+@pytest.mark.parametrize("kwargs", [{"chunk_size": 0}, {"max_concurrency": 0}])
+def test_limits_must_be_positive(kwargs):
+    with pytest.raises(ValueError):
+        _hydrate(_Manager(), [], **kwargs)
@@ -0,0 +1,106 @@
+"""
+==============================================================================
+Name: test_member_store
+Author: AI Assistant
+Date: 10/17/2026
+Description: Tests of the read-through dimension member store: fetch once,
+shared concurrent fetches, warming, version invalidation and indexes.
+==============================================================================
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from member_store import DimensionMemberStore
+
+
+def _member(name, member_id, parent=""):
+    return SimpleNamespace(name=name, member_id=member_id, parent_hierarchy=parent)
+
+
+class _Manager:
+    def __init__(self, members, round_trip_seconds=0.0):
+        self.members = {member.name: member for member in members}
+        self.calls = []
+        self._round_trip_seconds = round_trip_seconds
+
+    def get_dim_members(self, dim_type, dim_member_names):
+        self.calls.append(list(dim_member_names))
+        return [self.members[name] for name in dim_member_names if name in self.members]
+
+    async def get_dim_members_async(self, dim_type, dim_member_names):
+        self.calls.append(list(dim_member_names))
+        await asyncio.sleep(self._round_trip_seconds)
+        return [self.members[name] for name in dim_member_names if name in self.members]
+
+    async def get_all(self, dim_type):
+        self.calls.append("all")
+        return list(self.members.values())
+
+
+def test_names_are_fetched_once_including_missing_ones():
+    manager = _Manager([_member("a", 1), _member("b", 2)])
+    store = DimensionMemberStore(rubix_manager=manager)
+
+    first = store.get_dim_members(dim_type="Entity", dim_member_names=["a", "x", "a"])
+    second = store.get_dim_members(dim_type="Entity", dim_member_names=["x", "a", "b"])
+
+    assert [member.name for member in first] == ["a"]
+    assert [member.name for member in second] == ["a", "b"]
+    assert manager.calls == [["a", "x"], ["b"]]
+    assert store.stats.misses == 3 and store.stats.hits == 2
+
+
+def test_concurrent_async_lookups_share_one_fetch():
+    manager = _Manager([_member("a", 1), _member("b", 2)], round_trip_seconds=0.01)
+    store = DimensionMemberStore(rubix_manager=manager)
+
+    async def main():
+        return await asyncio.gather(
+            store.get_dim_members_async(dim_type="Entity", dim_member_names=["a", "b"]),
+            store.get_dim_members_async(dim_type="Entity", dim_member_names=["b"]),
+        )
+
+    first, second = asyncio.run(main())
+
+    assert [member.name for member in first] == ["a", "b"] and [member.name for member in second] == ["b"]
+    assert manager.calls == [["a", "b"]]
+
+
+def test_warmed_partition_answers_every_lookup_and_indexes_members():
+    manager = _Manager([_member("root", 1), _member("child", 2, parent="root")])
+    store = DimensionMemberStore(rubix_manager=manager, partition_loader=manager.get_all)
+
+    asyncio.run(store.warm_async(dim_types=["Entity"]))
+
+    assert [member.name for member in store.get_dim_members(dim_type="Entity", dim_member_names=["child", "unknown"])] == ["child"]
+    assert manager.calls == ["all"]
+    assert store.get_by_member_id(dim_type="Entity", member_id=2).name == "child"
+    assert store.get_child_names(dim_type="Entity", dim_member_name="root") == ["child"]
+
+
+def test_version_change_reloads_the_partition():
+    manager = _Manager([_member("a", 1)])
+    versions = iter(["v1", "v1", "v2", "v2"])
+
+    async def version_loader(dim_type):
+        return next(versions)
+
+    store = DimensionMemberStore(rubix_manager=manager, partition_loader=manager.get_all, version_loader=version_loader, version_check_seconds=0)
+
+    async def main():
+        await store.get_dim_members_async(dim_type="Entity", dim_member_names=["a"])
+        await store.get_dim_members_async(dim_type="Entity", dim_member_names=["a"])
+        await store.get_dim_members_async(dim_type="Entity", dim_member_names=["a"])
+
+    asyncio.run(main())
+
+    assert manager.calls == ["all", "all"]
+    assert store.stats.invalidations == 1 and store.stats.warms == 2
+
+
+def test_warming_needs_a_partition_loader():
+    with pytest.raises(ValueError):
+        asyncio.run(DimensionMemberStore(rubix_manager=_Manager([])).warm_async(dim_types=["Entity"]))
@@ -0,0 +1,112 @@
+"""
+==============================================================================
+Name: test_result_merge
+Author: AI Assistant
+Date: 10/17/2026
+Description: Tests of the streaming result merge: exact top k per dimension
+type against a full sort, counts, and cancellation of pending queries.
+==============================================================================
+"""
+
+import asyncio
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from result_merge import StreamingResultMerger, merge_results
+
+
+def _member(dim_type, name, score=0.5):
+    return SimpleNamespace(dim_type=dim_type, dim_member_name=name, search_score=score)
+
+
+def _random_queries(seed, queries=20, results=50, pool_size=300, dim_types=3):
+    rng = random.Random(seed)
+    pool = [(f"DimType{index % dim_types}", f"member {index}") for index in range(pool_size)]
+    query_results = []
+    for _ in range(queries):
+        picked = rng.sample(pool, results)
+        query_results.append([_member(dim_type, name, score=rng.random()) for dim_type, name in picked])
+    return query_results
+
+
+def _exact_top_k(query_results, top_k, rrf_k=60):
+    fused = {}
+    for results in query_results:
+        for rank, member in enumerate(results, start=1):
+            key = (member.dim_type, member.dim_member_name)
+            fused[key] = fused.get(key, 0.0) + 1.0 / (rrf_k + rank)
+    by_dim_type = {}
+    for key, score in fused.items():
+        by_dim_type.setdefault(key[0], []).append((score, key))
+    return {dim_type: [key for _, key in sorted(scored, key=lambda item: (-item[0], item[1][1]))[:top_k]] for dim_type, scored in by_dim_type.items()}
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("top_k", [1, 10, 60])
+def test_merge_matches_a_full_sort_in_any_arrival_order(seed, top_k):
+    query_results = _random_queries(seed=seed)
+    exact = _exact_top_k(query_results, top_k=top_k)
+    random.Random(seed).shuffle(query_results)
+
+    merged = merge_results(query_results, top_k_per_dim_type=top_k)
+
+    assert {dim_type: [(dim_type, member.name) for member in members] for dim_type, members in merged.by_dim_type.items()} == exact
+
+
+def test_counts_and_member_objects():
+    first = [_member("Account", "Sales", 0.9), _member("Account", "Cost", 0.4), _member("Account", "Sales", 0.1)]
+    second = [_member("Account", "Cost", 0.8), _member("Entity", "Sales", 0.7)]
+
+    merged = merge_results([first, second], top_k_per_dim_type=5)
+
+    assert (merged.queries, merged.received, merged.unique, merged.duplicates) == (2, 5, 3, 2)
+    cost = next(member for member in merged.by_dim_type["Account"] if member.name == "Cost")
+    assert (cost.queries, cost.best_rank, cost.best_score) == (2, 1, 0.8)
+    assert cost.member is second[0]
+
+
+def test_invalid_options_raise():
+    with pytest.raises(ValueError):
+        StreamingResultMerger(top_k_per_dim_type=0)
+
+
+def test_consume_merges_as_queries_complete_and_collects_errors():
+    async def query(results, delay, fail=False):
+        await asyncio.sleep(delay)
+        if fail:
+            raise RuntimeError("search failed")
+        return results
+
+    merger = StreamingResultMerger(top_k_per_dim_type=5)
+
+    errors = asyncio.run(merger.consume([query([_member("Account", "a")], 0.02), query([], 0.0, fail=True), query([_member("Account", "b")], 0.01)], return_exceptions=True))
+
+    assert [type(error) for error in errors] == [RuntimeError]
+    assert merger.result().queries == 2
+
+
+def test_consume_cancels_pending_queries_on_error():
+    cancelled = []
+
+    async def slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+        return []
+
+    async def failing():
+        await asyncio.sleep(0)
+        raise RuntimeError("search failed")
+
+    async def main():
+        merger = StreamingResultMerger()
+        with pytest.raises(RuntimeError):
+            await merger.consume([slow(), failing(), slow()])
+        return [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+
+    assert asyncio.run(main()) == []
+    assert cancelled == [True, True]
@@ -0,0 +1,91 @@
+"""
+==============================================================================
+Name: test_retrieval_benchmark
+Author: AI Assistant
+Date: 10/17/2026
+Description: Tests of the HDR latency histogram, reproducible workload
+selection and the benchmark sweep and run comparison.
+==============================================================================
+"""
+
+import asyncio
+import math
+import random
+
+import pytest
+
+from retrieval_benchmark import (
+    DIMENSION_SEARCHES,
+    BenchmarkRun,
+    LatencyHistogram,
+    StubIndexBackend,
+    compare_runs,
+    run_benchmark,
+    select_searches,
+)
+
+
+@pytest.mark.parametrize("significant_figures", [2, 3])
+def test_percentiles_are_within_the_relative_error(significant_figures):
+    rng = random.Random(significant_figures)
+    values = sorted(int(rng.lognormvariate(10, 2)) for _ in range(5000))
+    histogram = LatencyHistogram(significant_figures=significant_figures)
+    for value in values:
+        histogram.record(value)
+
+    for percentile in (1, 50, 90, 99, 99.9, 100):
+        exact = values[max(1, math.ceil(percentile / 100 * len(values))) - 1]
+        assert exact <= histogram.percentile(percentile) <= exact * (1 + 10**-significant_figures) + 1
+    assert histogram.min_us == values[0] and histogram.max_us == values[-1]
+    assert histogram.mean_us == pytest.approx(sum(values) / len(values))
+
+
+def test_small_values_are_exact():
+    histogram = LatencyHistogram()
+    for value in range(2000):
+        histogram.record(value)
+
+    assert [histogram.percentile(percentile) for percentile in (0.05, 50, 100)] == [0, 999, 1999]
+
+
+def test_merge_and_serialization_round_trip():
+    first, second = LatencyHistogram(), LatencyHistogram()
+    first.record_seconds(0.010)
+    second.record(250_000, count=3)
+    first.merge(second)
+
+    restored = LatencyHistogram.from_dict(first.to_dict())
+
+    assert restored.total == 4 and restored.counts == first.counts
+    assert restored.summary() == first.summary()
+    assert restored.min_us == 10_000 and restored.max_us == 250_000
+    with pytest.raises(ValueError):
+        first.merge(LatencyHistogram(significant_figures=2))
+
+
+def test_empty_histogram():
+    histogram = LatencyHistogram()
+
+    assert histogram.percentile(99) == 0 and histogram.summary()["count"] == 0
+
+
+def test_select_searches_is_reproducible():
+    assert select_searches(DIMENSION_SEARCHES, count=3, seed=7) == select_searches(DIMENSION_SEARCHES, count=3, seed=7)
+    assert len(select_searches(DIMENSION_SEARCHES, count=10_000, seed=7)) == len(DIMENSION_SEARCHES)
+
+
+def test_sweep_and_compare_flag_regressions(tmp_path):
+    workload = select_searches(DIMENSION_SEARCHES, count=4, seed=0)
+
+    def sweep(base_latency_seconds):
+        backend = StubIndexBackend(seed=0, base_latency_seconds=base_latency_seconds, capacity=4)
+        return asyncio.run(run_benchmark(backend=backend, workload=workload, seed=0, concurrency_levels=(1, 4), requests_per_level=20, warmup_rounds=0))
+
+    baseline = sweep(0.002)
+    baseline.to_json(tmp_path / "baseline.json")
+    baseline = BenchmarkRun.from_json(tmp_path / "baseline.json")
+
+    assert [level.concurrency for level in baseline.levels] == [1, 4]
+    assert all(level.errors == 0 and level.latency["count"] == 20 for level in baseline.levels)
+    assert compare_runs(baseline=baseline, candidate=baseline) == []
+    assert compare_runs(baseline=baseline, candidate=sweep(0.02), max_regression=0.5)
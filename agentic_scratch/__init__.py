@@ -1 +1,98 @@
-"""Agentic Scratch Orchestrator - Test orchestrator for agentic tool-calling behavior."""
+"""Agentic Scratch Orchestrator - Test orchestrator for agentic tool-calling behavior.
+
+Public names are loaded lazily on first attribute access, so `import agentic_scratch` (or importing a light module such
+as `agentic_scratch.state`) does not pay for langgraph, the LLM callers or the orchestrator until they are used.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from .agentic_scratch_orchestrator import AgenticScratchOrchestrator
+    from .batch import BatchInput, BatchReport, BatchResult, arun_batch, create_batch_http_client
+    from .callers.caller_cache import LLMCallerCache
+    from .checkpointers.buffered_checkpointer import BufferedCheckpointSaver, FlushPolicy
+    from .checkpointers.sqlite_checkpointer import SQLiteCheckpointSaver
+    from .graph_cache import CompiledGraphCache
+    from .instrumentation import NodeInstrumentation
+    from .loop_controller import LoopController
+    from .prefetch import KeywordQueryPredictor, PrefetchStats, SpeculativePrefetcher
+    from .run_context import AgenticScratchRunContext, get_run_context, use_run_context
+    from .state import AgenticScratchState, ConversationBuffer, LoopProgress, StopReason
+    from .tool_dispatcher import ToolCallDispatcher
+    from .tools.artifact_store import FileArtifactStore, InMemoryArtifactStore, load_artifact
+    from .tools import register_builtin_tools
+    from .tools.registry import ToolRegistration, ToolRegistry, register_tool_node, tool_node, tool_registry
+    from .tools.tool_result_cache import InMemoryToolResultCache, SQLiteToolResultCache
+
+# Public name -> module it is defined in, relative to this package
+_LAZY_EXPORTS: Dict[str, str] = {
+    "AgenticScratchOrchestrator": ".agentic_scratch_orchestrator",
+    "BatchInput": ".batch",
+    "BatchReport": ".batch",
+    "BatchResult": ".batch",
+    "arun_batch": ".batch",
+    "create_batch_http_client": ".batch",
+    "LLMCallerCache": ".callers.caller_cache",
+    "BufferedCheckpointSaver": ".checkpointers.buffered_checkpointer",
+    "FlushPolicy": ".checkpointers.buffered_checkpointer",
+    "SQLiteCheckpointSaver": ".checkpointers.sqlite_checkpointer",
+    "CompiledGraphCache": ".graph_cache",
+    "NodeInstrumentation": ".instrumentation",
+    "LoopController": ".loop_controller",
+    "KeywordQueryPredictor": ".prefetch",
+    "PrefetchStats": ".prefetch",
+    "SpeculativePrefetcher": ".prefetch",
+    "AgenticScratchRunContext": ".run_context",
+    "get_run_context": ".run_context",
+    "use_run_context": ".run_context",
+    "AgenticScratchState": ".state",
+    "ConversationBuffer": ".state",
+    "LoopProgress": ".state",
+    "StopReason": ".state",
+    "ToolCallDispatcher": ".tool_dispatcher",
+    "FileArtifactStore": ".tools.artifact_store",
+    "InMemoryArtifactStore": ".tools.artifact_store",
+    "load_artifact": ".tools.artifact_store",
+    "register_builtin_tools": ".tools",
+    "ToolRegistration": ".tools.registry",
+    "ToolRegistry": ".tools.registry",
+    "register_tool_node": ".tools.registry",
+    "tool_node": ".tools.registry",
+    "tool_registry": ".tools.registry",
+    "InMemoryToolResultCache": ".tools.tool_result_cache",
+    "SQLiteToolResultCache": ".tools.tool_result_cache",
+}
+
+__all__ = sorted(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import a public name's module on first access and cache the name on the package.
+
+    Args:
+        name (str): The attribute name.
+
+    Returns:
+        Any: The public class or function.
+
+    Raises:
+        AttributeError: If the name is not exported by the package.
+    """
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """
+    List the package attributes, including public names not loaded yet.
+
+    Returns:
+        List[str]: The attribute names.
+    """
+    return sorted({*globals(), *__all__})
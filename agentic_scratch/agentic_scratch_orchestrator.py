@@ -7,31 +7,51 @@ Description: Test orchestrator for agentic tool-calling behavior.
 ==============================================================================
 """
 
-from typing import List, Optional
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Hashable, Iterable, List, Optional, TextIO, Tuple, Union
 
-import httpx
-
-# Local imports
-from factory import tool_call_node_factory, tool_call_state_model_factory
 from langchain_core.callbacks import BaseCallbackHandler
 from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.graph.state import CompiledStateGraph, StateGraph
 from langgraph.types import Send
-from nodes.core_node import CoreNode
-from nodes.initial_node import InitialNode
 from packaging.version import Version
-from state import AgenticScratchState
-from tools.process_tool_node import ProcessToolNode
-from tools.search_tool_node import SearchToolNode
 
 from wernicke.engines.llm.llm_orchestrators.graph_llm_orchestrators.base import IGraphOrchestrator
+from wernicke.engines.llm.llm_orchestrators.graph_llm_orchestrators.models import GraphInputModel
 from wernicke.engines.llm.llm_orchestrators.graph_llm_orchestrators.node_types.basic_nodes import EndNode, PlaceHolderNode, StartNode
 from wernicke.internals.session.user_session import UserSessionInfo
 
+from .callers.caller_cache import LLMCallerCache
+from .checkpointers.buffered_checkpointer import BufferedCheckpointSaver, FlushPolicy
+from .factory import tool_call_node_instance_factory
+from .graph_cache import CompiledGraphCache, default_compiled_graph_cache
+from .instrumentation import NodeInstrumentation
+from .loop_controller import LoopController
+from .nodes.core_node import CoreNode
+from .nodes.initial_node import InitialNode
+from .prefetch import SpeculativePrefetcher
+from .run_context import AgenticScratchRunContext, get_run_context, use_run_context
+from .state import AgenticScratchState
+from .tool_dispatcher import ToolCallDispatcher
+from .tools import register_builtin_tools
+from .tools.artifact_store import IArtifactStore
+from .tools.registry import tool_registry
+from .tools.search_tool_node import SearchToolNode
+from .tools.tool_result_cache import IToolResultCache
+
+if TYPE_CHECKING:
+    import httpx
+
+    from .batch import BatchInput, BatchReport
+
 
 class AgenticScratchOrchestrator(IGraphOrchestrator):
     """
     Test orchestrator for agentic tool-calling behavior.
+
+    The compiled graph is shared process-wide by orchestrators with the same node configuration, so constructing one
+    per request does not rebuild the graph. Per-request dependencies reach the nodes through the run context that
+    `arun` sets.
     """
 
     version = Version("1.0.0")
@@ -45,7 +65,18 @@ class AgenticScratchOrchestrator(IGraphOrchestrator):
         user_session_info: UserSessionInfo,
         callbacks: Optional[List[BaseCallbackHandler]] = None,
         error_handling_active: bool = False,
-        http_async_client: Optional[httpx.AsyncClient] = None,
+        http_async_client: Optional["httpx.AsyncClient"] = None,
+        llm_caller_cache: Optional[LLMCallerCache] = None,
+        tool_dispatcher: Optional[ToolCallDispatcher] = None,
+        tool_result_cache: Optional[IToolResultCache] = None,
+        artifact_store: Optional[IArtifactStore] = None,
+        checkpoint_flush_policy: Optional[FlushPolicy] = None,
+        checkpoint_flush_every_n_steps: int = 10,
+        stream: bool = False,
+        node_instrumentation: Optional[NodeInstrumentation] = None,
+        compiled_graph_cache: Optional[CompiledGraphCache] = None,
+        loop_controller: Optional[LoopController] = None,
+        speculative_prefetcher: Optional[SpeculativePrefetcher] = None,
     ):
         """
         Initialize the orchestrator.
@@ -56,15 +87,53 @@ class AgenticScratchOrchestrator(IGraphOrchestrator):
             callbacks (Optional[List[BaseCallbackHandler]]): Callbacks for tracking.
             error_handling_active (bool): Whether error handling is active.
             http_async_client (Optional[httpx.AsyncClient]): HTTP client for API calls.
+            llm_caller_cache (Optional[LLMCallerCache]): Cache of warmed LLM callers reused across turns and runs.
+            tool_dispatcher (Optional[ToolCallDispatcher]): Dispatcher that coalesces identical tool calls and bounds per-tool concurrency.
+            tool_result_cache (Optional[IToolResultCache]): Result cache for cacheable tool nodes. Caching is disabled if None.
+            artifact_store (Optional[IArtifactStore]): Store for tool artifacts so state only carries references. Inline if None.
+            checkpoint_flush_policy (Optional[FlushPolicy]): Buffer checkpoint writes and flush them at this boundary. Every checkpoint is written through if None.
+            checkpoint_flush_every_n_steps (int): Checkpoints buffered per thread before flushing with `FlushPolicy.EVERY_N_STEPS`.
+            stream (bool): Stream the agent's LLM responses and start tools as soon as their arguments are complete.
+            node_instrumentation (Optional[NodeInstrumentation]): Records per-node latency, CPU, state size and allocation metrics. Disabled if None.
+            compiled_graph_cache (Optional[CompiledGraphCache]): Cache of compiled graphs. The process-wide cache is used if None.
+            loop_controller (Optional[LoopController]): Turn and token budgets and novelty tracking that force the agent onto the ProcessTool
+                path. The loop only ends once ProcessTool is called if None.
+            speculative_prefetcher (Optional[SpeculativePrefetcher]): Prefetches searches predicted from the user input and reasoning
+                summaries while the LLM call runs. Disabled if None.
         """
-        self._user_session_info = user_session_info
-        self._callbacks = callbacks
-        self._http_async_client = http_async_client
+        self._tool_dispatcher = tool_dispatcher or ToolCallDispatcher()
+        self._run_context = AgenticScratchRunContext(
+            user_session_info=user_session_info,
+            callbacks=callbacks,
+            http_async_client=http_async_client,
+            llm_caller_cache=llm_caller_cache or LLMCallerCache(user_session_info=user_session_info, http_async_client=http_async_client),
+            tool_dispatcher=self._tool_dispatcher,
+            tool_result_cache=tool_result_cache,
+            artifact_store=artifact_store,
+        )
+        self._error_handling_active = error_handling_active
+        self._checkpoint_flush_policy = checkpoint_flush_policy
+        self._checkpoint_flush_every_n_steps = checkpoint_flush_every_n_steps
+        self._buffered_checkpointer: Optional[BufferedCheckpointSaver] = None
+        self._stream = stream
+        self._node_instrumentation = node_instrumentation
+        self._compiled_graph_cache = compiled_graph_cache or default_compiled_graph_cache
+        self._loop_controller = loop_controller
+        self._speculative_prefetcher = speculative_prefetcher
+
+        # A no-op once the built-in tools are registered, so the registry version, and with it the graph cache key, is stable
+        register_builtin_tools()
+
+        # The shared search node reads its dependencies from the run context, so early searches started from this
+        # orchestrator's stream use its result cache and concurrency limit
+        SearchToolNode().register_early_dispatch(tool_dispatcher=self._tool_dispatcher)
+
         super().__init__(checkpointer=checkpointer, error_handling_active=error_handling_active)
 
     def compile_graph(self, checkpointer: BaseCheckpointSaver) -> CompiledStateGraph:
         """
-        Build and compile the LangGraph graph.
+        Return the compiled LangGraph graph bound to the checkpointer, compiling it only if no orchestrator with the same
+        node configuration has done so in this process.
 
         Args:
             checkpointer (BaseCheckpointSaver): The checkpointer to use for the graph.
@@ -72,16 +141,51 @@ class AgenticScratchOrchestrator(IGraphOrchestrator):
         Returns:
             CompiledStateGraph: The compiled graph.
         """
-        # Initialize nodes
-        initial_node = InitialNode(user_session_info=self._user_session_info, callbacks=self._callbacks)
-        core_node = CoreNode(
-            user_session_info=self._user_session_info,
-            callbacks=self._callbacks,
-            http_async_client=self._http_async_client,
+        compiled_graph = self._compiled_graph_cache.get_or_compile(key=self.graph_cache_key(), compile_fn=self._build_graph)
+
+        if self._checkpoint_flush_policy is not None:
+            self._buffered_checkpointer = BufferedCheckpointSaver(
+                checkpointer=checkpointer,
+                flush_policy=self._checkpoint_flush_policy,
+                flush_every_n_steps=self._checkpoint_flush_every_n_steps,
+            )
+            checkpointer = self._buffered_checkpointer
+
+        return compiled_graph.copy(update={"checkpointer": checkpointer})
+
+    def graph_cache_key(self) -> Tuple[Hashable, ...]:
+        """
+        Build the compiled graph cache key: everything the built graph depends on, other than the run context.
+
+        Returns:
+            Tuple[Hashable, ...]: The cache key.
+        """
+        return (
+            type(self),
+            str(self.version),
+            self._error_handling_active,
+            self._stream,
+            self._node_instrumentation,
+            self._loop_controller,
+            tool_registry.version,
         )
+
+    def _build_graph(self) -> CompiledStateGraph:
+        """
+        Build and compile the LangGraph graph without a checkpointer.
+
+        Returns:
+            CompiledStateGraph: The compiled graph.
+        """
+        # Initialize nodes; their per-request dependencies come from the run context
+        initial_node = InitialNode()
+        core_node = CoreNode(stream=self._stream, loop_controller=self._loop_controller)
         place_holder_node = PlaceHolderNode()
-        search_tool_node = SearchToolNode()
-        process_tool_node = ProcessToolNode()
+        tool_nodes = [tool_call_node_instance_factory(tool_name=registration.tool_name) for registration in tool_registry]
+
+        if self._node_instrumentation is not None:
+            for node in (initial_node, core_node, place_holder_node, *tool_nodes):
+                self._node_instrumentation.instrument(node=node)
 
         # Build the graph
         graph = StateGraph(state_schema=self.graph_state)
@@ -90,8 +194,8 @@ class AgenticScratchOrchestrator(IGraphOrchestrator):
         self.add_node(graph=graph, node=initial_node)
         self.add_node(graph=graph, node=core_node)
         self.add_node(graph=graph, node=place_holder_node)
-        self.add_node(graph=graph, node=search_tool_node)
-        self.add_node(graph=graph, node=process_tool_node)
+        for tool_node in tool_nodes:
+            self.add_node(graph=graph, node=tool_node)
 
         # Add edges
         self.add_edge(graph=graph, start_node=StartNode(), end_node=initial_node)
@@ -113,26 +217,103 @@ class AgenticScratchOrchestrator(IGraphOrchestrator):
             graph=graph,
             start_node=place_holder_node,
             conditional=self._send_tools_conditional,
-            conditional_node_map={
-                SearchToolNode.name: search_tool_node,
-                ProcessToolNode.name: process_tool_node,
-            },
+            conditional_node_map={tool_node.name: tool_node for tool_node in tool_nodes},
             is_parallel=True,
         )
 
         # Tools return to core node
         self.add_edge(
             graph=graph,
-            start_node=[search_tool_node, process_tool_node],
+            start_node=tool_nodes,
             end_node=core_node,
         )
 
-        return graph.compile(checkpointer=checkpointer)
+        return graph.compile()
+
+    async def arun(self, inputs: GraphInputModel, **kwargs: Any) -> Any:
+        """
+        Run the graph with this orchestrator's dependencies as the run context, flushing buffered checkpoints of the
+        thread and cancelling unclaimed early tool work and prefetches once the run ends.
+
+        Args:
+            inputs (GraphInputModel): The graph inputs.
+            **kwargs (Any): Passed to IGraphOrchestrator.arun.
+
+        Returns:
+            Any: The result of IGraphOrchestrator.arun.
+        """
+        run_context = self._run_context
+        if self._speculative_prefetcher is not None:
+            run_context = run_context.model_copy(update={"prefetch_run": self._speculative_prefetcher.start_run(tool_dispatcher=self._tool_dispatcher)})
+
+        try:
+            with use_run_context(run_context=run_context), self._tool_dispatcher.early_dispatch_scope():
+                return await super().arun(inputs=inputs, **kwargs)
+        finally:
+            if run_context.prefetch_run is not None:
+                run_context.prefetch_run.close()
+            # Flush on failure too, so the run can be resumed from its last superstep
+            if self._buffered_checkpointer is not None:
+                await self._buffered_checkpointer.aflush(thread_id=inputs.thread_id)
+
+    async def arun_batch(
+        self,
+        inputs: Iterable[Union[str, "BatchInput"]],
+        concurrency: int = 32,
+        output: Optional[Union[str, Path, TextIO]] = None,
+        run_timeout_seconds: Optional[float] = None,
+        progress_every_seconds: Optional[float] = 5.0,
+    ) -> "BatchReport":
+        """
+        Run the graph over many user inputs with a bounded pool of workers, each input on a fresh thread, streaming
+        each result to JSONL as it finishes. See `batch.arun_batch`.
+
+        Args:
+            inputs (Iterable[Union[str, BatchInput]]): The user inputs. Pulled lazily.
+            concurrency (int): Runs in flight at once.
+            output (Optional[Union[str, Path, TextIO]]): JSONL destination path or stream. Results are not written if None.
+            run_timeout_seconds (Optional[float]): Cancel a run after this long. Unbounded if None.
+            progress_every_seconds (Optional[float]): Interval between progress lines on stderr. No progress is printed if None.
+
+        Returns:
+            BatchReport: Counts, wall time and latencies of the batch.
+        """
+        # Batch runs pull in httpx; single runs do not need it
+        from .batch import arun_batch
+
+        return await arun_batch(
+            orchestrator=self,
+            inputs=inputs,
+            concurrency=concurrency,
+            output=output,
+            run_timeout_seconds=run_timeout_seconds,
+            progress_every_seconds=progress_every_seconds,
+        )
+
+    @property
+    def run_context(self) -> AgenticScratchRunContext:
+        """
+        Returns the dependencies the graph nodes read while this orchestrator's runs execute.
+
+        Returns:
+            AgenticScratchRunContext: The run context.
+        """
+        return self._run_context
+
+    @property
+    def buffered_checkpointer(self) -> Optional[BufferedCheckpointSaver]:
+        """
+        Returns the checkpointer wrapper that buffers checkpoint writes.
+
+        Returns:
+            Optional[BufferedCheckpointSaver]: The wrapper, or None if checkpoint writes are not buffered.
+        """
+        return self._buffered_checkpointer
 
     @staticmethod
     def _send_tools_conditional(graph_state: AgenticScratchState) -> List[Send]:
         """
-        Dynamically route tool calls to the correct nodes.
+        Dynamically route tool calls to the correct nodes, coalescing identical calls into a single Send.
 
         Args:
             graph_state (AgenticScratchState): The current state.
@@ -148,11 +329,11 @@ class AgenticScratchOrchestrator(IGraphOrchestrator):
 
         tool_sends = []
 
-        for tool_call_action in graph_state.tool_calls:
-            tool_call_node = tool_call_node_factory(tool_name=tool_call_action.content.name)
-            tool_call_state = tool_call_state_model_factory(tool_action=tool_call_action)
+        for tool_call_action, duplicate_tool_call_ids in get_run_context().tool_dispatcher.coalesce(tool_calls=graph_state.tool_calls):
+            registration = tool_registry.get(tool_call_action.content.name)
+            tool_call_state = registration.build_state(tool_action=tool_call_action, duplicate_tool_call_ids=duplicate_tool_call_ids)
 
-            tool_sends.append(Send(node=str(tool_call_node.name), arg=tool_call_state))
+            tool_sends.append(Send(node=registration.node_name, arg=tool_call_state))
 
         return tool_sends
 
@@ -0,0 +1,319 @@
+"""
+==============================================================================
+Name: batch
+Author: AI Assistant
+Date: 10/17/2026
+Description: Batch execution of the agentic scratch orchestrator over many user
+inputs with a bounded worker pool, results streamed to JSONL as each run
+finishes, and progress, throughput and failure reporting.
+==============================================================================
+"""
+
+import asyncio
+import importlib.util
+import math
+import sys
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, TextIO, Union
+
+import httpx
+from pydantic import BaseModel, Field
+
+from wernicke.engines.llm.llm_orchestrators.graph_llm_orchestrators.models import GraphInputModel, guid_to_str
+from wernicke.shared.guid import new_guid
+
+from .state import AgenticScratchState
+
+if TYPE_CHECKING:
+    from .agentic_scratch_orchestrator import AgenticScratchOrchestrator
+
+
+class BatchInput(BaseModel):
+    """
+    One input of a batch.
+
+    Attributes:
+        id (Optional[str]): Caller-provided ID copied to the result. The input's position in the batch if None.
+        user_input (str): The user input of the run.
+    """
+
+    id: Optional[str] = None
+    user_input: str
+
+
+class BatchResult(BaseModel):
+    """
+    Outcome of one run of a batch, written as one JSONL line.
+
+    Attributes:
+        index (int): Position of the input in the batch.
+        id (str): The input's ID.
+        thread_id (str): Thread the run was checkpointed under.
+        status (str): "ok", "error" or "timeout".
+        latency_seconds (float): Wall time of the run.
+        final_output (Optional[str]): The run's final output.
+        stop_reason (Optional[str]): Why the agentic loop stopped.
+        error (Optional[str]): The error of a failed run.
+    """
+
+    index: int
+    id: str
+    thread_id: str
+    status: str
+    latency_seconds: float
+    final_output: Optional[str] = None
+    stop_reason: Optional[str] = None
+    error: Optional[str] = None
+
+
+class BatchReport(BaseModel):
+    """
+    Summary of a batch.
+
+    Attributes:
+        total (int): Runs finished.
+        succeeded (int): Runs that completed.
+        failed (int): Runs that raised.
+        timed_out (int): Runs cancelled after the per-run timeout.
+        wall_seconds (float): Wall time of the batch.
+        latencies (List[float]): Wall time of each completed run, in completion order.
+    """
+
+    total: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    timed_out: int = 0
+    wall_seconds: float = 0.0
+    latencies: List[float] = Field(default_factory=list, repr=False)
+
+    @property
+    def throughput(self) -> float:
+        """
+        Returns the runs finished per second.
+
+        Returns:
+            float: The throughput, or 0.0 before any time has passed.
+        """
+        return self.total / self.wall_seconds if self.wall_seconds else 0.0
+
+    def latency_percentile(self, fraction: float) -> float:
+        """
+        Nearest-rank percentile of the completed runs' latencies.
+
+        Args:
+            fraction (float): The percentile as a fraction, e.g. 0.95.
+
+        Returns:
+            float: The latency in seconds, or 0.0 if no run completed.
+        """
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Summarize the batch for printing or JSON output.
+
+        Returns:
+            Dict[str, Any]: Counts, throughput and p50/p95/p99 latency.
+        """
+        return {
+            **self.model_dump(exclude={"latencies"}),
+            "throughput_rps": self.throughput,
+            "p50_seconds": self.latency_percentile(0.50),
+            "p95_seconds": self.latency_percentile(0.95),
+            "p99_seconds": self.latency_percentile(0.99),
+        }
+
+
+def create_batch_http_client(concurrency: int, http2: bool = False, timeout_seconds: float = 120.0) -> httpx.AsyncClient:
+    """
+    Build the HTTP client shared by every run of a batch, sized for its concurrency.
+
+    Every run in flight keeps one warm connection so back-to-back LLM calls skip the TLS handshake, with headroom
+    for the parallel tool calls of a turn.
+
+    Args:
+        concurrency (int): Runs in flight at once.
+        http2 (bool): Multiplex requests over HTTP/2 connections. Needs the `h2` package (`httpx[http2]`); HTTP/1.1 is
+            used with a warning if it is not installed.
+        timeout_seconds (float): Read and write timeout of a request; connecting times out after 10 seconds.
+
+    Returns:
+        httpx.AsyncClient: The client. Close it after the batch.
+    """
+    if http2 and importlib.util.find_spec("h2") is None:
+        print("⚠️ HTTP/2 needs the h2 package (pip install 'httpx[http2]'); using HTTP/1.1", file=sys.stderr)
+        http2 = False
+
+    return httpx.AsyncClient(
+        http2=http2,
+        limits=httpx.Limits(max_connections=max(100, 4 * concurrency), max_keepalive_connections=max(20, concurrency), keepalive_expiry=30.0),
+        timeout=httpx.Timeout(timeout_seconds, connect=10.0),
+        follow_redirects=True,
+    )
+
+
+def read_batch_inputs(path: Union[str, Path]) -> Iterator[BatchInput]:
+    """
+    Stream batch inputs from a file: JSONL objects with `user_input` (and optionally `id`), or one plain-text input per line.
+
+    Args:
+        path (Union[str, Path]): The input file.
+
+    Yields:
+        BatchInput: The inputs, in file order. Blank lines are skipped.
+    """
+    with open(path, encoding="utf-8") as input_file:
+        for line in input_file:
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith("{"):
+                yield BatchInput.model_validate_json(line)
+            else:
+                yield BatchInput(user_input=line)
+
+
+async def _run_one(
+    orchestrator: "AgenticScratchOrchestrator", index: int, batch_input: BatchInput, run_timeout_seconds: Optional[float]
+) -> BatchResult:
+    """
+    Run the graph for one input on a fresh thread, catching its failure.
+
+    Args:
+        orchestrator (AgenticScratchOrchestrator): The orchestrator.
+        index (int): Position of the input in the batch.
+        batch_input (BatchInput): The input.
+        run_timeout_seconds (Optional[float]): Cancel the run after this long. Unbounded if None.
+
+    Returns:
+        BatchResult: The outcome.
+    """
+    thread_id = str(guid_to_str(new_guid()))
+    result_id = batch_input.id if batch_input.id is not None else str(index)
+    graph_inputs = GraphInputModel(graph_state=AgenticScratchState(user_input=batch_input.user_input), thread_id=thread_id)
+
+    start = perf_counter()
+    try:
+        result, _ = await asyncio.wait_for(orchestrator.arun(inputs=graph_inputs), timeout=run_timeout_seconds)
+    except asyncio.TimeoutError:
+        return BatchResult(index=index, id=result_id, thread_id=thread_id, status="timeout", latency_seconds=perf_counter() - start)
+    except Exception as error:
+        return BatchResult(index=index, id=result_id, thread_id=thread_id, status="error", latency_seconds=perf_counter() - start, error=repr(error))
+
+    graph_state = result.graph_state
+    return BatchResult(
+        index=index,
+        id=result_id,
+        thread_id=thread_id,
+        status="ok",
+        latency_seconds=perf_counter() - start,
+        final_output=graph_state.final_output,
+        stop_reason=graph_state.stop_reason.value if graph_state.stop_reason else None,
+    )
+
+
+async def arun_batch(
+    orchestrator: "AgenticScratchOrchestrator",
+    inputs: Iterable[Union[str, BatchInput]],
+    concurrency: int = 32,
+    output: Optional[Union[str, Path, TextIO]] = None,
+    run_timeout_seconds: Optional[float] = None,
+    progress_every_seconds: Optional[float] = 5.0,
+    progress_stream: TextIO = sys.stderr,
+) -> BatchReport:
+    """
+    Run the orchestrator over many user inputs with a bounded pool of workers.
+
+    Inputs are pulled lazily, so a generator over a large file is never materialized, and each result is written as a
+    JSONL line as soon as its run finishes, in completion order. Runs share the orchestrator, and with it its HTTP client,
+    caller cache and compiled graph; each gets a fresh thread. A failing or timed-out run is recorded and does not stop
+    the batch.
+
+    Args:
+        orchestrator (AgenticScratchOrchestrator): The orchestrator, built with the shared HTTP client (see
+            `create_batch_http_client`).
+        inputs (Iterable[Union[str, BatchInput]]): The user inputs.
+        concurrency (int): Runs in flight at once.
+        output (Optional[Union[str, Path, TextIO]]): JSONL destination, as a path (overwritten) or an open text stream.
+            Results are not written if None.
+        run_timeout_seconds (Optional[float]): Cancel a run after this long. Unbounded if None.
+        progress_every_seconds (Optional[float]): Interval between progress lines. No progress is printed if None.
+        progress_stream (TextIO): Where progress lines are printed.
+
+    Returns:
+        BatchReport: Counts, wall time and latencies of the batch.
+
+    Raises:
+        ValueError: If concurrency is less than 1.
+    """
+    if concurrency < 1:
+        raise ValueError("Batch concurrency must be >= 1")
+
+    expected = len(inputs) if hasattr(inputs, "__len__") else None
+    # Workers share one iterator; pulling from it never awaits, so each input goes to exactly one worker
+    pending = enumerate(inputs)
+    report = BatchReport()
+    start = perf_counter()
+
+    output_file: Optional[TextIO] = None
+    owns_output = isinstance(output, (str, Path))
+    if owns_output:
+        output_file = open(output, "w", encoding="utf-8")
+    elif output is not None:
+        output_file = output
+
+    def print_progress() -> None:
+        elapsed = perf_counter() - start
+        rate = report.total / elapsed if elapsed else 0.0
+        progress = f"{report.total}/{expected}" if expected is not None else f"{report.total}"
+        eta = f", eta {(expected - report.total) / rate:.0f}s" if expected is not None and rate else ""
+        print(
+            f"[batch] {progress} done, {report.failed} failed, {report.timed_out} timed out, {rate:.1f} runs/s{eta}",
+            file=progress_stream,
+            flush=True,
+        )
+
+    async def worker() -> None:
+        for index, item in pending:
+            batch_input = BatchInput(user_input=item) if isinstance(item, str) else item
+            result = await _run_one(orchestrator=orchestrator, index=index, batch_input=batch_input, run_timeout_seconds=run_timeout_seconds)
+
+            report.total += 1
+            if result.status == "ok":
+                report.succeeded += 1
+                report.latencies.append(result.latency_seconds)
+            elif result.status == "timeout":
+                report.timed_out += 1
+            else:
+                report.failed += 1
+
+            if output_file is not None:
+                output_file.write(result.model_dump_json(exclude_none=True) + "\n")
+                output_file.flush()
+
+    async def reporter() -> None:
+        while True:
+            await asyncio.sleep(progress_every_seconds)
+            print_progress()
+
+    reporter_task = asyncio.ensure_future(reporter()) if progress_every_seconds else None
+    workers = [asyncio.ensure_future(worker()) for _ in range(concurrency)]
+    try:
+        await asyncio.gather(*workers)
+    finally:
+        # An unreadable input stops the whole batch
+        for task in workers:
+            task.cancel()
+        if reporter_task is not None:
+            reporter_task.cancel()
+        if owns_output:
+            output_file.close()
+        report.wall_seconds = perf_counter() - start
+
+    if progress_every_seconds:
+        print_progress()
+    return report
@@ -0,0 +1,85 @@
+"""
+==============================================================================
+Name: batch_agentic_scratch
+Author: AI Assistant
+Date: 10/17/2026
+Description: Command-line batch runner for the agentic scratch orchestrator.
+Reads user inputs from a file and writes one JSONL result per run.
+==============================================================================
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+
+from wernicke.tests.shared_utils.test_session import create_test_user_session
+
+from .agentic_scratch_orchestrator import AgenticScratchOrchestrator
+from .batch import create_batch_http_client, read_batch_inputs
+from .callers.caller_cache import LLMCallerCache
+from .callers.fake_llm_caller import FakeLLMProvider, FakeLLMScript, LatencyDistribution
+from .checkpointers.sqlite_checkpointer import SQLiteCheckpointSaver
+from .tools.tool_result_cache import InMemoryToolResultCache
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    """
+    Build the orchestrator around a shared HTTP client, run the batch and print the report.
+
+    Checkpoints go to a SQLite file rather than memory, so a large batch does not hold every run's checkpoints.
+
+    Args:
+        args (argparse.Namespace): The parsed command-line arguments.
+    """
+    user_session_info = create_test_user_session()
+    checkpointer = SQLiteCheckpointSaver(path=args.checkpoint_db)
+    async with create_batch_http_client(concurrency=args.concurrency, http2=args.http2) as http_async_client:
+        caller_factory = None
+        if args.fake_llm:
+            caller_factory = FakeLLMProvider(script=FakeLLMScript.search_then_process(), latency=LatencyDistribution(kind="lognormal", mean=0.05)).create_caller
+
+        orchestrator = AgenticScratchOrchestrator(
+            checkpointer=checkpointer,
+            user_session_info=user_session_info,
+            callbacks=[],
+            http_async_client=http_async_client,
+            llm_caller_cache=LLMCallerCache(user_session_info=user_session_info, http_async_client=http_async_client, caller_factory=caller_factory),
+            tool_result_cache=InMemoryToolResultCache(max_entries=10000, ttl_seconds=3600),
+        )
+        try:
+            report = await orchestrator.arun_batch(
+                inputs=read_batch_inputs(args.input),
+                concurrency=args.concurrency,
+                output=args.output,
+                run_timeout_seconds=args.run_timeout,
+                progress_every_seconds=args.progress_every,
+            )
+        finally:
+            checkpointer.close()
+
+    print(json.dumps(report.summary(), indent=2))
+    if report.failed or report.timed_out:
+        sys.exit(1)
+
+
+def main() -> None:
+    """
+    Parse arguments and run the batch.
+    """
+    parser = argparse.ArgumentParser(description="Run the agentic scratch orchestrator over a file of user inputs.")
+    parser.add_argument("input", help="JSONL file of {\"id\", \"user_input\"} objects, or one plain-text input per line.")
+    parser.add_argument("--output", default="agentic_scratch_batch_results.jsonl", help="JSONL file the results are written to.")
+    parser.add_argument("--concurrency", type=int, default=32, help="Runs in flight at once.")
+    parser.add_argument("--run-timeout", type=float, help="Seconds before a run is cancelled and recorded as timed out.")
+    parser.add_argument("--progress-every", type=float, default=5.0, help="Seconds between progress lines.")
+    parser.add_argument("--http2", action="store_true", help="Use HTTP/2 connections. Needs the h2 package (httpx[http2]).")
+    parser.add_argument("--checkpoint-db", default="agentic_scratch_batch_checkpoints.sqlite", help="SQLite file the run checkpoints are written to.")
+    parser.add_argument("--fake-llm", action="store_true", help="Use the offline fake LLM instead of the configured model.")
+    args = parser.parse_args()
+
+    asyncio.run(main_async(args=args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+==============================================================================
+Name: bench_caller_cache
+Author: AI Assistant
+Date: 10/17/2026
+Description: Benchmark of per-turn LLM caller setup with the caller cache on and off.
+==============================================================================
+"""
+
+import argparse
+import statistics
+from time import perf_counter
+from typing import List
+
+from wernicke.engines.llm.llm_callers.models import ResponseMode
+from wernicke.tests.shared_utils.test_session import create_test_user_session
+
+from ..callers.agentic_scratch_caller import AgenticScratchCallerConfig
+from ..callers.caller_cache import LLMCallerCache
+from ..tools.process_tool import ProcessTool
+from ..tools.search_tool import SearchTool
+
+
+def time_turn_setup(llm_caller_cache: LLMCallerCache, turns: int) -> List[float]:
+    """
+    Time the caller setup that CoreNode performs at the start of every turn.
+
+    Args:
+        llm_caller_cache (LLMCallerCache): The cache to get callers from.
+        turns (int): Number of agent turns to simulate.
+
+    Returns:
+        List[float]: Setup latency of each turn in seconds.
+    """
+    timings = []
+    for _ in range(turns):
+        start = perf_counter()
+        llm_caller_cache.get_caller(
+            caller_config=AgenticScratchCallerConfig,
+            tools=[SearchTool, ProcessTool],
+            response_mode=ResponseMode.TOOL,
+            stream=False,
+        )
+        timings.append(perf_counter() - start)
+    return timings
+
+
+def print_summary(label: str, timings: List[float]) -> None:
+    """
+    Print latency statistics for a benchmark run.
+
+    Args:
+        label (str): Label for the run.
+        timings (List[float]): Per-turn latencies in seconds.
+    """
+    ordered = sorted(timings)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    print(
+        f"{label:<12} turns={len(timings):<5} total={sum(timings) * 1000:9.2f}ms "
+        f"mean={statistics.mean(timings) * 1e6:9.1f}us p50={statistics.median(timings) * 1e6:9.1f}us p95={p95 * 1e6:9.1f}us"
+    )
+
+
+def main() -> None:
+    """
+    Compare per-turn caller setup latency with the cache enabled and disabled.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark caller setup with the caller cache on and off.")
+    parser.add_argument("--turns", type=int, default=200, help="Number of agent turns to simulate per run.")
+    args = parser.parse_args()
+
+    user_session_info = create_test_user_session()
+
+    uncached = LLMCallerCache(user_session_info=user_session_info, enabled=False)
+    cached = LLMCallerCache(user_session_info=user_session_info, enabled=True)
+
+    print_summary("cache off", time_turn_setup(llm_caller_cache=uncached, turns=args.turns))
+    print_summary("cache on", time_turn_setup(llm_caller_cache=cached, turns=args.turns))
+    print(f"cache on: hits={cached.hits} misses={cached.misses}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""
+==============================================================================
+Name: bench_checkpoint_writes
+Author: AI Assistant
+Date: 10/17/2026
+Description: Benchmark of checkpoint storage traffic for an agent-shaped graph,
+comparing direct writes with BufferedCheckpointSaver flush policies.
+==============================================================================
+"""
+
+import argparse
+import asyncio
+import operator
+import tempfile
+from pathlib import Path
+from time import perf_counter
+from typing import Annotated, Any, Dict, List, Optional, Union
+
+from langgraph.graph import END, START, StateGraph
+from langgraph.graph.state import CompiledStateGraph
+from langgraph.types import Send
+from typing_extensions import TypedDict
+
+from ..checkpointers.buffered_checkpointer import BufferedCheckpointSaver, FlushPolicy
+from ..checkpointers.sqlite_checkpointer import SQLiteCheckpointSaver
+
+
+class _AgentState(TypedDict):
+    """
+    State shaped like AgenticScratchState: a large static prompt, a growing message list and per-turn tool results.
+    """
+
+    prompt: str
+    turn: int
+    max_turns: int
+    tools_per_turn: int
+    messages: Annotated[List[str], operator.add]
+
+
+class _CountingSQLiteCheckpointSaver(SQLiteCheckpointSaver):
+    """
+    SQLite checkpointer that counts the storage calls it receives.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Initialize the checkpointer.
+
+        Args:
+            path (Union[str, Path]): Path to the SQLite database file.
+        """
+        super().__init__(path=path)
+        self.round_trips = 0
+
+    def put(self, *args: Any) -> Dict[str, Any]:
+        """
+        Count and store a checkpoint.
+
+        Returns:
+            Dict[str, Any]: The config of the stored checkpoint.
+        """
+        self.round_trips += 1
+        return super().put(*args)
+
+    def put_writes(self, *args: Any) -> None:
+        """
+        Count and store pending writes.
+        """
+        self.round_trips += 1
+        super().put_writes(*args)
+
+
+def _build_graph() -> StateGraph:
+    """
+    Build an agent loop with parallel tool calls, mirroring CoreNode -> tool nodes -> CoreNode.
+
+    Returns:
+        StateGraph: The uncompiled graph.
+    """
+
+    def core(state: _AgentState) -> Dict[str, Any]:
+        return {"turn": state["turn"] + 1, "messages": [f"AI message {state['turn']}"]}
+
+    def route(state: _AgentState) -> Union[List[Send], str]:
+        if state["turn"] >= state["max_turns"]:
+            return END
+        return [Send("tool", {"turn": state["turn"], "index": index}) for index in range(state["tools_per_turn"])]
+
+    def tool(arg: Dict[str, int]) -> Dict[str, Any]:
+        return {"messages": [f"Tool result {arg['turn']}-{arg['index']}"]}
+
+    graph = StateGraph(_AgentState)
+    graph.add_node("core", core)
+    graph.add_node("tool", tool)
+    graph.add_edge(START, "core")
+    graph.add_conditional_edges("core", route, ["tool", END])
+    graph.add_edge("tool", "core")
+    return graph
+
+
+async def run_policy(graph: StateGraph, policy: Optional[FlushPolicy], turns: int, tools_per_turn: int, database: Path) -> Dict[str, Any]:
+    """
+    Run the graph once against SQLite, optionally through BufferedCheckpointSaver.
+
+    Args:
+        graph (StateGraph): The graph to run.
+        policy (Optional[FlushPolicy]): The flush policy, or None to write every checkpoint directly.
+        turns (int): Number of agent turns.
+        tools_per_turn (int): Parallel tool calls per turn.
+        database (Path): Path of the SQLite file to create.
+
+    Returns:
+        Dict[str, Any]: Storage round trips, database size and run time.
+    """
+    inner = _CountingSQLiteCheckpointSaver(path=database)
+    checkpointer = BufferedCheckpointSaver(checkpointer=inner, flush_policy=policy, flush_every_n_steps=5) if policy else inner
+    compiled: CompiledStateGraph = graph.compile(checkpointer=checkpointer)
+
+    start = perf_counter()
+    await compiled.ainvoke(
+        {"prompt": "system prompt " * 2000, "turn": 0, "max_turns": turns, "tools_per_turn": tools_per_turn, "messages": []},
+        {"configurable": {"thread_id": "bench"}},
+    )
+    if isinstance(checkpointer, BufferedCheckpointSaver):
+        await checkpointer.aflush(thread_id="bench")
+    elapsed = perf_counter() - start
+
+    inner.close()
+    return {"round_trips": inner.round_trips, "bytes": database.stat().st_size, "seconds": elapsed}
+
+
+async def main_async(turns: int, tools_per_turn: int, directory: Path) -> None:
+    """
+    Compare storage traffic across flush policies.
+
+    Args:
+        turns (int): Number of agent turns.
+        tools_per_turn (int): Parallel tool calls per turn.
+        directory (Path): Directory for the SQLite files.
+    """
+    graph = _build_graph()
+    directory.mkdir(parents=True, exist_ok=True)
+
+    print(f"{'policy':>14} {'round trips':>12} {'per turn':>9} {'db size':>10} {'time':>10}")
+    for policy in (None, FlushPolicy.SUPERSTEP, FlushPolicy.EVERY_N_STEPS, FlushPolicy.END):
+        name = policy.value if policy else "write-through"
+        database = directory / f"checkpoints_{name}.sqlite"
+        for path in directory.glob(f"{database.name}*"):
+            path.unlink()
+        result = await run_policy(graph=graph, policy=policy, turns=turns, tools_per_turn=tools_per_turn, database=database)
+        print(
+            f"{name:>14} {result['round_trips']:>12} {result['round_trips'] / turns:>9.1f} "
+            f"{result['bytes'] / 1024:>8.0f}KB {result['seconds'] * 1000:>8.1f}ms"
+        )
+
+
+def main() -> None:
+    """
+    Parse arguments and run the benchmark.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark checkpoint storage round trips per agent turn.")
+    parser.add_argument("--turns", type=int, default=10, help="Agent turns per run.")
+    parser.add_argument("--tools-per-turn", type=int, default=4, help="Parallel tool calls per turn.")
+    parser.add_argument("--directory", type=Path, default=Path(tempfile.gettempdir()) / "agentic_scratch_checkpoints", help="Directory for the SQLite files.")
+    args = parser.parse_args()
+
+    asyncio.run(main_async(turns=args.turns, tools_per_turn=args.tools_per_turn, directory=args.directory))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+==============================================================================
+Name: bench_conversation_context
+Author: AI Assistant
+Date: 10/17/2026
+Description: Benchmark of per-turn conversation context building, comparing the
+rebuilt Conversation with the append-only ConversationBuffer.
+==============================================================================
+"""
+
+import argparse
+from time import perf_counter
+from typing import List, Tuple
+
+from langchain_core.messages import AIMessage, AnyMessage, ToolMessage
+
+from wernicke.engines.llm.llm_callers.factory import conversation_factory
+
+from ..callers.agentic_scratch_caller import AgenticScratchCallerConfig
+from ..state import ConversationBuffer, conversation_buffer_reducer
+
+TOOLS_PER_TURN = 2
+
+
+def _turn_messages(turn: int) -> Tuple[List[AnyMessage], AIMessage]:
+    """
+    Build the tool results and AI message produced by one simulated turn.
+
+    Args:
+        turn (int): The turn index.
+
+    Returns:
+        Tuple[List[AnyMessage], AIMessage]: The tool results and the AI message.
+    """
+    tool_results = [
+        ToolMessage(content=f"Search results for 'query {turn}-{i}':\n1. Result 1\n2. Result 2\n3. Result 3", tool_call_id=f"call_{turn}_{i}")
+        for i in range(TOOLS_PER_TURN)
+    ]
+    ai_message = AIMessage(content=f"Turn {turn} reasoning and tool calls")
+    return tool_results, ai_message
+
+
+def time_conversation(turns: int) -> float:
+    """
+    Time the previous CoreNode pattern: add messages twice per turn and rebuild the context.
+
+    Args:
+        turns (int): Number of agent turns.
+
+    Returns:
+        float: Total context-building time in seconds.
+    """
+    conversation = conversation_factory(caller_config=AgenticScratchCallerConfig, user_input="Search for Python and summarize")
+    total = 0.0
+    for turn in range(turns):
+        tool_results, ai_message = _turn_messages(turn=turn)
+        start = perf_counter()
+        conversation = conversation.add_messages(tool_results)
+        conversation.get_conversation_context()
+        conversation = conversation.add_messages([ai_message])
+        total += perf_counter() - start
+    return total
+
+
+def time_buffer(turns: int) -> float:
+    """
+    Time the append-only buffer pattern: build the context with pending tool results and append only new messages.
+
+    Args:
+        turns (int): Number of agent turns.
+
+    Returns:
+        float: Total context-building time in seconds.
+    """
+    conversation = conversation_factory(caller_config=AgenticScratchCallerConfig, user_input="Search for Python and summarize")
+    buffer = ConversationBuffer.from_prefix(conversation.get_conversation_context())
+    total = 0.0
+    for turn in range(turns):
+        tool_results, ai_message = _turn_messages(turn=turn)
+        start = perf_counter()
+        buffer.get_conversation_context(pending=tool_results)
+        buffer = conversation_buffer_reducer(buffer, [*tool_results, ai_message])
+        total += perf_counter() - start
+    return total
+
+
+def main() -> None:
+    """
+    Compare context-building time at several conversation lengths.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark conversation context building per agent turn.")
+    parser.add_argument("--turns", type=int, nargs="+", default=[5, 20, 100], help="Conversation lengths to measure.")
+    parser.add_argument("--repeats", type=int, default=5, help="Runs per length; the best run is reported.")
+    args = parser.parse_args()
+
+    print(f"{'turns':>6} {'conversation':>14} {'buffer':>12} {'speedup':>9}")
+    for turns in args.turns:
+        conversation_time = min(time_conversation(turns=turns) for _ in range(args.repeats))
+        buffer_time = min(time_buffer(turns=turns) for _ in range(args.repeats))
+        speedup = conversation_time / buffer_time if buffer_time > 0 else float("inf")
+        print(f"{turns:>6} {conversation_time * 1000:>12.3f}ms {buffer_time * 1000:>10.3f}ms {speedup:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+"""
+==============================================================================
+Name: bench_import_time
+Author: AI Assistant
+Date: 10/17/2026
+Description: Import-time benchmark of the agentic_scratch package based on
+`python -X importtime`, with per-module time budgets and forbidden eager
+imports that can be asserted on.
+==============================================================================
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from pydantic import BaseModel, Field
+
+# Directory containing the agentic_scratch package, put on the path of the measured interpreter
+PACKAGE_PARENT = Path(__file__).resolve().parent.parent.parent
+
+# Cold import budgets in milliseconds. The package root and the stdlib-only modules must stay cheap (the dispatcher
+# needs asyncio); the state model needs langchain_core messages and langgraph channels, and the orchestrator needs
+# langgraph's graph compiler.
+DEFAULT_BUDGETS_MS: Dict[str, float] = {
+    "agentic_scratch": 5.0,
+    "agentic_scratch.tool_dispatcher": 100.0,
+    "agentic_scratch.graph_cache": 10.0,
+    "agentic_scratch.state": 1500.0,
+    "agentic_scratch.agentic_scratch_orchestrator": 3000.0,
+}
+
+# Modules that must not be imported as a side effect of importing the key module
+FORBIDDEN_IMPORTS: Dict[str, Tuple[str, ...]] = {
+    "agentic_scratch": ("langgraph", "langchain_core", "httpx", "pydantic", "wernicke"),
+    "agentic_scratch.tool_dispatcher": ("langgraph", "langchain_core", "wernicke"),
+    "agentic_scratch.graph_cache": ("langgraph", "langchain_core", "wernicke"),
+    "agentic_scratch.state": ("langgraph.graph", "agentic_scratch.agentic_scratch_orchestrator", "agentic_scratch.callers"),
+    "agentic_scratch.agentic_scratch_orchestrator": ("wernicke.engines.llm.llm_callers.callers", "agentic_scratch.streaming"),
+}
+
+
+class ImportProfile(BaseModel):
+    """
+    Cold import cost of one module, measured in a fresh interpreter.
+
+    Attributes:
+        module (str): The imported module.
+        cumulative_ms (float): Time to import the module and its parent packages, including everything they import.
+        children_ms (Dict[str, float]): Cumulative time of each module imported directly by the module.
+        imported_modules (List[str]): Every module imported as a side effect.
+    """
+
+    module: str
+    cumulative_ms: float
+    children_ms: Dict[str, float] = Field(default_factory=dict)
+    imported_modules: List[str] = Field(default_factory=list)
+
+
+class BudgetResult(BaseModel):
+    """
+    Outcome of checking an import profile against its budget.
+
+    Attributes:
+        profile (ImportProfile): The measured profile.
+        budget_ms (Optional[float]): The time budget. Not checked if None.
+        forbidden_imported (List[str]): Forbidden modules the import pulled in.
+    """
+
+    profile: ImportProfile
+    budget_ms: Optional[float] = None
+    forbidden_imported: List[str] = Field(default_factory=list)
+
+    @property
+    def passed(self) -> bool:
+        """
+        Returns whether the import is within budget and imported no forbidden module.
+
+        Returns:
+            bool: True if the budget holds.
+        """
+        within_time = self.budget_ms is None or self.profile.cumulative_ms <= self.budget_ms
+        return within_time and not self.forbidden_imported
+
+
+def parse_importtime(module: str, stderr: str) -> ImportProfile:
+    """
+    Parse `-X importtime` output for an interpreter that ran `import <module>`.
+
+    Each line is `import time: <self us> | <cumulative us> | <indent><module>`; a module's imports are listed before it,
+    indented two more spaces.
+
+    Args:
+        module (str): The imported module.
+        stderr (str): The interpreter's stderr.
+
+    Returns:
+        ImportProfile: The import profile.
+    """
+    parts = module.split(".")
+    measured = {".".join(parts[: index + 1]) for index in range(len(parts))}
+
+    cumulative_us = 0
+    children: Dict[str, float] = {}
+    pending_children: Dict[str, float] = {}
+    imported_modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name_field = line[len("import time:") :].split("|")
+        name = name_field.strip()
+        indent = len(name_field) - len(name_field.lstrip()) - 1
+        imported_modules.append(name)
+
+        if indent == 2:
+            pending_children[name] = int(cumulative) / 1000
+        elif indent == 0:
+            if name in measured:
+                cumulative_us += int(cumulative)
+            if name == module:
+                children = pending_children
+            pending_children = {}
+
+    return ImportProfile(module=module, cumulative_ms=cumulative_us / 1000, children_ms=children, imported_modules=imported_modules)
+
+
+def measure_import(module: str, repeats: int = 5, python: str = sys.executable) -> ImportProfile:
+    """
+    Measure the cold import of a module, keeping the fastest of several fresh interpreters.
+
+    Args:
+        module (str): The module to import.
+        repeats (int): Fresh interpreters to run.
+        python (str): The interpreter to measure.
+
+    Returns:
+        ImportProfile: The fastest import profile.
+
+    Raises:
+        RuntimeError: If the import fails.
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(PACKAGE_PARENT), env.get("PYTHONPATH")]))
+
+    best: Optional[ImportProfile] = None
+    for _ in range(repeats):
+        completed = subprocess.run([python, "-X", "importtime", "-c", f"import {module}"], env=env, capture_output=True, text=True)
+        if completed.returncode != 0:
+            raise RuntimeError(f"Importing {module} failed:\n{completed.stderr[-2000:]}")
+        profile = parse_importtime(module=module, stderr=completed.stderr)
+        if best is None or profile.cumulative_ms < best.cumulative_ms:
+            best = profile
+    return best
+
+
+def check_import_budget(
+    module: str, budget_ms: Optional[float] = None, forbidden: Sequence[str] = (), repeats: int = 5
+) -> BudgetResult:
+    """
+    Measure a module's cold import and check it against a time budget and forbidden eager imports.
+
+    Args:
+        module (str): The module to import.
+        budget_ms (Optional[float]): Maximum cumulative import time. Not checked if None.
+        forbidden (Sequence[str]): Modules (and their submodules) the import must not pull in.
+        repeats (int): Fresh interpreters to run; the fastest is kept.
+
+    Returns:
+        BudgetResult: The profile and the budget outcome.
+    """
+    profile = measure_import(module=module, repeats=repeats)
+    forbidden_imported = sorted(
+        {name for name in profile.imported_modules if any(name == prefix or name.startswith(prefix + ".") for prefix in forbidden)}
+    )
+    return BudgetResult(profile=profile, budget_ms=budget_ms, forbidden_imported=forbidden_imported)
+
+
+def assert_import_budget(module: str, budget_ms: Optional[float] = None, forbidden: Sequence[str] = (), repeats: int = 5) -> ImportProfile:
+    """
+    Assert that a module's cold import stays within its budget, e.g. from a CI check.
+
+    Args:
+        module (str): The module to import.
+        budget_ms (Optional[float]): Maximum cumulative import time. Not checked if None.
+        forbidden (Sequence[str]): Modules (and their submodules) the import must not pull in.
+        repeats (int): Fresh interpreters to run; the fastest is kept.
+
+    Returns:
+        ImportProfile: The measured profile.
+
+    Raises:
+        AssertionError: If the import is over budget or pulls in a forbidden module.
+    """
+    result = check_import_budget(module=module, budget_ms=budget_ms, forbidden=forbidden, repeats=repeats)
+    assert not result.forbidden_imported, (
+        f"Importing {module} eagerly imports {len(result.forbidden_imported)} forbidden modules, e.g. {', '.join(result.forbidden_imported[:5])}"
+    )
+    assert result.passed, f"Importing {module} took {result.profile.cumulative_ms:.1f}ms, over its {budget_ms:.1f}ms budget"
+    return result.profile
+
+
+def _parse_budget(value: str) -> Tuple[str, float]:
+    """
+    Parse a `module=milliseconds` budget argument.
+
+    Args:
+        value (str): The argument.
+
+    Returns:
+        Tuple[str, float]: The module and its budget.
+
+    Raises:
+        argparse.ArgumentTypeError: If the argument is malformed.
+    """
+    module, _, budget = value.partition("=")
+    try:
+        return module, float(budget)
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(f"Expected MODULE=MILLISECONDS, got {value!r}") from error
+
+
+def main() -> None:
+    """
+    Parse arguments, measure every module and exit non-zero if any budget is broken.
+    """
+    parser = argparse.ArgumentParser(description="Measure cold import times of the agentic_scratch package against budgets.")
+    parser.add_argument("--budget", type=_parse_budget, action="append", default=[], help="MODULE=MILLISECONDS; overrides or adds a module budget.")
+    parser.add_argument("--repeats", type=int, default=5, help="Fresh interpreters per module; the fastest is reported.")
+    parser.add_argument("--top", type=int, default=5, help="Heaviest direct imports to list per module.")
+    parser.add_argument("--json", action="store_true", help="Print the results as JSON.")
+    args = parser.parse_args()
+
+    budgets = dict(DEFAULT_BUDGETS_MS)
+    budgets.update(dict(args.budget))
+
+    results = [
+        check_import_budget(module=module, budget_ms=budget_ms, forbidden=FORBIDDEN_IMPORTS.get(module, ()), repeats=args.repeats)
+        for module, budget_ms in budgets.items()
+    ]
+
+    if args.json:
+        print(json.dumps([{**result.model_dump(exclude={"profile": {"imported_modules"}}), "passed": result.passed} for result in results], indent=2))
+    else:
+        print(f"{'module':<46} {'import':>10} {'budget':>10}  status")
+        for result in results:
+            status = "ok" if result.passed else "OVER BUDGET"
+            if result.forbidden_imported:
+                status = f"imports {', '.join(result.forbidden_imported[:3])}{'...' if len(result.forbidden_imported) > 3 else ''}"
+            print(f"{result.profile.module:<46} {result.profile.cumulative_ms:>8.1f}ms {result.budget_ms:>8.1f}ms  {status}")
+            heaviest = sorted(result.profile.children_ms.items(), key=lambda item: item[1], reverse=True)[: args.top]
+            for name, child_ms in heaviest:
+                print(f"    {name:<42} {child_ms:>8.1f}ms")
+
+    if not all(result.passed for result in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+==============================================================================
+Name: bench_node_instrumentation
+Author: AI Assistant
+Date: 10/17/2026
+Description: Micro-benchmark of the per-execution overhead NodeInstrumentation
+adds to a node, for each measurement option.
+==============================================================================
+"""
+
+import argparse
+import asyncio
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional
+
+from langchain_core.messages import AIMessage, HumanMessage
+from pydantic import BaseModel
+
+from ..instrumentation import NodeInstrumentation
+
+
+class _BenchState(BaseModel):
+    """
+    Node input state with a conversation of the given number of turns.
+    """
+
+    messages: List[Any]
+
+
+class _BenchNode:
+    """
+    Node doing a small amount of work with one suspension point, like a tool node.
+    """
+
+    name = "BenchNode"
+
+    async def execute(self, graph_state: _BenchState) -> Dict[str, Any]:
+        """
+        Execute the node.
+
+        Args:
+            graph_state (_BenchState): The input state.
+
+        Returns:
+            Dict[str, Any]: The state update.
+        """
+        await asyncio.sleep(0)
+        return {"count": len(graph_state.messages)}
+
+
+async def time_executions(execute: Callable[..., Any], graph_state: _BenchState, executions: int) -> float:
+    """
+    Time repeated executions of a node.
+
+    Args:
+        execute (Callable[..., Any]): The node's execute function.
+        graph_state (_BenchState): The input state.
+        executions (int): Number of executions.
+
+    Returns:
+        float: Mean time per execution in seconds.
+    """
+    start = perf_counter()
+    for _ in range(executions):
+        await execute(graph_state)
+    return (perf_counter() - start) / executions
+
+
+async def main_async(executions: int, turns: int) -> None:
+    """
+    Compare the bare node with each instrumentation option.
+
+    Args:
+        executions (int): Executions per variant.
+        turns (int): Conversation turns in the input state.
+    """
+    graph_state = _BenchState(messages=[message for turn in range(turns) for message in (HumanMessage(content=f"Q{turn}"), AIMessage(content=f"A{turn}"))])
+    # Each variant is built just before it is timed, so tracemalloc is only running for the variant that traces allocations
+    variants: Dict[str, Optional[Dict[str, bool]]] = {
+        "bare": None,
+        "timing only": {"measure_state_size": False},
+        "+ state size": {"measure_state_size": True},
+        "+ tracemalloc": {"measure_state_size": True, "trace_allocations": True},
+    }
+
+    baseline = None
+    print(f"{'variant':>14} {'us/execution':>14} {'overhead':>10}")
+    for name, options in variants.items():
+        node_instrumentation = NodeInstrumentation(**options) if options is not None else None
+        execute = node_instrumentation.instrument(node=_BenchNode()).execute if node_instrumentation else _BenchNode().execute
+        try:
+            mean = await time_executions(execute=execute, graph_state=graph_state, executions=executions)
+        finally:
+            if node_instrumentation:
+                node_instrumentation.close()
+        baseline = baseline if baseline is not None else mean
+        print(f"{name:>14} {mean * 1e6:>14.1f} {(mean - baseline) * 1e6:>8.1f}us")
+
+
+def main() -> None:
+    """
+    Parse arguments and run the benchmark.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark NodeInstrumentation overhead per node execution.")
+    parser.add_argument("--executions", type=int, default=5000, help="Executions per variant.")
+    parser.add_argument("--turns", type=int, default=10, help="Conversation turns in the node input state.")
+    args = parser.parse_args()
+
+    asyncio.run(main_async(executions=args.executions, turns=args.turns))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+==============================================================================
+Name: bench_orchestrator_startup
+Author: AI Assistant
+Date: 10/17/2026
+Description: Benchmark of per-request AgenticScratchOrchestrator construction
+time, compiling the graph for every instance versus reusing the process-wide
+compiled graph.
+==============================================================================
+"""
+
+import argparse
+from statistics import median
+from time import perf_counter
+from typing import List
+
+from langgraph.checkpoint.memory import InMemorySaver
+
+from wernicke.tests.shared_utils.test_session import create_test_user_session
+
+from ..agentic_scratch_orchestrator import AgenticScratchOrchestrator
+from ..graph_cache import CompiledGraphCache
+
+
+def time_constructions(compiled_graph_cache: CompiledGraphCache, constructions: int) -> List[float]:
+    """
+    Time constructing one orchestrator per simulated request.
+
+    Args:
+        compiled_graph_cache (CompiledGraphCache): The compiled graph cache the orchestrators use.
+        constructions (int): Orchestrators to construct.
+
+    Returns:
+        List[float]: Construction time of each orchestrator in seconds.
+    """
+    user_session_info = create_test_user_session()
+    timings = []
+    for _ in range(constructions):
+        start = perf_counter()
+        AgenticScratchOrchestrator(
+            checkpointer=InMemorySaver(),
+            user_session_info=user_session_info,
+            compiled_graph_cache=compiled_graph_cache,
+        )
+        timings.append(perf_counter() - start)
+    return timings
+
+
+def main() -> None:
+    """
+    Parse arguments and run the benchmark.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark per-request orchestrator construction with and without the compiled graph cache.")
+    parser.add_argument("--constructions", type=int, default=200, help="Orchestrators constructed per mode.")
+    args = parser.parse_args()
+
+    shared_cache = CompiledGraphCache()
+    first_start = perf_counter()
+    time_constructions(compiled_graph_cache=shared_cache, constructions=1)
+    print(f"First construction (compiles the shared graph): {(perf_counter() - first_start) * 1000:.2f}ms")
+
+    print(f"{'mode':>10} {'p50':>10} {'max':>10} {'total':>10}")
+    for mode, compiled_graph_cache in (("compile", CompiledGraphCache(enabled=False)), ("cached", shared_cache)):
+        timings = time_constructions(compiled_graph_cache=compiled_graph_cache, constructions=args.constructions)
+        print(f"{mode:>10} {median(timings) * 1000:>8.3f}ms {max(timings) * 1000:>8.3f}ms {sum(timings) * 1000:>8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+==============================================================================
+Name: bench_streaming_tool_dispatch
+Author: AI Assistant
+Date: 10/17/2026
+Description: Benchmark of time-to-first-tool and turn latency for a multi-tool
+turn, comparing tools started after the full LLM response with tools started
+early from the stream. The last tool call's arguments complete at the end of
+the response, so with equal tool latencies the turn still waits one tool
+latency after the response; early dispatch shortens the turn when tool
+latencies differ or when work such as a checkpoint write separates the
+response from the tool nodes (`--step-overhead`).
+==============================================================================
+"""
+
+import argparse
+import asyncio
+from statistics import median
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+from langchain_core.messages import HumanMessage
+from langchain_openai import ChatOpenAI
+
+from ..streaming import EarlyToolDispatchHandler, early_tool_dispatch
+from ..tool_dispatcher import ToolCallDispatcher
+from .fake_llm_server import FakeLLMServer
+
+
+SEARCH_TOOL_SCHEMA = {
+    "type": "function",
+    "function": {
+        "name": "SearchTool",
+        "description": "Search for information based on a query. Returns relevant results.",
+        "parameters": {"type": "object", "properties": {"query": {"type": "string"}}, "required": ["query"]},
+    },
+}
+
+
+def _build_dispatcher(tool_latency: float, tool_started_at: List[float]) -> Tuple[ToolCallDispatcher, Callable[[Dict[str, Any]], Awaitable[Any]]]:
+    """
+    Build a dispatcher whose SearchTool handler sleeps for the tool latency.
+
+    Args:
+        tool_latency (float): Seconds each search takes.
+        tool_started_at (List[float]): Receives the start time of every search.
+
+    Returns:
+        Tuple[ToolCallDispatcher, Callable[[Dict[str, Any]], Awaitable[Any]]]: The dispatcher and the search function.
+    """
+
+    async def search(inputs: Dict[str, Any]) -> Dict[str, Any]:
+        tool_started_at.append(perf_counter())
+        await asyncio.sleep(tool_latency)
+        return {"content": f"Search results for '{inputs['query']}'"}
+
+    tool_dispatcher = ToolCallDispatcher()
+    tool_dispatcher.register_early_dispatch(tool_name="SearchTool", key_fn=lambda inputs: inputs["query"], run_fn=search)
+    return tool_dispatcher, search
+
+
+async def run_turn(model: Any, tool_latency: float, step_overhead: float, early: bool) -> Dict[str, float]:
+    """
+    Run one agent turn: stream the LLM response, then make sure every tool call has its result.
+
+    Args:
+        model (Any): The chat model bound to the SearchTool schema.
+        tool_latency (float): Seconds each search takes.
+        step_overhead (float): Seconds between the end of the response and the tool nodes starting.
+        early (bool): Whether tools start from the stream or after the full response.
+
+    Returns:
+        Dict[str, float]: Time to first tool start, time until every tool result is available, and how much of it
+            was spent waiting for tools after the response ended.
+    """
+    tool_started_at: List[float] = []
+    tool_dispatcher, search = _build_dispatcher(tool_latency=tool_latency, tool_started_at=tool_started_at)
+    messages = [HumanMessage(content="Search for three things")]
+
+    with tool_dispatcher.early_dispatch_scope():
+        start = perf_counter()
+        if early:
+            with early_tool_dispatch(handler=EarlyToolDispatchHandler(tool_dispatcher=tool_dispatcher)):
+                response = await model.ainvoke(messages)
+        else:
+            response = await model.ainvoke(messages)
+        response_end = perf_counter()
+        await asyncio.sleep(step_overhead)
+
+        # The tool nodes: claim early work or start the search now
+        await asyncio.gather(
+            *(
+                tool_dispatcher.take_early(tool_name="SearchTool", key=tool_call["args"]["query"]) or search(tool_call["args"])
+                for tool_call in response.tool_calls
+            )
+        )
+        end = perf_counter()
+
+    return {"time_to_first_tool": min(tool_started_at) - start, "turn_latency": end - start, "after_response": end - response_end}
+
+
+async def main_async(num_tools: int, tool_latency: float, step_overhead: float, chunk_delay: float, repeats: int) -> None:
+    """
+    Compare blocking and early tool dispatch against the fake LLM server.
+
+    Args:
+        num_tools (int): Tool calls in the scripted response.
+        tool_latency (float): Seconds each search takes.
+        step_overhead (float): Seconds between the end of the response and the tool nodes starting.
+        chunk_delay (float): Seconds between streamed chunks.
+        repeats (int): Turns per mode; medians are reported.
+    """
+    tool_calls = [("SearchTool", {"query": f"benchmark query number {index}"}) for index in range(num_tools)]
+    async with FakeLLMServer(tool_calls=tool_calls, chunk_delay=chunk_delay) as server:
+        model = ChatOpenAI(base_url=server.base_url, api_key="fake", model="fake", streaming=True).bind_tools([SEARCH_TOOL_SCHEMA])
+
+        print(f"{'mode':>10} {'first tool':>12} {'turn latency':>14} {'after response':>16}")
+        for early in (False, True):
+            results = [await run_turn(model=model, tool_latency=tool_latency, step_overhead=step_overhead, early=early) for _ in range(repeats)]
+            print(
+                f"{'early' if early else 'blocking':>10} "
+                f"{median(result['time_to_first_tool'] for result in results) * 1000:>10.0f}ms "
+                f"{median(result['turn_latency'] for result in results) * 1000:>12.0f}ms "
+                f"{median(result['after_response'] for result in results) * 1000:>14.0f}ms"
+            )
+
+
+def main() -> None:
+    """
+    Parse arguments and run the benchmark.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark early tool dispatch from a streamed LLM response.")
+    parser.add_argument("--tools", type=int, default=3, help="Tool calls per turn.")
+    parser.add_argument("--tool-latency", type=float, default=0.3, help="Seconds each search takes.")
+    parser.add_argument("--step-overhead", type=float, default=0.0, help="Seconds between the response and the tool nodes, e.g. a checkpoint write.")
+    parser.add_argument("--chunk-delay", type=float, default=0.02, help="Seconds between streamed chunks.")
+    parser.add_argument("--repeats", type=int, default=5, help="Turns per mode.")
+    args = parser.parse_args()
+
+    asyncio.run(main_async(num_tools=args.tools, tool_latency=args.tool_latency, step_overhead=args.step_overhead, chunk_delay=args.chunk_delay, repeats=args.repeats))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+"""
+==============================================================================
+Name: bench_tool_fanout
+Author: AI Assistant
+Date: 10/17/2026
+Description: Micro-benchmark of the tool-call fan-out in _send_tools_conditional,
+comparing JSON-keyed coalescing with per-call factory dict rebuilds against
+the current coalescing and the tool registry lookup.
+==============================================================================
+"""
+
+import argparse
+import json
+import tracemalloc
+from time import perf_counter
+from typing import Callable, Dict, List, Tuple, Type
+
+from langgraph.types import Send
+from pydantic import BaseModel
+
+from wernicke.engines.llm.llm_callers.models import ToolCallAction
+from wernicke.engines.llm.llm_orchestrators.graph_llm_orchestrators.node_types.base import INode
+
+from ..tool_dispatcher import ToolCallDispatcher
+from ..tools import register_builtin_tools
+from ..tools.process_tool import ProcessTool, ProcessToolInputs
+from ..tools.process_tool_node import ProcessToolNode, ProcessToolState
+from ..tools.registry import tool_registry
+from ..tools.search_tool import SearchTool, SearchToolInputs
+from ..tools.search_tool_node import SearchToolNode, SearchToolState
+
+
+def _legacy_node_factory(tool_name: str) -> Type[INode]:
+    """
+    The factory before the registry: rebuilds its lookup dict on every call.
+
+    Args:
+        tool_name (str): Name of the tool.
+
+    Returns:
+        Type[INode]: The node class for the tool.
+    """
+    tool_nodes: Dict[str, Type[INode]] = {
+        SearchTool.name: SearchToolNode,
+        ProcessTool.name: ProcessToolNode,
+    }
+    return tool_nodes[tool_name]
+
+
+def _legacy_state_factory(tool_action: ToolCallAction, **kwargs) -> BaseModel:
+    """
+    The state factory before the registry: rebuilds its lambda dict on every call.
+
+    Args:
+        tool_action (ToolCallAction): The tool call action.
+        **kwargs: `duplicate_tool_call_ids`.
+
+    Returns:
+        BaseModel: The node's input state.
+    """
+    tool_states: Dict[str, Callable] = {
+        SearchTool.name: lambda tool_action, **kwargs: SearchToolState(
+            tool_call_id=tool_action.id,
+            query=tool_action.content.inputs.query,
+            duplicate_tool_call_ids=kwargs.get("duplicate_tool_call_ids", []),
+        ),
+        ProcessTool.name: lambda tool_action, **kwargs: ProcessToolState(
+            tool_call_id=tool_action.id,
+            summary=tool_action.content.inputs.summary,
+            duplicate_tool_call_ids=kwargs.get("duplicate_tool_call_ids", []),
+        ),
+    }
+    return tool_states[tool_action.content.name](tool_action=tool_action, **kwargs)
+
+
+def _legacy_coalesce(tool_calls: List[ToolCallAction]) -> List[Tuple[ToolCallAction, List[str]]]:
+    """
+    Coalescing before keys used the models' own JSON serializer: inputs are dumped to a dict, then to sorted JSON.
+
+    Args:
+        tool_calls (List[ToolCallAction]): The turn's tool calls.
+
+    Returns:
+        List[Tuple[ToolCallAction, List[str]]]: The tool call to execute and the IDs of its duplicates.
+    """
+    groups: Dict[Tuple[str, str], Tuple[ToolCallAction, List[str]]] = {}
+    for tool_action in tool_calls:
+        key = tool_action.content.name, json.dumps(tool_action.content.inputs.model_dump(mode="json"), sort_keys=True, default=str)
+        if key in groups:
+            groups[key][1].append(tool_action.id)
+        else:
+            groups[key] = (tool_action, [])
+    return list(groups.values())
+
+
+def legacy_fan_out(tool_dispatcher: ToolCallDispatcher, tool_calls: List[ToolCallAction]) -> List[Send]:
+    """
+    Route a turn's tool calls the way `_send_tools_conditional` did before the registry.
+
+    Args:
+        tool_dispatcher (ToolCallDispatcher): Unused; the JSON-keyed coalescing is inlined.
+        tool_calls (List[ToolCallAction]): The turn's tool calls.
+
+    Returns:
+        List[Send]: One Send per distinct call.
+    """
+    tool_sends = []
+    for tool_call_action, duplicate_tool_call_ids in _legacy_coalesce(tool_calls=tool_calls):
+        tool_call_node = _legacy_node_factory(tool_name=tool_call_action.content.name)
+        tool_call_state = _legacy_state_factory(tool_action=tool_call_action, duplicate_tool_call_ids=duplicate_tool_call_ids)
+        tool_sends.append(Send(node=str(tool_call_node.name), arg=tool_call_state))
+    return tool_sends
+
+
+def registry_fan_out(tool_dispatcher: ToolCallDispatcher, tool_calls: List[ToolCallAction]) -> List[Send]:
+    """
+    Route a turn's tool calls the way `_send_tools_conditional` does with the registry.
+
+    Args:
+        tool_dispatcher (ToolCallDispatcher): Coalesces identical calls.
+        tool_calls (List[ToolCallAction]): The turn's tool calls.
+
+    Returns:
+        List[Send]: One Send per distinct call.
+    """
+    tool_sends = []
+    for tool_call_action, duplicate_tool_call_ids in tool_dispatcher.coalesce(tool_calls=tool_calls):
+        registration = tool_registry.get(tool_call_action.content.name)
+        tool_sends.append(
+            Send(node=registration.node_name, arg=registration.build_state(tool_action=tool_call_action, duplicate_tool_call_ids=duplicate_tool_call_ids))
+        )
+    return tool_sends
+
+
+def _tool_calls(num_calls: int) -> List[ToolCallAction]:
+    """
+    Build one turn of distinct tool calls: searches, with a ProcessTool call last.
+
+    Args:
+        num_calls (int): Tool calls in the turn.
+
+    Returns:
+        List[ToolCallAction]: The tool calls.
+    """
+    tool_calls = [
+        ToolCallAction.model_validate({"id": f"call_{index}", "content": {"name": SearchTool.name, "inputs": SearchToolInputs(query=f"query {index}")}})
+        for index in range(num_calls - 1)
+    ]
+    tool_calls.append(
+        ToolCallAction.model_validate({"id": "call_process", "content": {"name": ProcessTool.name, "inputs": ProcessToolInputs(summary="Summary.")}})
+    )
+    return tool_calls
+
+
+def time_fan_out(fan_out: Callable[[ToolCallDispatcher, List[ToolCallAction]], List[Send]], tool_calls: List[ToolCallAction], turns: int) -> float:
+    """
+    Time routing the same turn repeatedly.
+
+    Args:
+        fan_out (Callable[[ToolCallDispatcher, List[ToolCallAction]], List[Send]]): The fan-out implementation.
+        tool_calls (List[ToolCallAction]): The turn's tool calls.
+        turns (int): Turns to route.
+
+    Returns:
+        float: Mean time per turn in seconds.
+    """
+    tool_dispatcher = ToolCallDispatcher()
+    start = perf_counter()
+    for _ in range(turns):
+        fan_out(tool_dispatcher, tool_calls)
+    return (perf_counter() - start) / turns
+
+
+def peak_allocation(fan_out: Callable[[ToolCallDispatcher, List[ToolCallAction]], List[Send]], tool_calls: List[ToolCallAction]) -> int:
+    """
+    Measure the peak memory allocated while routing one turn.
+
+    Args:
+        fan_out (Callable[[ToolCallDispatcher, List[ToolCallAction]], List[Send]]): The fan-out implementation.
+        tool_calls (List[ToolCallAction]): The turn's tool calls.
+
+    Returns:
+        int: Peak traced bytes.
+    """
+    tool_dispatcher = ToolCallDispatcher()
+    fan_out(tool_dispatcher, tool_calls)
+    tracemalloc.start()
+    try:
+        fan_out(tool_dispatcher, tool_calls)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def main() -> None:
+    """
+    Parse arguments and run the benchmark.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the per-turn cost of routing tool calls to tool nodes.")
+    parser.add_argument("--calls", type=int, default=50, help="Tool calls per turn.")
+    parser.add_argument("--turns", type=int, default=2000, help="Turns routed per measurement.")
+    parser.add_argument("--repeats", type=int, default=5, help="Measurements per implementation; the best is reported.")
+    args = parser.parse_args()
+
+    register_builtin_tools()
+    tool_calls = _tool_calls(num_calls=args.calls)
+    print(f"{args.calls} tool calls per turn, {args.turns} turns")
+    print(f"{'fan-out':>10} {'per turn':>12} {'per call':>12} {'peak alloc':>12}")
+    for name, fan_out in (("factory", legacy_fan_out), ("registry", registry_fan_out)):
+        per_turn = min(time_fan_out(fan_out=fan_out, tool_calls=tool_calls, turns=args.turns) for _ in range(args.repeats))
+        peak = peak_allocation(fan_out=fan_out, tool_calls=tool_calls)
+        print(f"{name:>10} {per_turn * 1e6:>10.1f}us {per_turn / args.calls * 1e6:>10.2f}us {peak / 1024:>9.1f}KiB")
+
+
+if __name__ == "__main__":
+    main()
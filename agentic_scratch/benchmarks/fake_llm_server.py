@@ -0,0 +1,232 @@
+"""
+==============================================================================
+Name: fake_llm_server
+Author: AI Assistant
+Date: 10/17/2026
+Description: Local OpenAI-compatible chat completions server that streams a
+scripted response of chunked tool calls with configurable latency.
+==============================================================================
+"""
+
+import argparse
+import asyncio
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class FakeLLMServer:
+    """
+    Minimal HTTP server answering `POST /v1/chat/completions` with a scripted list of tool calls.
+
+    Streaming requests receive server-sent events in the OpenAI chunk format: each tool call's JSON arguments are split
+    into `chunk_chars` fragments sent `chunk_delay` seconds apart, after `time_to_first_token`. Non-streaming requests
+    receive the complete response after the same total delay.
+    """
+
+    def __init__(
+        self,
+        tool_calls: List[Tuple[str, Dict[str, Any]]],
+        chunk_chars: int = 4,
+        chunk_delay: float = 0.02,
+        time_to_first_token: float = 0.3,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """
+        Initialize the server.
+
+        Args:
+            tool_calls (List[Tuple[str, Dict[str, Any]]]): The (tool name, arguments) of each scripted tool call.
+            chunk_chars (int): Characters of JSON arguments per streamed chunk.
+            chunk_delay (float): Seconds between streamed chunks.
+            time_to_first_token (float): Seconds before the first chunk.
+            host (str): Host to bind.
+            port (int): Port to bind. A free port is picked if 0.
+        """
+        self._tool_calls = tool_calls
+        self._chunk_chars = chunk_chars
+        self._chunk_delay = chunk_delay
+        self._time_to_first_token = time_to_first_token
+        self._host = host
+        self._port = port
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    @property
+    def base_url(self) -> str:
+        """
+        Returns the OpenAI-compatible base URL of the running server.
+
+        Returns:
+            str: The base URL.
+        """
+        port = self._server.sockets[0].getsockname()[1] if self._server else self._port
+        return f"http://{self._host}:{port}/v1"
+
+    async def start(self) -> "FakeLLMServer":
+        """
+        Start listening.
+
+        Returns:
+            FakeLLMServer: The running server.
+        """
+        self._server = await asyncio.start_server(self._handle, host=self._host, port=self._port)
+        return self
+
+    async def close(self) -> None:
+        """
+        Stop listening and wait for the server to close.
+        """
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> "FakeLLMServer":
+        """
+        Start the server for the duration of the context.
+
+        Returns:
+            FakeLLMServer: The running server.
+        """
+        return await self.start()
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """
+        Close the server when the context exits.
+        """
+        await self.close()
+
+    def _chunks(self) -> List[Dict[str, Any]]:
+        """
+        Build the streamed deltas of the scripted response.
+
+        Returns:
+            List[Dict[str, Any]]: One `delta` per chunk.
+        """
+        deltas: List[Dict[str, Any]] = [{"role": "assistant", "content": None}]
+        for index, (name, args) in enumerate(self._tool_calls):
+            deltas.append({"tool_calls": [{"index": index, "id": f"call_{index}", "type": "function", "function": {"name": name, "arguments": ""}}]})
+            arguments = json.dumps(args)
+            for start in range(0, len(arguments), self._chunk_chars):
+                deltas.append({"tool_calls": [{"index": index, "function": {"arguments": arguments[start : start + self._chunk_chars]}}]})
+        return deltas
+
+    @staticmethod
+    def _completion_chunk(delta: Dict[str, Any], finish_reason: Optional[str] = None) -> bytes:
+        """
+        Encode one server-sent event in the chat completion chunk format.
+
+        Args:
+            delta (Dict[str, Any]): The delta of the chunk.
+            finish_reason (Optional[str]): The finish reason of the last chunk.
+
+        Returns:
+            bytes: The encoded event.
+        """
+        chunk = {
+            "id": "chatcmpl-fake",
+            "object": "chat.completion.chunk",
+            "created": 0,
+            "model": "fake",
+            "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+        }
+        return f"data: {json.dumps(chunk)}\n\n".encode()
+
+    def _completion(self) -> Dict[str, Any]:
+        """
+        Build the complete non-streamed response.
+
+        Returns:
+            Dict[str, Any]: The chat completion.
+        """
+        tool_calls = [
+            {"id": f"call_{index}", "type": "function", "function": {"name": name, "arguments": json.dumps(args)}}
+            for index, (name, args) in enumerate(self._tool_calls)
+        ]
+        return {
+            "id": "chatcmpl-fake",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "fake",
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": None, "tool_calls": tool_calls}, "finish_reason": "tool_calls"}],
+            "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+        }
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Serve one HTTP request and close the connection.
+
+        Args:
+            reader (asyncio.StreamReader): The request stream.
+            writer (asyncio.StreamWriter): The response stream.
+        """
+        try:
+            header_lines = (await reader.readuntil(b"\r\n\r\n")).decode().split("\r\n")
+            headers = {line.split(":", 1)[0].strip().lower(): line.split(":", 1)[1].strip() for line in header_lines[1:] if ":" in line}
+            body = await reader.readexactly(int(headers.get("content-length", 0)))
+            request = json.loads(body or b"{}")
+
+            chunks = self._chunks()
+            await asyncio.sleep(self._time_to_first_token)
+
+            if not request.get("stream"):
+                await asyncio.sleep(self._chunk_delay * len(chunks))
+                payload = json.dumps(self._completion()).encode()
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nConnection: close\r\n"
+                    + f"Content-Length: {len(payload)}\r\n\r\n".encode()
+                    + payload
+                )
+                await writer.drain()
+                return
+
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\nCache-Control: no-cache\r\nConnection: close\r\n\r\n")
+            for delta in chunks:
+                writer.write(self._completion_chunk(delta=delta))
+                await writer.drain()
+                await asyncio.sleep(self._chunk_delay)
+            writer.write(self._completion_chunk(delta={}, finish_reason="tool_calls"))
+            writer.write(b"data: [DONE]\n\n")
+            await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+
+async def _serve_forever(server: FakeLLMServer) -> None:
+    """
+    Run the server until interrupted.
+
+    Args:
+        server (FakeLLMServer): The server to run.
+    """
+    async with server:
+        print(f"Fake LLM server listening on {server.base_url}")
+        await asyncio.Event().wait()
+
+
+def main() -> None:
+    """
+    Run the fake server standalone, scripted with one SearchTool call per query.
+    """
+    parser = argparse.ArgumentParser(description="Serve scripted, chunked tool calls over the OpenAI chat completions API.")
+    parser.add_argument("--queries", nargs="+", default=["python asyncio", "langgraph send", "httpx streaming"], help="One SearchTool call per query.")
+    parser.add_argument("--chunk-chars", type=int, default=4, help="Characters of JSON arguments per chunk.")
+    parser.add_argument("--chunk-delay", type=float, default=0.02, help="Seconds between chunks.")
+    parser.add_argument("--time-to-first-token", type=float, default=0.3, help="Seconds before the first chunk.")
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on.")
+    args = parser.parse_args()
+
+    server = FakeLLMServer(
+        tool_calls=[("SearchTool", {"query": query}) for query in args.queries],
+        chunk_chars=args.chunk_chars,
+        chunk_delay=args.chunk_delay,
+        time_to_first_token=args.time_to_first_token,
+        port=args.port,
+    )
+    asyncio.run(_serve_forever(server=server))
+
+
+if __name__ == "__main__":
+    main()
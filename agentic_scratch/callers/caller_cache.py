@@ -0,0 +1,145 @@
+"""
+==============================================================================
+Name: caller_cache
+Author: AI Assistant
+Date: 10/17/2026
+Description: Cache of warmed LLM callers shared across agentic loop turns.
+==============================================================================
+"""
+
+from typing import TYPE_CHECKING, Callable, Dict, Hashable, List, Optional, Sequence, Tuple, Type
+
+if TYPE_CHECKING:
+    import httpx
+
+    from wernicke.engines.llm.auxillary.tools.wernicke_tools.base import ITool
+    from wernicke.engines.llm.llm_callers.callers import LLMCallerAgent
+    from wernicke.engines.llm.llm_callers.config import UserSessionInfo
+    from wernicke.engines.llm.llm_callers.models import CallerChatConfig, ResponseMode
+
+
+class LLMCallerCache:
+    """
+    Cache of LLMCallerAgent instances keyed by caller config, tool set and response mode.
+
+    Building an LLMCallerAgent instantiates every tool and re-derives the tool schemas from the
+    caller config, so the agentic loop reuses one warmed caller per key instead of rebuilding it
+    on every turn. The cache is bound to a single user session and HTTP client, which makes it
+    safe to share across every turn of a graph run and across runs of the same orchestrator.
+    """
+
+    def __init__(
+        self,
+        user_session_info: "UserSessionInfo",
+        http_async_client: Optional["httpx.AsyncClient"] = None,
+        enabled: bool = True,
+        caller_factory: Optional[Callable[..., "LLMCallerAgent"]] = None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            user_session_info (UserSessionInfo): User session information used to build callers.
+            http_async_client (Optional[httpx.AsyncClient]): HTTP client used by the callers.
+            enabled (bool): Whether callers are reused. When False every lookup builds a new caller.
+            caller_factory (Optional[Callable[..., LLMCallerAgent]]): Builds callers from the LLMCallerAgent keyword arguments.
+                Defaults to LLMCallerAgent, imported on first use; pass a fake provider's factory to run without a model.
+        """
+        self._user_session_info = user_session_info
+        self._http_async_client = http_async_client
+        self._enabled = enabled
+        self._caller_factory = caller_factory
+        self._callers: Dict[Tuple[Hashable, ...], "LLMCallerAgent"] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def cache_key(
+        caller_config: "CallerChatConfig",
+        tools: Sequence[Type["ITool"]],
+        response_mode: "ResponseMode",
+        stream: bool = False,
+    ) -> Tuple[Hashable, ...]:
+        """
+        Build the cache key for a caller.
+
+        Args:
+            caller_config (CallerChatConfig): The caller configuration.
+            tools (Sequence[Type[ITool]]): The tool classes available to the caller.
+            response_mode (ResponseMode): The response mode of the caller.
+            stream (bool): Whether the caller streams its response.
+
+        Returns:
+            Tuple[Hashable, ...]: The cache key.
+        """
+        return (
+            caller_config.name,
+            str(caller_config.version),
+            tuple(tool.name for tool in tools),
+            response_mode,
+            stream,
+        )
+
+    def get_caller(
+        self,
+        caller_config: "CallerChatConfig",
+        tools: Sequence[Type["ITool"]],
+        response_mode: "ResponseMode",
+        stream: bool = False,
+    ) -> "LLMCallerAgent":
+        """
+        Return a warmed caller for the given configuration, building it on first use.
+
+        Args:
+            caller_config (CallerChatConfig): The caller configuration.
+            tools (Sequence[Type[ITool]]): The tool classes available to the caller.
+            response_mode (ResponseMode): The response mode of the caller.
+            stream (bool): Whether the caller streams its response.
+
+        Returns:
+            LLMCallerAgent: The cached or newly built caller.
+        """
+        key = self.cache_key(caller_config=caller_config, tools=tools, response_mode=response_mode, stream=stream)
+
+        if self._enabled and key in self._callers:
+            self.hits += 1
+            return self._callers[key]
+
+        self.misses += 1
+        if self._caller_factory is None:
+            # The caller stack (LLM clients and provider SDKs) is the heaviest import of the graph; load it on first use
+            from wernicke.engines.llm.llm_callers.callers import LLMCallerAgent
+
+            self._caller_factory = LLMCallerAgent
+
+        llm_caller = self._caller_factory(
+            caller_config=caller_config,
+            user_session_info=self._user_session_info,
+            stream=stream,
+            tools=[tool() for tool in tools],
+            response_mode=response_mode,
+            http_async_client=self._http_async_client,
+        )
+
+        if self._enabled:
+            self._callers[key] = llm_caller
+
+        return llm_caller
+
+    def clear(self) -> None:
+        """
+        Drop every cached caller and reset the counters.
+        """
+        self._callers.clear()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def cached_keys(self) -> List[Tuple[Hashable, ...]]:
+        """
+        Returns the keys of the cached callers.
+
+        Returns:
+            List[Tuple[Hashable, ...]]: The cached keys.
+        """
+        return list(self._callers.keys())
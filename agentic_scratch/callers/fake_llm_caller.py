@@ -0,0 +1,214 @@
+"""
+==============================================================================
+Name: fake_llm_caller
+Author: AI Assistant
+Date: 10/17/2026
+Description: Offline, deterministic stand-in for LLMCallerAgent that returns
+scripted tool calls after a sampled latency.
+==============================================================================
+"""
+
+import asyncio
+import random
+from threading import Lock
+from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple
+
+from langchain_core.messages import AIMessage, AnyMessage
+from pydantic import BaseModel, Field
+
+from wernicke.engines.llm.auxillary.tools.wernicke_tools.base import ITool
+from wernicke.engines.llm.llm_callers.models import ToolCallAction
+
+
+class LatencyDistribution(BaseModel):
+    """
+    Latency distribution of a fake LLM call, in seconds.
+
+    Attributes:
+        kind (Literal["constant", "uniform", "lognormal"]): Shape of the distribution.
+        mean (float): Latency for "constant", median latency for "lognormal".
+        low (float): Lower bound for "uniform".
+        high (float): Upper bound for "uniform".
+        sigma (float): Standard deviation of the underlying normal for "lognormal".
+    """
+
+    kind: Literal["constant", "uniform", "lognormal"] = "constant"
+    mean: float = 0.0
+    low: float = 0.0
+    high: float = 0.0
+    sigma: float = 0.5
+
+    def sample(self, rng: random.Random) -> float:
+        """
+        Draw one latency.
+
+        Args:
+            rng (random.Random): The random number generator.
+
+        Returns:
+            float: The latency in seconds.
+        """
+        if self.kind == "uniform":
+            return rng.uniform(self.low, self.high)
+        if self.kind == "lognormal":
+            return self.mean * rng.lognormvariate(0.0, self.sigma)
+        return self.mean
+
+
+class ScriptedToolCall(BaseModel):
+    """
+    A tool call the fake LLM makes.
+
+    Attributes:
+        name (str): Name of the tool.
+        args (Dict[str, Any]): The tool arguments.
+    """
+
+    name: str
+    args: Dict[str, Any] = Field(default_factory=dict)
+
+
+class FakeLLMScript(BaseModel):
+    """
+    The tool calls the fake LLM makes on each agent turn.
+
+    The turn is the number of AI messages already in the conversation, so every thread replays the same script. Turns
+    past the end of the script repeat the last turn, and so does a turn calling tools the caller was not given, e.g.
+    when the loop controller forces the final ProcessTool call early.
+
+    Attributes:
+        turns (List[List[ScriptedToolCall]]): The tool calls of each turn.
+    """
+
+    turns: List[List[ScriptedToolCall]]
+
+    @classmethod
+    def search_then_process(cls, search_turns: int = 1, searches_per_turn: int = 2, repeat_queries: bool = False) -> "FakeLLMScript":
+        """
+        Build the usual agent trajectory: parallel searches for a few turns, then ProcessTool.
+
+        Args:
+            search_turns (int): Turns that call SearchTool.
+            searches_per_turn (int): Parallel SearchTool calls per turn.
+            repeat_queries (bool): Search the same queries on every turn, like an agent that stopped making progress.
+
+        Returns:
+            FakeLLMScript: The script.
+        """
+        turns = [
+            [
+                ScriptedToolCall(name="SearchTool", args={"query": f"topic {index}" if repeat_queries else f"topic {turn}-{index}"})
+                for index in range(searches_per_turn)
+            ]
+            for turn in range(search_turns)
+        ]
+        turns.append([ScriptedToolCall(name="ProcessTool", args={"summary": "Summary of the search results."})])
+        return cls(turns=turns)
+
+
+class FakeLLMCaller:
+    """
+    Drop-in for LLMCallerAgent in the agentic loop: `arun` returns the AI message and tool call actions of the next
+    scripted turn after a sampled latency, without any network access.
+    """
+
+    def __init__(self, provider: "FakeLLMProvider", tools: Sequence[ITool], **kwargs: Any):
+        """
+        Initialize the caller.
+
+        Args:
+            provider (FakeLLMProvider): The provider holding the script, latency and counters.
+            tools (Sequence[ITool]): The tools available to the caller; tool inputs are built with their input models.
+            **kwargs (Any): The remaining LLMCallerAgent arguments, ignored.
+        """
+        self._provider = provider
+        self._tools = {tool.name: tool for tool in tools}
+
+    async def arun(self, inputs: Sequence[AnyMessage]) -> Tuple[AIMessage, List[ToolCallAction]]:
+        """
+        Return the next scripted turn.
+
+        Args:
+            inputs (Sequence[AnyMessage]): The conversation context.
+
+        Returns:
+            Tuple[AIMessage, List[ToolCallAction]]: The AI message and its tool call actions.
+
+        Raises:
+            ValueError: If the script calls a tool the caller was not given.
+        """
+        turn = sum(1 for message in inputs if isinstance(message, AIMessage))
+        scripted_calls = self._provider.script.turns[min(turn, len(self._provider.script.turns) - 1)]
+        if any(scripted_call.name not in self._tools for scripted_call in scripted_calls):
+            scripted_calls = self._provider.script.turns[-1]
+
+        await asyncio.sleep(self._provider.sample_latency())
+
+        tool_calls = []
+        actions = []
+        for index, scripted_call in enumerate(scripted_calls):
+            if scripted_call.name not in self._tools:
+                raise ValueError(f"Fake LLM script calls unknown tool: {scripted_call.name}")
+            tool_call_id = f"call_{turn}_{index}"
+            tool_calls.append({"name": scripted_call.name, "args": scripted_call.args, "id": tool_call_id})
+            actions.append(
+                ToolCallAction.model_validate(
+                    {
+                        "id": tool_call_id,
+                        "content": {
+                            "name": scripted_call.name,
+                            "inputs": self._tools[scripted_call.name].input_model(**scripted_call.args),
+                        },
+                    }
+                )
+            )
+
+        return AIMessage(content="", tool_calls=tool_calls), actions
+
+
+class FakeLLMProvider:
+    """
+    Offline LLM provider for throughput testing of the graph machinery.
+
+    Plug it into the orchestrator with `LLMCallerCache(..., caller_factory=provider.create_caller)`. Latencies are drawn
+    from a seeded generator shared by every caller of the provider.
+    """
+
+    def __init__(self, script: FakeLLMScript, latency: Optional[LatencyDistribution] = None, seed: int = 0):
+        """
+        Initialize the provider.
+
+        Args:
+            script (FakeLLMScript): The tool calls to make on each turn.
+            latency (Optional[LatencyDistribution]): Latency of each call. No latency if None.
+            seed (int): Seed of the latency generator.
+        """
+        self.script = script
+        self._latency = latency or LatencyDistribution()
+        self._rng = random.Random(seed)
+        self._lock = Lock()
+        self.calls = 0
+
+    def sample_latency(self) -> float:
+        """
+        Draw the latency of the next call and count it.
+
+        Returns:
+            float: The latency in seconds.
+        """
+        with self._lock:
+            self.calls += 1
+            return self._latency.sample(rng=self._rng)
+
+    def create_caller(self, tools: Sequence[ITool], **kwargs: Any) -> FakeLLMCaller:
+        """
+        Caller factory matching the LLMCallerAgent constructor.
+
+        Args:
+            tools (Sequence[ITool]): The tools available to the caller.
+            **kwargs (Any): The remaining LLMCallerAgent arguments.
+
+        Returns:
+            FakeLLMCaller: The fake caller.
+        """
+        return FakeLLMCaller(provider=self, tools=tools, **kwargs)
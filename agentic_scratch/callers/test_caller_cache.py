@@ -0,0 +1,62 @@
+"""
+==============================================================================
+Name: test_caller_cache
+Author: AI Assistant
+Date: 10/17/2026
+Description: Tests of the warmed LLM caller cache.
+==============================================================================
+"""
+
+from types import SimpleNamespace
+
+from .caller_cache import LLMCallerCache
+
+CALLER_CONFIG = SimpleNamespace(name="AgenticScratch", version="1.0")
+
+
+class _Tool:
+    name = "SearchTool"
+
+
+class _OtherTool:
+    name = "ProcessTool"
+
+
+def _cache(**kwargs):
+    built = []
+
+    def caller_factory(**caller_kwargs):
+        built.append(caller_kwargs)
+        return SimpleNamespace(**caller_kwargs)
+
+    return LLMCallerCache(user_session_info="session", caller_factory=caller_factory, **kwargs), built
+
+
+def test_callers_are_reused_per_config_tools_mode_and_stream():
+    cache, built = _cache()
+
+    first = cache.get_caller(caller_config=CALLER_CONFIG, tools=[_Tool], response_mode="tool")
+    assert cache.get_caller(caller_config=CALLER_CONFIG, tools=[_Tool], response_mode="tool") is first
+    cache.get_caller(caller_config=CALLER_CONFIG, tools=[_OtherTool], response_mode="tool")
+    cache.get_caller(caller_config=CALLER_CONFIG, tools=[_Tool], response_mode="tool", stream=True)
+
+    assert (cache.hits, cache.misses, len(built)) == (1, 3, 3)
+    assert first.user_session_info == "session" and isinstance(first.tools[0], _Tool)
+
+
+def test_disabled_cache_builds_every_time():
+    cache, built = _cache(enabled=False)
+
+    cache.get_caller(caller_config=CALLER_CONFIG, tools=[_Tool], response_mode="tool")
+    cache.get_caller(caller_config=CALLER_CONFIG, tools=[_Tool], response_mode="tool")
+
+    assert len(built) == 2 and cache.cached_keys == []
+
+
+def test_clear_drops_callers_and_counters():
+    cache, _ = _cache()
+    cache.get_caller(caller_config=CALLER_CONFIG, tools=[_Tool], response_mode="tool")
+
+    cache.clear()
+
+    assert (cache.hits, cache.misses, cache.cached_keys) == (0, 0, [])
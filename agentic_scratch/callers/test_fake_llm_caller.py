@@ -0,0 +1,105 @@
+"""
+==============================================================================
+Name: test_fake_llm_caller
+Author: AI Assistant
+Date: 10/17/2026
+Description: Tests of the fake LLM script replay and seeded latency sampling.
+==============================================================================
+"""
+
+import asyncio
+import random
+
+import pytest
+
+pytest.importorskip("wernicke")
+
+from langchain_core.messages import AIMessage, HumanMessage  # noqa: E402
+
+from ..tools.process_tool import ProcessTool  # noqa: E402
+from ..tools.search_tool import SearchTool  # noqa: E402
+from .fake_llm_caller import FakeLLMProvider, FakeLLMScript, LatencyDistribution, ScriptedToolCall  # noqa: E402
+
+
+def _conversation(turns):
+    return [HumanMessage(content="prompt"), *(AIMessage(content="") for _ in range(turns))]
+
+
+def _replay(caller, turns):
+    return asyncio.run(caller.arun(inputs=_conversation(turns)))
+
+
+def test_script_replays_each_turn_in_order():
+    provider = FakeLLMProvider(script=FakeLLMScript.search_then_process(search_turns=2, searches_per_turn=2))
+    caller = provider.create_caller(tools=[SearchTool(), ProcessTool()])
+
+    for turn, expected in enumerate([["topic 0-0", "topic 0-1"], ["topic 1-0", "topic 1-1"]]):
+        message, actions = _replay(caller, turns=turn)
+        assert [tool_call["args"]["query"] for tool_call in message.tool_calls] == expected
+        assert [action.id for action in actions] == [f"call_{turn}_0", f"call_{turn}_1"]
+        assert [action.content.inputs.query for action in actions] == expected
+
+    message, actions = _replay(caller, turns=2)
+    assert [tool_call["name"] for tool_call in message.tool_calls] == ["ProcessTool"]
+    assert actions[0].content.inputs.summary == "Summary of the search results."
+    assert provider.calls == 3
+
+
+def test_turns_past_the_script_repeat_the_last_turn():
+    provider = FakeLLMProvider(script=FakeLLMScript.search_then_process(search_turns=1))
+    caller = provider.create_caller(tools=[SearchTool(), ProcessTool()])
+
+    message, actions = _replay(caller, turns=5)
+
+    assert [tool_call["name"] for tool_call in message.tool_calls] == ["ProcessTool"]
+    assert actions[0].id == "call_5_0"
+
+
+def test_turn_with_tools_the_caller_lacks_falls_back_to_the_last_turn():
+    provider = FakeLLMProvider(script=FakeLLMScript.search_then_process(search_turns=2))
+    caller = provider.create_caller(tools=[ProcessTool()])
+
+    message, _ = _replay(caller, turns=0)
+
+    assert [tool_call["name"] for tool_call in message.tool_calls] == ["ProcessTool"]
+
+
+def test_unknown_tool_in_the_last_turn_raises():
+    provider = FakeLLMProvider(script=FakeLLMScript(turns=[[ScriptedToolCall(name="MissingTool")]]))
+    caller = provider.create_caller(tools=[SearchTool()])
+
+    with pytest.raises(ValueError, match="MissingTool"):
+        _replay(caller, turns=0)
+
+
+def test_repeat_queries_searches_the_same_queries_every_turn():
+    script = FakeLLMScript.search_then_process(search_turns=3, searches_per_turn=2, repeat_queries=True)
+
+    queries = [[scripted_call.args["query"] for scripted_call in turn] for turn in script.turns[:-1]]
+
+    assert queries == [["topic 0", "topic 1"]] * 3
+
+
+@pytest.mark.parametrize(
+    "latency",
+    [
+        LatencyDistribution(kind="uniform", low=0.01, high=0.1),
+        LatencyDistribution(kind="lognormal", mean=0.05, sigma=0.5),
+    ],
+)
+def test_latency_is_reproducible_for_a_seed(latency):
+    def samples(seed):
+        provider = FakeLLMProvider(script=FakeLLMScript.search_then_process(), latency=latency, seed=seed)
+        return [provider.sample_latency() for _ in range(20)]
+
+    assert samples(seed=7) == samples(seed=7)
+    assert samples(seed=7) != samples(seed=8)
+
+
+def test_latency_distributions():
+    rng = random.Random(0)
+
+    assert LatencyDistribution(kind="constant", mean=0.25).sample(rng=rng) == 0.25
+    assert all(0.01 <= LatencyDistribution(kind="uniform", low=0.01, high=0.1).sample(rng=rng) <= 0.1 for _ in range(100))
+    assert all(LatencyDistribution(kind="lognormal", mean=0.05).sample(rng=rng) > 0 for _ in range(100))
+    assert FakeLLMProvider(script=FakeLLMScript.search_then_process()).sample_latency() == 0.0
@@ -0,0 +1,78 @@
+"""
+==============================================================================
+Name: channels
+Author: AI Assistant
+Date: 10/17/2026
+Description: Reducer and graph channel for the tool results of the agentic scratch state.
+==============================================================================
+"""
+
+from typing import Any, List, Optional, Sequence
+
+from langgraph.channels.binop import BinaryOperatorAggregate
+
+
+def _is_rewrite(update: Any) -> bool:
+    """
+    Check whether a tool results update replaces the list instead of appending to it.
+
+    Args:
+        update (Any): The tool results update.
+
+    Returns:
+        bool: True if the update is a {"kind": "rewrite", "value": [...]} dict.
+    """
+    return isinstance(update, dict) and update.get("kind") == "rewrite"
+
+
+def tool_results_reducer(left: Any, right: Any) -> List[Any]:
+    """
+    Reducer for combining tool results from parallel tool execution.
+
+    Args:
+        left (Any): The existing list of tool results.
+        right (Any): Either a list of new tool results to append, or a dict with
+                     {"kind": "rewrite", "value": [...]} to replace the entire list.
+
+    Returns:
+        List[Any]: The combined or rewritten list of tool results.
+    """
+    if _is_rewrite(right):
+        return list(right["value"])
+    return [*(left or []), *right]
+
+
+class ToolResultsChannel(BinaryOperatorAggregate):
+    """
+    Channel that applies all tool results of a superstep in a single pass.
+
+    Applying `tool_results_reducer` once per tool completion copies the whole list every time, which makes
+    fan-in O(n^2) when many tools return in one superstep. This channel copies the previous list at most once
+    per superstep and then appends every result to that copy, so fan-in is O(n). The previous list is never
+    mutated, which keeps checkpoints that are still being written intact. Rewrite semantics are unchanged.
+    """
+
+    def update(self, values: Sequence[Any]) -> bool:
+        """
+        Apply the tool results written during one superstep.
+
+        Args:
+            values (Sequence[Any]): The updates written by the nodes of the superstep.
+
+        Returns:
+            bool: True if the channel was updated.
+        """
+        if not values:
+            return False
+
+        merged: Optional[List[Any]] = None
+        for value in values:
+            if _is_rewrite(value):
+                merged = list(value["value"])
+                continue
+            if merged is None:
+                merged = list(self.value) if isinstance(self.value, list) else []
+            merged.extend(value)
+
+        self.value = merged
+        return True
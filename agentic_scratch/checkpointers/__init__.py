@@ -0,0 +1 @@
+"""Checkpointers for the Agentic Scratch Orchestrator."""
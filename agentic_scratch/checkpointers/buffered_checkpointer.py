@@ -0,0 +1,492 @@
+"""
+==============================================================================
+Name: buffered_checkpointer
+Author: AI Assistant
+Date: 10/17/2026
+Description: Checkpointer wrapper that buffers checkpoint writes in memory and
+flushes only the latest checkpoint, with the channels changed since the last
+flush, at configurable boundaries.
+==============================================================================
+"""
+
+from enum import Enum
+from threading import Lock
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+)
+from pydantic import BaseModel
+
+
+class FlushPolicy(str, Enum):
+    """
+    When a BufferedCheckpointSaver writes buffered checkpoints to the inner checkpointer.
+    """
+
+    SUPERSTEP = "superstep"
+    EVERY_N_STEPS = "every_n_steps"
+    END = "end"
+
+
+class CheckpointWriteStats(BaseModel):
+    """
+    Counters comparing checkpoint traffic received from the graph with traffic sent to storage.
+
+    Attributes:
+        buffered_puts (int): Checkpoints received from the graph.
+        buffered_writes (int): Pending-write batches received from the graph.
+        flushed_puts (int): Checkpoints written to the inner checkpointer.
+        flushed_writes (int): Pending-write batches written to the inner checkpointer.
+        flushed_channels (int): Channel values written to the inner checkpointer.
+    """
+
+    buffered_puts: int = 0
+    buffered_writes: int = 0
+    flushed_puts: int = 0
+    flushed_writes: int = 0
+    flushed_channels: int = 0
+
+    @property
+    def round_trips_saved(self) -> int:
+        """
+        Returns the number of storage calls avoided by buffering.
+
+        Returns:
+            int: Calls received minus calls sent to the inner checkpointer.
+        """
+        return (self.buffered_puts + self.buffered_writes) - (self.flushed_puts + self.flushed_writes)
+
+
+class _ThreadBuffer:
+    """
+    Unflushed checkpoint state of one thread and checkpoint namespace.
+    """
+
+    def __init__(self, persisted_config: RunnableConfig):
+        """
+        Initialize the buffer.
+
+        Args:
+            persisted_config (RunnableConfig): Config of the last checkpoint known to be in the inner checkpointer.
+        """
+        self.persisted_config = persisted_config
+        self.checkpoint_tuple: Optional[CheckpointTuple] = None
+        self.new_versions: ChannelVersions = {}
+        self.writes: List[Tuple[str, Sequence[Tuple[str, Any]], str]] = []
+        self.steps = 0
+
+
+class BufferedCheckpointSaver(BaseCheckpointSaver):
+    """
+    Wraps a checkpointer so the graph's per-step checkpoint traffic is coalesced before it reaches storage.
+
+    Every `put` replaces the buffered checkpoint of its thread and accumulates the changed channel versions, and
+    `put_writes` against the buffered checkpoint are held with it. A flush writes only the latest checkpoint, passing the
+    union of `new_versions` since the last flush so delta-aware checkpointers store just the changed channels, followed by
+    its pending writes. Intermediate checkpoints are superseded and never reach storage. Reads of the buffered checkpoint
+    are served from memory, so the graph sees the same state as with the inner checkpointer.
+
+    With `FlushPolicy.END` nothing is persisted until `flush`/`aflush` is called, so a crashed run resumes from the last
+    flushed checkpoint.
+    """
+
+    def __init__(self, checkpointer: BaseCheckpointSaver, flush_policy: FlushPolicy = FlushPolicy.END, flush_every_n_steps: int = 10):
+        """
+        Initialize the wrapper.
+
+        Args:
+            checkpointer (BaseCheckpointSaver): The checkpointer that persists flushed checkpoints.
+            flush_policy (FlushPolicy): When buffered checkpoints are flushed.
+            flush_every_n_steps (int): Checkpoints buffered per thread before flushing with `FlushPolicy.EVERY_N_STEPS`.
+
+        Raises:
+            ValueError: If flush_every_n_steps is less than 1.
+        """
+        if flush_every_n_steps < 1:
+            raise ValueError("flush_every_n_steps must be >= 1")
+
+        super().__init__(serde=checkpointer.serde)
+        self._checkpointer = checkpointer
+        self._flush_policy = FlushPolicy(flush_policy)
+        self._flush_every_n_steps = flush_every_n_steps
+        self._buffers: Dict[Tuple[str, str], _ThreadBuffer] = {}
+        self._stats = CheckpointWriteStats()
+        self._lock = Lock()
+
+    @property
+    def checkpointer(self) -> BaseCheckpointSaver:
+        """
+        Returns the wrapped checkpointer.
+
+        Returns:
+            BaseCheckpointSaver: The wrapped checkpointer.
+        """
+        return self._checkpointer
+
+    @property
+    def stats(self) -> CheckpointWriteStats:
+        """
+        Returns a snapshot of the write counters.
+
+        Returns:
+            CheckpointWriteStats: The write counters.
+        """
+        with self._lock:
+            return self._stats.model_copy()
+
+    @property
+    def config_specs(self) -> list:
+        """
+        Returns the config specs of the wrapped checkpointer.
+
+        Returns:
+            list: The config specs.
+        """
+        return self._checkpointer.config_specs
+
+    def get_next_version(self, current: Optional[Any], channel: None) -> Any:
+        """
+        Delegate channel versioning to the wrapped checkpointer so flushed versions match its format.
+
+        Args:
+            current (Optional[Any]): The current channel version.
+            channel (None): Deprecated, kept for signature compatibility.
+
+        Returns:
+            Any: The next channel version.
+        """
+        return self._checkpointer.get_next_version(current, channel)
+
+    @staticmethod
+    def _thread_key(config: RunnableConfig) -> Tuple[str, str]:
+        """
+        Returns the thread ID and checkpoint namespace of a config.
+
+        Args:
+            config (RunnableConfig): The runnable config.
+
+        Returns:
+            Tuple[str, str]: The thread ID and checkpoint namespace.
+        """
+        configurable = config["configurable"]
+        return str(configurable["thread_id"]), configurable.get("checkpoint_ns", "")
+
+    def _buffer_put(
+        self, config: RunnableConfig, checkpoint: Checkpoint, metadata: CheckpointMetadata, new_versions: ChannelVersions
+    ) -> Tuple[RunnableConfig, bool]:
+        """
+        Replace the thread's buffered checkpoint and decide whether the flush policy triggers.
+
+        Args:
+            config (RunnableConfig): The config of the parent checkpoint.
+            checkpoint (Checkpoint): The new checkpoint.
+            metadata (CheckpointMetadata): The checkpoint metadata.
+            new_versions (ChannelVersions): Channels updated since the parent checkpoint and their new versions.
+
+        Returns:
+            Tuple[RunnableConfig, bool]: The config of the new checkpoint and whether the thread should be flushed.
+        """
+        key = self._thread_key(config=config)
+        checkpoint_config = {"configurable": {"thread_id": key[0], "checkpoint_ns": key[1], "checkpoint_id": checkpoint["id"]}}
+        with self._lock:
+            thread_buffer = self._buffers.get(key)
+            if thread_buffer is None:
+                thread_buffer = self._buffers[key] = _ThreadBuffer(persisted_config=config)
+
+            thread_buffer.checkpoint_tuple = CheckpointTuple(
+                config=checkpoint_config,
+                checkpoint=checkpoint,
+                metadata=metadata,
+                parent_config=config if get_checkpoint_id(config) else None,
+                pending_writes=[],
+            )
+            thread_buffer.new_versions = {**thread_buffer.new_versions, **new_versions}
+            # Writes against the previous buffered checkpoint are already applied in this one
+            thread_buffer.writes = []
+            thread_buffer.steps += 1
+            self._stats.buffered_puts += 1
+
+            should_flush = self._flush_policy == FlushPolicy.SUPERSTEP or (
+                self._flush_policy == FlushPolicy.EVERY_N_STEPS and thread_buffer.steps >= self._flush_every_n_steps
+            )
+        return checkpoint_config, should_flush
+
+    def _buffer_writes(self, config: RunnableConfig, writes: Sequence[Tuple[str, Any]], task_id: str, task_path: str) -> bool:
+        """
+        Hold writes made against the thread's buffered checkpoint.
+
+        Args:
+            config (RunnableConfig): The config of the checkpoint the writes belong to.
+            writes (Sequence[Tuple[str, Any]]): The (channel, value) writes.
+            task_id (str): The ID of the task that produced the writes.
+            task_path (str): The path of the task that produced the writes.
+
+        Returns:
+            bool: True if the writes were buffered, False if they belong to a flushed checkpoint and must be written through.
+        """
+        with self._lock:
+            self._stats.buffered_writes += 1
+            thread_buffer = self._buffers.get(self._thread_key(config=config))
+            if (
+                thread_buffer is None
+                or thread_buffer.checkpoint_tuple is None
+                or get_checkpoint_id(config) != thread_buffer.checkpoint_tuple.checkpoint["id"]
+            ):
+                self._stats.flushed_writes += 1
+                return False
+
+            thread_buffer.writes.append((task_id, list(writes), task_path))
+            thread_buffer.checkpoint_tuple.pending_writes.extend((task_id, channel, value) for channel, value in writes)
+            return True
+
+    def _take_buffer(self, key: Tuple[str, str]) -> Optional[_ThreadBuffer]:
+        """
+        Detach a thread's unflushed checkpoint so it can be written out.
+
+        Args:
+            key (Tuple[str, str]): The thread ID and checkpoint namespace.
+
+        Returns:
+            Optional[_ThreadBuffer]: The buffer, or None if nothing is waiting to be flushed.
+        """
+        with self._lock:
+            thread_buffer = self._buffers.get(key)
+            if thread_buffer is None or thread_buffer.checkpoint_tuple is None:
+                return None
+            self._buffers[key] = _ThreadBuffer(persisted_config=thread_buffer.checkpoint_tuple.config)
+            self._stats.flushed_puts += 1
+            self._stats.flushed_writes += len(thread_buffer.writes)
+            self._stats.flushed_channels += len(thread_buffer.new_versions)
+            return thread_buffer
+
+    def _keys_to_flush(self, thread_id: Optional[str]) -> List[Tuple[str, str]]:
+        """
+        Returns the buffered thread keys to flush.
+
+        Args:
+            thread_id (Optional[str]): Flush only this thread. Every thread if None.
+
+        Returns:
+            List[Tuple[str, str]]: The thread ID and checkpoint namespace of each buffer.
+        """
+        with self._lock:
+            return [key for key in self._buffers if thread_id is None or key[0] == str(thread_id)]
+
+    def _buffered_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        """
+        Returns the buffered checkpoint if the config refers to it.
+
+        Args:
+            config (RunnableConfig): The config identifying the thread and optionally the checkpoint.
+
+        Returns:
+            Optional[CheckpointTuple]: The buffered checkpoint, or None if the read must go to the inner checkpointer.
+        """
+        with self._lock:
+            thread_buffer = self._buffers.get(self._thread_key(config=config))
+            if thread_buffer is None or thread_buffer.checkpoint_tuple is None:
+                return None
+            checkpoint_id = get_checkpoint_id(config)
+            if checkpoint_id and checkpoint_id != thread_buffer.checkpoint_tuple.checkpoint["id"]:
+                return None
+            return thread_buffer.checkpoint_tuple
+
+    def flush(self, thread_id: Optional[str] = None) -> None:
+        """
+        Write the latest buffered checkpoint of each thread, and its pending writes, to the inner checkpointer.
+
+        Args:
+            thread_id (Optional[str]): Flush only this thread. Every thread if None.
+        """
+        for key in self._keys_to_flush(thread_id=thread_id):
+            thread_buffer = self._take_buffer(key=key)
+            if thread_buffer is None:
+                continue
+            checkpoint_tuple = thread_buffer.checkpoint_tuple
+            config = self._checkpointer.put(
+                thread_buffer.persisted_config, checkpoint_tuple.checkpoint, checkpoint_tuple.metadata, thread_buffer.new_versions
+            )
+            for task_id, writes, task_path in thread_buffer.writes:
+                self._checkpointer.put_writes(config, writes, task_id, task_path)
+
+    async def aflush(self, thread_id: Optional[str] = None) -> None:
+        """
+        Async version of `flush`.
+
+        Args:
+            thread_id (Optional[str]): Flush only this thread. Every thread if None.
+        """
+        for key in self._keys_to_flush(thread_id=thread_id):
+            thread_buffer = self._take_buffer(key=key)
+            if thread_buffer is None:
+                continue
+            checkpoint_tuple = thread_buffer.checkpoint_tuple
+            config = await self._checkpointer.aput(
+                thread_buffer.persisted_config, checkpoint_tuple.checkpoint, checkpoint_tuple.metadata, thread_buffer.new_versions
+            )
+            for task_id, writes, task_path in thread_buffer.writes:
+                await self._checkpointer.aput_writes(config, writes, task_id, task_path)
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        """
+        Get a checkpoint, serving the thread's buffered checkpoint from memory.
+
+        Args:
+            config (RunnableConfig): The config identifying the thread and optionally the checkpoint.
+
+        Returns:
+            Optional[CheckpointTuple]: The checkpoint, or None if it does not exist.
+        """
+        return self._buffered_tuple(config=config) or self._checkpointer.get_tuple(config)
+
+    def list(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CheckpointTuple]:
+        """
+        List persisted checkpoints, flushing the thread first so the latest checkpoint is included.
+
+        Args:
+            config (Optional[RunnableConfig]): Restrict to the thread of this config. All threads if None.
+            filter (Optional[Dict[str, Any]]): Metadata key/values the checkpoints must match.
+            before (Optional[RunnableConfig]): Only checkpoints older than this one.
+            limit (Optional[int]): Maximum number of checkpoints to return.
+
+        Yields:
+            CheckpointTuple: The matching checkpoints.
+        """
+        self.flush(thread_id=config["configurable"]["thread_id"] if config else None)
+        yield from self._checkpointer.list(config, filter=filter, before=before, limit=limit)
+
+    def put(self, config: RunnableConfig, checkpoint: Checkpoint, metadata: CheckpointMetadata, new_versions: ChannelVersions) -> RunnableConfig:
+        """
+        Buffer a checkpoint, flushing the thread if the flush policy triggers.
+
+        Args:
+            config (RunnableConfig): The config of the parent checkpoint.
+            checkpoint (Checkpoint): The checkpoint to store.
+            metadata (CheckpointMetadata): The checkpoint metadata.
+            new_versions (ChannelVersions): Channels updated since the parent checkpoint and their new versions.
+
+        Returns:
+            RunnableConfig: The config of the new checkpoint.
+        """
+        checkpoint_config, should_flush = self._buffer_put(config=config, checkpoint=checkpoint, metadata=metadata, new_versions=new_versions)
+        if should_flush:
+            self.flush(thread_id=checkpoint_config["configurable"]["thread_id"])
+        return checkpoint_config
+
+    def put_writes(self, config: RunnableConfig, writes: Sequence[Tuple[str, Any]], task_id: str, task_path: str = "") -> None:
+        """
+        Buffer writes against the buffered checkpoint, or write them through if it was already flushed.
+
+        Args:
+            config (RunnableConfig): The config of the checkpoint the writes belong to.
+            writes (Sequence[Tuple[str, Any]]): The (channel, value) writes.
+            task_id (str): The ID of the task that produced the writes.
+            task_path (str): The path of the task that produced the writes.
+        """
+        if not self._buffer_writes(config=config, writes=writes, task_id=task_id, task_path=task_path):
+            self._checkpointer.put_writes(config, writes, task_id, task_path)
+
+    def delete_thread(self, thread_id: str) -> None:
+        """
+        Drop a thread's buffered checkpoint and delete it from the inner checkpointer.
+
+        Args:
+            thread_id (str): The thread ID.
+        """
+        with self._lock:
+            for key in [key for key in self._buffers if key[0] == str(thread_id)]:
+                del self._buffers[key]
+        self._checkpointer.delete_thread(thread_id)
+
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        """
+        Async version of `get_tuple`.
+
+        Args:
+            config (RunnableConfig): The config identifying the thread and optionally the checkpoint.
+
+        Returns:
+            Optional[CheckpointTuple]: The checkpoint, or None if it does not exist.
+        """
+        return self._buffered_tuple(config=config) or await self._checkpointer.aget_tuple(config)
+
+    async def alist(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        """
+        Async version of `list`.
+
+        Args:
+            config (Optional[RunnableConfig]): Restrict to the thread of this config. All threads if None.
+            filter (Optional[Dict[str, Any]]): Metadata key/values the checkpoints must match.
+            before (Optional[RunnableConfig]): Only checkpoints older than this one.
+            limit (Optional[int]): Maximum number of checkpoints to return.
+
+        Yields:
+            CheckpointTuple: The matching checkpoints.
+        """
+        await self.aflush(thread_id=config["configurable"]["thread_id"] if config else None)
+        async for checkpoint_tuple in self._checkpointer.alist(config, filter=filter, before=before, limit=limit):
+            yield checkpoint_tuple
+
+    async def aput(self, config: RunnableConfig, checkpoint: Checkpoint, metadata: CheckpointMetadata, new_versions: ChannelVersions) -> RunnableConfig:
+        """
+        Async version of `put`.
+
+        Args:
+            config (RunnableConfig): The config of the parent checkpoint.
+            checkpoint (Checkpoint): The checkpoint to store.
+            metadata (CheckpointMetadata): The checkpoint metadata.
+            new_versions (ChannelVersions): Channels updated since the parent checkpoint and their new versions.
+
+        Returns:
+            RunnableConfig: The config of the new checkpoint.
+        """
+        checkpoint_config, should_flush = self._buffer_put(config=config, checkpoint=checkpoint, metadata=metadata, new_versions=new_versions)
+        if should_flush:
+            await self.aflush(thread_id=checkpoint_config["configurable"]["thread_id"])
+        return checkpoint_config
+
+    async def aput_writes(self, config: RunnableConfig, writes: Sequence[Tuple[str, Any]], task_id: str, task_path: str = "") -> None:
+        """
+        Async version of `put_writes`.
+
+        Args:
+            config (RunnableConfig): The config of the checkpoint the writes belong to.
+            writes (Sequence[Tuple[str, Any]]): The (channel, value) writes.
+            task_id (str): The ID of the task that produced the writes.
+            task_path (str): The path of the task that produced the writes.
+        """
+        if not self._buffer_writes(config=config, writes=writes, task_id=task_id, task_path=task_path):
+            await self._checkpointer.aput_writes(config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        """
+        Async version of `delete_thread`.
+
+        Args:
+            thread_id (str): The thread ID.
+        """
+        with self._lock:
+            for key in [key for key in self._buffers if key[0] == str(thread_id)]:
+                del self._buffers[key]
+        await self._checkpointer.adelete_thread(thread_id)
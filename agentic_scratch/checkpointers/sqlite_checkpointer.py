@@ -0,0 +1,405 @@
+"""
+==============================================================================
+Name: sqlite_checkpointer
+Author: AI Assistant
+Date: 10/17/2026
+Description: Local SQLite checkpointer that stores channel values as deltas,
+writing only the channels that changed since the previous checkpoint.
+==============================================================================
+"""
+
+import sqlite3
+from pathlib import Path
+from threading import Lock
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+)
+
+_EMPTY_TYPE = "empty"
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS checkpoints (
+        thread_id TEXT NOT NULL,
+        checkpoint_ns TEXT NOT NULL DEFAULT '',
+        checkpoint_id TEXT NOT NULL,
+        parent_checkpoint_id TEXT,
+        type TEXT NOT NULL,
+        checkpoint BLOB NOT NULL,
+        metadata_type TEXT NOT NULL,
+        metadata BLOB NOT NULL,
+        PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS checkpoint_blobs (
+        thread_id TEXT NOT NULL,
+        checkpoint_ns TEXT NOT NULL DEFAULT '',
+        channel TEXT NOT NULL,
+        version TEXT NOT NULL,
+        type TEXT NOT NULL,
+        blob BLOB,
+        PRIMARY KEY (thread_id, checkpoint_ns, channel, version)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS checkpoint_writes (
+        thread_id TEXT NOT NULL,
+        checkpoint_ns TEXT NOT NULL DEFAULT '',
+        checkpoint_id TEXT NOT NULL,
+        task_id TEXT NOT NULL,
+        task_path TEXT NOT NULL DEFAULT '',
+        idx INTEGER NOT NULL,
+        channel TEXT NOT NULL,
+        type TEXT NOT NULL,
+        blob BLOB,
+        PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
+    )
+    """,
+)
+
+
+class SQLiteCheckpointSaver(BaseCheckpointSaver):
+    """
+    Checkpointer backed by a local SQLite file, intended for testing and local runs.
+
+    Checkpoints are stored without their channel values. Each channel value is stored once per channel version, and
+    `put` only writes the channels listed in `new_versions`, so a checkpoint costs the size of what changed rather than
+    the size of the full state. Reads reassemble the full state from the blobs matching the checkpoint's channel versions.
+    """
+
+    def __init__(self, path: Union[str, Path], **kwargs: Any):
+        """
+        Initialize the checkpointer, creating the database file and tables if needed.
+
+        Args:
+            path (Union[str, Path]): Path to the SQLite database file. Use ":memory:" for a throwaway database.
+            **kwargs (Any): Passed to BaseCheckpointSaver (e.g. `serde`).
+        """
+        super().__init__(**kwargs)
+        self._lock = Lock()
+        self._connection = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        for statement in _SCHEMA:
+            self._connection.execute(statement)
+
+    @staticmethod
+    def _thread_key(config: RunnableConfig) -> Tuple[str, str]:
+        """
+        Returns the thread ID and checkpoint namespace of a config.
+
+        Args:
+            config (RunnableConfig): The runnable config.
+
+        Returns:
+            Tuple[str, str]: The thread ID and checkpoint namespace.
+        """
+        configurable = config["configurable"]
+        return str(configurable["thread_id"]), configurable.get("checkpoint_ns", "")
+
+    def _load_channel_values(self, thread_id: str, checkpoint_ns: str, channel_versions: ChannelVersions) -> Dict[str, Any]:
+        """
+        Reassemble the channel values of a checkpoint from the stored blobs.
+
+        Args:
+            thread_id (str): The thread ID.
+            checkpoint_ns (str): The checkpoint namespace.
+            channel_versions (ChannelVersions): The channel versions recorded in the checkpoint.
+
+        Returns:
+            Dict[str, Any]: The channel values.
+        """
+        channel_values = {}
+        for channel, version in channel_versions.items():
+            row = self._connection.execute(
+                "SELECT type, blob FROM checkpoint_blobs WHERE thread_id = ? AND checkpoint_ns = ? AND channel = ? AND version = ?",
+                (thread_id, checkpoint_ns, channel, str(version)),
+            ).fetchone()
+            if row is None or row[0] == _EMPTY_TYPE:
+                continue
+            channel_values[channel] = self.serde.loads_typed((row[0], row[1]))
+        return channel_values
+
+    def _load_pending_writes(self, thread_id: str, checkpoint_ns: str, checkpoint_id: str) -> List[Tuple[str, str, Any]]:
+        """
+        Load the pending writes recorded against a checkpoint.
+
+        Args:
+            thread_id (str): The thread ID.
+            checkpoint_ns (str): The checkpoint namespace.
+            checkpoint_id (str): The checkpoint ID.
+
+        Returns:
+            List[Tuple[str, str, Any]]: The (task_id, channel, value) writes in the order they were applied.
+        """
+        rows = self._connection.execute(
+            "SELECT task_id, channel, type, blob FROM checkpoint_writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? "
+            "ORDER BY task_path, task_id, idx",
+            (thread_id, checkpoint_ns, checkpoint_id),
+        ).fetchall()
+        return [(task_id, channel, self.serde.loads_typed((value_type, blob))) for task_id, channel, value_type, blob in rows]
+
+    def _row_to_tuple(self, row: Sequence[Any]) -> CheckpointTuple:
+        """
+        Build a CheckpointTuple from a row of the checkpoints table.
+
+        Args:
+            row (Sequence[Any]): The checkpoints row.
+
+        Returns:
+            CheckpointTuple: The checkpoint with its channel values and pending writes.
+        """
+        thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, checkpoint_type, checkpoint_blob, metadata_type, metadata_blob = row
+        checkpoint = self.serde.loads_typed((checkpoint_type, checkpoint_blob))
+        checkpoint["channel_values"] = self._load_channel_values(
+            thread_id=thread_id,
+            checkpoint_ns=checkpoint_ns,
+            channel_versions=checkpoint["channel_versions"],
+        )
+        return CheckpointTuple(
+            config={"configurable": {"thread_id": thread_id, "checkpoint_ns": checkpoint_ns, "checkpoint_id": checkpoint_id}},
+            checkpoint=checkpoint,
+            metadata=self.serde.loads_typed((metadata_type, metadata_blob)),
+            parent_config=(
+                {"configurable": {"thread_id": thread_id, "checkpoint_ns": checkpoint_ns, "checkpoint_id": parent_checkpoint_id}}
+                if parent_checkpoint_id
+                else None
+            ),
+            pending_writes=self._load_pending_writes(thread_id=thread_id, checkpoint_ns=checkpoint_ns, checkpoint_id=checkpoint_id),
+        )
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        """
+        Get a checkpoint by ID, or the latest checkpoint of the thread if the config has no checkpoint ID.
+
+        Args:
+            config (RunnableConfig): The config identifying the thread and optionally the checkpoint.
+
+        Returns:
+            Optional[CheckpointTuple]: The checkpoint, or None if it does not exist.
+        """
+        thread_id, checkpoint_ns = self._thread_key(config=config)
+        checkpoint_id = get_checkpoint_id(config)
+        with self._lock:
+            if checkpoint_id:
+                row = self._connection.execute(
+                    "SELECT * FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+                    (thread_id, checkpoint_ns, checkpoint_id),
+                ).fetchone()
+            else:
+                row = self._connection.execute(
+                    "SELECT * FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? ORDER BY checkpoint_id DESC LIMIT 1",
+                    (thread_id, checkpoint_ns),
+                ).fetchone()
+            return self._row_to_tuple(row=row) if row is not None else None
+
+    def list(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CheckpointTuple]:
+        """
+        List checkpoints, newest first.
+
+        Args:
+            config (Optional[RunnableConfig]): Restrict to the thread (and namespace) of this config. All threads if None.
+            filter (Optional[Dict[str, Any]]): Metadata key/values the checkpoints must match.
+            before (Optional[RunnableConfig]): Only checkpoints older than this one.
+            limit (Optional[int]): Maximum number of checkpoints to return.
+
+        Yields:
+            CheckpointTuple: The matching checkpoints.
+        """
+        clauses, params = [], []
+        if config is not None:
+            clauses.append("thread_id = ?")
+            params.append(str(config["configurable"]["thread_id"]))
+            if "checkpoint_ns" in config["configurable"]:
+                clauses.append("checkpoint_ns = ?")
+                params.append(config["configurable"]["checkpoint_ns"])
+        if before is not None and get_checkpoint_id(before):
+            clauses.append("checkpoint_id < ?")
+            params.append(get_checkpoint_id(before))
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        with self._lock:
+            rows = self._connection.execute(f"SELECT * FROM checkpoints {where} ORDER BY checkpoint_id DESC", params).fetchall()
+
+        yielded = 0
+        for row in rows:
+            if limit is not None and yielded >= limit:
+                return
+            with self._lock:
+                checkpoint_tuple = self._row_to_tuple(row=row)
+            if filter and any(checkpoint_tuple.metadata.get(key) != value for key, value in filter.items()):
+                continue
+            yielded += 1
+            yield checkpoint_tuple
+
+    def put(self, config: RunnableConfig, checkpoint: Checkpoint, metadata: CheckpointMetadata, new_versions: ChannelVersions) -> RunnableConfig:
+        """
+        Store a checkpoint, writing values only for the channels in `new_versions`.
+
+        Args:
+            config (RunnableConfig): The config of the parent checkpoint.
+            checkpoint (Checkpoint): The checkpoint to store.
+            metadata (CheckpointMetadata): The checkpoint metadata.
+            new_versions (ChannelVersions): Channels updated since the parent checkpoint and their new versions.
+
+        Returns:
+            RunnableConfig: The config of the stored checkpoint.
+        """
+        thread_id, checkpoint_ns = self._thread_key(config=config)
+        parent_checkpoint_id = get_checkpoint_id(config)
+
+        checkpoint_copy = checkpoint.copy()
+        channel_values = checkpoint_copy.pop("channel_values", {})
+        checkpoint_type, checkpoint_blob = self.serde.dumps_typed(checkpoint_copy)
+        metadata_type, metadata_blob = self.serde.dumps_typed(get_checkpoint_metadata(config, metadata))
+        blob_rows = [
+            (
+                thread_id,
+                checkpoint_ns,
+                channel,
+                str(version),
+                *(self.serde.dumps_typed(channel_values[channel]) if channel in channel_values else (_EMPTY_TYPE, None)),
+            )
+            for channel, version in new_versions.items()
+        ]
+
+        with self._lock:
+            with self._connection:
+                self._connection.execute("BEGIN")
+                self._connection.executemany("INSERT OR REPLACE INTO checkpoint_blobs VALUES (?, ?, ?, ?, ?, ?)", blob_rows)
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (thread_id, checkpoint_ns, checkpoint["id"], parent_checkpoint_id, checkpoint_type, checkpoint_blob, metadata_type, metadata_blob),
+                )
+
+        return {"configurable": {"thread_id": thread_id, "checkpoint_ns": checkpoint_ns, "checkpoint_id": checkpoint["id"]}}
+
+    def put_writes(self, config: RunnableConfig, writes: Sequence[Tuple[str, Any]], task_id: str, task_path: str = "") -> None:
+        """
+        Store the intermediate writes of a task against a checkpoint.
+
+        Args:
+            config (RunnableConfig): The config of the checkpoint the writes belong to.
+            writes (Sequence[Tuple[str, Any]]): The (channel, value) writes.
+            task_id (str): The ID of the task that produced the writes.
+            task_path (str): The path of the task that produced the writes.
+        """
+        thread_id, checkpoint_ns = self._thread_key(config=config)
+        checkpoint_id = get_checkpoint_id(config)
+        # Special channels (errors, interrupts) replace earlier writes, regular writes are only recorded once
+        verb = "INSERT OR REPLACE" if all(channel in WRITES_IDX_MAP for channel, _ in writes) else "INSERT OR IGNORE"
+        rows = [
+            (thread_id, checkpoint_ns, checkpoint_id, task_id, task_path, WRITES_IDX_MAP.get(channel, idx), channel, *self.serde.dumps_typed(value))
+            for idx, (channel, value) in enumerate(writes)
+        ]
+        with self._lock:
+            with self._connection:
+                self._connection.execute("BEGIN")
+                self._connection.executemany(f"{verb} INTO checkpoint_writes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+    def delete_thread(self, thread_id: str) -> None:
+        """
+        Delete every checkpoint, blob and write of a thread.
+
+        Args:
+            thread_id (str): The thread ID.
+        """
+        with self._lock:
+            with self._connection:
+                self._connection.execute("BEGIN")
+                for table in ("checkpoints", "checkpoint_blobs", "checkpoint_writes"):
+                    self._connection.execute(f"DELETE FROM {table} WHERE thread_id = ?", (str(thread_id),))
+
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        """
+        Async version of `get_tuple`. SQLite calls are local and short, so they run inline.
+
+        Args:
+            config (RunnableConfig): The config identifying the thread and optionally the checkpoint.
+
+        Returns:
+            Optional[CheckpointTuple]: The checkpoint, or None if it does not exist.
+        """
+        return self.get_tuple(config)
+
+    async def alist(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        """
+        Async version of `list`.
+
+        Args:
+            config (Optional[RunnableConfig]): Restrict to the thread (and namespace) of this config. All threads if None.
+            filter (Optional[Dict[str, Any]]): Metadata key/values the checkpoints must match.
+            before (Optional[RunnableConfig]): Only checkpoints older than this one.
+            limit (Optional[int]): Maximum number of checkpoints to return.
+
+        Yields:
+            CheckpointTuple: The matching checkpoints.
+        """
+        for checkpoint_tuple in self.list(config, filter=filter, before=before, limit=limit):
+            yield checkpoint_tuple
+
+    async def aput(self, config: RunnableConfig, checkpoint: Checkpoint, metadata: CheckpointMetadata, new_versions: ChannelVersions) -> RunnableConfig:
+        """
+        Async version of `put`.
+
+        Args:
+            config (RunnableConfig): The config of the parent checkpoint.
+            checkpoint (Checkpoint): The checkpoint to store.
+            metadata (CheckpointMetadata): The checkpoint metadata.
+            new_versions (ChannelVersions): Channels updated since the parent checkpoint and their new versions.
+
+        Returns:
+            RunnableConfig: The config of the stored checkpoint.
+        """
+        return self.put(config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(self, config: RunnableConfig, writes: Sequence[Tuple[str, Any]], task_id: str, task_path: str = "") -> None:
+        """
+        Async version of `put_writes`.
+
+        Args:
+            config (RunnableConfig): The config of the checkpoint the writes belong to.
+            writes (Sequence[Tuple[str, Any]]): The (channel, value) writes.
+            task_id (str): The ID of the task that produced the writes.
+            task_path (str): The path of the task that produced the writes.
+        """
+        self.put_writes(config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        """
+        Async version of `delete_thread`.
+
+        Args:
+            thread_id (str): The thread ID.
+        """
+        self.delete_thread(thread_id)
+
+    def close(self) -> None:
+        """
+        Close the database connection.
+        """
+        self._connection.close()
@@ -0,0 +1,242 @@
+"""
+==============================================================================
+Name: test_buffered_checkpointer
+Author: AI Assistant
+Date: 10/17/2026
+Description: Tests of the buffered checkpointer flush policies and of the
+SQLite checkpointer storing only changed channels.
+==============================================================================
+"""
+
+import asyncio
+import operator
+from typing import Annotated, List
+
+import pytest
+from langgraph.checkpoint.base import empty_checkpoint
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.graph import END, START, StateGraph
+from typing_extensions import TypedDict
+
+from .buffered_checkpointer import BufferedCheckpointSaver, FlushPolicy
+from .sqlite_checkpointer import SQLiteCheckpointSaver
+
+
+class _CountingSaver(InMemorySaver):
+    """In-memory checkpointer recording the calls that reach storage."""
+
+    def __init__(self):
+        super().__init__()
+        self.puts = []
+        self.put_writes_calls = 0
+
+    def put(self, config, checkpoint, metadata, new_versions):
+        self.puts.append(dict(new_versions))
+        return super().put(config, checkpoint, metadata, new_versions)
+
+    def put_writes(self, config, writes, task_id, task_path=""):
+        self.put_writes_calls += 1
+        super().put_writes(config, writes, task_id, task_path)
+
+
+def _thread(thread_id="t1"):
+    return {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}}
+
+
+def _checkpoint(step, channel_values, channel_versions):
+    checkpoint = empty_checkpoint()
+    checkpoint["id"] = f"{step:08d}"
+    checkpoint["channel_values"] = dict(channel_values)
+    checkpoint["channel_versions"] = dict(channel_versions)
+    return checkpoint
+
+
+def _put_steps(saver, steps, thread_id="t1"):
+    """Put one checkpoint per step, each changing channel "a", and return the config of the last one."""
+    config = _thread(thread_id)
+    for step in range(1, steps + 1):
+        config = saver.put(config, _checkpoint(step, {"a": step, "prompt": "static"}, {"a": step, "prompt": 1}), {"step": step}, {"a": step})
+    return config
+
+
+def test_superstep_policy_flushes_every_put():
+    inner = _CountingSaver()
+    saver = BufferedCheckpointSaver(inner, flush_policy=FlushPolicy.SUPERSTEP)
+
+    _put_steps(saver, steps=3)
+
+    assert len(inner.puts) == 3
+    assert saver.stats.flushed_puts == 3
+    assert saver.stats.round_trips_saved == 0
+
+
+def test_every_n_steps_policy_flushes_the_latest_checkpoint_every_n_puts():
+    inner = _CountingSaver()
+    saver = BufferedCheckpointSaver(inner, flush_policy=FlushPolicy.EVERY_N_STEPS, flush_every_n_steps=2)
+
+    _put_steps(saver, steps=5)
+    assert len(inner.puts) == 2
+    assert inner.get_tuple(_thread()).checkpoint["id"] == f"{4:08d}"
+
+    saver.flush()
+    stats = saver.stats
+    assert len(inner.puts) == 3
+    assert (stats.buffered_puts, stats.flushed_puts, stats.round_trips_saved) == (5, 3, 2)
+
+
+def test_end_policy_writes_nothing_until_flushed():
+    inner = _CountingSaver()
+    saver = BufferedCheckpointSaver(inner, flush_policy=FlushPolicy.END)
+
+    config = _put_steps(saver, steps=4)
+    saver.put_writes(config, [("a", 5)], task_id="task-1")
+    assert inner.puts == [] and inner.put_writes_calls == 0
+
+    saver.flush(thread_id="t1")
+    stats = saver.stats
+    assert len(inner.puts) == 1 and inner.put_writes_calls == 1
+    assert inner.get_tuple(_thread()).pending_writes == [("task-1", "a", 5)]
+    assert (stats.buffered_puts, stats.buffered_writes, stats.round_trips_saved) == (4, 1, 3)
+
+
+def test_flush_is_per_thread():
+    inner = _CountingSaver()
+    saver = BufferedCheckpointSaver(inner)
+    _put_steps(saver, steps=2, thread_id="t1")
+    _put_steps(saver, steps=2, thread_id="t2")
+
+    saver.flush(thread_id="t2")
+
+    assert inner.get_tuple(_thread("t1")) is None
+    assert inner.get_tuple(_thread("t2")) is not None
+
+
+def test_get_tuple_is_served_from_the_buffer_before_a_flush():
+    inner = _CountingSaver()
+    saver = BufferedCheckpointSaver(inner)
+
+    config = _put_steps(saver, steps=2)
+    saver.put_writes(config, [("a", 3)], task_id="task-1")
+
+    buffered = saver.get_tuple(_thread())
+    assert inner.get_tuple(_thread()) is None
+    assert buffered.config == config
+    assert buffered.checkpoint["channel_values"]["a"] == 2
+    assert buffered.pending_writes == [("task-1", "a", 3)]
+    assert saver.get_tuple(config) is buffered
+    assert asyncio.run(saver.aget_tuple(_thread())) is buffered
+
+
+def test_writes_against_a_flushed_checkpoint_go_straight_through():
+    inner = _CountingSaver()
+    saver = BufferedCheckpointSaver(inner, flush_policy=FlushPolicy.SUPERSTEP)
+
+    config = _put_steps(saver, steps=1)
+    saver.put_writes(config, [("a", 2)], task_id="task-1")
+
+    assert inner.put_writes_calls == 1
+    assert inner.get_tuple(config).pending_writes == [("task-1", "a", 2)]
+
+
+def test_list_flushes_the_thread_first():
+    inner = _CountingSaver()
+    saver = BufferedCheckpointSaver(inner)
+    _put_steps(saver, steps=3)
+
+    listed = list(saver.list(_thread()))
+
+    assert len(inner.puts) == 1
+    assert [checkpoint_tuple.checkpoint["id"] for checkpoint_tuple in listed] == [f"{3:08d}"]
+
+
+def test_alist_flushes_the_thread_first():
+    inner = _CountingSaver()
+    saver = BufferedCheckpointSaver(inner)
+    _put_steps(saver, steps=3)
+
+    async def main():
+        return [checkpoint_tuple async for checkpoint_tuple in saver.alist(_thread())]
+
+    listed = asyncio.run(main())
+
+    assert len(inner.puts) == 1
+    assert listed[0].checkpoint["channel_values"]["a"] == 3
+
+
+def test_flush_unions_new_versions_across_buffered_puts():
+    inner = _CountingSaver()
+    saver = BufferedCheckpointSaver(inner)
+    versions = {"a": 1, "b": 1, "c": 1}
+    config = saver.put(_thread(), _checkpoint(1, {"a": 1, "b": 1, "c": 1}, versions), {}, dict(versions))
+    saver.flush()
+
+    config = saver.put(config, _checkpoint(2, {"a": 2, "b": 1, "c": 1}, {**versions, "a": 2}), {}, {"a": 2})
+    saver.put(config, _checkpoint(3, {"a": 2, "b": 3, "c": 1}, {**versions, "a": 2, "b": 3}), {}, {"b": 3})
+    saver.flush()
+
+    assert inner.puts[-1] == {"a": 2, "b": 3}
+    assert saver.stats.flushed_channels == 5
+    assert inner.get_tuple(_thread()).checkpoint["channel_values"] == {"a": 2, "b": 3, "c": 1}
+
+
+def test_flush_every_n_steps_must_be_positive():
+    with pytest.raises(ValueError):
+        BufferedCheckpointSaver(InMemorySaver(), flush_every_n_steps=0)
+
+
+class _LoopState(TypedDict):
+    turn: int
+    messages: Annotated[List[str], operator.add]
+
+
+def _run_loop(checkpointer):
+    def step(state):
+        return {"turn": state["turn"] + 1, "messages": [f"turn {state['turn']}"]}
+
+    builder = StateGraph(_LoopState)
+    builder.add_node("step", step)
+    builder.add_edge(START, "step")
+    builder.add_conditional_edges("step", lambda state: "step" if state["turn"] < 5 else END)
+    graph = builder.compile(checkpointer=checkpointer)
+    return graph.invoke({"turn": 0, "messages": []}, _thread())
+
+
+def test_graph_run_round_trips_through_the_buffer():
+    inner = _CountingSaver()
+    saver = BufferedCheckpointSaver(inner, flush_policy=FlushPolicy.END)
+
+    result = _run_loop(saver)
+    saver.flush()
+
+    assert result == _run_loop(InMemorySaver())
+    assert len(inner.puts) == 1
+    assert inner.get_tuple(_thread()).checkpoint["channel_values"]["messages"] == result["messages"]
+
+
+def test_sqlite_round_trip_stores_only_changed_channel_blobs(tmp_path):
+    saver = SQLiteCheckpointSaver(path=tmp_path / "checkpoints.sqlite")
+    try:
+        first = saver.put(_thread(), _checkpoint(1, {"prompt": "static", "a": 1}, {"prompt": 1, "a": 1}), {"step": 1}, {"prompt": 1, "a": 1})
+        second = saver.put(first, _checkpoint(2, {"prompt": "static", "a": 2}, {"prompt": 1, "a": 2}), {"step": 2}, {"a": 2})
+        saver.put_writes(second, [("a", 3)], task_id="task-1")
+
+        blobs = saver._connection.execute("SELECT channel, version FROM checkpoint_blobs ORDER BY channel, version").fetchall()
+        assert blobs == [("a", "1"), ("a", "2"), ("prompt", "1")]
+
+        latest = saver.get_tuple(_thread())
+        assert latest.config == second
+        assert latest.parent_config == first
+        assert latest.checkpoint["channel_values"] == {"prompt": "static", "a": 2}
+        assert latest.metadata["step"] == 2
+        assert latest.pending_writes == [("task-1", "a", 3)]
+        assert saver.get_tuple(first).checkpoint["channel_values"] == {"prompt": "static", "a": 1}
+
+        listed = list(saver.list(_thread()))
+        assert [checkpoint_tuple.config for checkpoint_tuple in listed] == [second, first]
+        assert list(saver.list(_thread(), before=second)) == listed[1:]
+        assert [checkpoint_tuple.config for checkpoint_tuple in saver.list(_thread(), filter={"step": 1})] == [first]
+
+        saver.delete_thread("t1")
+        assert saver.get_tuple(_thread()) is None
+    finally:
+        saver.close()
@@ -3,75 +3,51 @@
 Name: factory
 Author: AI Assistant
 Date: 10/20/2025
-Description: Factory for creating tool nodes and states.
+Description: Factory for creating tool nodes from the tool registry.
 ==============================================================================
 """
 
-from typing import Callable, Dict, Type
+import inspect
+from typing import Optional
 
-from pydantic import BaseModel
-
-# Local imports
-from tools.process_tool import ProcessTool
-from tools.process_tool_node import ProcessToolNode, ProcessToolState
-from tools.search_tool import SearchTool
-from tools.search_tool_node import SearchToolNode, SearchToolState
-
-from wernicke.engines.llm.llm_callers.models import ToolCallAction
 from wernicke.engines.llm.llm_orchestrators.graph_llm_orchestrators.node_types.base import INode
 
+from .tool_dispatcher import ToolCallDispatcher
+from .tools.artifact_store import IArtifactStore
+from .tools.registry import tool_registry
+from .tools.tool_result_cache import IToolResultCache
 
-def tool_call_node_factory(tool_name: str) -> Type[INode]:
-    """
-    Factory for creating the node class from the tool name.
-
-    Args:
-        tool_name (str): Name of the tool.
-
-    Returns:
-        Type[INode]: The node class for the tool.
 
-    Raises:
-        NotImplementedError: If the tool name is not supported.
+def tool_call_node_instance_factory(
+    tool_name: str,
+    tool_dispatcher: Optional[ToolCallDispatcher] = None,
+    tool_result_cache: Optional[IToolResultCache] = None,
+    artifact_store: Optional[IArtifactStore] = None,
+) -> INode:
     """
-    tool_nodes: Dict[str, Type[INode]] = {
-        SearchTool.name: SearchToolNode,
-        ProcessTool.name: ProcessToolNode,
-    }
-
-    if tool_name not in tool_nodes:
-        raise NotImplementedError(f"Tool node factory does not support tool: {tool_name}")
-
-    return tool_nodes[tool_name]
+    Factory for creating the node instance from the tool name.
 
-
-def tool_call_state_model_factory(tool_action: ToolCallAction, **kwargs) -> BaseModel:
-    """
-    Factory for creating the state model from the tool action.
+    Node classes opt in to result caching by setting `cacheable = True` and accepting a `tool_result_cache` argument, and
+    receive the dispatcher only if their constructor accepts a `tool_dispatcher` argument.
 
     Args:
-        tool_action (ToolCallAction): The tool call action.
-        **kwargs: Additional keyword arguments.
+        tool_name (str): Name of the tool.
+        tool_dispatcher (Optional[ToolCallDispatcher]): Dispatcher shared by the tool nodes.
+        tool_result_cache (Optional[IToolResultCache]): Result cache given to cacheable tool nodes.
+        artifact_store (Optional[IArtifactStore]): Store the tool nodes write their artifacts to.
 
     Returns:
-        BaseModel: The state model for the tool.
+        INode: The node instance for the tool.
 
     Raises:
         NotImplementedError: If the tool name is not supported.
     """
-    tool_states: Dict[str, Callable] = {
-        SearchTool.name: lambda tool_action, **kwargs: SearchToolState(
-            tool_call_id=tool_action.id,
-            query=tool_action.content.inputs.query,
-        ),
-        ProcessTool.name: lambda tool_action, **kwargs: ProcessToolState(
-            tool_call_id=tool_action.id,
-            summary=tool_action.content.inputs.summary,
-        ),
-    }
+    node_class = tool_registry.get(tool_name).node_class
 
-    if tool_action.content.name not in tool_states:
-        raise NotImplementedError(f"Tool state model factory does not support tool: {tool_action.content.name}")
+    node_kwargs = {"artifact_store": artifact_store}
+    if "tool_dispatcher" in inspect.signature(node_class).parameters:
+        node_kwargs["tool_dispatcher"] = tool_dispatcher
+    if tool_result_cache is not None and getattr(node_class, "cacheable", False):
+        node_kwargs["tool_result_cache"] = tool_result_cache
 
-    constructor = tool_states[tool_action.content.name]
-    return constructor(tool_action=tool_action, **kwargs)
+    return node_class(**node_kwargs)
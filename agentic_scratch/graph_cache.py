@@ -0,0 +1,82 @@
+"""
+==============================================================================
+Name: graph_cache
+Author: AI Assistant
+Date: 10/17/2026
+Description: Process-wide cache of compiled orchestrator graphs, so creating an
+orchestrator per request does not rebuild and recompile its graph.
+==============================================================================
+"""
+
+from threading import Lock
+from typing import TYPE_CHECKING, Callable, Dict, Hashable, List, Tuple
+
+if TYPE_CHECKING:
+    from langgraph.graph.state import CompiledStateGraph
+
+
+class CompiledGraphCache:
+    """
+    Cache of compiled graphs keyed by orchestrator class, version and node configuration.
+
+    Cached graphs are compiled without a checkpointer and hold no per-request dependencies; each orchestrator takes a
+    copy bound to its own checkpointer and passes its dependencies to the nodes through the run context.
+    """
+
+    def __init__(self, enabled: bool = True):
+        """
+        Initialize the cache.
+
+        Args:
+            enabled (bool): Whether compiled graphs are reused. When False every lookup compiles a new graph.
+        """
+        self._enabled = enabled
+        self._graphs: Dict[Tuple[Hashable, ...], "CompiledStateGraph"] = {}
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compile(self, key: Tuple[Hashable, ...], compile_fn: Callable[[], "CompiledStateGraph"]) -> "CompiledStateGraph":
+        """
+        Return the compiled graph for the key, compiling it on first use.
+
+        Args:
+            key (Tuple[Hashable, ...]): The graph key.
+            compile_fn (Callable[[], CompiledStateGraph]): Builds and compiles the graph.
+
+        Returns:
+            CompiledStateGraph: The cached or newly compiled graph.
+        """
+        with self._lock:
+            if self._enabled and key in self._graphs:
+                self.hits += 1
+                return self._graphs[key]
+            self.misses += 1
+
+            compiled_graph = compile_fn()
+            if self._enabled:
+                self._graphs[key] = compiled_graph
+
+        return compiled_graph
+
+    def clear(self) -> None:
+        """
+        Drop every cached graph and reset the counters.
+        """
+        with self._lock:
+            self._graphs.clear()
+            self.hits = 0
+            self.misses = 0
+
+    @property
+    def cached_keys(self) -> List[Tuple[Hashable, ...]]:
+        """
+        Returns the keys of the cached graphs.
+
+        Returns:
+            List[Tuple[Hashable, ...]]: The cached keys.
+        """
+        return list(self._graphs.keys())
+
+
+default_compiled_graph_cache = CompiledGraphCache()
@@ -0,0 +1,489 @@
+"""
+==============================================================================
+Name: instrumentation
+Author: AI Assistant
+Date: 10/17/2026
+Description: In-process per-node instrumentation for graph orchestrators: wall
+time, CPU time, state size and allocation peak per node execution, collected
+in a histogram registry exportable as Prometheus text or JSON.
+==============================================================================
+"""
+
+import functools
+import inspect
+import time
+import tracemalloc
+from bisect import bisect_left
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Callable, Dict, Generator, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from wernicke.engines.llm.llm_orchestrators.graph_llm_orchestrators.node_types.base import INode
+
+SECONDS_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+BYTES_BUCKETS = tuple(float(2**exponent) for exponent in range(8, 27, 2))
+
+
+class Histogram:
+    """
+    Cumulative-bucket histogram with Prometheus semantics.
+    """
+
+    def __init__(self, buckets: Sequence[float]):
+        """
+        Initialize the histogram.
+
+        Args:
+            buckets (Sequence[float]): Upper bounds of the buckets, ascending. A +Inf bucket is always added.
+        """
+        self.buckets: Tuple[float, ...] = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self._lock = Lock()
+
+    def observe(self, value: float) -> None:
+        """
+        Record one observation.
+
+        Args:
+            value (float): The observed value.
+        """
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self.count += 1
+            self.sum += value
+
+    def reset(self) -> None:
+        """
+        Drop every observation, keeping the buckets.
+        """
+        with self._lock:
+            self._counts = [0] * (len(self.buckets) + 1)
+            self.count = 0
+            self.sum = 0.0
+
+    def cumulative_counts(self) -> List[Tuple[float, int]]:
+        """
+        Returns the cumulative count of each bucket.
+
+        Returns:
+            List[Tuple[float, int]]: (upper bound, observations <= bound) pairs, ending with +Inf.
+        """
+        with self._lock:
+            counts = list(self._counts)
+        cumulative, total = [], 0
+        for bound, count in zip((*self.buckets, float("inf")), counts):
+            total += count
+            cumulative.append((bound, total))
+        return cumulative
+
+    def quantile(self, fraction: float) -> float:
+        """
+        Estimate a quantile by linear interpolation within its bucket, like Prometheus `histogram_quantile`.
+
+        Args:
+            fraction (float): The quantile as a fraction, e.g. 0.95.
+
+        Returns:
+            float: The estimated quantile, or 0.0 if there are no observations. Quantiles in the +Inf bucket return the largest bound.
+        """
+        cumulative = self.cumulative_counts()
+        total = cumulative[-1][1]
+        if total == 0:
+            return 0.0
+
+        rank = fraction * total
+        lower_bound, lower_count = 0.0, 0
+        for bound, count in cumulative:
+            if count >= rank:
+                if bound == float("inf"):
+                    return lower_bound
+                in_bucket = count - lower_count
+                return lower_bound + (bound - lower_bound) * ((rank - lower_count) / in_bucket if in_bucket else 0.0)
+            lower_bound, lower_count = bound, count
+        return lower_bound
+
+
+class MetricsRegistry:
+    """
+    In-process registry of labelled histograms and counters.
+    """
+
+    def __init__(self):
+        """
+        Initialize the registry.
+        """
+        self._help: Dict[str, str] = {}
+        self._histograms: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], Histogram] = {}
+        self._counters: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], float] = {}
+        self._lock = Lock()
+
+    def histogram(self, name: str, help: str, buckets: Sequence[float], labels: Optional[Dict[str, str]] = None) -> Histogram:
+        """
+        Get or create a histogram series.
+
+        Args:
+            name (str): Metric name.
+            help (str): Metric description.
+            buckets (Sequence[float]): Bucket upper bounds, used when the series is created.
+            labels (Optional[Dict[str, str]]): Series labels.
+
+        Returns:
+            Histogram: The histogram series.
+        """
+        key = (name, tuple(sorted((labels or {}).items())))
+        with self._lock:
+            if key not in self._histograms:
+                self._help[name] = help
+                self._histograms[key] = Histogram(buckets=buckets)
+            return self._histograms[key]
+
+    def increment(self, name: str, help: str, labels: Optional[Dict[str, str]] = None, amount: float = 1.0) -> None:
+        """
+        Increment a counter series.
+
+        Args:
+            name (str): Metric name.
+            help (str): Metric description.
+            labels (Optional[Dict[str, str]]): Series labels.
+            amount (float): Amount to add.
+        """
+        key = (name, tuple(sorted((labels or {}).items())))
+        with self._lock:
+            self._help[name] = help
+            self._counters[key] = self._counters.get(key, 0.0) + amount
+
+    def clear(self) -> None:
+        """
+        Drop every observation. Histogram series stay registered, so callers holding a series keep recording into it.
+        """
+        with self._lock:
+            histograms = list(self._histograms.values())
+            self._counters.clear()
+        for histogram in histograms:
+            histogram.reset()
+
+    @staticmethod
+    def _format_labels(labels: Sequence[Tuple[str, str]]) -> str:
+        """
+        Format labels in the Prometheus exposition format.
+
+        Args:
+            labels (Sequence[Tuple[str, str]]): The label pairs.
+
+        Returns:
+            str: The formatted labels, including braces, or "" if there are none.
+        """
+        if not labels:
+            return ""
+        escaped = []
+        for key, value in labels:
+            value = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+            escaped.append(f'{key}="{value}"')
+        return "{" + ",".join(escaped) + "}"
+
+    def to_prometheus(self) -> str:
+        """
+        Export every series in the Prometheus text exposition format.
+
+        Returns:
+            str: The exposition text.
+        """
+        with self._lock:
+            histograms = sorted(self._histograms.items())
+            counters = sorted(self._counters.items())
+
+        lines: List[str] = []
+        described = set()
+        for (name, labels), histogram in histograms:
+            if name not in described:
+                lines += [f"# HELP {name} {self._help[name]}", f"# TYPE {name} histogram"]
+                described.add(name)
+            for bound, count in histogram.cumulative_counts():
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f"{name}_bucket{self._format_labels((*labels, ('le', le)))} {count}")
+            lines.append(f"{name}_sum{self._format_labels(labels)} {histogram.sum}")
+            lines.append(f"{name}_count{self._format_labels(labels)} {histogram.count}")
+        for (name, labels), value in counters:
+            if name not in described:
+                lines += [f"# HELP {name} {self._help[name]}", f"# TYPE {name} counter"]
+                described.add(name)
+            lines.append(f"{name}{self._format_labels(labels)} {value}")
+        return "\n".join(lines) + "\n"
+
+    def to_json(self) -> Dict[str, Any]:
+        """
+        Export every series as JSON-serializable data, with estimated p50/p95/p99 per histogram series.
+
+        Returns:
+            Dict[str, Any]: Metrics keyed by name, each with its help text, type and series.
+        """
+        with self._lock:
+            histograms = sorted(self._histograms.items())
+            counters = sorted(self._counters.items())
+
+        metrics: Dict[str, Any] = {}
+        for (name, labels), histogram in histograms:
+            metric = metrics.setdefault(name, {"help": self._help[name], "type": "histogram", "series": []})
+            metric["series"].append(
+                {
+                    "labels": dict(labels),
+                    "count": histogram.count,
+                    "sum": histogram.sum,
+                    "p50": histogram.quantile(0.50),
+                    "p95": histogram.quantile(0.95),
+                    "p99": histogram.quantile(0.99),
+                    "buckets": [["+Inf" if bound == float("inf") else bound, count] for bound, count in histogram.cumulative_counts()],
+                }
+            )
+        for (name, labels), value in counters:
+            metric = metrics.setdefault(name, {"help": self._help[name], "type": "counter", "series": []})
+            metric["series"].append({"labels": dict(labels), "value": value})
+        return metrics
+
+
+class _StepTimer:
+    """
+    Awaitable that drives a coroutine and measures only the steps the coroutine itself runs.
+
+    Other tasks on the event loop run between the steps of a node, so CPU time and allocation peaks are measured around
+    each `send`/`throw` rather than over the node's whole wall time.
+    """
+
+    def __init__(self, coroutine: Any, trace_allocations: bool):
+        """
+        Initialize the timer.
+
+        Args:
+            coroutine (Any): The node's coroutine.
+            trace_allocations (bool): Whether to measure the tracemalloc peak of each step.
+        """
+        self._coroutine = coroutine
+        self._trace_allocations = trace_allocations
+        self.cpu_seconds = 0.0
+        self.allocation_peak = 0
+
+    def _step(self, value: Any, error: Optional[BaseException]) -> Any:
+        """
+        Run one step of the coroutine.
+
+        Args:
+            value (Any): Value to send in.
+            error (Optional[BaseException]): Exception to throw in instead of sending a value.
+
+        Returns:
+            Any: What the coroutine yielded to the event loop.
+        """
+        if self._trace_allocations:
+            baseline, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+        start = time.thread_time()
+        try:
+            return self._coroutine.throw(error) if error is not None else self._coroutine.send(value)
+        finally:
+            self.cpu_seconds += time.thread_time() - start
+            if self._trace_allocations:
+                _, peak = tracemalloc.get_traced_memory()
+                self.allocation_peak = max(self.allocation_peak, peak - baseline)
+
+    def __await__(self) -> Generator[Any, Any, Any]:
+        """
+        Drive the coroutine to completion.
+
+        Returns:
+            Any: The coroutine result.
+        """
+        value, error = None, None
+        while True:
+            try:
+                yielded = self._step(value=value, error=error)
+            except StopIteration as stop:
+                return stop.value
+            try:
+                value, error = (yield yielded), None
+            except BaseException as thrown:
+                value, error = None, thrown
+
+
+class NodeInstrumentation:
+    """
+    Instruments graph nodes so each execution records its wall time, CPU time, input state size and allocation peak.
+
+    Attach it in `compile_graph` with `instrument(node)` before the node is added to the graph. Allocation peaks need
+    tracemalloc, which slows Python allocations down noticeably, so they are only recorded with `trace_allocations=True`.
+    Peaks are attributed per coroutine step and assume one event loop per process. Call `close` when done so tracing
+    started here does not keep slowing the process down.
+    """
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None, measure_state_size: bool = True, trace_allocations: bool = False):
+        """
+        Initialize the instrumentation.
+
+        Args:
+            registry (Optional[MetricsRegistry]): Registry the metrics go to. A new registry is created if None.
+            measure_state_size (bool): Whether to serialize each node's input state to measure its size.
+            trace_allocations (bool): Whether to record tracemalloc peaks, starting tracemalloc if needed.
+        """
+        self.registry = registry or MetricsRegistry()
+        self._measure_state_size = measure_state_size
+        self._trace_allocations = trace_allocations
+        self._serde = None
+        if measure_state_size:
+            # The serializer pulls in the langgraph checkpoint package, so it is only loaded when state sizes are measured
+            from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+            self._serde = JsonPlusSerializer()
+        self._histograms: Dict[str, Dict[str, Histogram]] = {}
+        self._started_tracemalloc = trace_allocations and not tracemalloc.is_tracing()
+        if self._started_tracemalloc:
+            tracemalloc.start()
+
+    def close(self) -> None:
+        """
+        Stop tracemalloc if this instrumentation started it. Tracing started by someone else is left running.
+        """
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def _state_size(self, graph_state: Any) -> Optional[int]:
+        """
+        Returns the serialized size of a node's input state, as the checkpointer serializer would write it.
+
+        Args:
+            graph_state (Any): The input state.
+
+        Returns:
+            Optional[int]: The size in bytes, or None if the state cannot be serialized.
+        """
+        try:
+            _, payload = self._serde.dumps_typed(graph_state)
+        except Exception:
+            return None
+        return len(payload)
+
+    def _node_histograms(self, node_name: str) -> Dict[str, Histogram]:
+        """
+        Resolve the histogram series of a node once, so recording does not look them up per execution.
+
+        Args:
+            node_name (str): Name of the node.
+
+        Returns:
+            Dict[str, Histogram]: The node's histograms keyed by measurement.
+        """
+        labels = {"node": node_name}
+        return {
+            "wall": self.registry.histogram("agentic_node_wall_seconds", "Wall time of node executions.", SECONDS_BUCKETS, labels),
+            "cpu": self.registry.histogram("agentic_node_cpu_seconds", "CPU time spent in node executions.", SECONDS_BUCKETS, labels),
+            "state": self.registry.histogram("agentic_node_state_bytes", "Serialized size of node input state.", BYTES_BUCKETS, labels),
+            "allocation": self.registry.histogram("agentic_node_allocation_peak_bytes", "tracemalloc peak of node executions.", BYTES_BUCKETS, labels),
+        }
+
+    def _record(
+        self,
+        node_name: str,
+        wall_seconds: float,
+        cpu_seconds: float,
+        state_bytes: Optional[int],
+        allocation_peak: Optional[int],
+        failed: bool,
+    ) -> None:
+        """
+        Record the measurements of one node execution.
+
+        Args:
+            node_name (str): Name of the node.
+            wall_seconds (float): Wall time of the execution.
+            cpu_seconds (float): CPU time spent in the node.
+            state_bytes (Optional[int]): Serialized size of the input state, if measured.
+            allocation_peak (Optional[int]): Peak traced allocation above the baseline, if traced.
+            failed (bool): Whether the execution raised.
+        """
+        histograms = self._histograms.get(node_name)
+        if histograms is None:
+            histograms = self._histograms[node_name] = self._node_histograms(node_name=node_name)
+
+        histograms["wall"].observe(wall_seconds)
+        histograms["cpu"].observe(cpu_seconds)
+        if state_bytes is not None:
+            histograms["state"].observe(state_bytes)
+        if allocation_peak is not None:
+            histograms["allocation"].observe(allocation_peak)
+        if failed:
+            self.registry.increment("agentic_node_errors_total", "Node executions that raised.", {"node": node_name})
+
+    def wrap(self, node_name: str, execute: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Wrap a node's execute function.
+
+        Args:
+            node_name (str): Name of the node, used as the `node` label.
+            execute (Callable[..., Any]): The execute function, sync or async.
+
+        Returns:
+            Callable[..., Any]: The instrumented function, with the same signature and type hints.
+        """
+        if inspect.iscoroutinefunction(execute):
+
+            @functools.wraps(execute)
+            async def instrumented_async(graph_state: Any, *args: Any, **kwargs: Any) -> Any:
+                state_bytes = self._state_size(graph_state) if self._measure_state_size else None
+                timer = _StepTimer(coroutine=execute(graph_state, *args, **kwargs), trace_allocations=self._trace_allocations)
+                failed = True
+                start = time.perf_counter()
+                try:
+                    result = await timer
+                    failed = False
+                    return result
+                finally:
+                    self._record(
+                        node_name=node_name,
+                        wall_seconds=time.perf_counter() - start,
+                        cpu_seconds=timer.cpu_seconds,
+                        state_bytes=state_bytes,
+                        allocation_peak=timer.allocation_peak if self._trace_allocations else None,
+                        failed=failed,
+                    )
+
+            return instrumented_async
+
+        @functools.wraps(execute)
+        def instrumented(graph_state: Any, *args: Any, **kwargs: Any) -> Any:
+            state_bytes = self._state_size(graph_state) if self._measure_state_size else None
+            if self._trace_allocations:
+                baseline, _ = tracemalloc.get_traced_memory()
+                tracemalloc.reset_peak()
+            failed = True
+            start, cpu_start = time.perf_counter(), time.thread_time()
+            try:
+                result = execute(graph_state, *args, **kwargs)
+                failed = False
+                return result
+            finally:
+                allocation_peak = tracemalloc.get_traced_memory()[1] - baseline if self._trace_allocations else None
+                self._record(
+                    node_name=node_name,
+                    wall_seconds=time.perf_counter() - start,
+                    cpu_seconds=time.thread_time() - cpu_start,
+                    state_bytes=state_bytes,
+                    allocation_peak=allocation_peak,
+                    failed=failed,
+                )
+
+        return instrumented
+
+    def instrument(self, node: "INode") -> "INode":
+        """
+        Instrument a node in place by replacing its bound `execute`.
+
+        Args:
+            node (INode): The node to instrument.
+
+        Returns:
+            INode: The same node.
+        """
+        node.execute = self.wrap(node_name=str(node.name), execute=node.execute)
+        return node
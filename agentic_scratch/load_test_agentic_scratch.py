@@ -0,0 +1,330 @@
+"""
+==============================================================================
+Name: load_test_agentic_scratch
+Author: AI Assistant
+Date: 10/17/2026
+Description: Offline load generator for the agentic scratch orchestrator. Runs
+concurrent graph threads against a fake LLM and an in-memory checkpointer and
+reports per-node latency percentiles.
+==============================================================================
+"""
+
+import argparse
+import asyncio
+import json
+import math
+from contextvars import ContextVar
+from threading import Lock
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.tracers.context import register_configure_hook
+from langgraph.checkpoint.memory import InMemorySaver
+
+from wernicke.engines.llm.llm_orchestrators.graph_llm_orchestrators.models import GraphInputModel, guid_to_str
+from wernicke.shared.guid import new_guid
+from wernicke.tests.shared_utils.test_session import create_test_user_session
+
+from .agentic_scratch_orchestrator import AgenticScratchOrchestrator
+from .callers.caller_cache import LLMCallerCache
+from .callers.fake_llm_caller import FakeLLMProvider, FakeLLMScript, LatencyDistribution
+from .instrumentation import NodeInstrumentation
+from .loop_controller import LoopController
+from .prefetch import SpeculativePrefetcher
+from .state import AgenticScratchState
+from .tools.artifact_store import InMemoryArtifactStore
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    """
+    Nearest-rank percentile.
+
+    Args:
+        samples (List[float]): The samples, in any order.
+        fraction (float): The percentile as a fraction, e.g. 0.95.
+
+    Returns:
+        float: The percentile, or 0.0 if there are no samples.
+    """
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+class NodeLatencyRecorder(BaseCallbackHandler):
+    """
+    Records the wall time of every graph node execution from LangGraph's per-node chain runs.
+    """
+
+    run_inline = True
+
+    def __init__(self):
+        """
+        Initialize the recorder.
+        """
+        self._started: Dict[UUID, Tuple[str, float]] = {}
+        self._lock = Lock()
+        self.latencies: Dict[str, List[float]] = {}
+        self.errors: Dict[str, int] = {}
+
+    def on_chain_start(
+        self,
+        serialized: Optional[Dict[str, Any]],
+        inputs: Any,
+        *,
+        run_id: UUID,
+        metadata: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Start timing a node run. Child runs inside the node carry the same `langgraph_node` but a different name.
+
+        Args:
+            serialized (Optional[Dict[str, Any]]): The serialized runnable.
+            inputs (Any): The run inputs.
+            run_id (UUID): ID of the run.
+            metadata (Optional[Dict[str, Any]]): Run metadata, including `langgraph_node`.
+            **kwargs (Any): Additional callback arguments, including the run `name`.
+        """
+        node_name = (metadata or {}).get("langgraph_node")
+        if node_name and kwargs.get("name") == node_name:
+            with self._lock:
+                self._started[run_id] = (node_name, perf_counter())
+
+    def _finish(self, run_id: UUID, failed: bool) -> None:
+        """
+        Record the wall time of a finished node run.
+
+        Args:
+            run_id (UUID): ID of the run.
+            failed (bool): Whether the run raised.
+        """
+        with self._lock:
+            started = self._started.pop(run_id, None)
+            if started is None:
+                return
+            node_name, start = started
+            self.latencies.setdefault(node_name, []).append(perf_counter() - start)
+            if failed:
+                self.errors[node_name] = self.errors.get(node_name, 0) + 1
+
+    def on_chain_end(self, outputs: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        """
+        Stop timing a node run.
+
+        Args:
+            outputs (Any): The run outputs.
+            run_id (UUID): ID of the run.
+            **kwargs (Any): Additional callback arguments.
+        """
+        self._finish(run_id=run_id, failed=False)
+
+    def on_chain_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        """
+        Stop timing a failed node run.
+
+        Args:
+            error (BaseException): The raised error.
+            run_id (UUID): ID of the run.
+            **kwargs (Any): Additional callback arguments.
+        """
+        self._finish(run_id=run_id, failed=True)
+
+
+_node_latency_recorder: ContextVar[Optional[NodeLatencyRecorder]] = ContextVar("node_latency_recorder", default=None)
+register_configure_hook(_node_latency_recorder, inheritable=True)
+
+
+async def run_load(
+    orchestrator: AgenticScratchOrchestrator, runs: int, concurrency: int, user_input: str
+) -> Tuple[List[float], int, float, Dict[str, int]]:
+    """
+    Run the orchestrator on `runs` fresh threads, at most `concurrency` at a time.
+
+    Args:
+        orchestrator (AgenticScratchOrchestrator): The orchestrator to drive.
+        runs (int): Total graph runs.
+        concurrency (int): Graph runs in flight at once.
+        user_input (str): The user input of every run.
+
+    Returns:
+        Tuple[List[float], int, float, Dict[str, int]]: End-to-end latency of each successful run, the number of failed runs, the total
+            wall time and the number of successful runs per stop reason.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    run_latencies: List[float] = []
+    failures = 0
+    stop_reasons: Dict[str, int] = {}
+
+    async def run_one() -> None:
+        nonlocal failures
+        async with semaphore:
+            graph_inputs = GraphInputModel(
+                graph_state=AgenticScratchState(user_input=user_input),
+                thread_id=str(guid_to_str(new_guid())),
+            )
+            start = perf_counter()
+            try:
+                result, _ = await orchestrator.arun(inputs=graph_inputs)
+            except Exception as error:
+                failures += 1
+                print(f"Run failed: {error!r}")
+                return
+            run_latencies.append(perf_counter() - start)
+            stop_reason = result.graph_state.stop_reason
+            stop_reason_name = stop_reason.value if stop_reason else "none"
+            stop_reasons[stop_reason_name] = stop_reasons.get(stop_reason_name, 0) + 1
+
+    start = perf_counter()
+    await asyncio.gather(*(run_one() for _ in range(runs)))
+    return run_latencies, failures, perf_counter() - start, stop_reasons
+
+
+def _latency_row(name: str, samples: List[float], errors: int = 0) -> Dict[str, Any]:
+    """
+    Summarize latency samples in milliseconds.
+
+    Args:
+        name (str): Name of the node or "run".
+        samples (List[float]): Latencies in seconds.
+        errors (int): Failed executions.
+
+    Returns:
+        Dict[str, Any]: Count, errors and p50/p95/p99/max in milliseconds.
+    """
+    return {
+        "name": name,
+        "count": len(samples),
+        "errors": errors,
+        "p50_ms": percentile(samples, 0.50) * 1000,
+        "p95_ms": percentile(samples, 0.95) * 1000,
+        "p99_ms": percentile(samples, 0.99) * 1000,
+        "max_ms": max(samples, default=0.0) * 1000,
+    }
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    """
+    Build the offline orchestrator, drive the load and print the report.
+
+    Args:
+        args (argparse.Namespace): The parsed command-line arguments.
+    """
+    user_session_info = create_test_user_session()
+
+    provider = FakeLLMProvider(
+        script=FakeLLMScript.search_then_process(
+            search_turns=args.search_turns, searches_per_turn=args.searches_per_turn, repeat_queries=args.repeat_queries
+        ),
+        latency=LatencyDistribution(kind=args.latency_kind, mean=args.latency_mean, low=args.latency_low, high=args.latency_high, sigma=args.latency_sigma),
+        seed=args.seed,
+    )
+    node_instrumentation = NodeInstrumentation(trace_allocations=args.trace_allocations) if args.metrics else None
+    speculative_prefetcher = SpeculativePrefetcher(max_prefetches_per_run=args.max_prefetches) if args.max_prefetches else None
+    loop_controller = None
+    if args.max_turns is not None or args.max_tokens is not None or args.stall_turns is not None:
+        loop_controller = LoopController(
+            max_turns=args.max_turns, max_tokens=args.max_tokens, stall_turns=args.stall_turns or 0, min_novelty=args.min_novelty
+        )
+    orchestrator = AgenticScratchOrchestrator(
+        checkpointer=InMemorySaver(),
+        user_session_info=user_session_info,
+        callbacks=[],
+        llm_caller_cache=LLMCallerCache(user_session_info=user_session_info, caller_factory=provider.create_caller),
+        artifact_store=InMemoryArtifactStore(),
+        node_instrumentation=node_instrumentation,
+        loop_controller=loop_controller,
+        speculative_prefetcher=speculative_prefetcher,
+    )
+
+    recorder = NodeLatencyRecorder()
+    token = _node_latency_recorder.set(recorder)
+    try:
+        if args.warmup:
+            await run_load(orchestrator=orchestrator, runs=args.warmup, concurrency=args.concurrency, user_input=args.user_input)
+            recorder.latencies.clear()
+            recorder.errors.clear()
+            if node_instrumentation:
+                node_instrumentation.registry.clear()
+            if speculative_prefetcher:
+                speculative_prefetcher.reset_stats()
+        run_latencies, failures, wall_time, stop_reasons = await run_load(
+            orchestrator=orchestrator, runs=args.runs, concurrency=args.concurrency, user_input=args.user_input
+        )
+    finally:
+        _node_latency_recorder.reset(token)
+        if node_instrumentation:
+            node_instrumentation.close()
+
+    rows = [_latency_row(name=node_name, samples=samples, errors=recorder.errors.get(node_name, 0)) for node_name, samples in recorder.latencies.items()]
+    rows.append(_latency_row(name="run", samples=run_latencies, errors=failures))
+    throughput = len(run_latencies) / wall_time if wall_time else 0.0
+
+    if args.json:
+        report = {"runs": args.runs, "concurrency": args.concurrency, "throughput_rps": throughput, "latency": rows, "stop_reasons": stop_reasons}
+        if args.metrics:
+            report["metrics"] = node_instrumentation.registry.to_json()
+        if speculative_prefetcher:
+            prefetch_stats = speculative_prefetcher.stats
+            report["prefetch"] = {**prefetch_stats.model_dump(), "hit_rate": prefetch_stats.hit_rate, "waste_rate": prefetch_stats.waste_rate}
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f"{args.runs} runs, concurrency {args.concurrency}: {throughput:.1f} runs/s, {failures} failed, {provider.calls} LLM calls")
+    print(f"Stop reasons: {', '.join(f'{name}={count}' for name, count in sorted(stop_reasons.items()))}")
+    if speculative_prefetcher:
+        prefetch_stats = speculative_prefetcher.stats
+        print(
+            f"Prefetch: started={prefetch_stats.started} hits={prefetch_stats.hits} misses={prefetch_stats.misses} "
+            f"wasted={prefetch_stats.wasted} skipped={prefetch_stats.skipped} hit_rate={prefetch_stats.hit_rate:.1%} "
+            f"waste_rate={prefetch_stats.waste_rate:.1%}"
+        )
+    print(f"{'node':<18} {'count':>7} {'errors':>7} {'p50':>10} {'p95':>10} {'p99':>10} {'max':>10}")
+    for row in rows:
+        print(
+            f"{row['name']:<18} {row['count']:>7} {row['errors']:>7} {row['p50_ms']:>8.2f}ms "
+            f"{row['p95_ms']:>8.2f}ms {row['p99_ms']:>8.2f}ms {row['max_ms']:>8.2f}ms"
+        )
+
+    if args.metrics == "prometheus":
+        print(node_instrumentation.registry.to_prometheus())
+    elif args.metrics == "json":
+        print(json.dumps(node_instrumentation.registry.to_json(), indent=2))
+
+
+def main() -> None:
+    """
+    Parse arguments and run the load test.
+    """
+    parser = argparse.ArgumentParser(description="Load test the agentic scratch graph offline with a fake LLM.")
+    parser.add_argument("--runs", type=int, default=200, help="Total graph runs.")
+    parser.add_argument("--concurrency", type=int, default=20, help="Graph runs (threads) in flight at once.")
+    parser.add_argument("--warmup", type=int, default=5, help="Runs before measuring.")
+    parser.add_argument("--search-turns", type=int, default=2, help="Agent turns that call SearchTool before ProcessTool.")
+    parser.add_argument("--searches-per-turn", type=int, default=3, help="Parallel SearchTool calls per turn.")
+    parser.add_argument("--latency-kind", choices=["constant", "uniform", "lognormal"], default="lognormal", help="Fake LLM latency distribution.")
+    parser.add_argument("--latency-mean", type=float, default=0.05, help="Constant or median latency in seconds.")
+    parser.add_argument("--latency-low", type=float, default=0.01, help="Uniform lower bound in seconds.")
+    parser.add_argument("--latency-high", type=float, default=0.1, help="Uniform upper bound in seconds.")
+    parser.add_argument("--latency-sigma", type=float, default=0.5, help="Lognormal sigma.")
+    parser.add_argument("--repeat-queries", action="store_true", help="Every search turn repeats the same queries, so the results stop being novel.")
+    parser.add_argument("--max-turns", type=int, help="LoopController turn budget, including the forced ProcessTool call.")
+    parser.add_argument("--max-tokens", type=int, help="LoopController token budget.")
+    parser.add_argument("--stall-turns", type=int, help="LoopController stalled turns before ProcessTool is forced.")
+    parser.add_argument("--min-novelty", type=float, default=0.2, help="LoopController novelty below which a turn counts as stalled.")
+    parser.add_argument("--max-prefetches", type=int, default=0, help="Attach a SpeculativePrefetcher with this per-run budget.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the latency generator.")
+    parser.add_argument("--user-input", default="Search for information about Python programming and then summarize what you found")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON.")
+    parser.add_argument("--metrics", choices=["prometheus", "json"], help="Attach NodeInstrumentation and export its metrics in this format.")
+    parser.add_argument("--trace-allocations", action="store_true", help="Record tracemalloc peaks per node (slower).")
+    args = parser.parse_args()
+
+    asyncio.run(main_async(args=args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""
+==============================================================================
+Name: loop_controller
+Author: AI Assistant
+Date: 10/17/2026
+Description: Budgets and novelty tracking that decide when the agentic loop
+must stop searching and complete the task with ProcessTool.
+==============================================================================
+"""
+
+import hashlib
+import re
+from typing import Dict, List, Optional, Sequence
+
+from langchain_core.messages import AIMessage, AnyMessage, HumanMessage, ToolMessage
+from pydantic import BaseModel, ConfigDict, Field
+
+from .state import LoopProgress, StopReason
+
+# Rough characters per token, used when the provider reports no usage
+CHARS_PER_TOKEN = 4
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def result_item_hashes(tool_results: Sequence[ToolMessage]) -> List[str]:
+    """
+    Hash every item of the tool results: each non-empty line of their content, whitespace and case normalized.
+
+    Line-level hashes let a result set that overlaps an earlier one count as partly novel instead of all or nothing.
+
+    Args:
+        tool_results (Sequence[ToolMessage]): The tool results of one turn.
+
+    Returns:
+        List[str]: The item hashes, in order, with duplicates.
+    """
+    hashes = []
+    for tool_message in tool_results:
+        content = tool_message.content if isinstance(tool_message.content, str) else str(tool_message.content)
+        for line in content.splitlines():
+            item = _WHITESPACE.sub(" ", line).strip().lower()
+            if item:
+                hashes.append(hashlib.blake2b(item.encode("utf-8"), digest_size=8).hexdigest())
+    return hashes
+
+
+def estimate_tokens(inputs: Sequence[AnyMessage], response: AIMessage) -> int:
+    """
+    Tokens spent on one LLM call: the provider's usage metadata if reported, otherwise estimated from message length.
+
+    Args:
+        inputs (Sequence[AnyMessage]): The messages sent.
+        response (AIMessage): The response.
+
+    Returns:
+        int: The tokens spent.
+    """
+    usage = getattr(response, "usage_metadata", None)
+    if usage and usage.get("total_tokens"):
+        return int(usage["total_tokens"])
+
+    characters = sum(len(str(message.content)) for message in [*inputs, response])
+    characters += sum(len(str(tool_call.get("args", ""))) for tool_call in getattr(response, "tool_calls", None) or [])
+    return characters // CHARS_PER_TOKEN
+
+
+class LoopController(BaseModel):
+    """
+    Decides, before each LLM call of the agentic loop, whether the agent may keep using tools.
+
+    After every tool turn it measures the novelty of the results: the fraction of result items whose hash was not seen
+    in one of the last `max_seen_hashes` items of earlier turns. A turn below `min_novelty` counts as stalled. The loop is forced onto the ProcessTool path
+    once `stall_turns` consecutive turns stalled, or before the call that would exceed the turn or token budget. The
+    budgets are checked before each call, so the forced call itself may overshoot `max_tokens` by one call.
+
+    The controller is immutable configuration; progress lives in the graph state, so one controller is shared by every
+    run of the compiled graph.
+
+    Attributes:
+        max_turns (Optional[int]): LLM calls per run, including the forced final call. Unbounded if None.
+        max_tokens (Optional[int]): Tokens per run before the final call is forced. Unbounded if None.
+        min_novelty (float): Novelty below which a tool turn counts as stalled.
+        stall_turns (int): Consecutive stalled turns that force the final call. Never forced on stalls if 0.
+        max_seen_hashes (int): Most recent distinct result item hashes kept in the progress, which is checkpointed every
+            step. Items seen only before the window count as novel again.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    max_turns: Optional[int] = Field(default=None, ge=1)
+    max_tokens: Optional[int] = Field(default=None, ge=1)
+    min_novelty: float = Field(default=0.2, ge=0.0, le=1.0)
+    stall_turns: int = Field(default=2, ge=0)
+    max_seen_hashes: int = Field(default=2048, ge=1)
+
+    def observe(self, progress: LoopProgress, tool_results: Sequence[ToolMessage]) -> LoopProgress:
+        """
+        Record the novelty of the tool results the agent is about to see.
+
+        Args:
+            progress (LoopProgress): The progress so far.
+            tool_results (Sequence[ToolMessage]): The tool results of the previous turn.
+
+        Returns:
+            LoopProgress: The updated progress. The input is not modified.
+        """
+        if not tool_results:
+            return progress
+
+        hashes = result_item_hashes(tool_results=tool_results)
+        seen = set(progress.seen_result_hashes)
+        new_hashes = list(dict.fromkeys(item for item in hashes if item not in seen))
+        novelty = len([item for item in hashes if item not in seen]) / len(hashes) if hashes else 0.0
+
+        return progress.model_copy(
+            update={
+                "seen_result_hashes": [*progress.seen_result_hashes, *new_hashes][-self.max_seen_hashes :],
+                "last_novelty": novelty,
+                "stalled_turns": progress.stalled_turns + 1 if novelty < self.min_novelty else 0,
+            }
+        )
+
+    def stop_reason(self, progress: LoopProgress) -> Optional[StopReason]:
+        """
+        Decide whether the next LLM call must be the final, ProcessTool-only call.
+
+        Args:
+            progress (LoopProgress): The progress so far, including the latest observed tool results.
+
+        Returns:
+            Optional[StopReason]: Why the loop must stop, or None if the agent may keep using tools.
+        """
+        if self.max_turns is not None and progress.turns + 1 >= self.max_turns:
+            return StopReason.TURN_BUDGET
+        if self.max_tokens is not None and progress.tokens_used >= self.max_tokens:
+            return StopReason.TOKEN_BUDGET
+        if self.stall_turns and progress.stalled_turns >= self.stall_turns:
+            return StopReason.STALLED
+        return None
+
+    @staticmethod
+    def record_call(progress: LoopProgress, inputs: Sequence[AnyMessage], response: AIMessage) -> LoopProgress:
+        """
+        Count an LLM call against the budgets.
+
+        Args:
+            progress (LoopProgress): The progress so far.
+            inputs (Sequence[AnyMessage]): The messages sent.
+            response (AIMessage): The response.
+
+        Returns:
+            LoopProgress: The updated progress. The input is not modified.
+        """
+        return progress.model_copy(
+            update={"turns": progress.turns + 1, "tokens_used": progress.tokens_used + estimate_tokens(inputs=inputs, response=response)}
+        )
+
+    @staticmethod
+    def final_call_instruction(stop_reason: StopReason, progress: LoopProgress) -> HumanMessage:
+        """
+        Build the message that tells the agent to complete the task now.
+
+        Args:
+            stop_reason (StopReason): Why the loop must stop.
+            progress (LoopProgress): The progress so far.
+
+        Returns:
+            HumanMessage: The instruction appended before the final call.
+        """
+        reasons: Dict[StopReason, str] = {
+            StopReason.TURN_BUDGET: f"the turn budget is used up after {progress.turns} turns",
+            StopReason.TOKEN_BUDGET: f"the token budget is used up after {progress.tokens_used} tokens",
+            StopReason.STALLED: f"the last {progress.stalled_turns} searches returned almost nothing new",
+        }
+        return HumanMessage(
+            content=f"Stop gathering information: {reasons[stop_reason]}. Call ProcessTool now with a summary of what you have found."
+        )
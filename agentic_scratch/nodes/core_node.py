@@ -7,51 +7,98 @@ Description: Core agentic loop node for the agentic scratch orchestrator.
 ==============================================================================
 """
 
-# Local imports
-import sys
-from pathlib import Path
-from typing import Any, Dict, List, Optional
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
 
-import httpx
 from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.messages import AIMessage, AnyMessage
 
-from wernicke.engines.llm.llm_callers.callers import LLMCallerAgent
 from wernicke.engines.llm.llm_callers.config import UserSessionInfo
 from wernicke.engines.llm.llm_callers.models import ActionType, ResponseMode
 from wernicke.engines.llm.llm_orchestrators.graph_llm_orchestrators.node_types.base import INode
 from wernicke.shared.decorators.wernicke_langsmith_tracing import wernicke_ls_traceable
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-from callers.agentic_scratch_caller import AgenticScratchCallerConfig
-from state import AgenticScratchState
-from tools.process_tool import ProcessTool
-from tools.search_tool import SearchTool
+from ..callers.agentic_scratch_caller import AgenticScratchCallerConfig
+from ..callers.caller_cache import LLMCallerCache
+from ..loop_controller import LoopController
+from ..run_context import get_run_context
+from ..state import AgenticScratchState, StopReason
+from ..tool_dispatcher import ToolCallDispatcher
+from ..tools.process_tool import ProcessTool
+from ..tools.registry import tool_registry
+
+if TYPE_CHECKING:
+    import httpx
+
+    from wernicke.engines.llm.llm_callers.callers import LLMCallerAgent
+
+    from ..prefetch import PrefetchRun
 
 
 class CoreNode(INode):
     """
     Core node that implements the agentic loop.
+
+    Dependencies not given to the constructor are read from the run context, so one node instance can serve every
+    orchestrator sharing a compiled graph.
     """
 
     name = "CoreNode"
 
     def __init__(
         self,
-        user_session_info: UserSessionInfo,
+        user_session_info: Optional[UserSessionInfo] = None,
         callbacks: Optional[List[BaseCallbackHandler]] = None,
-        http_async_client: Optional[httpx.AsyncClient] = None,
+        http_async_client: Optional["httpx.AsyncClient"] = None,
+        llm_caller_cache: Optional[LLMCallerCache] = None,
+        tool_dispatcher: Optional[ToolCallDispatcher] = None,
+        stream: bool = False,
+        loop_controller: Optional[LoopController] = None,
     ):
         """
         Initialize the node.
 
         Args:
-            user_session_info (UserSessionInfo): User session information.
+            user_session_info (Optional[UserSessionInfo]): User session information. A node-owned caller cache is built for it if given
+                without `llm_caller_cache`; otherwise the run context's caller cache is used.
             callbacks (Optional[List[BaseCallbackHandler]]): Callbacks for tracking.
             http_async_client (Optional[httpx.AsyncClient]): HTTP client for API calls.
+            llm_caller_cache (Optional[LLMCallerCache]): Cache of warmed callers. Read from the run context if None.
+            tool_dispatcher (Optional[ToolCallDispatcher]): Dispatcher shared with the tool nodes, used to start tools early when streaming.
+                Read from the run context if None.
+            stream (bool): Stream the LLM response and start each tool as soon as its arguments are complete.
+            loop_controller (Optional[LoopController]): Turn and token budgets and novelty tracking that force the ProcessTool path
+                when they run out or the searches stall. The loop only ends once ProcessTool is called if None.
         """
         self._user_session_info = user_session_info
         self._callbacks = callbacks
         self._http_async_client = http_async_client
+        if llm_caller_cache is None and user_session_info is not None:
+            llm_caller_cache = LLMCallerCache(user_session_info=user_session_info, http_async_client=http_async_client)
+        self._llm_caller_cache = llm_caller_cache
+        self._tool_dispatcher = tool_dispatcher
+        self._stream = stream
+        self._loop_controller = loop_controller
+
+    @property
+    def llm_caller_cache(self) -> LLMCallerCache:
+        """
+        Returns the caller cache of the node, or of the run in progress.
+
+        Returns:
+            LLMCallerCache: The caller cache.
+        """
+        return self._llm_caller_cache or get_run_context().llm_caller_cache
+
+    @property
+    def tool_dispatcher(self) -> ToolCallDispatcher:
+        """
+        Returns the tool dispatcher of the node, or of the run in progress.
+
+        Returns:
+            ToolCallDispatcher: The tool dispatcher.
+        """
+        return self._tool_dispatcher or get_run_context().tool_dispatcher
 
     @wernicke_ls_traceable
     async def execute(self, graph_state: AgenticScratchState) -> Dict[str, Any]:
@@ -64,37 +111,53 @@ class CoreNode(INode):
         Returns:
             Dict[str, Any]: Updated state with tool calls or completion.
         """
-        if not graph_state.conversation:
-            raise ValueError("Conversation is required to execute the CoreNode")
+        if not graph_state.conversation_buffer:
+            raise ValueError("Conversation buffer is required to execute the CoreNode")
 
         # Check exit condition: if ProcessTool was called and we have results, exit
         if graph_state.tool_calls and graph_state.tool_calls[0].content.name == ProcessTool.name and graph_state.tool_results:
-            return {"tool_calls": []}
-
-        conversation = graph_state.conversation
-
-        # Add tool results to conversation if we just ran tools
-        if graph_state.tool_results:
-            conversation = conversation.add_messages(graph_state.tool_results)
-
-        # Set up LLM with tools
-        llm_caller = LLMCallerAgent(
+            return {"tool_calls": [], "stop_reason": graph_state.stop_reason or StopReason.COMPLETED}
+
+        # Tool results from the previous turn are the only new input; the rest of the context is already built
+        tool_results: List[AnyMessage] = list(graph_state.tool_results)
+
+        # Before the first call, start searches predicted from the user input so they run while the model thinks
+        prefetch_run = get_run_context().prefetch_run
+        if prefetch_run is not None and not graph_state.conversation_buffer.messages:
+            prefetch_run.prefetch(text=graph_state.user_input)
+
+        # Measure the new results and decide whether the agent may keep searching
+        loop_progress = graph_state.loop_progress
+        stop_reason = None
+        if self._loop_controller is not None:
+            loop_progress = self._loop_controller.observe(progress=loop_progress, tool_results=tool_results)
+            stop_reason = self._loop_controller.stop_reason(progress=loop_progress)
+            if stop_reason is not None:
+                print(f"\n🛑 Forcing ProcessTool: {stop_reason.value} (novelty {loop_progress.last_novelty}, {loop_progress.tokens_used} tokens)")
+                tool_results.append(LoopController.final_call_instruction(stop_reason=stop_reason, progress=loop_progress))
+                # No more searches will be sent, so nothing will claim speculative work still in flight
+                await self._cancel_pending_tool_work(prefetch_run=prefetch_run)
+
+        # Reuse the warmed LLM caller with the registered tools; a forced final call may only complete the task
+        llm_caller = self.llm_caller_cache.get_caller(
             caller_config=AgenticScratchCallerConfig,
-            user_session_info=self._user_session_info,
-            stream=False,
-            tools=[
-                SearchTool(),
-                ProcessTool(),
-            ],
+            tools=[ProcessTool] if stop_reason is not None else tool_registry.tools,
             response_mode=ResponseMode.TOOL,
-            http_async_client=self._http_async_client,
+            stream=self._stream,
         )
 
         # Call the LLM
-        resp, actions = await llm_caller.arun(inputs=conversation.get_conversation_context())
+        inputs = graph_state.conversation_buffer.get_conversation_context(pending=tool_results)
+        if self._stream:
+            resp, actions = await self._arun_streaming(llm_caller=llm_caller, inputs=inputs)
+        else:
+            resp, actions = await llm_caller.arun(inputs=inputs)
 
-        # Add AI message to conversation
-        updated_conversation = conversation.add_messages([resp])
+        if self._loop_controller is not None:
+            loop_progress = LoopController.record_call(progress=loop_progress, inputs=inputs, response=resp)
+
+        # Only the new tool results (and any stop instruction) and AI message are appended to the buffer
+        new_messages = [*tool_results, resp]
 
         # Print out any reasoning summaries
         reasoning_messages = [action for action in actions if action.action_type == ActionType.REASONING]
@@ -105,17 +168,72 @@ class CoreNode(INode):
         # Extract tool calls
         tool_calls = [action for action in actions if action.action_type == ActionType.TOOL_CALL]
 
+        # Reasoning hints at the next turn's searches; prefetch them while this turn's tools run
+        if prefetch_run is not None and reasoning_messages and stop_reason is None:
+            current_queries = [
+                getattr(tool_call.content.inputs, prefetch_run.query_field, "")
+                for tool_call in tool_calls
+                if tool_call.content.name == prefetch_run.tool_name
+            ]
+            for summary in reasoning_messages:
+                prefetch_run.prefetch(text="\n".join(summary.content), exclude=current_queries)
+
         if tool_calls:
             # Go run tools
             return {
-                "conversation": updated_conversation,
+                "conversation_buffer": new_messages,
                 "tool_calls": tool_calls,
                 "tool_results": {"kind": "rewrite", "value": []},
+                "loop_progress": loop_progress,
+                "stop_reason": stop_reason,
             }
 
         # No tool calls - shouldn't happen in TOOL mode, but handle gracefully
         return {
-            "conversation": updated_conversation,
+            "conversation_buffer": new_messages,
             "tool_calls": [],
             "tool_results": {"kind": "rewrite", "value": []},
+            "loop_progress": loop_progress,
+            "stop_reason": stop_reason or StopReason.NO_TOOL_CALLS,
         }
+
+    async def _cancel_pending_tool_work(self, prefetch_run: Optional["PrefetchRun"]) -> None:
+        """
+        Cancel the run's unclaimed early tool work and prefetches and wait until they have stopped.
+
+        Args:
+            prefetch_run (Optional[PrefetchRun]): The run's prefetches, if prefetching is enabled.
+        """
+        tasks = self.tool_dispatcher.cancel_early()
+        if prefetch_run is not None:
+            tasks.extend(prefetch_run.close())
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _arun_streaming(self, llm_caller: "LLMCallerAgent", inputs: Sequence[AnyMessage]) -> Tuple[AIMessage, List[Any]]:
+        """
+        Run the caller in streaming mode, starting tool nodes' work as soon as each tool call's arguments are complete.
+
+        Args:
+            llm_caller (LLMCallerAgent): The streaming caller.
+            inputs (Sequence[AnyMessage]): The conversation context.
+
+        Returns:
+            Tuple[AIMessage, List[Any]]: The response message and the parsed actions.
+        """
+        # Only streaming runs need the stream parser and callback hook
+        from ..streaming import EarlyToolDispatchHandler, early_tool_dispatch
+
+        tool_dispatcher = self.tool_dispatcher
+        handler = EarlyToolDispatchHandler(tool_dispatcher=tool_dispatcher)
+        try:
+            with early_tool_dispatch(handler=handler):
+                resp, actions = await llm_caller.arun(inputs=inputs)
+        except BaseException:
+            tool_dispatcher.discard_early(early_keys=handler.early_keys)
+            raise
+
+        # Early work for calls that did not make it into the parsed actions would never be claimed
+        tool_calls = [action for action in actions if action.action_type == ActionType.TOOL_CALL]
+        tool_dispatcher.discard_early(early_keys=handler.early_keys, keep=tool_calls)
+        return resp, actions
@@ -7,9 +7,6 @@ Description: Initial node for the agentic scratch orchestrator.
 ==============================================================================
 """
 
-# Local imports
-import sys
-from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from langchain_core.callbacks import BaseCallbackHandler
@@ -19,9 +16,8 @@ from wernicke.engines.llm.llm_callers.factory import conversation_factory
 from wernicke.engines.llm.llm_orchestrators.graph_llm_orchestrators.node_types.base import INode
 from wernicke.shared.decorators.wernicke_langsmith_tracing import wernicke_ls_traceable
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-from callers.agentic_scratch_caller import AgenticScratchCallerConfig
-from state import AgenticScratchState
+from ..callers.agentic_scratch_caller import AgenticScratchCallerConfig
+from ..state import AgenticScratchState, ConversationBuffer
 
 
 class InitialNode(INode):
@@ -33,14 +29,14 @@ class InitialNode(INode):
 
     def __init__(
         self,
-        user_session_info: UserSessionInfo,
+        user_session_info: Optional[UserSessionInfo] = None,
         callbacks: Optional[List[BaseCallbackHandler]] = None,
     ):
         """
         Initialize the node.
 
         Args:
-            user_session_info (UserSessionInfo): User session information.
+            user_session_info (Optional[UserSessionInfo]): User session information. The run context provides it when None.
             callbacks (Optional[List[BaseCallbackHandler]]): Callbacks for tracking.
         """
         self._user_session_info = user_session_info
@@ -55,11 +51,14 @@ class InitialNode(INode):
             graph_state (AgenticScratchState): The current state.
 
         Returns:
-            Dict[str, Any]: Updated state with conversation.
+            Dict[str, Any]: Updated state with conversation and conversation buffer.
         """
         conversation = conversation_factory(
             caller_config=AgenticScratchCallerConfig,
             user_input=graph_state.user_input,
         )
 
-        return {"conversation": conversation}
+        # Render the prompt once; the agentic loop only appends to it from here on
+        conversation_buffer = ConversationBuffer.from_prefix(conversation.get_conversation_context())
+
+        return {"conversation": conversation, "conversation_buffer": conversation_buffer}
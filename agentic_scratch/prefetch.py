@@ -0,0 +1,377 @@
+"""
+==============================================================================
+Name: prefetch
+Author: AI Assistant
+Date: 10/17/2026
+Description: Speculative prefetch of predicted tool calls. Queries predicted
+from the user input and reasoning summaries are started through the tool's
+early-dispatch handler and held in a short-lived per-run store that the tool
+nodes claim from.
+==============================================================================
+"""
+
+import asyncio
+import re
+from abc import ABC, abstractmethod
+from threading import Lock
+from time import monotonic
+from typing import Dict, Hashable, List, Optional, Sequence, Set, Tuple
+
+from pydantic import BaseModel
+
+from .tool_dispatcher import ToolCallDispatcher
+
+# Phrases that introduce a search target, e.g. "search for information about <target>"
+_CUE = re.compile(
+    r"^(?:(?:please|i should|i need to|i will|i'll|let me|let's|we should|now)\s+)*"
+    r"(?:(?:search(?:\s+the\s+web)?(?:\s+for)?|look\s+up|look\s+for|find(?:\s+out)?|research|query|check)\s+)?"
+    r"(?:(?:more\s+)?(?:information|info|details|results|data|documentation)\s+(?:about|on|for|regarding)\s+|(?:about|regarding)\s+)?",
+    re.IGNORECASE,
+)
+# Clause boundaries; a period only ends a sentence before whitespace or the end, so "python 3.13" stays whole
+_SENTENCE_BREAK = re.compile(r"[;:!?\n]+|\.+(?=\s|$)|\bthen\b", re.IGNORECASE)
+# A list item joined by "and" or a comma continues the previous item's list of targets, unless it starts a new action
+_LIST_BREAK = re.compile(r",|\band\b|\bor\b", re.IGNORECASE)
+_ACTION = re.compile(
+    r"^(?:analy[sz]e|answer|combine|compare|compile|create|describe|explain|give|list|make|process|read|report|return|"
+    r"review|summari[sz]e|tell|use|write)\b",
+    re.IGNORECASE,
+)
+_QUOTED = re.compile(r"[\"“]([^\"”]{2,80})[\"”]")
+
+
+class PrefetchStats(BaseModel):
+    """
+    Counters describing prefetch effectiveness.
+
+    Attributes:
+        started (int): Prefetches started.
+        hits (int): Tool calls served by a prefetch.
+        misses (int): Tool calls of the prefetched tool with no matching prefetch.
+        wasted (int): Prefetches never claimed, cancelled when they expired or their run ended.
+        skipped (int): Predicted queries not prefetched because a run's prefetch budget was used up.
+    """
+
+    started: int = 0
+    hits: int = 0
+    misses: int = 0
+    wasted: int = 0
+    skipped: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Returns the fraction of tool calls served by a prefetch.
+
+        Returns:
+            float: The hit rate, or 0.0 if there were no tool calls.
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @property
+    def waste_rate(self) -> float:
+        """
+        Returns the fraction of finished-with prefetches that were never used.
+
+        Returns:
+            float: The waste rate, or 0.0 if no prefetch was claimed or wasted yet.
+        """
+        settled = self.hits + self.wasted
+        return self.wasted / settled if settled else 0.0
+
+
+class IQueryPredictor(ABC):
+    """
+    Interface for predicting the queries the agent is about to search for.
+    """
+
+    @abstractmethod
+    def predict(self, text: str) -> List[str]:
+        """
+        Predict search queries from text the agent is working from.
+
+        Args:
+            text (str): The user input or a reasoning summary.
+
+        Returns:
+            List[str]: The predicted queries, most likely first.
+        """
+
+
+class KeywordQueryPredictor(IQueryPredictor):
+    """
+    Predicts queries from search phrasing: quoted phrases, and the targets of clauses such as "search for X and Y" or
+    "information about X". Clauses without a search cue (e.g. "then summarize what you found" or "and compare them")
+    are ignored.
+    """
+
+    def __init__(self, max_queries: int = 3, max_words: int = 8):
+        """
+        Initialize the predictor.
+
+        Args:
+            max_queries (int): Maximum queries predicted from one text.
+            max_words (int): Longer targets are unlikely to be verbatim queries and are ignored.
+        """
+        self._max_queries = max_queries
+        self._max_words = max_words
+
+    def predict(self, text: str) -> List[str]:
+        """
+        Predict search queries from text the agent is working from.
+
+        Args:
+            text (str): The user input or a reasoning summary.
+
+        Returns:
+            List[str]: The predicted queries, most likely first.
+        """
+        queries = [match.strip() for match in _QUOTED.findall(text)]
+
+        for sentence in _SENTENCE_BREAK.split(text):
+            cued = False
+            for clause in _LIST_BREAK.split(sentence):
+                clause = clause.strip()
+                if not clause:
+                    continue
+                cue = _CUE.match(clause)
+                if cue.end():
+                    cued = True
+                    clause = clause[cue.end() :]
+                elif _ACTION.match(clause):
+                    cued = False
+                if cued and clause and len(clause.split()) <= self._max_words:
+                    queries.append(clause.strip(" \"“”"))
+
+        unique = list(dict.fromkeys(query for query in queries if len(query) > 1))
+        return unique[: self._max_queries]
+
+
+class PrefetchRun:
+    """
+    Prefetches of one graph run: started speculatively by the core node and claimed by the tool nodes.
+
+    Unclaimed prefetches are cancelled once they are older than the prefetcher's TTL and when the run ends, and a run
+    starts at most `max_prefetches_per_run`, which bounds the work a wrong prediction can waste.
+    """
+
+    def __init__(self, prefetcher: "SpeculativePrefetcher", tool_dispatcher: ToolCallDispatcher):
+        """
+        Initialize the run.
+
+        Args:
+            prefetcher (SpeculativePrefetcher): The prefetcher holding the configuration and counters.
+            tool_dispatcher (ToolCallDispatcher): The dispatcher holding the tool's early-dispatch handler.
+        """
+        self._prefetcher = prefetcher
+        self._tool_dispatcher = tool_dispatcher
+        self._pending: Dict[Tuple[str, Hashable], Tuple[asyncio.Task, float]] = {}
+        self._prefetched_keys: Set[Tuple[str, Hashable]] = set()
+
+    @property
+    def tool_name(self) -> str:
+        """
+        Returns the prefetched tool.
+
+        Returns:
+            str: Name of the tool.
+        """
+        return self._prefetcher.tool_name
+
+    @property
+    def query_field(self) -> str:
+        """
+        Returns the tool input holding the query.
+
+        Returns:
+            str: Name of the input field.
+        """
+        return self._prefetcher.query_field
+
+    def prefetch(self, text: str, exclude: Sequence[str] = ()) -> List[str]:
+        """
+        Start prefetches for the queries predicted from the text, within the run's budget.
+
+        Args:
+            text (str): The user input or a reasoning summary.
+            exclude (Sequence[str]): Queries already being run by real tool calls.
+
+        Returns:
+            List[str]: The queries prefetched.
+        """
+        prefetcher = self._prefetcher
+        self._expire()
+
+        excluded = {self._tool_dispatcher.early_key(tool_name=prefetcher.tool_name, inputs={prefetcher.query_field: query}) for query in exclude}
+        started = []
+        skipped = 0
+        for query in prefetcher.predictor.predict(text):
+            inputs = {prefetcher.query_field: query}
+            early_key = self._tool_dispatcher.early_key(tool_name=prefetcher.tool_name, inputs=inputs)
+            if early_key is None or early_key in excluded or early_key in self._prefetched_keys:
+                continue
+            if len(self._prefetched_keys) >= prefetcher.max_prefetches_per_run or len(self._pending) >= prefetcher.max_pending:
+                skipped += 1
+                continue
+
+            task = self._tool_dispatcher.start_early(tool_name=prefetcher.tool_name, inputs=inputs)
+            # A failed speculative search is only reported if a tool node claims it
+            task.add_done_callback(lambda done: done.cancelled() or done.exception())
+            self._pending[early_key] = (task, monotonic())
+            self._prefetched_keys.add(early_key)
+            started.append(query)
+
+        prefetcher.record(started=len(started), skipped=skipped)
+        return started
+
+    def take(self, tool_name: str, key: Hashable) -> Optional[asyncio.Task]:
+        """
+        Claim the prefetch for a tool call.
+
+        Args:
+            tool_name (str): Name of the tool.
+            key (Hashable): The key returned by the tool's early-dispatch `key_fn` for the call inputs.
+
+        Returns:
+            Optional[asyncio.Task]: The in-flight or finished prefetch, or None if there is no usable one.
+        """
+        if tool_name != self._prefetcher.tool_name:
+            return None
+
+        self._expire()
+        entry = self._pending.pop((tool_name, key), None)
+        if entry is not None:
+            task, _ = entry
+            if not task.done() or (not task.cancelled() and task.exception() is None):
+                self._prefetcher.record(hits=1)
+                return task
+            self._prefetcher.record(wasted=1)
+
+        self._prefetcher.record(misses=1)
+        return None
+
+    def close(self) -> List[asyncio.Task]:
+        """
+        Cancel the prefetches no tool node claimed.
+
+        Returns:
+            List[asyncio.Task]: The cancelled prefetches, to await if the caller must know they have stopped.
+        """
+        tasks = [task for task, _ in self._pending.values()]
+        for task in tasks:
+            task.cancel()
+        self._prefetcher.record(wasted=len(tasks))
+        self._pending.clear()
+        return tasks
+
+    def _expire(self) -> None:
+        """
+        Cancel the prefetches older than the TTL.
+        """
+        deadline = monotonic() - self._prefetcher.ttl_seconds
+        expired = [early_key for early_key, (_, started_at) in self._pending.items() if started_at < deadline]
+        for early_key in expired:
+            task, _ = self._pending.pop(early_key)
+            task.cancel()
+        if expired:
+            self._prefetcher.record(wasted=len(expired))
+
+
+class SpeculativePrefetcher:
+    """
+    Starts cheap prefetches of the tool calls the agent is predicted to make, so a matching real call resolves
+    without waiting for the tool.
+
+    Predictions are made from the user input before the first LLM call, and from each response's reasoning summaries
+    while its tool calls run. The prefetch runs through the tool's early-dispatch handler, so it shares the tool's
+    concurrency limit and warms its result cache. One prefetcher serves every run of an orchestrator; its counters
+    aggregate them for tuning the per-run budget and TTL.
+    """
+
+    def __init__(
+        self,
+        predictor: Optional[IQueryPredictor] = None,
+        tool_name: str = "SearchTool",
+        query_field: str = "query",
+        max_prefetches_per_run: int = 3,
+        max_pending: int = 3,
+        ttl_seconds: float = 30.0,
+    ):
+        """
+        Initialize the prefetcher.
+
+        Args:
+            predictor (Optional[IQueryPredictor]): Predicts queries from text. A KeywordQueryPredictor if None.
+            tool_name (str): The tool to prefetch. Its node must register an early-dispatch handler.
+            query_field (str): The tool input holding the query.
+            max_prefetches_per_run (int): Prefetches started per run, claimed or not.
+            max_pending (int): Unclaimed prefetches in flight per run at once.
+            ttl_seconds (float): Seconds an unclaimed prefetch is kept before it is cancelled.
+
+        Raises:
+            ValueError: If a budget is negative or the TTL is not positive.
+        """
+        if max_prefetches_per_run < 0 or max_pending < 0:
+            raise ValueError("Prefetch budgets must be >= 0")
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be > 0")
+
+        self.predictor = predictor or KeywordQueryPredictor()
+        self.tool_name = tool_name
+        self.query_field = query_field
+        self.max_prefetches_per_run = max_prefetches_per_run
+        self.max_pending = max_pending
+        self.ttl_seconds = ttl_seconds
+        self._stats = PrefetchStats()
+        self._lock = Lock()
+
+    def start_run(self, tool_dispatcher: ToolCallDispatcher) -> PrefetchRun:
+        """
+        Create the prefetch store of one graph run.
+
+        Args:
+            tool_dispatcher (ToolCallDispatcher): The dispatcher holding the tool's early-dispatch handler.
+
+        Returns:
+            PrefetchRun: The run's prefetch store. Close it when the run ends.
+        """
+        return PrefetchRun(prefetcher=self, tool_dispatcher=tool_dispatcher)
+
+    def record(self, started: int = 0, hits: int = 0, misses: int = 0, wasted: int = 0, skipped: int = 0) -> None:
+        """
+        Add to the counters.
+
+        Args:
+            started (int): Prefetches started.
+            hits (int): Tool calls served by a prefetch.
+            misses (int): Tool calls with no matching prefetch.
+            wasted (int): Prefetches cancelled unclaimed.
+            skipped (int): Predicted queries over budget.
+        """
+        with self._lock:
+            self._stats = PrefetchStats(
+                started=self._stats.started + started,
+                hits=self._stats.hits + hits,
+                misses=self._stats.misses + misses,
+                wasted=self._stats.wasted + wasted,
+                skipped=self._stats.skipped + skipped,
+            )
+
+    @property
+    def stats(self) -> PrefetchStats:
+        """
+        Returns the counters across every run.
+
+        Returns:
+            PrefetchStats: A snapshot of the counters.
+        """
+        with self._lock:
+            return self._stats.model_copy()
+
+    def reset_stats(self) -> None:
+        """
+        Reset the counters, e.g. after a warmup.
+        """
+        with self._lock:
+            self._stats = PrefetchStats()
@@ -0,0 +1,108 @@
+"""
+==============================================================================
+Name: run_context
+Author: AI Assistant
+Date: 10/17/2026
+Description: Per-run dependencies of the agentic scratch graph, made available
+to the nodes of a shared compiled graph through a context variable.
+==============================================================================
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional
+
+import httpx
+from langchain_core.callbacks import BaseCallbackHandler
+from langgraph.config import get_config
+from pydantic import BaseModel, ConfigDict
+
+from wernicke.internals.session.user_session import UserSessionInfo
+
+from .callers.caller_cache import LLMCallerCache
+from .prefetch import PrefetchRun
+from .tool_dispatcher import ToolCallDispatcher
+from .tools.artifact_store import IArtifactStore
+from .tools.tool_result_cache import IToolResultCache
+
+
+class AgenticScratchRunContext(BaseModel):
+    """
+    Dependencies of a single orchestrator, read by the graph nodes while one of its runs executes.
+
+    The compiled graph is shared by every orchestrator in the process, so nodes hold no per-request state; they look
+    these up with `get_run_context()` instead.
+
+    Attributes:
+        user_session_info (UserSessionInfo): User session information.
+        callbacks (Optional[List[BaseCallbackHandler]]): Callbacks for tracking.
+        http_async_client (Optional[httpx.AsyncClient]): HTTP client for API calls.
+        llm_caller_cache (LLMCallerCache): Cache of warmed LLM callers.
+        tool_dispatcher (ToolCallDispatcher): Dispatcher that coalesces identical tool calls and bounds per-tool concurrency.
+        tool_result_cache (Optional[IToolResultCache]): Result cache for cacheable tool nodes. Caching is disabled if None.
+        artifact_store (Optional[IArtifactStore]): Store for tool artifacts. Inline if None.
+        prefetch_run (Optional[PrefetchRun]): Speculative prefetches of the run in progress. Prefetching is disabled if None.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True)
+
+    user_session_info: UserSessionInfo
+    callbacks: Optional[List[BaseCallbackHandler]] = None
+    http_async_client: Optional[httpx.AsyncClient] = None
+    llm_caller_cache: LLMCallerCache
+    tool_dispatcher: ToolCallDispatcher
+    tool_result_cache: Optional[IToolResultCache] = None
+    artifact_store: Optional[IArtifactStore] = None
+    prefetch_run: Optional[PrefetchRun] = None
+
+
+_run_context: ContextVar[Optional[AgenticScratchRunContext]] = ContextVar("agentic_scratch_run_context", default=None)
+
+
+def get_run_context() -> AgenticScratchRunContext:
+    """
+    Returns the dependencies of the run in progress.
+
+    Returns:
+        AgenticScratchRunContext: The run context.
+
+    Raises:
+        RuntimeError: If called outside of `use_run_context`, e.g. a node executed outside of an orchestrator run.
+    """
+    run_context = _run_context.get()
+    if run_context is None:
+        raise RuntimeError("No agentic scratch run context is set; run the graph through AgenticScratchOrchestrator.arun")
+    return run_context
+
+
+def get_thread_id() -> Optional[str]:
+    """
+    Returns the ID of the thread the graph run in progress belongs to, used to namespace per-thread data.
+
+    Returns:
+        Optional[str]: The thread ID, or None outside of a graph run or if the run has none.
+    """
+    try:
+        config = get_config()
+    except RuntimeError:
+        return None
+    thread_id = (config.get("configurable") or {}).get("thread_id")
+    return str(thread_id) if thread_id is not None else None
+
+
+@contextmanager
+def use_run_context(run_context: AgenticScratchRunContext) -> Iterator[AgenticScratchRunContext]:
+    """
+    Make the run context available to the graph nodes, and to the tasks they start, for the duration of the block.
+
+    Args:
+        run_context (AgenticScratchRunContext): The run context.
+
+    Yields:
+        AgenticScratchRunContext: The run context.
+    """
+    token = _run_context.set(run_context)
+    try:
+        yield run_context
+    finally:
+        _run_context.reset(token)
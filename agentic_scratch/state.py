@@ -7,31 +7,215 @@ Description: State model for the agentic scratch orchestrator.
 ==============================================================================
 """
 
-from typing import Annotated, Any, Dict, List, Optional
+import hashlib
+import itertools
+from enum import Enum
+from typing import Annotated, Any, Dict, Iterator, List, Optional, Sequence, Tuple
 
-from langchain_core.messages import ToolMessage
-from pydantic import Field
+from langchain_core.messages import AnyMessage, ToolMessage
+from pydantic import BaseModel, Field, field_serializer
 
 from wernicke.engines.llm.llm_callers.models import Conversation, ToolCallAction
 from wernicke.engines.llm.llm_orchestrators.graph_llm_orchestrators.models import BaseGraphState
 
+from .channels import ToolResultsChannel, tool_results_reducer
 
-def tool_results_reducer(left: Any, right: Any) -> List[Any]:
+
+class MessageLogView(Sequence[AnyMessage]):
+    """
+    Read-only view of a shared, append-only message log, optionally followed by pending messages.
+
+    Buffers appended from one another share one log: each sees the messages up to its own length, and appending
+    to the newest buffer extends the log in place without changing what older buffers (and their checkpoints)
+    see. Building a view is O(1) and appending is O(new messages), so a run of n turns never copies its history.
+    """
+
+    __slots__ = ("_log", "_start", "_stop", "_pending")
+
+    def __init__(self, log: List[AnyMessage], start: int, stop: int, pending: Sequence[AnyMessage] = ()):
+        """
+        Initialize the view.
+
+        Args:
+            log (List[AnyMessage]): The shared log. Only ever appended to.
+            start (int): Index of the first message of the view in the log.
+            stop (int): Index after the last message of the view in the log.
+            pending (Sequence[AnyMessage]): Messages that follow the log's messages in the view.
+        """
+        self._log = log
+        self._start = start
+        self._stop = stop
+        self._pending = tuple(pending)
+
+    def __len__(self) -> int:
+        return self._stop - self._start + len(self._pending)
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("message index out of range")
+        logged = self._stop - self._start
+        return self._log[self._start + index] if index < logged else self._pending[index - logged]
+
+    def __iter__(self) -> Iterator[AnyMessage]:
+        return itertools.chain(itertools.islice(self._log, self._start, self._stop), self._pending)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, (str, bytes)):
+            return NotImplemented
+        return len(self) == len(other) and all(mine == theirs for mine, theirs in zip(self, other))
+
+    def __repr__(self) -> str:
+        return f"MessageLogView({list(self)!r})"
+
+
+class ConversationBuffer(BaseModel):
+    """
+    Append-only message history for the agentic loop.
+
+    The prompt messages are rendered once into `prefix` and never change during a run, so every LLM call
+    starts with a byte-identical prefix that provider-side prompt caching can reuse. Each turn only appends
+    its new tool results and AI message instead of rebuilding the whole conversation.
+
+    Appended buffers keep the prefix and messages in a log shared with the buffer they were appended from
+    (see MessageLogView), so neither appending nor building the context copies the history.
+
+    Attributes:
+        prefix (List[AnyMessage]): Messages rendered from the caller prompt (system and user messages).
+        messages (Sequence[AnyMessage]): Messages appended by the loop (AI messages and tool results).
+        prefix_key (str): Content hash of the prefix, usable as a prompt-cache key.
+    """
+
+    prefix: List[AnyMessage] = Field(default_factory=list)
+    messages: Sequence[AnyMessage] = Field(default_factory=list)
+    prefix_key: str = ""
+
+    @field_serializer("messages")
+    def _serialize_messages(self, messages: Sequence[AnyMessage]) -> List[AnyMessage]:
+        return list(messages)
+
+    @classmethod
+    def from_prefix(cls, prefix: Sequence[AnyMessage]) -> "ConversationBuffer":
+        """
+        Create a buffer from the rendered prompt messages.
+
+        Args:
+            prefix (Sequence[AnyMessage]): The rendered prompt messages.
+
+        Returns:
+            ConversationBuffer: A buffer with no loop messages yet.
+        """
+        digest = hashlib.sha256()
+        for message in prefix:
+            digest.update(message.type.encode())
+            digest.update(str(message.content).encode())
+        return cls(prefix=list(prefix), prefix_key=digest.hexdigest())
+
+    def _log(self) -> Tuple[List[AnyMessage], int]:
+        """
+        Return the log holding the prefix followed by the messages, and the buffer's length in it.
+
+        A buffer that does not share a log yet (a new or deserialized one) gets one, built once.
+
+        Returns:
+            Tuple[List[AnyMessage], int]: The log and the index after the buffer's last message.
+        """
+        messages = self.messages
+        if isinstance(messages, MessageLogView) and messages._start == len(self.prefix) and not messages._pending:
+            return messages._log, messages._stop
+        log = [*self.prefix, *messages]
+        self.messages = MessageLogView(log=log, start=len(self.prefix), stop=len(log))
+        return log, len(log)
+
+    def append(self, messages: Sequence[AnyMessage]) -> "ConversationBuffer":
+        """
+        Return a buffer with the messages appended.
+
+        The existing buffer is left untouched because a checkpoint of it may still be being written. If it is
+        the newest buffer of its log, the log is extended in place, which the existing buffer does not see;
+        appending to an older buffer (e.g. one restored from an earlier checkpoint) forks a new log.
+
+        Args:
+            messages (Sequence[AnyMessage]): The new messages.
+
+        Returns:
+            ConversationBuffer: The buffer with the messages appended.
+        """
+        log, stop = self._log()
+        if len(log) != stop:
+            log = log[:stop]
+        log.extend(messages)
+        view = MessageLogView(log=log, start=len(self.prefix), stop=len(log))
+        return ConversationBuffer.model_construct(prefix=self.prefix, messages=view, prefix_key=self.prefix_key)
+
+    def get_conversation_context(self, pending: Optional[Sequence[AnyMessage]] = None) -> Sequence[AnyMessage]:
+        """
+        Return the messages to send to the LLM.
+
+        Args:
+            pending (Optional[Sequence[AnyMessage]]): Messages not yet appended to the buffer that should follow the context.
+
+        Returns:
+            Sequence[AnyMessage]: A read-only view of the prefix, the appended messages and any pending messages.
+        """
+        log, stop = self._log()
+        return MessageLogView(log=log, start=0, stop=stop, pending=pending or ())
+
+
+def conversation_buffer_reducer(left: Optional[ConversationBuffer], right: Any) -> Optional[ConversationBuffer]:
     """
-    Reducer for combining tool results from parallel tool execution.
+    Reducer for the append-only conversation buffer.
 
     Args:
-        left (Any): The existing list of tool results.
-        right (Any): Either a list of new tool results to append, or a dict with
-                     {"kind": "rewrite", "value": [...]} to replace the entire list.
+        left (Optional[ConversationBuffer]): The existing buffer.
+        right (Any): Either a ConversationBuffer that replaces the existing one, or a list of new messages to append.
 
     Returns:
-        List[Any]: The combined or rewritten list of tool results.
+        Optional[ConversationBuffer]: The replaced or appended buffer.
+
+    Raises:
+        ValueError: If messages are appended before a buffer exists.
     """
-    left = left or []
-    if isinstance(right, dict) and right.get("kind") == "rewrite":
-        return right["value"]
-    return left + right
+    if right is None or isinstance(right, ConversationBuffer):
+        return right
+    if left is None:
+        raise ValueError("Cannot append messages before the conversation buffer is initialized")
+    return left.append(right)
+
+
+class StopReason(str, Enum):
+    """
+    Why the agentic loop stopped.
+    """
+
+    COMPLETED = "completed"
+    NO_TOOL_CALLS = "no_tool_calls"
+    TURN_BUDGET = "turn_budget"
+    TOKEN_BUDGET = "token_budget"
+    STALLED = "stalled"
+
+
+class LoopProgress(BaseModel):
+    """
+    Progress of the agentic loop, tracked by the LoopController across turns.
+
+    Attributes:
+        turns (int): LLM calls made so far.
+        tokens_used (int): Tokens spent on those calls, from the provider's usage metadata or estimated.
+        seen_result_hashes (List[str]): Hashes of the most recent distinct tool result items, oldest first, bounded by the
+            controller's `max_seen_hashes`.
+        last_novelty (Optional[float]): Fraction of the last turn's tool result items not seen before.
+        stalled_turns (int): Consecutive turns whose tool results were below the novelty threshold.
+    """
+
+    turns: int = 0
+    tokens_used: int = 0
+    seen_result_hashes: List[str] = Field(default_factory=list)
+    last_novelty: Optional[float] = None
+    stalled_turns: int = 0
 
 
 class AgenticScratchState(BaseGraphState):
@@ -40,16 +224,23 @@ class AgenticScratchState(BaseGraphState):
 
     Attributes:
         user_input (str): The user's input query.
-        conversation (Optional[Conversation]): The conversation state of the agentic loop.
+        conversation (Optional[Conversation]): The conversation rendered from the caller prompt.
+        conversation_buffer (Annotated[Optional[ConversationBuffer], conversation_buffer_reducer]): The append-only message
+            history of the agentic loop.
         tool_calls (List[ToolCallAction]): The tool calls made by the agent.
-        tool_results (Annotated[List[ToolMessage], tool_results_reducer]): The tool results.
+        tool_results (Annotated[List[ToolMessage], ToolResultsChannel]): The tool results, merged once per superstep.
         task_data (Dict[str, Any]): Dictionary to store any task-specific data.
         final_output (Optional[str]): The final output to return to the user.
+        loop_progress (LoopProgress): Turn, token and novelty tracking of the agentic loop.
+        stop_reason (Optional[StopReason]): Why the loop stopped, set once it has.
     """
 
     user_input: str
     conversation: Optional[Conversation] = None
+    conversation_buffer: Annotated[Optional[ConversationBuffer], conversation_buffer_reducer] = None
     tool_calls: List[ToolCallAction] = Field(default_factory=list)
-    tool_results: Annotated[List[ToolMessage], tool_results_reducer] = Field(default_factory=list)
+    tool_results: Annotated[List[ToolMessage], ToolResultsChannel(list, tool_results_reducer)] = Field(default_factory=list)
     task_data: Dict[str, Any] = Field(default_factory=dict)
     final_output: Optional[str] = None
+    loop_progress: LoopProgress = Field(default_factory=LoopProgress)
+    stop_reason: Optional[StopReason] = None
@@ -0,0 +1,155 @@
+"""
+==============================================================================
+Name: streaming
+Author: AI Assistant
+Date: 10/17/2026
+Description: Incremental tool-call parsing for streamed LLM responses and the
+callback handler that dispatches tools as soon as their arguments complete.
+==============================================================================
+"""
+
+import json
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from langchain_core.callbacks import AsyncCallbackHandler
+from langchain_core.tracers.context import register_configure_hook
+
+from .tool_dispatcher import ToolCallDispatcher
+
+
+class StreamingToolCallParser:
+    """
+    Assembles streamed tool call chunks and reports each tool call once its arguments are complete.
+
+    Chunks follow the LangChain `tool_call_chunks` format (`index`, `id`, `name`, and a fragment of the JSON `args`).
+    Arguments are complete as soon as the accumulated fragment parses as a JSON object: no proper prefix of a JSON
+    object is itself a valid JSON object, so a tool call is reported while later tool calls are still streaming.
+    """
+
+    def __init__(self):
+        """
+        Initialize the parser.
+        """
+        self._calls: Dict[Any, Dict[str, Any]] = {}
+        self._last_index: Any = None
+
+    def feed(self, tool_call_chunks: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Consume tool call chunks.
+
+        Args:
+            tool_call_chunks (Sequence[Dict[str, Any]]): The chunks of one streamed message chunk.
+
+        Returns:
+            List[Dict[str, Any]]: Tool calls completed by these chunks, as `{"id", "name", "args"}` with parsed args.
+        """
+        completed = []
+        for tool_call_chunk in tool_call_chunks:
+            index = tool_call_chunk.get("index")
+            if index is None:
+                index = tool_call_chunk.get("id") or self._last_index
+            self._last_index = index
+
+            call = self._calls.setdefault(index, {"id": None, "name": "", "args": "", "done": False})
+            if call["done"]:
+                continue
+            call["id"] = call["id"] or tool_call_chunk.get("id")
+            call["name"] += tool_call_chunk.get("name") or ""
+            call["args"] += tool_call_chunk.get("args") or ""
+
+            args = self._parse_args(call["args"])
+            if call["name"] and args is not None:
+                call["done"] = True
+                completed.append({"id": call["id"], "name": call["name"], "args": args})
+        return completed
+
+    @staticmethod
+    def _parse_args(args: str) -> Optional[Dict[str, Any]]:
+        """
+        Parse accumulated tool call arguments.
+
+        Args:
+            args (str): The accumulated JSON fragment.
+
+        Returns:
+            Optional[Dict[str, Any]]: The arguments, or None if they are not complete yet.
+        """
+        if not args.rstrip().endswith("}"):
+            return None
+        try:
+            parsed = json.loads(args)
+        except json.JSONDecodeError:
+            return None
+        return parsed if isinstance(parsed, dict) else None
+
+
+class EarlyToolDispatchHandler(AsyncCallbackHandler):
+    """
+    Callback handler that starts tool work while the LLM is still generating.
+
+    Each streamed chunk's tool call chunks are fed to a StreamingToolCallParser (one per LLM run), and every completed
+    tool call is handed to `ToolCallDispatcher.dispatch_early`.
+    """
+
+    def __init__(self, tool_dispatcher: ToolCallDispatcher):
+        """
+        Initialize the handler.
+
+        Args:
+            tool_dispatcher (ToolCallDispatcher): The dispatcher holding the early-dispatch handlers and in-flight work.
+        """
+        self._tool_dispatcher = tool_dispatcher
+        self._parsers: Dict[UUID, StreamingToolCallParser] = {}
+        self._started_at = perf_counter()
+        self.early_keys: List[Tuple[str, Hashable]] = []
+        self.first_dispatch_seconds: Optional[float] = None
+
+    async def on_llm_new_token(self, token: Any, *, chunk: Any = None, run_id: UUID, parent_run_id: Optional[UUID] = None, **kwargs: Any) -> None:
+        """
+        Parse the tool call chunks of a streamed token and dispatch completed tool calls.
+
+        Args:
+            token (Any): The streamed token.
+            chunk (Any): The streamed generation chunk.
+            run_id (UUID): ID of the LLM run.
+            parent_run_id (Optional[UUID]): ID of the parent run.
+            **kwargs (Any): Additional callback arguments.
+        """
+        tool_call_chunks = getattr(getattr(chunk, "message", None), "tool_call_chunks", None)
+        if not tool_call_chunks:
+            return
+
+        parser = self._parsers.setdefault(run_id, StreamingToolCallParser())
+        for tool_call in parser.feed(tool_call_chunks=tool_call_chunks):
+            early_key = self._tool_dispatcher.dispatch_early(tool_name=tool_call["name"], inputs=tool_call["args"])
+            if early_key is None:
+                continue
+            self.early_keys.append(early_key)
+            if self.first_dispatch_seconds is None:
+                self.first_dispatch_seconds = perf_counter() - self._started_at
+
+
+_early_tool_dispatch_handler: ContextVar[Optional[EarlyToolDispatchHandler]] = ContextVar("early_tool_dispatch_handler", default=None)
+register_configure_hook(_early_tool_dispatch_handler, inheritable=True)
+
+
+@contextmanager
+def early_tool_dispatch(handler: EarlyToolDispatchHandler) -> Iterator[EarlyToolDispatchHandler]:
+    """
+    Attach the handler to every LangChain run started in this context, including the LLM call inside the caller.
+
+    Args:
+        handler (EarlyToolDispatchHandler): The handler to attach.
+
+    Yields:
+        EarlyToolDispatchHandler: The attached handler.
+    """
+    token = _early_tool_dispatch_handler.set(handler)
+    try:
+        yield handler
+    finally:
+        _early_tool_dispatch_handler.reset(token)
@@ -8,19 +8,10 @@ Description: Test file for the agentic scratch orchestrator.
 """
 
 import asyncio
-import sys
-from pathlib import Path
 
 import httpx
 from langsmith import trace, tracing_context
 
-# Add the source directory to Python path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent / "source"))
-
-# Local imports
-from agentic_scratch_orchestrator import AgenticScratchOrchestrator
-from state import AgenticScratchState
-
 from wernicke.config.env_config.constants import EnvVar
 from wernicke.engines.llm.llm_orchestrators.graph_llm_orchestrators.graph_checkpointers.table_storage_checkpointer import (
     AzureTableStorageCheckpointer,
@@ -31,6 +22,13 @@ from wernicke.internals.session.user_session import CosmosDatabaseManager
 from wernicke.shared.guid import new_guid
 from wernicke.tests.shared_utils.test_session import create_test_user_session
 
+from .agentic_scratch_orchestrator import AgenticScratchOrchestrator
+from .checkpointers.buffered_checkpointer import FlushPolicy
+from .loop_controller import LoopController
+from .state import AgenticScratchState
+from .tools.artifact_store import InMemoryArtifactStore, load_artifact
+from .tools.tool_result_cache import InMemoryToolResultCache
+
 
 async def run_agentic_scratch_orchestrator():
     """
@@ -45,6 +43,9 @@ async def run_agentic_scratch_orchestrator():
             user_session_info=user_session_info,
         )
 
+        tool_result_cache = InMemoryToolResultCache(max_entries=1024, ttl_seconds=300)
+        artifact_store = InMemoryArtifactStore()
+
         orchestrator = AgenticScratchOrchestrator(
             checkpointer=table_storage_checkpointer,
             user_session_info=user_session_info,
@@ -54,6 +55,10 @@ async def run_agentic_scratch_orchestrator():
                 limits=httpx.Limits(max_connections=200, max_keepalive_connections=20),
                 follow_redirects=True,
             ),
+            tool_result_cache=tool_result_cache,
+            artifact_store=artifact_store,
+            checkpoint_flush_policy=FlushPolicy.END,
+            loop_controller=LoopController(max_turns=8, max_tokens=50000),
         )
 
         graph_state = AgenticScratchState(
@@ -94,6 +99,8 @@ async def run_agentic_scratch_orchestrator():
 
         print(f"\nResponse Type: {response_type}")
         print(f"\nTool Calls Made: {len(result.graph_state.tool_calls)}")
+        loop_progress = result.graph_state.loop_progress
+        print(f"Stop Reason: {result.graph_state.stop_reason} ({loop_progress.turns} turns, {loop_progress.tokens_used} tokens)")
 
         if tracing_enabled:
             print(f"\n🔍 LangSmith Trace ID: {trace_id}")
@@ -104,6 +111,20 @@ async def run_agentic_scratch_orchestrator():
             for i, tool_result in enumerate(result.graph_state.tool_results, 1):
                 print(f"\n--- Tool Result {i} ---")
                 print(tool_result.content)
+                print(f"Artifact: {load_artifact(tool_message=tool_result, artifact_store=artifact_store)}")
+
+        cache_stats = tool_result_cache.stats
+        print(
+            f"\nTool Result Cache: hits={cache_stats.hits} misses={cache_stats.misses} evictions={cache_stats.evictions} "
+            f"expirations={cache_stats.expirations} size={cache_stats.size} hit_rate={cache_stats.hit_rate:.1%}"
+        )
+
+        checkpoint_stats = orchestrator.buffered_checkpointer.stats
+        print(
+            f"Checkpoint Writes: received={checkpoint_stats.buffered_puts + checkpoint_stats.buffered_writes} "
+            f"stored={checkpoint_stats.flushed_puts + checkpoint_stats.flushed_writes} "
+            f"channels={checkpoint_stats.flushed_channels} saved={checkpoint_stats.round_trips_saved}"
+        )
 
         if result.graph_state.final_output:
             print(f"\n" + "=" * 80)
@@ -0,0 +1,48 @@
+"""
+==============================================================================
+Name: test_batch
+Author: AI Assistant
+Date: 10/17/2026
+Description: Tests of batch input parsing, the batch report and the shared
+HTTP client.
+==============================================================================
+"""
+
+import asyncio
+import importlib.util
+
+import pytest
+
+pytest.importorskip("wernicke")
+
+from .batch import BatchReport, create_batch_http_client, read_batch_inputs  # noqa: E402
+
+
+def test_read_batch_inputs_accepts_jsonl_and_plain_lines(tmp_path):
+    path = tmp_path / "inputs.txt"
+    path.write_text('{"id": "a", "user_input": "first"}\n\nsecond\n', encoding="utf-8")
+
+    inputs = list(read_batch_inputs(path))
+
+    assert [(batch_input.id, batch_input.user_input) for batch_input in inputs] == [("a", "first"), (None, "second")]
+
+
+def test_latency_percentile_is_nearest_rank():
+    report = BatchReport(total=4, succeeded=4, wall_seconds=2.0, latencies=[0.4, 0.1, 0.3, 0.2])
+
+    assert report.latency_percentile(0.5) == 0.2
+    assert report.latency_percentile(0.99) == 0.4
+    assert report.throughput == 2.0
+    assert BatchReport().latency_percentile(0.5) == 0.0
+
+
+def test_http2_falls_back_to_http1_without_h2(capsys):
+    async def main():
+        async with create_batch_http_client(concurrency=4, http2=True) as client:
+            return client
+
+    client = asyncio.run(main())
+
+    if importlib.util.find_spec("h2") is None:
+        assert "HTTP/1.1" in capsys.readouterr().err
+    assert client.is_closed
@@ -0,0 +1,80 @@
+"""
+==============================================================================
+Name: test_channels
+Author: AI Assistant
+Date: 10/17/2026
+Description: Tests of the tool results channel applying a superstep in one pass.
+==============================================================================
+"""
+
+from .channels import ToolResultsChannel, tool_results_reducer
+
+
+class _CopyCountingList(list):
+    """List that counts how often it is copied with list(...)."""
+
+    copies = 0
+
+    def __iter__(self):
+        type(self).copies += 1
+        return super().__iter__()
+
+
+def _channel(value=None):
+    channel = ToolResultsChannel(list, tool_results_reducer)
+    if value is not None:
+        channel.value = value
+    return channel
+
+
+def test_appends_in_one_superstep_copy_the_previous_list_once():
+    _CopyCountingList.copies = 0
+    previous = _CopyCountingList(["a"])
+    channel = _channel(previous)
+
+    assert channel.update([["b"], ["c"], ["d", "e"]])
+    assert channel.value == ["a", "b", "c", "d", "e"]
+    assert _CopyCountingList.copies == 1
+
+
+def test_matches_the_reducer_applied_write_by_write():
+    writes = [["b"], {"kind": "rewrite", "value": ["x"]}, ["c"], ["d"]]
+    expected = ["a"]
+    for write in writes:
+        expected = tool_results_reducer(expected, write)
+
+    channel = _channel(["a"])
+    channel.update(writes)
+
+    assert channel.value == expected == ["x", "c", "d"]
+
+
+def test_rewrite_mid_superstep_drops_earlier_appends_and_keeps_later_ones():
+    channel = _channel(["a", "b"])
+
+    channel.update([["c"], {"kind": "rewrite", "value": ("r1", "r2")}, ["d"], ["e"]])
+
+    assert channel.value == ["r1", "r2", "d", "e"]
+
+
+def test_previous_value_is_never_mutated():
+    previous = ["a"]
+    rewrite = ["r"]
+    channel = _channel(previous)
+
+    channel.update([["b"], ["c"]])
+    first = channel.value
+    channel.update([{"kind": "rewrite", "value": rewrite}, ["d"]])
+
+    assert previous == ["a"]
+    assert first == ["a", "b", "c"]
+    assert rewrite == ["r"]
+    assert channel.value is not first and channel.value is not rewrite
+
+
+def test_empty_superstep_leaves_the_channel_unchanged():
+    channel = _channel(["a"])
+    value = channel.value
+
+    assert channel.update([]) is False
+    assert channel.value is value
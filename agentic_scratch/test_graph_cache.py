@@ -0,0 +1,38 @@
+"""
+==============================================================================
+Name: test_graph_cache
+Author: AI Assistant
+Date: 10/17/2026
+Description: Tests of the process-wide compiled graph cache.
+==============================================================================
+"""
+
+from .graph_cache import CompiledGraphCache
+
+
+def test_graphs_are_compiled_once_per_key():
+    cache = CompiledGraphCache()
+    compiled = []
+
+    def compile_fn():
+        compiled.append(object())
+        return compiled[-1]
+
+    first = cache.get_or_compile(key=("Orchestrator", "1"), compile_fn=compile_fn)
+    assert cache.get_or_compile(key=("Orchestrator", "1"), compile_fn=compile_fn) is first
+    cache.get_or_compile(key=("Orchestrator", "2"), compile_fn=compile_fn)
+
+    assert (cache.hits, cache.misses, len(compiled)) == (1, 2, 2)
+    assert cache.cached_keys == [("Orchestrator", "1"), ("Orchestrator", "2")]
+
+    cache.clear()
+    assert (cache.hits, cache.misses, cache.cached_keys) == (0, 0, [])
+
+
+def test_disabled_cache_compiles_every_time():
+    cache = CompiledGraphCache(enabled=False)
+
+    first = cache.get_or_compile(key=("Orchestrator",), compile_fn=object)
+
+    assert cache.get_or_compile(key=("Orchestrator",), compile_fn=object) is not first
+    assert cache.cached_keys == []
@@ -0,0 +1,230 @@
+"""
+==============================================================================
+Name: test_instrumentation
+Author: AI Assistant
+Date: 10/17/2026
+Description: Tests of the node instrumentation histograms, exports and
+per-execution recording.
+==============================================================================
+"""
+
+import asyncio
+import json
+import time
+import tracemalloc
+
+import pytest
+
+from .instrumentation import Histogram, MetricsRegistry, NodeInstrumentation
+
+
+@pytest.fixture
+def no_tracing():
+    was_tracing = tracemalloc.is_tracing()
+    tracemalloc.stop()
+    yield
+    tracemalloc.stop()
+    if was_tracing:
+        tracemalloc.start()
+
+
+def test_histogram_buckets_are_cumulative_with_inclusive_upper_bounds():
+    histogram = Histogram(buckets=[10.0, 1.0, 5.0])
+    for value in (0.5, 1.0, 3.0, 5.0, 7.0, 50.0):
+        histogram.observe(value)
+
+    assert histogram.buckets == (1.0, 5.0, 10.0)
+    assert histogram.cumulative_counts() == [(1.0, 2), (5.0, 4), (10.0, 5), (float("inf"), 6)]
+    assert (histogram.count, histogram.sum) == (6, 66.5)
+
+
+def test_histogram_quantile_interpolates_within_the_bucket():
+    histogram = Histogram(buckets=[1.0, 2.0, 4.0])
+    for value in (0.5, 0.5, 1.5, 1.5, 1.5, 1.5, 3.0, 3.0, 3.0, 3.0):
+        histogram.observe(value)
+
+    assert histogram.quantile(0.1) == pytest.approx(0.5)
+    assert histogram.quantile(0.5) == pytest.approx(1.75)
+    assert histogram.quantile(0.8) == pytest.approx(3.0)
+    assert histogram.quantile(1.0) == pytest.approx(4.0)
+
+
+def test_histogram_quantile_edge_cases():
+    histogram = Histogram(buckets=[1.0, 2.0])
+    assert histogram.quantile(0.5) == 0.0
+
+    histogram.observe(10.0)
+    assert histogram.quantile(0.99) == 2.0
+
+    histogram.reset()
+    assert histogram.count == 0 and histogram.cumulative_counts()[-1] == (float("inf"), 0)
+
+
+def test_registry_reuses_series_and_clear_keeps_them_registered():
+    registry = MetricsRegistry()
+    series = registry.histogram("latency_seconds", "Latency.", [1.0], {"node": "a"})
+    series.observe(0.5)
+
+    assert registry.histogram("latency_seconds", "Latency.", [1.0], {"node": "a"}) is series
+    assert registry.histogram("latency_seconds", "Latency.", [1.0], {"node": "b"}) is not series
+
+    registry.increment("errors_total", "Errors.", {"node": "a"})
+    registry.clear()
+    series.observe(2.0)
+
+    assert series.count == 1
+    assert "errors_total" not in registry.to_json()
+
+
+def test_prometheus_export_format():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("latency_seconds", "Latency.", [0.5, 1.0], {"node": 'Core "A"'})
+    histogram.observe(0.25)
+    histogram.observe(2.0)
+    registry.increment("errors_total", "Errors.", {"node": "a"}, amount=2)
+
+    assert registry.to_prometheus().splitlines() == [
+        "# HELP latency_seconds Latency.",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{node="Core \\"A\\"",le="0.5"} 1',
+        'latency_seconds_bucket{node="Core \\"A\\"",le="1.0"} 1',
+        'latency_seconds_bucket{node="Core \\"A\\"",le="+Inf"} 2',
+        'latency_seconds_sum{node="Core \\"A\\""} 2.25',
+        'latency_seconds_count{node="Core \\"A\\""} 2',
+        "# HELP errors_total Errors.",
+        "# TYPE errors_total counter",
+        'errors_total{node="a"} 2.0',
+    ]
+
+
+def test_json_export_format():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("latency_seconds", "Latency.", [1.0, 2.0], {"node": "a"})
+    for value in (0.5, 1.5):
+        histogram.observe(value)
+    registry.increment("errors_total", "Errors.")
+
+    metrics = json.loads(json.dumps(registry.to_json()))
+
+    assert metrics["latency_seconds"] == {
+        "help": "Latency.",
+        "type": "histogram",
+        "series": [
+            {
+                "labels": {"node": "a"},
+                "count": 2,
+                "sum": 2.0,
+                "p50": 1.0,
+                "p95": pytest.approx(1.9),
+                "p99": pytest.approx(1.98),
+                "buckets": [[1.0, 1], [2.0, 2], ["+Inf", 2]],
+            }
+        ],
+    }
+    assert metrics["errors_total"] == {"help": "Errors.", "type": "counter", "series": [{"labels": {}, "value": 1.0}]}
+
+
+def test_tracemalloc_only_runs_with_allocation_tracking(no_tracing):
+    NodeInstrumentation(measure_state_size=False).close()
+    assert not tracemalloc.is_tracing()
+
+    node_instrumentation = NodeInstrumentation(measure_state_size=False, trace_allocations=True)
+    assert tracemalloc.is_tracing()
+    node_instrumentation.close()
+    assert not tracemalloc.is_tracing()
+
+
+def test_close_leaves_tracing_started_elsewhere_running(no_tracing):
+    tracemalloc.start()
+
+    NodeInstrumentation(measure_state_size=False, trace_allocations=True).close()
+
+    assert tracemalloc.is_tracing()
+
+
+def _series(node_instrumentation, name, node_name):
+    return node_instrumentation.registry.histogram(name, "", [], {"node": node_name})
+
+
+def test_sync_node_records_wall_cpu_and_state_size():
+    node_instrumentation = NodeInstrumentation()
+
+    def execute(graph_state):
+        time.sleep(0.02)
+        return {"seen": len(graph_state["messages"])}
+
+    wrapped = node_instrumentation.wrap(node_name="SyncNode", execute=execute)
+
+    assert wrapped({"messages": ["x" * 1000]}) == {"seen": 1}
+    wall = _series(node_instrumentation, "agentic_node_wall_seconds", "SyncNode")
+    cpu = _series(node_instrumentation, "agentic_node_cpu_seconds", "SyncNode")
+    state = _series(node_instrumentation, "agentic_node_state_bytes", "SyncNode")
+    assert wall.count == cpu.count == state.count == 1
+    assert wall.sum >= 0.02
+    assert cpu.sum < wall.sum
+    assert state.sum > 1000
+    assert _series(node_instrumentation, "agentic_node_allocation_peak_bytes", "SyncNode").count == 0
+
+
+def _burn_cpu(seconds):
+    deadline = time.thread_time() + seconds
+    while time.thread_time() < deadline:
+        pass
+
+
+def test_async_node_is_not_charged_for_other_tasks_on_the_loop():
+    node_instrumentation = NodeInstrumentation(measure_state_size=False)
+
+    async def execute(graph_state):
+        await asyncio.sleep(0.01)
+        return graph_state
+
+    async def neighbour():
+        await asyncio.sleep(0)
+        _burn_cpu(0.05)
+
+    wrapped = node_instrumentation.wrap(node_name="AsyncNode", execute=execute)
+
+    async def main():
+        result, _ = await asyncio.gather(wrapped({"value": 1}), neighbour())
+        return result
+
+    assert asyncio.run(main()) == {"value": 1}
+    wall = _series(node_instrumentation, "agentic_node_wall_seconds", "AsyncNode")
+    cpu = _series(node_instrumentation, "agentic_node_cpu_seconds", "AsyncNode")
+    assert wall.count == cpu.count == 1
+    assert wall.sum >= 0.05
+    assert cpu.sum < 0.025
+    assert _series(node_instrumentation, "agentic_node_state_bytes", "AsyncNode").count == 0
+
+
+def test_async_node_records_allocation_peak_and_errors(no_tracing):
+    node_instrumentation = NodeInstrumentation(measure_state_size=False, trace_allocations=True)
+
+    async def execute(graph_state):
+        buffer = bytearray(1_000_000)
+        await asyncio.sleep(0)
+        raise RuntimeError(len(buffer))
+
+    wrapped = node_instrumentation.wrap(node_name="AsyncNode", execute=execute)
+    try:
+        with pytest.raises(RuntimeError):
+            asyncio.run(wrapped({}))
+    finally:
+        node_instrumentation.close()
+
+    assert _series(node_instrumentation, "agentic_node_allocation_peak_bytes", "AsyncNode").sum >= 1_000_000
+    assert node_instrumentation.registry.to_json()["agentic_node_errors_total"]["series"] == [{"labels": {"node": "AsyncNode"}, "value": 1.0}]
+
+
+def test_instrument_replaces_the_bound_execute():
+    class _Node:
+        name = "PlainNode"
+
+        def execute(self, graph_state):
+            return {"done": True}
+
+    node = NodeInstrumentation(measure_state_size=False).instrument(node=_Node())
+
+    assert node.execute({}) == {"done": True}
+    assert node.execute.__name__ == "execute"
@@ -0,0 +1,63 @@
+"""
+==============================================================================
+Name: test_load_test_agentic_scratch
+Author: AI Assistant
+Date: 10/17/2026
+Description: Tests of the load generator's per-node latency aggregation.
+==============================================================================
+"""
+
+from uuid import uuid4
+
+import pytest
+
+pytest.importorskip("wernicke")
+
+from .load_test_agentic_scratch import NodeLatencyRecorder, _latency_row, percentile  # noqa: E402
+
+
+def test_percentile_is_nearest_rank_on_unordered_samples():
+    samples = [float(value) for value in reversed(range(1, 101))]
+
+    assert percentile(samples, 0.50) == 50.0
+    assert percentile(samples, 0.95) == 95.0
+    assert percentile(samples, 0.99) == 99.0
+    assert percentile(samples, 1.0) == 100.0
+    assert percentile([3.0, 1.0, 2.0], 0.5) == 2.0
+    assert percentile([], 0.5) == 0.0
+
+
+def test_latency_row_reports_milliseconds():
+    samples = [value / 1000 for value in range(1, 21)]
+
+    row = _latency_row(name="CoreNode", samples=samples, errors=1)
+
+    assert row["name"] == "CoreNode"
+    assert (row["count"], row["errors"]) == (20, 1)
+    assert row["p50_ms"] == pytest.approx(10.0)
+    assert row["p95_ms"] == pytest.approx(19.0)
+    assert row["p99_ms"] == pytest.approx(20.0)
+    assert row["max_ms"] == pytest.approx(20.0)
+
+
+def test_recorder_aggregates_node_runs_and_ignores_child_runs(monkeypatch):
+    clock = iter([0.0, 0.010, 1.0, 1.030, 2.0, 2.005])
+    monkeypatch.setattr("agentic_scratch.load_test_agentic_scratch.perf_counter", lambda: next(clock))
+    recorder = NodeLatencyRecorder()
+
+    def run(node_name, name, failed=False):
+        run_id = uuid4()
+        recorder.on_chain_start(None, {}, run_id=run_id, metadata={"langgraph_node": node_name}, name=name)
+        if failed:
+            recorder.on_chain_error(RuntimeError("boom"), run_id=run_id)
+        else:
+            recorder.on_chain_end({}, run_id=run_id)
+
+    run("CoreNode", "CoreNode")
+    run("CoreNode", "ChatModel")
+    run("CoreNode", "CoreNode")
+    run("SearchToolNode", "SearchToolNode", failed=True)
+
+    assert recorder.latencies["CoreNode"] == pytest.approx([0.010, 0.030])
+    assert recorder.latencies["SearchToolNode"] == pytest.approx([0.005])
+    assert recorder.errors == {"SearchToolNode": 1}
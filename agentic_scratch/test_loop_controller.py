@@ -0,0 +1,61 @@
+"""
+==============================================================================
+Name: test_loop_controller
+Author: AI Assistant
+Date: 10/17/2026
+Description: Tests of the loop budgets, novelty tracking and its bounded
+window of seen result hashes.
+==============================================================================
+"""
+
+import pytest
+
+pytest.importorskip("wernicke")
+
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage  # noqa: E402
+
+from .loop_controller import LoopController, result_item_hashes  # noqa: E402
+from .state import LoopProgress, StopReason  # noqa: E402
+
+
+def _results(*lines):
+    return [ToolMessage(content="\n".join(lines), tool_call_id="1")]
+
+
+def test_result_item_hashes_normalize_whitespace_and_case():
+    assert result_item_hashes(_results("Foo  Bar", "", "foo bar")) == result_item_hashes(_results("foo bar")) * 2
+
+
+def test_observe_measures_novelty_and_counts_stalls():
+    controller = LoopController(min_novelty=0.5, stall_turns=2)
+
+    progress = controller.observe(progress=LoopProgress(), tool_results=_results("a", "b"))
+    assert progress.last_novelty == 1.0 and progress.stalled_turns == 0
+
+    progress = controller.observe(progress=progress, tool_results=_results("a", "b", "c"))
+    assert progress.last_novelty == pytest.approx(1 / 3) and progress.stalled_turns == 1
+    assert controller.stop_reason(progress=progress) is None
+
+    progress = controller.observe(progress=progress, tool_results=_results("a"))
+    assert controller.stop_reason(progress=progress) == StopReason.STALLED
+
+
+def test_seen_hashes_are_bounded_to_the_most_recent_items():
+    controller = LoopController(max_seen_hashes=3)
+
+    progress = controller.observe(progress=LoopProgress(), tool_results=_results("a", "b", "c", "d"))
+    assert progress.seen_result_hashes == result_item_hashes(_results("b", "c", "d"))
+
+    # Items that fell out of the window count as novel again
+    progress = controller.observe(progress=progress, tool_results=_results("a", "d"))
+    assert progress.last_novelty == 0.5
+    assert progress.seen_result_hashes == result_item_hashes(_results("c", "d", "a"))
+
+
+def test_budgets_force_the_final_call():
+    progress = LoopController.record_call(progress=LoopProgress(), inputs=[HumanMessage(content="x" * 400)], response=AIMessage(content=""))
+
+    assert progress.turns == 1 and progress.tokens_used == 100
+    assert LoopController(max_turns=2).stop_reason(progress=progress) == StopReason.TURN_BUDGET
+    assert LoopController(max_tokens=100).stop_reason(progress=progress) == StopReason.TOKEN_BUDGET
+    assert LoopController(max_turns=3, max_tokens=101).stop_reason(progress=progress) is None
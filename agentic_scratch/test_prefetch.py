@@ -0,0 +1,74 @@
+"""
+==============================================================================
+Name: test_prefetch
+Author: AI Assistant
+Date: 10/17/2026
+Description: Tests of query prediction and per-run speculative prefetches.
+==============================================================================
+"""
+
+import asyncio
+
+import pytest
+
+from .prefetch import KeywordQueryPredictor, SpeculativePrefetcher
+from .tool_dispatcher import ToolCallDispatcher
+
+
+@pytest.mark.parametrize(
+    "text, queries",
+    [
+        ("Search for python 3.13 release notes and then summarize what you found", ["python 3.13 release notes"]),
+        ("I should search for asyncio and trio, then summarize.", ["asyncio", "trio"]),
+        ("Let me look up the pricing of GPT models and compare the results", ["the pricing of GPT models"]),
+        ("Search for pandas. Then summarize it.", ["pandas"]),
+        ("Summarize what the user asked about", []),
+    ],
+)
+def test_keyword_predictor(text, queries):
+    assert KeywordQueryPredictor().predict(text) == queries
+
+
+def _dispatcher(delay=10):
+    async def search(inputs):
+        await asyncio.sleep(delay)
+        return inputs["query"]
+
+    tool_dispatcher = ToolCallDispatcher()
+    tool_dispatcher.register_early_dispatch(tool_name="SearchTool", key_fn=lambda inputs: inputs["query"], run_fn=search)
+    return tool_dispatcher
+
+
+def test_prefetch_is_claimed_once_and_bounded_per_run():
+    prefetcher = SpeculativePrefetcher(max_prefetches_per_run=2)
+
+    async def main():
+        prefetch_run = prefetcher.start_run(tool_dispatcher=_dispatcher(delay=0))
+        started = prefetch_run.prefetch(text="Search for alpha, beta and gamma")
+        claimed = prefetch_run.take(tool_name="SearchTool", key="alpha")
+        assert prefetch_run.take(tool_name="SearchTool", key="alpha") is None
+        result = await claimed
+        prefetch_run.close()
+        return started, result
+
+    started, result = asyncio.run(main())
+
+    assert started == ["alpha", "beta"] and result == "alpha"
+    stats = prefetcher.stats
+    assert (stats.started, stats.hits, stats.misses, stats.wasted, stats.skipped) == (2, 1, 1, 1, 1)
+
+
+def test_close_cancels_and_returns_unclaimed_prefetches():
+    prefetcher = SpeculativePrefetcher()
+
+    async def main():
+        prefetch_run = prefetcher.start_run(tool_dispatcher=_dispatcher())
+        prefetch_run.prefetch(text="Search for alpha and beta")
+        tasks = prefetch_run.close()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        return tasks
+
+    tasks = asyncio.run(main())
+
+    assert len(tasks) == 2 and all(task.cancelled() for task in tasks)
+    assert prefetcher.stats.wasted == 2
@@ -0,0 +1,64 @@
+"""
+==============================================================================
+Name: test_state
+Author: AI Assistant
+Date: 10/17/2026
+Description: Tests of the append-only conversation buffer.
+==============================================================================
+"""
+
+import pytest
+
+pytest.importorskip("wernicke")
+
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage  # noqa: E402
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer  # noqa: E402
+
+from .state import ConversationBuffer, MessageLogView, conversation_buffer_reducer  # noqa: E402
+
+
+def _contents(messages):
+    return [message.content for message in messages]
+
+
+def test_append_shares_the_log_and_leaves_older_buffers_unchanged():
+    first = ConversationBuffer.from_prefix([HumanMessage(content="prompt")])
+    second = conversation_buffer_reducer(first, [AIMessage(content="a")])
+    third = conversation_buffer_reducer(second, [ToolMessage(content="t", tool_call_id="1"), AIMessage(content="b")])
+
+    assert _contents(first.messages) == []
+    assert _contents(second.messages) == ["a"]
+    assert _contents(third.messages) == ["a", "t", "b"]
+    assert second.messages._log is third.messages._log
+
+
+def test_append_to_an_older_buffer_forks_the_log():
+    first = ConversationBuffer.from_prefix([HumanMessage(content="prompt")])
+    second = first.append([AIMessage(content="a")])
+    third = second.append([AIMessage(content="b")])
+    fork = second.append([AIMessage(content="x")])
+
+    assert _contents(third.messages) == ["a", "b"]
+    assert _contents(fork.messages) == ["a", "x"]
+
+
+def test_context_is_a_view_with_pending_messages():
+    buffer = ConversationBuffer.from_prefix([HumanMessage(content="prompt")]).append([AIMessage(content="a")])
+
+    context = buffer.get_conversation_context(pending=[ToolMessage(content="t", tool_call_id="1")])
+
+    assert isinstance(context, MessageLogView)
+    assert _contents(context) == ["prompt", "a", "t"]
+    assert context[-1].content == "t"
+    assert _contents(context[1:]) == ["a", "t"]
+    assert _contents(buffer.get_conversation_context()) == ["prompt", "a"]
+
+
+def test_buffer_round_trips_through_the_checkpoint_serializer():
+    buffer = ConversationBuffer.from_prefix([HumanMessage(content="prompt")]).append([AIMessage(content="a"), AIMessage(content="b")])
+    serde = JsonPlusSerializer()
+
+    restored = serde.loads_typed(serde.dumps_typed(buffer))
+
+    assert restored == buffer
+    assert _contents(restored.append([AIMessage(content="c")]).messages) == ["a", "b", "c"]
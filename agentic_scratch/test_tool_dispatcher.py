@@ -0,0 +1,138 @@
+"""
+==============================================================================
+Name: test_tool_dispatcher
+Author: AI Assistant
+Date: 10/17/2026
+Description: Tests of tool call coalescing, per-tool concurrency limits and
+run-scoped early dispatch.
+==============================================================================
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from .tool_dispatcher import ToolCallDispatcher
+
+
+def _tool_call(tool_call_id, name, **inputs):
+    return SimpleNamespace(id=tool_call_id, content=SimpleNamespace(name=name, inputs=inputs))
+
+
+def _dispatcher(started=None, delay=0.01):
+    async def search(inputs):
+        if started is not None:
+            started.append(inputs["query"])
+        await asyncio.sleep(delay)
+        return f"results for {inputs['query']}"
+
+    tool_dispatcher = ToolCallDispatcher()
+    tool_dispatcher.register_early_dispatch(tool_name="SearchTool", key_fn=lambda inputs: inputs["query"], run_fn=search)
+    return tool_dispatcher
+
+
+def test_coalesce_groups_identical_calls_in_order():
+    calls = [_tool_call("1", "SearchTool", query="a"), _tool_call("2", "SearchTool", query="b"), _tool_call("3", "SearchTool", query="a")]
+
+    groups = ToolCallDispatcher().coalesce(tool_calls=calls)
+
+    assert [(tool_call.id, duplicates) for tool_call, duplicates in groups] == [("1", ["3"]), ("2", [])]
+
+
+def test_limit_bounds_concurrency_per_tool():
+    tool_dispatcher = ToolCallDispatcher(max_concurrency={"SearchTool": 2})
+    running = peak = 0
+
+    async def work():
+        nonlocal running, peak
+        async with tool_dispatcher.limit(tool_name="SearchTool"):
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    async def main():
+        await asyncio.gather(*(work() for _ in range(6)))
+
+    asyncio.run(main())
+    assert peak == 2
+
+
+def test_concurrency_limits_must_be_positive():
+    with pytest.raises(ValueError):
+        ToolCallDispatcher(max_concurrency={"SearchTool": 0})
+
+
+def test_early_work_is_not_started_outside_a_scope():
+    started = []
+    tool_dispatcher = _dispatcher(started=started)
+
+    async def main():
+        assert tool_dispatcher.dispatch_early(tool_name="SearchTool", inputs={"query": "a"}) is None
+        assert tool_dispatcher.take_early(tool_name="SearchTool", key="a") is None
+
+    asyncio.run(main())
+    assert started == []
+
+
+def test_concurrent_runs_do_not_claim_each_others_work():
+    tool_dispatcher = _dispatcher()
+
+    async def run(query, other_query):
+        with tool_dispatcher.early_dispatch_scope():
+            tool_dispatcher.dispatch_early(tool_name="SearchTool", inputs={"query": query})
+            await asyncio.sleep(0)
+            assert tool_dispatcher.take_early(tool_name="SearchTool", key=other_query) is None
+            task = tool_dispatcher.take_early(tool_name="SearchTool", key=query)
+            return await task
+
+    async def main():
+        return await asyncio.gather(run("a", "b"), run("b", "a"))
+
+    assert asyncio.run(main()) == ["results for a", "results for b"]
+
+
+def test_scope_cancels_unclaimed_work_when_the_run_ends():
+    tool_dispatcher = _dispatcher(delay=10)
+
+    async def main():
+        with tool_dispatcher.early_dispatch_scope():
+            tool_dispatcher.dispatch_early(tool_name="SearchTool", inputs={"query": "a"})
+            task = asyncio.all_tasks() - {asyncio.current_task()}
+        await asyncio.sleep(0)
+        return task.pop()
+
+    assert asyncio.run(main()).cancelled()
+
+
+def test_discard_early_keeps_work_of_parsed_calls():
+    tool_dispatcher = _dispatcher(delay=10)
+
+    async def main():
+        with tool_dispatcher.early_dispatch_scope():
+            keys = [tool_dispatcher.dispatch_early(tool_name="SearchTool", inputs={"query": query}) for query in ("a", "b")]
+            tool_dispatcher.discard_early(early_keys=keys, keep=[_tool_call("1", "SearchTool", query="a")])
+            kept = tool_dispatcher.take_early(tool_name="SearchTool", key="a")
+            assert tool_dispatcher.take_early(tool_name="SearchTool", key="b") is None
+            kept.cancel()
+
+    asyncio.run(main())
+
+
+def test_cancel_early_abandons_all_unclaimed_work_of_the_run():
+    tool_dispatcher = _dispatcher(delay=10)
+
+    async def main():
+        with tool_dispatcher.early_dispatch_scope():
+            for query in ("a", "b"):
+                tool_dispatcher.dispatch_early(tool_name="SearchTool", inputs={"query": query})
+            tasks = tool_dispatcher.cancel_early()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            assert tool_dispatcher.take_early(tool_name="SearchTool", key="a") is None
+        return tasks
+
+    tasks = asyncio.run(main())
+
+    assert len(tasks) == 2 and all(task.cancelled() for task in tasks)
+    assert ToolCallDispatcher().cancel_early() == []
@@ -0,0 +1,326 @@
+"""
+==============================================================================
+Name: tool_dispatcher
+Author: AI Assistant
+Date: 10/17/2026
+Description: Tool-dispatch stage that coalesces identical tool calls, bounds
+per-tool concurrency for the Send fan-out and holds tool work started early
+from a streaming LLM response.
+==============================================================================
+"""
+
+import asyncio
+import json
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from langchain_core.messages import ToolMessage
+
+    from wernicke.engines.llm.llm_callers.models import ToolCallAction
+
+# Early work of the run in progress, keyed by tool name and key. Set by `ToolCallDispatcher.early_dispatch_scope`, so
+# concurrent runs sharing a dispatcher never see, claim or cancel each other's work.
+_early_results: ContextVar[Optional[Dict[Tuple[str, Hashable], asyncio.Task]]] = ContextVar("agentic_scratch_early_results", default=None)
+
+
+class ToolCallDispatcher:
+    """
+    Dispatch stage between the agent and the tool nodes.
+
+    Identical tool calls (same tool name and inputs) within a turn are coalesced so only one tool node runs,
+    and its result is fanned back out to every tool_call_id. Tool nodes acquire a per-tool slot before doing
+    work, which bounds how many run concurrently against a downstream backend.
+
+    Tool nodes can also register an early-dispatch handler. While a streaming LLM response is still generating,
+    `dispatch_early` starts the tool's work as soon as a tool call's arguments are complete, and the tool node that is
+    later sent for that call picks up the in-flight result with `take_early` instead of starting over. Early work is
+    held per run: it is only started inside `early_dispatch_scope`, which cancels whatever was not claimed when the run
+    ends.
+    """
+
+    def __init__(self, max_concurrency: Optional[Dict[str, int]] = None, default_max_concurrency: Optional[int] = None):
+        """
+        Initialize the dispatcher.
+
+        Args:
+            max_concurrency (Optional[Dict[str, int]]): Max concurrent executions keyed by tool name.
+            default_max_concurrency (Optional[int]): Max concurrent executions for tools not in `max_concurrency`. Unbounded if None.
+
+        Raises:
+            ValueError: If any concurrency limit is less than 1.
+        """
+        self._max_concurrency = dict(max_concurrency or {})
+        self._default_max_concurrency = default_max_concurrency
+
+        limits = list(self._max_concurrency.values()) + ([default_max_concurrency] if default_max_concurrency is not None else [])
+        if any(limit < 1 for limit in limits):
+            raise ValueError("Tool concurrency limits must be >= 1")
+
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._early_handlers: Dict[str, Tuple[Callable[[Dict[str, Any]], Hashable], Callable[[Dict[str, Any]], Awaitable[Any]]]] = {}
+
+    @staticmethod
+    def tool_call_key(tool_action: "ToolCallAction") -> Tuple[str, str]:
+        """
+        Build the key that identifies identical tool calls.
+
+        Args:
+            tool_action (ToolCallAction): The tool call action.
+
+        Returns:
+            Tuple[str, str]: The tool name and its canonical JSON inputs.
+        """
+        inputs = tool_action.content.inputs
+        if hasattr(inputs, "model_dump_json"):
+            # Fields serialize in declaration order, so the JSON is canonical among calls of the same tool
+            return tool_action.content.name, inputs.model_dump_json()
+        return tool_action.content.name, json.dumps(inputs, sort_keys=True, default=str)
+
+    def coalesce(self, tool_calls: Sequence["ToolCallAction"]) -> List[Tuple["ToolCallAction", List[str]]]:
+        """
+        Group identical tool calls, keeping the order of first occurrence.
+
+        Args:
+            tool_calls (Sequence[ToolCallAction]): The tool calls made by the agent in one turn.
+
+        Returns:
+            List[Tuple[ToolCallAction, List[str]]]: The tool call to execute and the IDs of the duplicate calls that share its result.
+        """
+        groups: Dict[Tuple[str, str], Tuple["ToolCallAction", List[str]]] = {}
+        for tool_action in tool_calls:
+            key = self.tool_call_key(tool_action=tool_action)
+            if key in groups:
+                groups[key][1].append(tool_action.id)
+            else:
+                groups[key] = (tool_action, [])
+        return list(groups.values())
+
+    def _get_semaphore(self, tool_name: str) -> Optional[asyncio.Semaphore]:
+        """
+        Return the semaphore bounding the given tool, creating it for the running event loop.
+
+        Args:
+            tool_name (str): Name of the tool.
+
+        Returns:
+            Optional[asyncio.Semaphore]: The semaphore, or None if the tool is unbounded.
+        """
+        limit = self._max_concurrency.get(tool_name, self._default_max_concurrency)
+        if limit is None:
+            return None
+
+        # Semaphores are bound to the loop they are first used on, so start fresh for each new loop
+        loop = asyncio.get_running_loop()
+        if loop is not self._semaphore_loop:
+            self._semaphores = {}
+            self._semaphore_loop = loop
+
+        if tool_name not in self._semaphores:
+            self._semaphores[tool_name] = asyncio.Semaphore(limit)
+        return self._semaphores[tool_name]
+
+    @asynccontextmanager
+    async def limit(self, tool_name: str) -> AsyncIterator[None]:
+        """
+        Hold one of the tool's concurrency slots for the duration of the context.
+
+        Args:
+            tool_name (str): Name of the tool.
+
+        Yields:
+            None
+        """
+        semaphore = self._get_semaphore(tool_name=tool_name)
+        if semaphore is None:
+            yield
+            return
+
+        async with semaphore:
+            yield
+
+    @staticmethod
+    def fan_out(tool_message: "ToolMessage", duplicate_tool_call_ids: Sequence[str]) -> List["ToolMessage"]:
+        """
+        Copy a tool result to every coalesced tool call.
+
+        Args:
+            tool_message (ToolMessage): The result of the executed tool call.
+            duplicate_tool_call_ids (Sequence[str]): IDs of the coalesced duplicate calls.
+
+        Returns:
+            List[ToolMessage]: The original result followed by one copy per duplicate call.
+        """
+        return [tool_message] + [tool_message.model_copy(update={"tool_call_id": tool_call_id}) for tool_call_id in duplicate_tool_call_ids]
+
+    def register_early_dispatch(
+        self,
+        tool_name: str,
+        key_fn: Callable[[Dict[str, Any]], Hashable],
+        run_fn: Callable[[Dict[str, Any]], Awaitable[Any]],
+    ) -> None:
+        """
+        Allow a tool's work to start before the LLM response that requested it has finished.
+
+        Args:
+            tool_name (str): Name of the tool.
+            key_fn (Callable[[Dict[str, Any]], Hashable]): Maps tool inputs to the key the tool node looks its result up by.
+            run_fn (Callable[[Dict[str, Any]], Awaitable[Any]]): Runs the tool's work for the given inputs.
+        """
+        self._early_handlers[tool_name] = (key_fn, run_fn)
+
+    def early_key(self, tool_name: str, inputs: Dict[str, Any]) -> Optional[Tuple[str, Hashable]]:
+        """
+        Build the key a tool node looks up early work by.
+
+        Args:
+            tool_name (str): Name of the tool.
+            inputs (Dict[str, Any]): The complete tool call arguments.
+
+        Returns:
+            Optional[Tuple[str, Hashable]]: The tool name and key, or None if the tool registered no early-dispatch handler
+                or the tool node could not have been built from the arguments.
+        """
+        if tool_name not in self._early_handlers:
+            return None
+
+        key_fn, _ = self._early_handlers[tool_name]
+        try:
+            return tool_name, key_fn(inputs)
+        except (KeyError, TypeError):
+            return None
+
+    def start_early(self, tool_name: str, inputs: Dict[str, Any]) -> asyncio.Task:
+        """
+        Start a tool's registered early work in the background without recording it for `take_early`.
+
+        Args:
+            tool_name (str): Name of the tool. Must have an early-dispatch handler.
+            inputs (Dict[str, Any]): The complete tool call arguments.
+
+        Returns:
+            asyncio.Task: The started work.
+        """
+        _, run_fn = self._early_handlers[tool_name]
+        return asyncio.ensure_future(run_fn(inputs))
+
+    @contextmanager
+    def early_dispatch_scope(self) -> Iterator[None]:
+        """
+        Hold the early work of one run for the duration of the block, then cancel the work no tool node claimed.
+
+        Tasks started in the block, such as the graph's node tasks, share the scope; a run started concurrently
+        gets its own.
+
+        Yields:
+            None
+        """
+        early_results: Dict[Tuple[str, Hashable], asyncio.Task] = {}
+        token = _early_results.set(early_results)
+        try:
+            yield
+        finally:
+            _early_results.reset(token)
+            for task in early_results.values():
+                self._abandon(task=task)
+            early_results.clear()
+
+    @staticmethod
+    def _abandon(task: asyncio.Task) -> None:
+        """
+        Cancel unclaimed early work, retrieving the exception of work that already failed so it is not reported.
+
+        Args:
+            task (asyncio.Task): The early work.
+        """
+        if not task.done():
+            task.cancel()
+        elif not task.cancelled():
+            task.exception()
+
+    def dispatch_early(self, tool_name: str, inputs: Dict[str, Any]) -> Optional[Tuple[str, Hashable]]:
+        """
+        Start a tool's work in the background if the tool registered an early-dispatch handler.
+
+        Args:
+            tool_name (str): Name of the tool.
+            inputs (Dict[str, Any]): The complete tool call arguments.
+
+        Returns:
+            Optional[Tuple[str, Hashable]]: The tool name and key of the started work, or None if nothing was started,
+                including outside of `early_dispatch_scope`, where nothing could claim or cancel it.
+        """
+        early_results = _early_results.get()
+        if early_results is None:
+            return None
+
+        # Arguments the tool node could not have been built from are left to the regular dispatch
+        early_key = self.early_key(tool_name=tool_name, inputs=inputs)
+        if early_key is None:
+            return None
+
+        if early_key not in early_results:
+            early_results[early_key] = self.start_early(tool_name=tool_name, inputs=inputs)
+        return early_key
+
+    def take_early(self, tool_name: str, key: Hashable) -> Optional[asyncio.Task]:
+        """
+        Claim the result of work started early for a tool call of the run in progress.
+
+        Args:
+            tool_name (str): Name of the tool.
+            key (Hashable): The key returned by the tool's `key_fn` for the call inputs.
+
+        Returns:
+            Optional[asyncio.Task]: The in-flight or finished work, or None if none was started.
+        """
+        early_results = _early_results.get()
+        if early_results is None:
+            return None
+        return early_results.pop((tool_name, key), None)
+
+    def cancel_early(self) -> List[asyncio.Task]:
+        """
+        Cancel all early work of the run in progress that no tool node claimed, e.g. once the loop is forced to stop.
+
+        Returns:
+            List[asyncio.Task]: The abandoned work, to await before the run goes on.
+        """
+        early_results = _early_results.get()
+        if early_results is None:
+            return []
+
+        tasks = list(early_results.values())
+        early_results.clear()
+        for task in tasks:
+            self._abandon(task=task)
+        return tasks
+
+    def discard_early(self, early_keys: Iterable[Tuple[str, Hashable]], keep: Sequence["ToolCallAction"] = ()) -> None:
+        """
+        Cancel early work of the run in progress that no tool node will claim.
+
+        Args:
+            early_keys (Iterable[Tuple[str, Hashable]]): Keys returned by `dispatch_early`.
+            keep (Sequence[ToolCallAction]): Tool calls that will be sent to tool nodes; their early work is kept.
+        """
+        early_results = _early_results.get()
+        if early_results is None:
+            return
+
+        kept = set()
+        for tool_action in keep:
+            if tool_action.content.name in self._early_handlers:
+                inputs = tool_action.content.inputs
+                inputs_dict = inputs.model_dump(mode="json") if hasattr(inputs, "model_dump") else inputs
+                key_fn, _ = self._early_handlers[tool_action.content.name]
+                kept.add((tool_action.content.name, key_fn(inputs_dict)))
+
+        for early_key in early_keys:
+            if early_key in kept:
+                continue
+            task = early_results.pop(early_key, None)
+            if task is not None:
+                self._abandon(task=task)
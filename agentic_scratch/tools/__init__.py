@@ -1 +1,29 @@
 """Tools for the Agentic Scratch Orchestrator."""
+
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from .registry import ToolRegistry
+
+
+def register_builtin_tools(registry: Optional["ToolRegistry"] = None) -> "ToolRegistry":
+    """
+    Register the built-in tool nodes, in the order they are offered to the LLM. Registering them again is a no-op.
+
+    The node modules are imported here rather than at package import, so light modules such as the result caches can be
+    imported without wernicke.
+
+    Args:
+        registry (Optional[ToolRegistry]): The registry to add the tools to. The process-wide `tool_registry` if None.
+
+    Returns:
+        ToolRegistry: The registry.
+    """
+    from .process_tool_node import ProcessToolNode
+    from .registry import tool_registry
+    from .search_tool_node import SearchToolNode
+
+    registry = tool_registry if registry is None else registry
+    for node_class in (SearchToolNode, ProcessToolNode):
+        registry.register(node_class.tool_registration)
+    return registry
@@ -0,0 +1,284 @@
+"""
+==============================================================================
+Name: artifact_store
+Author: AI Assistant
+Date: 10/17/2026
+Description: Stores for tool message artifacts so graph state only carries
+small references that are resolved on demand.
+==============================================================================
+"""
+
+import hashlib
+import json
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Union
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from langchain_core.messages import ToolMessage
+
+ARTIFACT_REF_KEY = "artifact_ref"
+
+
+class ArtifactRef(BaseModel):
+    """
+    Reference to an artifact held in an artifact store.
+
+    Attributes:
+        artifact_ref (str): Key of the artifact in the store: the tool call ID that produced it, prefixed by its namespace.
+        size_bytes (int): Size of the serialized artifact.
+    """
+
+    artifact_ref: str
+    size_bytes: int
+
+
+class IArtifactStore(ABC):
+    """
+    Interface for artifact stores. Artifacts must be JSON-serializable.
+    """
+
+    @abstractmethod
+    def _write(self, key: str, payload: str) -> None:
+        """
+        Persist a serialized artifact.
+
+        Args:
+            key (str): Key of the artifact.
+            payload (str): The JSON-serialized artifact.
+        """
+
+    @abstractmethod
+    def _read(self, key: str) -> str:
+        """
+        Read a serialized artifact.
+
+        Args:
+            key (str): Key of the artifact.
+
+        Returns:
+            str: The JSON-serialized artifact.
+
+        Raises:
+            KeyError: If the artifact is not in the store.
+        """
+
+    def put(self, key: str, artifact: Any, namespace: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Store an artifact once and return the reference to keep in state.
+
+        Args:
+            key (str): Key of the artifact, usually the tool call ID.
+            artifact (Any): The artifact payload.
+            namespace (Optional[str]): Namespace of the key, usually the thread ID, so tool call IDs reused by other
+                threads do not overwrite the artifact.
+
+        Returns:
+            Dict[str, Any]: The serialized ArtifactRef.
+        """
+        if namespace is not None:
+            key = f"{namespace}/{key}"
+        payload = json.dumps(artifact, default=str)
+        self._write(key, payload)
+        return ArtifactRef(artifact_ref=key, size_bytes=len(payload.encode())).model_dump()
+
+    def get(self, key: str) -> Any:
+        """
+        Load an artifact.
+
+        Args:
+            key (str): Key of the artifact.
+
+        Returns:
+            Any: The artifact payload.
+
+        Raises:
+            KeyError: If the artifact is not in the store.
+        """
+        return json.loads(self._read(key))
+
+
+class InMemoryArtifactStore(IArtifactStore):
+    """
+    Artifact store that keeps serialized artifacts in process memory, bounded in size and age.
+
+    Artifacts are evicted oldest first once their total size exceeds `max_bytes` or once they are older than
+    `ttl_seconds`. A reference to an evicted artifact no longer resolves, so the bounds should outlast the runs that
+    read their artifacts back.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = 256 * 1024 * 1024, ttl_seconds: Optional[float] = 60 * 60):
+        """
+        Initialize the store.
+
+        Args:
+            max_bytes (Optional[int]): Total size of the serialized artifacts kept. Unbounded if None.
+            ttl_seconds (Optional[float]): Seconds an artifact is kept. Artifacts never expire if None.
+
+        Raises:
+            ValueError: If max_bytes is less than 1.
+        """
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be >= 1")
+
+        self._max_bytes = max_bytes
+        self._ttl_seconds = ttl_seconds
+        # Oldest first: every artifact has the same TTL, so this is also expiry order
+        self._artifacts: "OrderedDict[str, Tuple[float, str, int]]" = OrderedDict()
+        self._size_bytes = 0
+        self._lock = Lock()
+
+    @property
+    def size_bytes(self) -> int:
+        """
+        Returns the total size of the artifacts kept.
+
+        Returns:
+            int: Size of the serialized artifacts, in bytes.
+        """
+        with self._lock:
+            return self._size_bytes
+
+    def _write(self, key: str, payload: str) -> None:
+        """
+        Keep a serialized artifact in memory, evicting expired artifacts and the oldest beyond the size bound.
+
+        Args:
+            key (str): Key of the artifact.
+            payload (str): The JSON-serialized artifact.
+        """
+        now = time.monotonic()
+        expires_at = now + self._ttl_seconds if self._ttl_seconds is not None else float("inf")
+        with self._lock:
+            self._discard(key)
+            size_bytes = len(payload.encode())
+            self._artifacts[key] = (expires_at, payload, size_bytes)
+            self._size_bytes += size_bytes
+            while self._artifacts:
+                oldest_key, (oldest_expires_at, _, _) = next(iter(self._artifacts.items()))
+                if oldest_expires_at >= now and (self._max_bytes is None or self._size_bytes <= self._max_bytes):
+                    break
+                self._discard(oldest_key)
+
+    def _discard(self, key: str) -> None:
+        """
+        Remove an artifact, if present. Must be called with the lock held.
+
+        Args:
+            key (str): Key of the artifact.
+        """
+        entry = self._artifacts.pop(key, None)
+        if entry is not None:
+            self._size_bytes -= entry[2]
+
+    def _read(self, key: str) -> str:
+        """
+        Read a serialized artifact from memory.
+
+        Args:
+            key (str): Key of the artifact.
+
+        Returns:
+            str: The JSON-serialized artifact.
+
+        Raises:
+            KeyError: If the artifact is not in the store.
+        """
+        with self._lock:
+            expires_at, payload, _ = self._artifacts[key]
+            if expires_at < time.monotonic():
+                self._discard(key)
+                raise KeyError(key)
+            return payload
+
+
+class FileArtifactStore(IArtifactStore):
+    """
+    Artifact store that writes one JSON file per artifact into a directory.
+
+    Files are named by the SHA-256 of the key, so distinct keys never share a file whatever characters they contain.
+    """
+
+    def __init__(self, directory: Union[str, Path]):
+        """
+        Initialize the store, creating the directory if needed.
+
+        Args:
+            directory (Union[str, Path]): Directory to write artifacts to.
+        """
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        """
+        Returns the file path for an artifact key.
+
+        Args:
+            key (str): Key of the artifact.
+
+        Returns:
+            Path: The file path.
+        """
+        return self._directory / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+    def _write(self, key: str, payload: str) -> None:
+        """
+        Write a serialized artifact to its file.
+
+        Args:
+            key (str): Key of the artifact.
+            payload (str): The JSON-serialized artifact.
+        """
+        self._path(key).write_text(payload, encoding="utf-8")
+
+    def _read(self, key: str) -> str:
+        """
+        Read a serialized artifact from its file.
+
+        Args:
+            key (str): Key of the artifact.
+
+        Returns:
+            str: The JSON-serialized artifact.
+
+        Raises:
+            KeyError: If the artifact is not in the store.
+        """
+        path = self._path(key)
+        if not path.exists():
+            raise KeyError(key)
+        return path.read_text(encoding="utf-8")
+
+
+def is_artifact_ref(artifact: Any) -> bool:
+    """
+    Check whether a tool message artifact is a reference into an artifact store.
+
+    Args:
+        artifact (Any): The tool message artifact.
+
+    Returns:
+        bool: True if the artifact is a serialized ArtifactRef.
+    """
+    return isinstance(artifact, dict) and ARTIFACT_REF_KEY in artifact
+
+
+def load_artifact(tool_message: "ToolMessage", artifact_store: IArtifactStore) -> Any:
+    """
+    Resolve a tool message artifact, loading it from the store if state only holds a reference.
+
+    Args:
+        tool_message (ToolMessage): The tool message.
+        artifact_store (IArtifactStore): The store the tool node wrote the artifact to.
+
+    Returns:
+        Any: The artifact payload.
+    """
+    if is_artifact_ref(tool_message.artifact):
+        return artifact_store.get(tool_message.artifact[ARTIFACT_REF_KEY])
+    return tool_message.artifact
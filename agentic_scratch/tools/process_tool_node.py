@@ -7,14 +7,21 @@ Description: Node implementation for the process tool.
 ==============================================================================
 """
 
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
 from langchain_core.messages import ToolMessage
+from pydantic import Field
 
 from wernicke.engines.llm.llm_orchestrators.graph_llm_orchestrators.models import BaseGraphState
 from wernicke.engines.llm.llm_orchestrators.graph_llm_orchestrators.node_types.base import INode
 from wernicke.shared.decorators.wernicke_langsmith_tracing import wernicke_ls_traceable
 
+from ..run_context import get_run_context, get_thread_id
+from ..tool_dispatcher import ToolCallDispatcher
+from .artifact_store import IArtifactStore
+from .process_tool import ProcessTool
+from .registry import tool_node
+
 
 class ProcessToolState(BaseGraphState):
     """
@@ -23,18 +30,44 @@ class ProcessToolState(BaseGraphState):
     Attributes:
         tool_call_id (str): The tool call ID.
         summary (str): Task summary.
+        duplicate_tool_call_ids (List[str]): IDs of identical tool calls coalesced into this one.
     """
 
     tool_call_id: str
     summary: str
+    duplicate_tool_call_ids: List[str] = Field(default_factory=list)
 
 
+@tool_node(tool=ProcessTool, state_model=ProcessToolState, input_extractor=lambda inputs: {"summary": inputs.summary})
 class ProcessToolNode(INode):
     """
     Node that executes the process tool logic and completes the task.
+
+    Dependencies not given to the constructor are read from the run context.
     """
 
     name = "ProcessToolNode"
+    cacheable = False
+
+    def __init__(self, artifact_store: Optional[IArtifactStore] = None):
+        """
+        Initialize the node.
+
+        Args:
+            artifact_store (Optional[IArtifactStore]): Store for the completion artifact; state keeps only a reference. Read from the run
+                context if None; inline if neither provides one.
+        """
+        self._artifact_store = artifact_store
+
+    @property
+    def artifact_store(self) -> Optional[IArtifactStore]:
+        """
+        Returns the artifact store of the node, or of the run in progress.
+
+        Returns:
+            Optional[IArtifactStore]: The artifact store, or None if artifacts are kept inline.
+        """
+        return self._artifact_store or get_run_context().artifact_store
 
     @wernicke_ls_traceable
     async def execute(self, graph_state: ProcessToolState) -> Dict[str, Any]:
@@ -49,13 +82,18 @@ class ProcessToolNode(INode):
         """
         content = f"✅ Task completed successfully!\n\nSummary: {graph_state.summary}"
 
+        artifact = {"status": "completed", "summary": graph_state.summary}
+        artifact_store = self.artifact_store
+        if artifact_store:
+            artifact = artifact_store.put(graph_state.tool_call_id, artifact, namespace=get_thread_id())
+
         tool_message = ToolMessage(
             content=content,
             tool_call_id=graph_state.tool_call_id,
-            artifact={"status": "completed", "summary": graph_state.summary},
+            artifact=artifact,
         )
 
         return {
-            "tool_results": [tool_message],
+            "tool_results": ToolCallDispatcher.fan_out(tool_message=tool_message, duplicate_tool_call_ids=graph_state.duplicate_tool_call_ids),
             "final_output": content,
         }
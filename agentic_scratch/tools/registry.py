@@ -0,0 +1,300 @@
+"""
+==============================================================================
+Name: registry
+Author: AI Assistant
+Date: 10/17/2026
+Description: Registry of the tools available to the agentic scratch graph:
+each tool's node class, state model and input extractor, registered once and
+looked up by tool name.
+==============================================================================
+"""
+
+from threading import Lock
+from typing import Any, Callable, Dict, Iterator, Optional, Sequence, Tuple, Type, TypeVar
+
+from pydantic import BaseModel, ConfigDict
+
+from wernicke.engines.llm.auxillary.tools.wernicke_tools.base import ITool
+from wernicke.engines.llm.llm_callers.models import ToolCallAction
+from wernicke.engines.llm.llm_orchestrators.graph_llm_orchestrators.node_types.base import INode
+
+NodeClass = TypeVar("NodeClass", bound=Type[INode])
+
+
+class ToolRegistration(BaseModel):
+    """
+    How the graph runs one tool.
+
+    Attributes:
+        tool (Type[ITool]): The tool class offered to the LLM.
+        node_class (Type[INode]): The node that executes the tool's calls. Constructed without arguments, it reads its
+            dependencies from the run context.
+        state_model (Type[BaseModel]): The node's input state. It must accept `tool_call_id` and `duplicate_tool_call_ids`
+            besides the extracted inputs.
+        input_extractor (Callable[[Any], Dict[str, Any]]): Maps the parsed tool inputs to the state model's remaining fields.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True)
+
+    tool: Type[ITool]
+    node_class: Type[INode]
+    state_model: Type[BaseModel]
+    input_extractor: Callable[[Any], Dict[str, Any]]
+
+    @property
+    def tool_name(self) -> str:
+        """
+        Returns the name the LLM calls the tool by.
+
+        Returns:
+            str: The tool name.
+        """
+        return self.tool.name
+
+    @property
+    def node_name(self) -> str:
+        """
+        Returns the graph node name of the tool's node.
+
+        Returns:
+            str: The node name.
+        """
+        return self.node_class.name
+
+    def build_state(self, tool_action: ToolCallAction, duplicate_tool_call_ids: Sequence[str] = ()) -> BaseModel:
+        """
+        Build the node's input state for a tool call.
+
+        Args:
+            tool_action (ToolCallAction): The tool call action.
+            duplicate_tool_call_ids (Sequence[str]): IDs of identical tool calls coalesced into this one.
+
+        Returns:
+            BaseModel: The node's input state.
+        """
+        return self.state_model(
+            tool_call_id=tool_action.id,
+            duplicate_tool_call_ids=duplicate_tool_call_ids,
+            **self.input_extractor(tool_action.content.inputs),
+        )
+
+
+class ToolRegistry:
+    """
+    Tool registrations keyed by tool name.
+
+    Tools register once, so routing a tool call is a single dict lookup. The built-in tools are registered by
+    `register_builtin_tools`; tools from outside this package plug in by registering before the orchestrator builds its
+    graph. The registry version is part of the compiled graph cache key, so a graph built before a registration is not
+    reused after it.
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty registry.
+        """
+        self._registrations: Dict[str, ToolRegistration] = {}
+        self._ordered: Tuple[ToolRegistration, ...] = ()
+        self._tools: Tuple[Type[ITool], ...] = ()
+        self._version = 0
+        self._lock = Lock()
+
+    def register(self, registration: ToolRegistration, replace: bool = False) -> ToolRegistration:
+        """
+        Register a tool.
+
+        Registering an identical registration again is a no-op and leaves the version unchanged. Registering the same node
+        class again with different details (e.g. when its module is reloaded) replaces the registration.
+
+        Args:
+            registration (ToolRegistration): The tool registration.
+            replace (bool): Replace a registration of the same tool name with a different node class.
+
+        Returns:
+            ToolRegistration: The registration.
+
+        Raises:
+            ValueError: If another node is already registered for the tool name or node name and `replace` is False.
+        """
+        with self._lock:
+            existing = self._registrations.get(registration.tool_name)
+            if existing == registration:
+                return existing
+            if existing is not None and existing.node_class.__qualname__ != registration.node_class.__qualname__ and not replace:
+                raise ValueError(f"Tool {registration.tool_name} is already registered to {existing.node_class.__qualname__}")
+            clashing = next(
+                (
+                    other
+                    for other in self._registrations.values()
+                    if other.node_name == registration.node_name and other.tool_name != registration.tool_name
+                ),
+                None,
+            )
+            if clashing is not None:
+                raise ValueError(f"Node name {registration.node_name} is already used by tool {clashing.tool_name}")
+
+            registrations = dict(self._registrations)
+            registrations[registration.tool_name] = registration
+            self._registrations = registrations
+            self._ordered = tuple(registrations.values())
+            self._tools = tuple(item.tool for item in self._ordered)
+            self._version += 1
+        return registration
+
+    def unregister(self, tool_name: str) -> None:
+        """
+        Remove a tool registration.
+
+        Args:
+            tool_name (str): The tool name.
+        """
+        with self._lock:
+            if tool_name not in self._registrations:
+                return
+            registrations = {name: item for name, item in self._registrations.items() if name != tool_name}
+            self._registrations = registrations
+            self._ordered = tuple(registrations.values())
+            self._tools = tuple(item.tool for item in self._ordered)
+            self._version += 1
+
+    def get(self, tool_name: str) -> ToolRegistration:
+        """
+        Look up a tool registration.
+
+        Args:
+            tool_name (str): The tool name.
+
+        Returns:
+            ToolRegistration: The registration.
+
+        Raises:
+            NotImplementedError: If no tool is registered under the name.
+        """
+        try:
+            return self._registrations[tool_name]
+        except KeyError:
+            raise NotImplementedError(f"No tool node is registered for tool: {tool_name}") from None
+
+    @property
+    def registrations(self) -> Tuple[ToolRegistration, ...]:
+        """
+        Returns every registration, in registration order.
+
+        Returns:
+            Tuple[ToolRegistration, ...]: The registrations.
+        """
+        return self._ordered
+
+    @property
+    def tools(self) -> Tuple[Type[ITool], ...]:
+        """
+        Returns the tool classes to offer the LLM, in registration order.
+
+        Returns:
+            Tuple[Type[ITool], ...]: The tool classes.
+        """
+        return self._tools
+
+    @property
+    def version(self) -> int:
+        """
+        Returns a counter that changes whenever the registrations do.
+
+        Returns:
+            int: The version.
+        """
+        return self._version
+
+    def __contains__(self, tool_name: object) -> bool:
+        """
+        Returns whether a tool is registered under the name.
+
+        Args:
+            tool_name (object): The tool name.
+
+        Returns:
+            bool: True if registered.
+        """
+        return tool_name in self._registrations
+
+    def __iter__(self) -> Iterator[ToolRegistration]:
+        """
+        Iterate over the registrations in registration order.
+
+        Returns:
+            Iterator[ToolRegistration]: The registrations.
+        """
+        return iter(self._ordered)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of registered tools.
+
+        Returns:
+            int: The number of registrations.
+        """
+        return len(self._ordered)
+
+
+# Process-wide registry the orchestrator builds its graph from
+tool_registry = ToolRegistry()
+
+
+def tool_node(
+    tool: Type[ITool],
+    state_model: Type[BaseModel],
+    input_extractor: Callable[[Any], Dict[str, Any]],
+) -> Callable[[NodeClass], NodeClass]:
+    """
+    Class decorator describing how a node class executes a tool, without registering it.
+
+    The registration is kept on the class as `tool_registration`, so importing the node module has no side effects and
+    the tool is registered explicitly, e.g. by `register_builtin_tools`.
+
+    Args:
+        tool (Type[ITool]): The tool class offered to the LLM.
+        state_model (Type[BaseModel]): The node's input state.
+        input_extractor (Callable[[Any], Dict[str, Any]]): Maps the parsed tool inputs to the state model's fields.
+
+    Returns:
+        Callable[[NodeClass], NodeClass]: The decorator, returning the node class with its `tool_registration` set.
+    """
+
+    def decorator(node_class: NodeClass) -> NodeClass:
+        node_class.tool_registration = ToolRegistration(tool=tool, node_class=node_class, state_model=state_model, input_extractor=input_extractor)
+        return node_class
+
+    return decorator
+
+
+def register_tool_node(
+    tool: Type[ITool],
+    state_model: Type[BaseModel],
+    input_extractor: Callable[[Any], Dict[str, Any]],
+    registry: Optional[ToolRegistry] = None,
+) -> Callable[[NodeClass], NodeClass]:
+    """
+    Class decorator describing a node class as the executor of a tool, like `tool_node`, and registering it.
+
+    Example:
+        @register_tool_node(tool=WeatherTool, state_model=WeatherToolState, input_extractor=lambda inputs: {"city": inputs.city})
+        class WeatherToolNode(INode):
+            ...
+
+    Args:
+        tool (Type[ITool]): The tool class offered to the LLM.
+        state_model (Type[BaseModel]): The node's input state.
+        input_extractor (Callable[[Any], Dict[str, Any]]): Maps the parsed tool inputs to the state model's fields.
+        registry (Optional[ToolRegistry]): The registry to add the tool to. The process-wide `tool_registry` if None.
+
+    Returns:
+        Callable[[NodeClass], NodeClass]: The decorator, returning the node class with its `tool_registration` set.
+    """
+    describe = tool_node(tool=tool, state_model=state_model, input_extractor=input_extractor)
+
+    def decorator(node_class: NodeClass) -> NodeClass:
+        node_class = describe(node_class)
+        (tool_registry if registry is None else registry).register(node_class.tool_registration)
+        return node_class
+
+    return decorator
@@ -7,7 +7,7 @@ Description: Node implementation for the search tool.
 ==============================================================================
 """
 
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
 from langchain_core.messages import ToolMessage
 from pydantic import BaseModel, Field
@@ -16,6 +16,13 @@ from wernicke.engines.llm.llm_orchestrators.graph_llm_orchestrators.models impor
 from wernicke.engines.llm.llm_orchestrators.graph_llm_orchestrators.node_types.base import INode
 from wernicke.shared.decorators.wernicke_langsmith_tracing import wernicke_ls_traceable
 
+from ..run_context import get_run_context, get_thread_id
+from ..tool_dispatcher import ToolCallDispatcher
+from .artifact_store import IArtifactStore
+from .registry import tool_node
+from .search_tool import SearchTool
+from .tool_result_cache import IToolResultCache, normalize_cache_key
+
 
 class SearchToolState(BaseGraphState):
     """
@@ -24,44 +31,166 @@ class SearchToolState(BaseGraphState):
     Attributes:
         tool_call_id (str): The tool call ID.
         query (str): The search query.
+        duplicate_tool_call_ids (List[str]): IDs of identical tool calls coalesced into this one.
     """
 
     tool_call_id: str
     query: str
+    duplicate_tool_call_ids: List[str] = Field(default_factory=list)
 
 
+@tool_node(tool=SearchTool, state_model=SearchToolState, input_extractor=lambda inputs: {"query": inputs.query})
 class SearchToolNode(INode):
     """
     Node that executes the search tool logic.
+
+    Dependencies not given to the constructor are read from the run context.
     """
 
     name = "SearchToolNode"
+    cacheable = True
+
+    def __init__(
+        self,
+        tool_dispatcher: Optional[ToolCallDispatcher] = None,
+        tool_result_cache: Optional[IToolResultCache] = None,
+        artifact_store: Optional[IArtifactStore] = None,
+    ):
+        """
+        Initialize the node.
 
-    @wernicke_ls_traceable
-    async def execute(self, graph_state: SearchToolState) -> Dict[str, Any]:
+        Args:
+            tool_dispatcher (Optional[ToolCallDispatcher]): Dispatcher bounding concurrent searches. Read from the run context if None.
+            tool_result_cache (Optional[IToolResultCache]): Cache of search results keyed on normalized query text. Read from the run
+                context if None; caching is disabled if neither provides one.
+            artifact_store (Optional[IArtifactStore]): Store for the search artifact; state keeps only a reference. Read from the run
+                context if None; inline if neither provides one.
+        """
+        self._tool_dispatcher = tool_dispatcher
+        self._tool_result_cache = tool_result_cache
+        self._artifact_store = artifact_store
+        if tool_dispatcher is not None:
+            self.register_early_dispatch(tool_dispatcher=tool_dispatcher)
+
+    @property
+    def tool_dispatcher(self) -> ToolCallDispatcher:
+        """
+        Returns the tool dispatcher of the node, or of the run in progress.
+
+        Returns:
+            ToolCallDispatcher: The tool dispatcher.
+        """
+        return self._tool_dispatcher or get_run_context().tool_dispatcher
+
+    @property
+    def tool_result_cache(self) -> Optional[IToolResultCache]:
+        """
+        Returns the result cache of the node, or of the run in progress.
+
+        Returns:
+            Optional[IToolResultCache]: The result cache, or None if caching is disabled.
+        """
+        return self._tool_result_cache or get_run_context().tool_result_cache
+
+    @property
+    def artifact_store(self) -> Optional[IArtifactStore]:
+        """
+        Returns the artifact store of the node, or of the run in progress.
+
+        Returns:
+            Optional[IArtifactStore]: The artifact store, or None if artifacts are kept inline.
         """
-        Execute the search tool logic.
+        return self._artifact_store or get_run_context().artifact_store
+
+    def register_early_dispatch(self, tool_dispatcher: ToolCallDispatcher) -> None:
+        """
+        Let the dispatcher start searches from the streaming response, before this node runs.
 
         Args:
-            graph_state (SearchToolState): The current state.
+            tool_dispatcher (ToolCallDispatcher): The dispatcher the core node streams tool calls to.
+        """
+        tool_dispatcher.register_early_dispatch(
+            tool_name=SearchTool.name,
+            key_fn=lambda inputs: normalize_cache_key(tool_name=SearchTool.name, text=inputs["query"]),
+            run_fn=lambda inputs: self._get_search_result(query=inputs["query"]),
+        )
+
+    async def _search(self, query: str) -> Dict[str, Any]:
+        """
+        Run the search and format its result.
+
+        Args:
+            query (str): The search query.
 
         Returns:
-            Dict[str, Any]: Updated state with tool results.
+            Dict[str, Any]: The tool message `content` and `artifact`.
         """
         # Mock search results
         results = [
-            f"Result 1 for '{graph_state.query}'",
-            f"Result 2 for '{graph_state.query}'",
-            f"Result 3 for '{graph_state.query}'",
+            f"Result 1 for '{query}'",
+            f"Result 2 for '{query}'",
+            f"Result 3 for '{query}'",
         ]
 
         formatted_results = "\n".join([f"{i+1}. {result}" for i, result in enumerate(results)])
-        content = f"Search results for '{graph_state.query}':\n{formatted_results}"
+        content = f"Search results for '{query}':\n{formatted_results}"
+
+        return {"content": content, "artifact": {"results": results, "query": query}}
+
+    async def _get_search_result(self, query: str) -> Dict[str, Any]:
+        """
+        Get the search result from the result cache, or run the search within the tool's concurrency limit.
+
+        Args:
+            query (str): The search query.
+
+        Returns:
+            Dict[str, Any]: The tool message `content` and `artifact`.
+        """
+        cache_key = normalize_cache_key(tool_name=SearchTool.name, text=query)
+        tool_result_cache = self.tool_result_cache
+        search_result = tool_result_cache.get(cache_key) if tool_result_cache else None
+
+        if search_result is None:
+            async with self.tool_dispatcher.limit(tool_name=SearchTool.name):
+                search_result = await self._search(query=query)
+            if tool_result_cache:
+                tool_result_cache.set(cache_key, search_result)
+
+        return search_result
+
+    @wernicke_ls_traceable
+    async def execute(self, graph_state: SearchToolState) -> Dict[str, Any]:
+        """
+        Execute the search tool logic, picking up a search started early from the streaming response or prefetched
+        speculatively, or serving repeated queries from the result cache.
+
+        Args:
+            graph_state (SearchToolState): The current state.
+
+        Returns:
+            Dict[str, Any]: Updated state with tool results.
+        """
+        early_key = normalize_cache_key(tool_name=SearchTool.name, text=graph_state.query)
+        early_search = self.tool_dispatcher.take_early(tool_name=SearchTool.name, key=early_key)
+        prefetch_run = get_run_context().prefetch_run
+        if early_search is None and prefetch_run is not None:
+            early_search = prefetch_run.take(tool_name=SearchTool.name, key=early_key)
+
+        if early_search is not None:
+            search_result = await early_search
+        else:
+            search_result = await self._get_search_result(query=graph_state.query)
+
+        artifact = search_result["artifact"]
+        artifact_store = self.artifact_store
+        if artifact_store:
+            artifact = artifact_store.put(graph_state.tool_call_id, artifact, namespace=get_thread_id())
 
         tool_message = ToolMessage(
-            content=content,
+            content=search_result["content"],
             tool_call_id=graph_state.tool_call_id,
-            artifact={"results": results, "query": graph_state.query},
+            artifact=artifact,
         )
 
-        return {"tool_results": [tool_message]}
+        return {"tool_results": ToolCallDispatcher.fan_out(tool_message=tool_message, duplicate_tool_call_ids=graph_state.duplicate_tool_call_ids)}
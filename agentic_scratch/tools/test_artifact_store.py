@@ -0,0 +1,79 @@
+"""
+==============================================================================
+Name: test_artifact_store
+Author: AI Assistant
+Date: 10/17/2026
+Description: Tests of the artifact stores: namespaced keys, size and age
+bounds of the in-memory store, and collision-free file names.
+==============================================================================
+"""
+
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from .artifact_store import FileArtifactStore, InMemoryArtifactStore, is_artifact_ref, load_artifact
+
+
+def test_put_returns_a_reference_that_loads_the_artifact():
+    store = InMemoryArtifactStore()
+
+    ref = store.put("call_1", {"results": [1, 2]})
+
+    assert is_artifact_ref(ref)
+    assert load_artifact(SimpleNamespace(artifact=ref), artifact_store=store) == {"results": [1, 2]}
+    assert load_artifact(SimpleNamespace(artifact={"inline": True}), artifact_store=store) == {"inline": True}
+
+
+def test_namespaces_keep_reused_tool_call_ids_apart():
+    store = InMemoryArtifactStore()
+
+    first = store.put("call_1", "thread a", namespace="a")
+    second = store.put("call_1", "thread b", namespace="b")
+
+    assert store.get(first["artifact_ref"]) == "thread a"
+    assert store.get(second["artifact_ref"]) == "thread b"
+
+
+def test_in_memory_store_evicts_the_oldest_beyond_max_bytes():
+    store = InMemoryArtifactStore(max_bytes=30, ttl_seconds=None)
+
+    refs = [store.put(f"call_{index}", "x" * 8) for index in range(4)]
+
+    with pytest.raises(KeyError):
+        store.get(refs[0]["artifact_ref"])
+    assert [store.get(ref["artifact_ref"]) for ref in refs[1:]] == ["x" * 8] * 3
+    assert store.size_bytes == 30
+
+
+def test_in_memory_store_expires_artifacts():
+    store = InMemoryArtifactStore(ttl_seconds=0.01)
+    ref = store.put("call_1", "payload")
+
+    time.sleep(0.02)
+
+    with pytest.raises(KeyError):
+        store.get(ref["artifact_ref"])
+    assert store.size_bytes == 0
+
+
+def test_rewriting_a_key_replaces_its_size():
+    store = InMemoryArtifactStore()
+
+    store.put("call_1", "x" * 100)
+    store.put("call_1", "y")
+
+    assert store.size_bytes == len('"y"')
+
+
+def test_file_store_keys_that_sanitized_alike_do_not_collide(tmp_path):
+    store = FileArtifactStore(directory=tmp_path)
+
+    first = store.put("call/1", "slash")
+    second = store.put("call_1", "underscore")
+
+    assert store.get(first["artifact_ref"]) == "slash"
+    assert store.get(second["artifact_ref"]) == "underscore"
+    with pytest.raises(KeyError):
+        store.get("missing")
@@ -0,0 +1,180 @@
+"""
+==============================================================================
+Name: test_registry
+Author: AI Assistant
+Date: 10/17/2026
+Description: Tests of the tool registry, its decorators and the registration
+of the built-in tools.
+==============================================================================
+"""
+
+from typing import Any, Dict, List, Type
+
+import pytest
+
+pytest.importorskip("wernicke")
+
+from pydantic import BaseModel, Field  # noqa: E402
+
+from wernicke.engines.llm.auxillary.tools.wernicke_tools.base import ITool, IToolInputs  # noqa: E402
+from wernicke.engines.llm.llm_callers.models import ToolCallAction  # noqa: E402
+from wernicke.engines.llm.llm_orchestrators.graph_llm_orchestrators.node_types.base import INode  # noqa: E402
+
+from ..factory import tool_call_node_instance_factory  # noqa: E402
+from . import register_builtin_tools  # noqa: E402
+from .process_tool_node import ProcessToolNode  # noqa: E402
+from .registry import ToolRegistration, ToolRegistry, register_tool_node, tool_node, tool_registry  # noqa: E402
+from .search_tool_node import SearchToolNode  # noqa: E402
+
+
+class WeatherToolInputs(IToolInputs):
+    city: str
+
+
+class WeatherTool(ITool):
+    name = "WeatherTool"
+    description = "Look up the weather of a city."
+
+    @property
+    def input_model(self) -> Type[WeatherToolInputs]:
+        return WeatherToolInputs
+
+
+class WeatherToolState(BaseModel):
+    tool_call_id: str
+    city: str
+    duplicate_tool_call_ids: List[str] = Field(default_factory=list)
+
+
+def _weather_node_class(name: str = "WeatherToolNode") -> Type[INode]:
+    class WeatherToolNode(INode):
+        async def execute(self, graph_state: WeatherToolState) -> Dict[str, Any]:
+            return {}
+
+    WeatherToolNode.name = name
+    return WeatherToolNode
+
+
+def _registration(node_class: Type[INode], tool: Type[ITool] = WeatherTool) -> ToolRegistration:
+    return ToolRegistration(tool=tool, node_class=node_class, state_model=WeatherToolState, input_extractor=lambda inputs: {"city": inputs.city})
+
+
+@pytest.fixture
+def global_weather_tool():
+    yield
+    tool_registry.unregister(WeatherTool.name)
+
+
+def test_third_party_tool_registers_with_the_decorator_and_builds_through_the_factory(global_weather_tool):
+    register_builtin_tools()
+
+    @register_tool_node(tool=WeatherTool, state_model=WeatherToolState, input_extractor=lambda inputs: {"city": inputs.city})
+    class WeatherToolNode(INode):
+        name = "WeatherToolNode"
+
+        def __init__(self, artifact_store=None):
+            self.artifact_store = artifact_store
+
+        async def execute(self, graph_state: WeatherToolState) -> Dict[str, Any]:
+            return {}
+
+    assert WeatherTool in tool_registry.tools
+    assert isinstance(tool_call_node_instance_factory(tool_name="WeatherTool", tool_dispatcher=object()), WeatherToolNode)
+
+    action = ToolCallAction.model_validate({"id": "call_1", "content": {"name": "WeatherTool", "inputs": WeatherToolInputs(city="Oslo")}})
+    state = tool_registry.get("WeatherTool").build_state(tool_action=action, duplicate_tool_call_ids=["call_2"])
+    assert state == WeatherToolState(tool_call_id="call_1", city="Oslo", duplicate_tool_call_ids=["call_2"])
+
+
+def test_decorator_registers_into_an_empty_custom_registry():
+    registry = ToolRegistry()
+
+    node_class = register_tool_node(tool=WeatherTool, state_model=WeatherToolState, input_extractor=dict, registry=registry)(_weather_node_class())
+
+    assert registry.get("WeatherTool").node_class is node_class
+    assert "WeatherTool" not in tool_registry
+
+
+def test_tool_node_describes_without_registering():
+    registry_version = tool_registry.version
+
+    node_class = tool_node(tool=WeatherTool, state_model=WeatherToolState, input_extractor=dict)(_weather_node_class())
+
+    assert node_class.tool_registration.node_class is node_class
+    assert "WeatherTool" not in tool_registry
+    assert tool_registry.version == registry_version
+
+
+def test_lookup_returns_the_prebuilt_registration_and_cached_tuples():
+    registry = ToolRegistry()
+    registration = registry.register(_registration(_weather_node_class()))
+
+    assert registry.get("WeatherTool") is registration
+    assert "WeatherTool" in registry and len(registry) == 1
+    assert registry.tools is registry.tools == (WeatherTool,)
+    assert registry.registrations is registry.registrations == tuple(registry)
+
+
+def test_version_changes_only_when_the_registrations_do():
+    registry = ToolRegistry()
+    registration = _registration(_weather_node_class())
+
+    registry.register(registration)
+    assert registry.version == 1
+    registry.register(registration)
+    assert registry.version == 1
+    registry.unregister("WeatherTool")
+    assert registry.version == 2 and "WeatherTool" not in registry
+    registry.unregister("WeatherTool")
+    assert registry.version == 2
+
+
+def test_duplicate_tool_name_needs_replace():
+    registry = ToolRegistry()
+    registry.register(_registration(_weather_node_class()))
+
+    class OtherWeatherNode(INode):
+        name = "WeatherToolNode"
+
+    with pytest.raises(ValueError, match="already registered"):
+        registry.register(_registration(OtherWeatherNode))
+
+    registry.register(_registration(OtherWeatherNode), replace=True)
+    assert registry.get("WeatherTool").node_class is OtherWeatherNode
+
+
+def test_reloaded_node_class_replaces_its_registration():
+    registry = ToolRegistry()
+    registry.register(_registration(_weather_node_class()))
+
+    reloaded = _weather_node_class()
+    registry.register(_registration(reloaded))
+
+    assert registry.get("WeatherTool").node_class is reloaded
+    assert len(registry) == 1
+
+
+def test_node_name_clash_between_tools_is_rejected():
+    class ForecastTool(WeatherTool):
+        name = "ForecastTool"
+
+    registry = ToolRegistry()
+    registry.register(_registration(_weather_node_class()))
+
+    with pytest.raises(ValueError, match="Node name WeatherToolNode"):
+        registry.register(_registration(_weather_node_class(), tool=ForecastTool))
+
+
+def test_unknown_tool_raises_not_implemented():
+    with pytest.raises(NotImplementedError, match="MissingTool"):
+        ToolRegistry().get("MissingTool")
+
+
+def test_builtin_tools_register_in_order_and_only_once():
+    registry = register_builtin_tools(registry=ToolRegistry())
+    version = registry.version
+
+    register_builtin_tools(registry=registry)
+
+    assert [registration.node_class for registration in registry] == [SearchToolNode, ProcessToolNode]
+    assert registry.version == version
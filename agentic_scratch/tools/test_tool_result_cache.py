@@ -0,0 +1,100 @@
+"""
+==============================================================================
+Name: test_tool_result_cache
+Author: AI Assistant
+Date: 10/17/2026
+Description: Tests of the tool result caches: LRU eviction, expiry, copies
+of cached values and the SQLite cache's tracked size.
+==============================================================================
+"""
+
+import time
+
+import pytest
+
+from .tool_result_cache import InMemoryToolResultCache, SQLiteToolResultCache, normalize_cache_key
+
+
+def test_normalize_cache_key_collapses_case_and_whitespace():
+    assert normalize_cache_key("SearchTool", "  Python   3.13 ") == normalize_cache_key("SearchTool", "python 3.13")
+
+
+def test_in_memory_cache_evicts_least_recently_used():
+    cache = InMemoryToolResultCache(max_entries=2)
+    cache.set("a", {"value": 1})
+    cache.set("b", {"value": 2})
+    cache.get("a")
+    cache.set("c", {"value": 3})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"value": 1}
+    stats = cache.stats
+    assert (stats.evictions, stats.size, stats.hits, stats.misses) == (1, 2, 2, 1)
+
+
+def test_in_memory_cache_expires_entries():
+    cache = InMemoryToolResultCache(ttl_seconds=0.01)
+    cache.set("a", {"value": 1})
+
+    time.sleep(0.02)
+
+    assert cache.get("a") is None
+    assert cache.stats.expirations == 1
+
+
+def test_in_memory_cache_values_are_copies():
+    cache = InMemoryToolResultCache()
+    value = {"artifact": {"results": [1]}}
+    cache.set("a", value)
+    value["artifact"]["results"].append(2)
+
+    got = cache.get("a")
+    got["artifact"]["results"].append(3)
+
+    assert cache.get("a") == {"artifact": {"results": [1]}}
+
+
+def test_sqlite_cache_evicts_least_recently_used(tmp_path):
+    cache = SQLiteToolResultCache(path=tmp_path / "cache.db", max_entries=2)
+    cache.set("a", {"value": 1})
+    time.sleep(0.001)
+    cache.set("b", {"value": 2})
+    time.sleep(0.001)
+    cache.get("a")
+    time.sleep(0.001)
+    cache.set("c", {"value": 3})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"value": 1}
+    assert (cache.stats.evictions, cache.stats.size) == (1, 2)
+    cache.close()
+
+
+def test_sqlite_cache_overwrites_without_growing(tmp_path):
+    cache = SQLiteToolResultCache(path=tmp_path / "cache.db", max_entries=2)
+    for value in range(5):
+        cache.set("a", {"value": value})
+
+    assert cache.get("a") == {"value": 4}
+    assert (cache.stats.evictions, cache.stats.size) == (0, 1)
+    cache.close()
+
+
+def test_sqlite_cache_recount_covers_entries_of_other_connections(tmp_path):
+    first = SQLiteToolResultCache(path=tmp_path / "cache.db", max_entries=3)
+    second = SQLiteToolResultCache(path=tmp_path / "cache.db", max_entries=3)
+    for index in range(3):
+        first.set(f"first {index}", {"value": index})
+    for index in range(3):
+        second.set(f"second {index}", {"value": index})
+
+    assert second.stats.size == 3
+    first.close()
+    second.close()
+
+
+def test_caches_reject_empty_bounds(tmp_path):
+    with pytest.raises(ValueError):
+        InMemoryToolResultCache(max_entries=0)
+    with pytest.raises(ValueError):
+        SQLiteToolResultCache(path=tmp_path / "cache.db", max_entries=0)
@@ -0,0 +1,319 @@
+"""
+==============================================================================
+Name: tool_result_cache
+Author: AI Assistant
+Date: 10/17/2026
+Description: Pluggable result caches for tool nodes (in-process LRU+TTL and
+on-disk SQLite).
+==============================================================================
+"""
+
+import copy
+import json
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple, Union
+
+from pydantic import BaseModel
+
+
+def normalize_cache_key(tool_name: str, text: str) -> str:
+    """
+    Build a cache key from the tool name and normalized query text.
+
+    The text is lowercased and whitespace is collapsed so trivially different spellings of the same query share an entry.
+
+    Args:
+        tool_name (str): Name of the tool.
+        text (str): The query text.
+
+    Returns:
+        str: The cache key.
+    """
+    return f"{tool_name}:{' '.join(text.lower().split())}"
+
+
+class ToolResultCacheStats(BaseModel):
+    """
+    Counters describing cache effectiveness.
+
+    Attributes:
+        hits (int): Lookups served from the cache.
+        misses (int): Lookups not found in the cache, including expired entries.
+        evictions (int): Entries removed to stay within the size bound.
+        expirations (int): Entries removed because their TTL elapsed.
+        size (int): Entries currently in the cache.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    size: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Returns the fraction of lookups served from the cache.
+
+        Returns:
+            float: The hit rate, or 0.0 if there were no lookups.
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class IToolResultCache(ABC):
+    """
+    Interface for tool result caches. Values are JSON-serializable dicts.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached value.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[Dict[str, Any]]: The cached value, or None on a miss.
+        """
+
+    @abstractmethod
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """
+        Store a value.
+
+        Args:
+            key (str): The cache key.
+            value (Dict[str, Any]): The value to cache.
+        """
+
+    @property
+    @abstractmethod
+    def stats(self) -> ToolResultCacheStats:
+        """
+        Returns the cache counters.
+
+        Returns:
+            ToolResultCacheStats: The cache counters.
+        """
+
+
+class InMemoryToolResultCache(IToolResultCache):
+    """
+    In-process cache with least-recently-used eviction and a time-to-live per entry.
+
+    Values are copied in and out, so callers may mutate what they stored or got without changing the cached entry.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: Optional[float] = 300.0):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries (int): Maximum number of entries kept before evicting the least recently used.
+            ttl_seconds (Optional[float]): Seconds an entry stays valid. Entries never expire if None.
+
+        Raises:
+            ValueError: If max_entries is less than 1.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._stats = ToolResultCacheStats()
+        self._lock = Lock()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached value and mark it as most recently used.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[Dict[str, Any]]: A copy of the cached value, or None on a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats.misses += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                self._stats.expirations += 1
+                self._stats.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+        return copy.deepcopy(value)
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """
+        Store a value, evicting the least recently used entries beyond the size bound.
+
+        Args:
+            key (str): The cache key.
+            value (Dict[str, Any]): The value to cache.
+        """
+        expires_at = time.monotonic() + self._ttl_seconds if self._ttl_seconds is not None else float("inf")
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+    @property
+    def stats(self) -> ToolResultCacheStats:
+        """
+        Returns a snapshot of the cache counters.
+
+        Returns:
+            ToolResultCacheStats: The cache counters.
+        """
+        with self._lock:
+            return self._stats.model_copy(update={"size": len(self._entries)})
+
+
+class SQLiteToolResultCache(IToolResultCache):
+    """
+    On-disk cache backed by SQLite, shared across processes and restarts.
+
+    Entries expire after the TTL and the least recently used entries are evicted beyond `max_entries`. The entry count
+    is tracked as entries are added and removed rather than counted on every write; it is recounted once every tenth
+    of `max_entries` writes to pick up entries written by other processes, which may exceed the bound until then.
+    """
+
+    def __init__(self, path: Union[str, Path], max_entries: int = 100_000, ttl_seconds: Optional[float] = 24 * 60 * 60):
+        """
+        Initialize the cache, creating the database file and table if needed.
+
+        Args:
+            path (Union[str, Path]): Path to the SQLite database file.
+            max_entries (int): Maximum number of entries kept before evicting the least recently used.
+            ttl_seconds (Optional[float]): Seconds an entry stays valid. Entries never expire if None.
+
+        Raises:
+            ValueError: If max_entries is less than 1.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._stats = ToolResultCacheStats()
+        self._lock = Lock()
+        self._connection = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS tool_results (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL, last_access REAL NOT NULL)"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS tool_results_last_access ON tool_results (last_access)")
+        (self._size,) = self._connection.execute("SELECT COUNT(*) FROM tool_results").fetchone()
+        self._recount_every = max(1, max_entries // 10)
+        self._writes_since_count = 0
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached value and refresh its last access time.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[Dict[str, Any]]: The cached value, or None on a miss.
+        """
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute("SELECT value, expires_at FROM tool_results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self._stats.misses += 1
+                return None
+
+            value, expires_at = row
+            if expires_at < now:
+                deleted = self._connection.execute("DELETE FROM tool_results WHERE key = ?", (key,)).rowcount
+                self._size = max(self._size - deleted, 0)
+                self._stats.expirations += 1
+                self._stats.misses += 1
+                return None
+
+            self._connection.execute("UPDATE tool_results SET last_access = ? WHERE key = ?", (now, key))
+            self._stats.hits += 1
+            return json.loads(value)
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """
+        Store a value, evicting the least recently used entries beyond the size bound.
+
+        Args:
+            key (str): The cache key.
+            value (Dict[str, Any]): The value to cache.
+        """
+        now = time.time()
+        expires_at = now + self._ttl_seconds if self._ttl_seconds is not None else float("inf")
+        payload = json.dumps(value, default=str)
+        with self._lock:
+            # One transaction, so the write and any eviction commit together
+            self._connection.execute("BEGIN")
+            try:
+                inserted = self._connection.execute(
+                    "INSERT OR IGNORE INTO tool_results (key, value, expires_at, last_access) VALUES (?, ?, ?, ?)",
+                    (key, payload, expires_at, now),
+                ).rowcount
+                if inserted:
+                    self._size += 1
+                else:
+                    self._connection.execute(
+                        "UPDATE tool_results SET value = ?, expires_at = ?, last_access = ? WHERE key = ?",
+                        (payload, expires_at, now, key),
+                    )
+
+                self._writes_since_count += 1
+                if self._writes_since_count >= self._recount_every:
+                    (self._size,) = self._connection.execute("SELECT COUNT(*) FROM tool_results").fetchone()
+                    self._writes_since_count = 0
+
+                overflow = self._size - self._max_entries
+                if overflow > 0:
+                    evicted = self._connection.execute(
+                        "DELETE FROM tool_results WHERE rowid IN (SELECT rowid FROM tool_results ORDER BY last_access LIMIT ?)",
+                        (overflow,),
+                    ).rowcount
+                    self._size -= evicted
+                    self._stats.evictions += evicted
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+
+    @property
+    def stats(self) -> ToolResultCacheStats:
+        """
+        Returns a snapshot of the cache counters.
+
+        Returns:
+            ToolResultCacheStats: The cache counters.
+        """
+        with self._lock:
+            (size,) = self._connection.execute("SELECT COUNT(*) FROM tool_results").fetchone()
+            return self._stats.model_copy(update={"size": size})
+
+    def close(self) -> None:
+        """
+        Close the database connection.
+        """
+        self._connection.close()